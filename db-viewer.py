@@ -10,6 +10,10 @@ import json
 from http.server import HTTPServer, BaseHTTPRequestHandler
 import urllib.parse
 
+from src.storage.pagination import Page, estimate_count, fetch_page
+from src.storage.search import count_matches_dbapi, search_workflows_dbapi
+from src.storage.workflow_stats import read_statistics_dbapi
+
 # Database connection
 DB_CONFIG = {
     'host': 'n8n-scraper-database',
@@ -19,77 +23,113 @@ DB_CONFIG = {
     'password': 'scraper_pass'
 }
 
-def get_workflows(limit=50, offset=0, search=None, sort_by='workflow_id', sort_order='DESC'):
-    """Get workflows from database"""
+WORKFLOW_COLUMNS = """
+    workflow_id,
+    url,
+    quality_score,
+    layer1_success,
+    layer2_success,
+    layer3_success,
+    processing_time,
+    extracted_at
+"""
+
+
+def _workflow_row(w):
+    """Workflow row as JSON-ready dict"""
+    return {
+        'workflow_id': w['workflow_id'],
+        'url': w['url'],
+        'quality_score': float(w['quality_score']) if w['quality_score'] else 0,
+        'layer1_success': w['layer1_success'],
+        'layer2_success': w['layer2_success'],
+        'layer3_success': w['layer3_success'],
+        'processing_time': float(w['processing_time']) if w['processing_time'] else 0,
+        'extracted_at': w['extracted_at'].isoformat() if w['extracted_at'] else None
+    }
+
+
+def is_id_or_url_search(search):
+    """Workflow IDs and URLs are matched literally; anything else is a full-text search"""
+    return search.strip().isdigit() or '/' in search or search.strip().startswith('http')
+
+
+def search_workflows_ranked(search, limit=50, offset=0):
+    """Full-text search (title, description, explainer, transcripts), best match first
+    
+    Ranking reads every match anyway, so results page by offset; the page
+    cursors are the offsets of the neighbouring pages.
+    """
+    try:
+        conn = psycopg2.connect(**DB_CONFIG)
+        try:
+            hits = search_workflows_dbapi(conn, search, limit=limit, offset=offset)
+            total = count_matches_dbapi(conn, search)
+            
+            next_cursor = str(offset + limit) if offset + limit < total else None
+            prev_cursor = str(max(offset - limit, 0)) if offset > 0 else None
+            if not hits:
+                return Page([], None, prev_cursor), total, True
+            
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            cursor.execute(
+                f"SELECT {WORKFLOW_COLUMNS} FROM workflows WHERE workflow_id = ANY(%s)",
+                ([hit.workflow_id for hit in hits],)
+            )
+            rows = {w['workflow_id']: w for w in cursor.fetchall()}
+            cursor.close()
+        finally:
+            conn.close()
+        
+        return Page([
+            {**_workflow_row(rows[hit.workflow_id]), 'title': hit.title, 'snippet': hit.snippet}
+            for hit in hits if hit.workflow_id in rows
+        ], next_cursor, prev_cursor), total, True
+        
+    except Exception as e:
+        print(f"Error searching workflows: {e}")
+        return Page([], None, None), 0, True
+
+def get_workflows(limit=50, cursor=None, backwards=False, search=None, sort_by='workflow_id', sort_order='DESC'):
+    """Get one page of workflows from database
+    
+    Returns (page, total, whether total is exact). Listings page by keyset:
+    `cursor` is a next_cursor/prev_cursor of the previous page and
+    `backwards` selects the page before it. Raises ValueError for a cursor
+    that doesn't belong to this sort.
+    """
+    if search and not is_id_or_url_search(search):
+        offset = int(cursor) if cursor and cursor.isdigit() else 0
+        return search_workflows_ranked(search, limit=limit, offset=offset)
+    
     try:
         conn = psycopg2.connect(**DB_CONFIG)
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
         
         where_clause = ""
         params = []
         
         if search:
-            where_clause = "WHERE workflow_id ILIKE %s OR url ILIKE %s"
+            where_clause = "workflow_id ILIKE %s OR url ILIKE %s"
             search_pattern = f"%{search}%"
             params = [search_pattern, search_pattern]
         
-        # Validate sort column to prevent SQL injection
-        valid_sort_columns = {
-            'workflow_id': 'CAST(workflow_id AS INTEGER)',
-            'url': 'url',
-            'quality_score': 'quality_score',
-            'processing_time': 'processing_time',
-            'extracted_at': 'extracted_at'
-        }
-        
-        sort_column = valid_sort_columns.get(sort_by, 'CAST(workflow_id AS INTEGER)')
-        sort_order = 'ASC' if sort_order.upper() == 'ASC' else 'DESC'
-        
-        query = f"""
-            SELECT 
-                workflow_id,
-                url,
-                quality_score,
-                layer1_success,
-                layer2_success,
-                layer3_success,
-                processing_time,
-                extracted_at
-            FROM workflows
-            {where_clause}
-            ORDER BY {sort_column} {sort_order}
-            LIMIT %s OFFSET %s
-        """
-        params.extend([limit, offset])
-        
-        cursor.execute(query, params)
-        workflows = cursor.fetchall()
-        
-        # Get total count
-        count_query = f"SELECT COUNT(*) FROM workflows {where_clause}"
-        cursor.execute(count_query, params[:len(params)-2] if where_clause else [])
-        total = cursor.fetchone()['count']
-        
-        cursor.close()
-        conn.close()
+        # Sort names are validated against SORT_KEYS to prevent SQL injection
+        try:
+            page = fetch_page(
+                conn, WORKFLOW_COLUMNS, sort=sort_by, order=sort_order, limit=limit,
+                cursor=cursor, backwards=backwards, where=where_clause, params=params
+            )
+            total, exact = estimate_count(conn, where_clause, params)
+        finally:
+            conn.close()
         
-        return [
-            {
-                'workflow_id': w['workflow_id'],
-                'url': w['url'],
-                'quality_score': float(w['quality_score']) if w['quality_score'] else 0,
-                'layer1_success': w['layer1_success'],
-                'layer2_success': w['layer2_success'],
-                'layer3_success': w['layer3_success'],
-                'processing_time': float(w['processing_time']) if w['processing_time'] else 0,
-                'extracted_at': w['extracted_at'].isoformat() if w['extracted_at'] else None
-            }
-            for w in workflows
-        ], total
+        return page._replace(rows=[_workflow_row(w) for w in page.rows]), total, exact
         
+    except ValueError:
+        raise
     except Exception as e:
         print(f"Error getting workflows: {e}")
-        return [], 0
+        return Page([], None, None), 0, True
 
 def get_workflow_details(workflow_id):
     """Get detailed information for a specific workflow"""
@@ -175,33 +215,17 @@ def get_statistics():
     """Get database statistics"""
     try:
         conn = psycopg2.connect(**DB_CONFIG)
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-        
-        query = """
-            SELECT 
-                COUNT(*) as total_workflows,
-                COUNT(*) FILTER (WHERE layer1_success AND layer2_success AND layer3_success) as fully_successful,
-                COUNT(*) FILTER (WHERE NOT (layer1_success AND layer2_success AND layer3_success)) as partial_success,
-                COUNT(*) FILTER (WHERE error_message IS NOT NULL) as with_errors,
-                ROUND(AVG(quality_score)::numeric, 2) as avg_quality_score,
-                ROUND(AVG(processing_time)::numeric, 2) as avg_processing_time
-            FROM workflows
-        """
-        
-        cursor.execute(query)
-        stats = cursor.fetchone()
-        
-        cursor.close()
+        stats = read_statistics_dbapi(conn)
         conn.close()
         
         return {
-            'total_workflows': int(stats['total_workflows']),
-            'fully_successful': int(stats['fully_successful']),
-            'partial_success': int(stats['partial_success']),
-            'with_errors': int(stats['with_errors']),
-            'avg_quality_score': float(stats['avg_quality_score']) if stats['avg_quality_score'] else 0,
-            'avg_processing_time': float(stats['avg_processing_time']) if stats['avg_processing_time'] else 0,
-            'success_rate': round((stats['fully_successful'] / stats['total_workflows'] * 100), 1) if stats['total_workflows'] > 0 else 0
+            'total_workflows': stats['total_workflows'],
+            'fully_successful': stats['fully_successful'],
+            'partial_success': stats['total_workflows'] - stats['fully_successful'],
+            'with_errors': stats['with_errors'],
+            'avg_quality_score': stats['avg_quality_score'],
+            'avg_processing_time': stats['avg_processing_time'],
+            'success_rate': stats['success_rate']
         }
         
     except Exception as e:
@@ -234,25 +258,35 @@ class DBViewerHandler(BaseHTTPRequestHandler):
             self.serve_workflow_details(workflow_id)
         elif path == '/api/workflows':
             # Get parameters
-            page = int(params.get('page', [1])[0])
+            cursor = params.get('cursor', [None])[0]
+            backwards = params.get('direction', ['next'])[0] == 'prev'
             search = params.get('search', [None])[0]
             sort_by = params.get('sort', ['workflow_id'])[0]
             sort_order = params.get('order', ['desc'])[0]
             limit = 50
             
-            workflows, total = get_workflows(
-                limit=limit,
-                offset=(page-1)*limit,
-                search=search,
-                sort_by=sort_by,
-                sort_order=sort_order
-            )
+            try:
+                page, total, exact = get_workflows(
+                    limit=limit,
+                    cursor=cursor,
+                    backwards=backwards,
+                    search=search,
+                    sort_by=sort_by,
+                    sort_order=sort_order
+                )
+            except ValueError as e:
+                self.send_response(400)
+                self.send_header('Content-type', 'application/json')
+                self.end_headers()
+                self.wfile.write(json.dumps({'error': str(e)}).encode('utf-8'))
+                return
             
             response = {
-                'workflows': workflows,
+                'workflows': page.rows,
                 'total': total,
-                'page': page,
-                'total_pages': (total + limit - 1) // limit
+                'total_exact': exact,
+                'next_cursor': page.next_cursor,
+                'prev_cursor': page.prev_cursor
             }
             
             self.send_response(200)
@@ -386,6 +420,16 @@ class DBViewerHandler(BaseHTTPRequestHandler):
             font-size: 1em;
         }}
         
+        .search-snippet {{
+            margin-top: 6px;
+            font-size: 12px;
+            color: #555;
+        }}
+        
+        .search-snippet mark {{
+            background: #fff3b0;
+        }}
+        
         .search-box:focus {{
             outline: none;
             border-color: #667eea;
@@ -552,7 +596,7 @@ class DBViewerHandler(BaseHTTPRequestHandler):
         </div>
         
         <div class="controls">
-            <input type="text" class="search-box" id="search-input" placeholder="Search by workflow ID or URL...">
+            <input type="text" class="search-box" id="search-input" placeholder="Search workflows, or enter an ID or URL...">
             <button class="btn" onclick="searchWorkflows()">Search</button>
             <button class="btn" onclick="clearSearch()">Clear</button>
         </div>
@@ -585,8 +629,9 @@ class DBViewerHandler(BaseHTTPRequestHandler):
     </div>
     
     <script>
-        let currentPage = 1;
         let currentSearch = '';
+        let nextCursor = null;
+        let prevCursor = null;
         let currentSort = 'workflow_id';
         let currentOrder = 'desc';
         
@@ -604,11 +649,21 @@ class DBViewerHandler(BaseHTTPRequestHandler):
             }}
         }}
         
-        async function loadWorkflows(page = 1, search = '', sort = currentSort, order = currentOrder) {{
+        async function loadWorkflows(cursor = null, direction = 'next') {{
             try {{
-                const url = `/api/workflows?page=${{page}}${{search ? '&search=' + encodeURIComponent(search) : ''}}&sort=${{sort}}&order=${{order}}`;
+                const search = currentSearch;
+                const url = `/api/workflows?sort=${{currentSort}}&order=${{currentOrder}}`
+                    + `${{search ? '&search=' + encodeURIComponent(search) : ''}}`
+                    + `${{cursor ? '&cursor=' + encodeURIComponent(cursor) + '&direction=' + direction : ''}}`;
                 const response = await fetch(url);
                 const data = await response.json();
+                if (!response.ok) {{
+                    // Stale cursor (e.g. from another sort): start over
+                    if (cursor) loadWorkflows();
+                    return;
+                }}
+                nextCursor = data.next_cursor;
+                prevCursor = data.prev_cursor;
                 
                 const tbody = document.getElementById('workflows-table');
                 const pagination = document.getElementById('pagination');
@@ -634,6 +689,7 @@ class DBViewerHandler(BaseHTTPRequestHandler):
                                 <a href="${{workflow.url}}" target="_blank" class="url-link">
                                     ${{workflow.url.length > 50 ? workflow.url.substring(0, 50) + '...' : workflow.url}}
                                 </a>
+                                ${{workflow.snippet ? `<div class="search-snippet">${{workflow.snippet}}</div>` : ''}}
                             </td>
                             <td>
                                 <div style="margin-bottom: 5px;">${{workflow.quality_score.toFixed(1)}}%</div>
@@ -650,28 +706,23 @@ class DBViewerHandler(BaseHTTPRequestHandler):
                     `;
                 }}).join('');
                 
-                // Update pagination
-                if (data.total_pages > 1) {{
-                    let paginationHTML = '';
-                    
-                    if (page > 1) {{
-                        paginationHTML += `<button class="page-btn" onclick="loadWorkflows(${{page-1}}, '${{search}}')">← Previous</button>`;
-                    }}
-                    
-                    for (let i = Math.max(1, page - 2); i <= Math.min(data.total_pages, page + 2); i++) {{
-                        const activeClass = i === page ? 'active' : '';
-                        paginationHTML += `<button class="page-btn ${{activeClass}}" onclick="loadWorkflows(${{i}}, '${{search}}')">${{i}}</button>`;
-                    }}
-                    
-                    if (page < data.total_pages) {{
-                        paginationHTML += `<button class="page-btn" onclick="loadWorkflows(${{page+1}}, '${{search}}')">Next →</button>`;
-                    }}
-                    
-                    pagination.innerHTML = paginationHTML;
-                }} else {{
-                    pagination.innerHTML = '';
+                // Update pagination (keyset: previous/next only, no page numbers)
+                let paginationHTML = '';
+                
+                if (prevCursor) {{
+                    paginationHTML += `<button class="page-btn" onclick="loadWorkflows()">⇤ First</button>`;
+                    paginationHTML += `<button class="page-btn" onclick="loadWorkflows(prevCursor, 'prev')">← Previous</button>`;
                 }}
                 
+                const total = (data.total_exact ? '' : '~') + data.total.toLocaleString();
+                paginationHTML += `<span style="margin: 0 10px; color: #666;">${{data.workflows.length}} shown of ${{total}}</span>`;
+                
+                if (nextCursor) {{
+                    paginationHTML += `<button class="page-btn" onclick="loadWorkflows(nextCursor)">Next →</button>`;
+                }}
+                
+                pagination.innerHTML = paginationHTML;
+                
             }} catch (error) {{
                 console.error('Error loading workflows:', error);
                 document.getElementById('workflows-table').innerHTML = '<tr><td colspan="6" style="text-align: center; padding: 40px; color: #666;">Error loading workflows</td></tr>';
@@ -681,15 +732,13 @@ class DBViewerHandler(BaseHTTPRequestHandler):
         function searchWorkflows() {{
             const search = document.getElementById('search-input').value;
             currentSearch = search;
-            currentPage = 1;
-            loadWorkflows(1, search);
+            loadWorkflows();
         }}
         
         function clearSearch() {{
             document.getElementById('search-input').value = '';
             currentSearch = '';
-            currentPage = 1;
-            loadWorkflows(1);
+            loadWorkflows();
         }}
         
         function sortBy(column) {{
@@ -717,8 +766,7 @@ class DBViewerHandler(BaseHTTPRequestHandler):
             }}
             
             // Reload with new sort
-            currentPage = 1;
-            loadWorkflows(1, currentSearch, currentSort, currentOrder);
+            loadWorkflows();
         }}
         
         // Initial load
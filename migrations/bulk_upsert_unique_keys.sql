@@ -0,0 +1,44 @@
+-- Unique Keys for Bulk Upserts
+-- Purpose: WorkflowRepository.bulk_upsert_workflows writes each table with
+-- INSERT ... ON CONFLICT (...) DO UPDATE, which needs a unique index on the
+-- conflict columns. workflows, workflow_metadata, workflow_structure and
+-- workflow_content are already unique on workflow_id; the tables below are not.
+
+-- =====================================================
+-- 1. Remove duplicates (keep the newest row per key)
+-- =====================================================
+
+DELETE FROM workflow_business_intelligence a
+USING workflow_business_intelligence b
+WHERE a.workflow_id = b.workflow_id AND a.id < b.id;
+
+DELETE FROM workflow_community_data a
+USING workflow_community_data b
+WHERE a.workflow_id = b.workflow_id AND a.id < b.id;
+
+DELETE FROM workflow_technical_details a
+USING workflow_technical_details b
+WHERE a.workflow_id = b.workflow_id AND a.id < b.id;
+
+DELETE FROM workflow_performance_analytics a
+USING workflow_performance_analytics b
+WHERE a.workflow_id = b.workflow_id AND a.id < b.id;
+
+DELETE FROM video_transcripts a
+USING video_transcripts b
+WHERE a.workflow_id = b.workflow_id AND a.video_url = b.video_url AND a.id < b.id;
+
+-- =====================================================
+-- 2. Unique indexes used as ON CONFLICT targets
+-- =====================================================
+
+CREATE UNIQUE INDEX IF NOT EXISTS workflow_business_intelligence_workflow_id_key
+    ON workflow_business_intelligence (workflow_id);
+CREATE UNIQUE INDEX IF NOT EXISTS workflow_community_data_workflow_id_key
+    ON workflow_community_data (workflow_id);
+CREATE UNIQUE INDEX IF NOT EXISTS workflow_technical_details_workflow_id_key
+    ON workflow_technical_details (workflow_id);
+CREATE UNIQUE INDEX IF NOT EXISTS workflow_performance_analytics_workflow_id_key
+    ON workflow_performance_analytics (workflow_id);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_video_transcripts_workflow_video
+    ON video_transcripts (workflow_id, video_url);
@@ -0,0 +1,25 @@
+-- Payload Blob Store
+-- Generated by `python scripts/install_blob_store.py --sql` from
+-- src/storage/blob_store.py; edit the definitions there, not here.
+-- Snapshot payloads move to payload_blobs (zstd, keyed by SHA-256 of the
+-- canonical JSON). Existing payloads are compressed client-side, so move
+-- them with `python scripts/install_blob_store.py` after applying this.
+
+CREATE TABLE IF NOT EXISTS payload_blobs (
+    sha256 CHAR(64) PRIMARY KEY,
+    raw_size INTEGER NOT NULL,
+    data BYTEA NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+ALTER TABLE payload_blobs ALTER COLUMN data SET STORAGE EXTERNAL;
+
+ALTER TABLE workflow_extraction_snapshots
+    ADD COLUMN IF NOT EXISTS payload_sha256 CHAR(64) REFERENCES payload_blobs (sha256);
+
+ALTER TABLE workflow_extraction_snapshots ALTER COLUMN payload DROP NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_extraction_snapshots_payload_sha256
+    ON workflow_extraction_snapshots (payload_sha256);
+
+DROP INDEX IF EXISTS idx_extraction_snapshots_gin;
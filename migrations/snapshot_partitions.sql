@@ -0,0 +1,82 @@
+-- Extraction Snapshot Partitioning and Archives
+-- Generated by `python scripts/maintain_snapshots.py --sql` from
+-- src/storage/snapshot_lifecycle.py; edit the definitions there, not here.
+-- Requires migrations/payload_blobs.sql. Converts workflow_extraction_snapshots
+-- to monthly partitions (rewriting it once) and adds workflow_snapshot_archives.
+
+CREATE TABLE IF NOT EXISTS workflow_snapshot_archives (
+    id SERIAL PRIMARY KEY,
+    workflow_id VARCHAR(50) NOT NULL,
+    layer VARCHAR(20) NOT NULL,
+    first_created_at TIMESTAMP NOT NULL,
+    last_created_at TIMESTAMP NOT NULL,
+    snapshot_count INTEGER NOT NULL,
+    archive_sha256 CHAR(64) NOT NULL REFERENCES payload_blobs (sha256),
+    created_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_snapshot_archives_workflow
+    ON workflow_snapshot_archives (workflow_id, layer, first_created_at);
+
+CREATE OR REPLACE FUNCTION workflow_extraction_snapshots_add_partitions(p_from DATE, p_months_ahead INTEGER)
+RETURNS INTEGER AS $$
+DECLARE
+    v_month DATE;
+    v_name TEXT;
+    v_created INTEGER := 0;
+BEGIN
+    FOR v_month IN
+        SELECT generate_series(
+            date_trunc('month', p_from),
+            date_trunc('month', NOW()) + make_interval(months => p_months_ahead),
+            INTERVAL '1 month'
+        )::date
+    LOOP
+        v_name := 'workflow_extraction_snapshots_' || to_char(v_month, 'YYYY_MM');
+        IF to_regclass(v_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF workflow_extraction_snapshots FOR VALUES FROM (%L) TO (%L)',
+                v_name, v_month, (v_month + INTERVAL '1 month')::date
+            );
+            v_created := v_created + 1;
+        END IF;
+    END LOOP;
+    RETURN v_created;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = 'workflow_extraction_snapshots'::regclass) = 'p' THEN
+        RETURN;
+    END IF;
+    LOCK TABLE workflow_extraction_snapshots IN EXCLUSIVE MODE;
+    ALTER TABLE workflow_extraction_snapshots RENAME TO workflow_extraction_snapshots_unpartitioned;
+    ALTER SEQUENCE workflow_extraction_snapshots_id_seq OWNED BY NONE;
+    CREATE TABLE workflow_extraction_snapshots (
+        id BIGINT NOT NULL DEFAULT nextval('workflow_extraction_snapshots_id_seq'),
+        workflow_id VARCHAR(50) REFERENCES workflows (workflow_id),
+        layer VARCHAR(20) NOT NULL,
+        payload JSONB,
+        payload_sha256 CHAR(64) REFERENCES payload_blobs (sha256),
+        created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+        PRIMARY KEY (id, created_at)
+    ) PARTITION BY RANGE (created_at);
+    ALTER SEQUENCE workflow_extraction_snapshots_id_seq OWNED BY workflow_extraction_snapshots.id;
+    CREATE TABLE workflow_extraction_snapshots_default PARTITION OF workflow_extraction_snapshots DEFAULT;
+    PERFORM workflow_extraction_snapshots_add_partitions(
+        COALESCE((SELECT MIN(created_at) FROM workflow_extraction_snapshots_unpartitioned), NOW())::date,
+        2
+    );
+    INSERT INTO workflow_extraction_snapshots (id, workflow_id, layer, payload, payload_sha256, created_at)
+    SELECT id, workflow_id, layer, payload, payload_sha256, COALESCE(created_at, NOW())
+    FROM workflow_extraction_snapshots_unpartitioned;
+    DROP TABLE workflow_extraction_snapshots_unpartitioned;
+END;
+$$;
+
+CREATE INDEX IF NOT EXISTS idx_extraction_snapshots_workflow_layer
+    ON workflow_extraction_snapshots (workflow_id, layer, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_extraction_snapshots_payload_sha256
+    ON workflow_extraction_snapshots (payload_sha256);
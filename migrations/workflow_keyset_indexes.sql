@@ -0,0 +1,20 @@
+-- Workflow Listing Keyset Indexes
+-- Generated by `python scripts/install_keyset_indexes.py --sql` from
+-- src/storage/pagination.py; edit SORT_KEYS there, not here.
+-- Each index matches one viewer sort so a page is a single index range scan.
+
+CREATE INDEX IF NOT EXISTS idx_workflows_keyset_workflow_id ON workflows ((LENGTH(workflow_id)), workflow_id);
+
+CREATE INDEX IF NOT EXISTS idx_workflows_keyset_url ON workflows ((url), workflow_id);
+
+CREATE INDEX IF NOT EXISTS idx_workflows_keyset_quality_score ON workflows ((COALESCE(quality_score, -1)), workflow_id);
+
+CREATE INDEX IF NOT EXISTS idx_workflows_keyset_processing_time ON workflows ((COALESCE(processing_time, -1)), workflow_id);
+
+CREATE INDEX IF NOT EXISTS idx_workflows_keyset_created_at ON workflows ((COALESCE(created_at, '0001-01-01')), workflow_id);
+
+CREATE INDEX IF NOT EXISTS idx_workflows_keyset_extracted_at ON workflows ((COALESCE(extracted_at, '0001-01-01')), workflow_id);
+
+CREATE INDEX IF NOT EXISTS idx_workflows_keyset_last_scraped_at ON workflows ((COALESCE(last_scraped_at, '0001-01-01')), workflow_id);
+
+CREATE INDEX IF NOT EXISTS idx_workflows_keyset_scraping_status ON workflows ((CASE WHEN layer1_success AND layer2_success AND layer3_success THEN 4 WHEN layer1_success OR layer2_success OR layer3_success THEN 3 WHEN last_scraped_at IS NOT NULL THEN 2 ELSE 1 END), workflow_id);
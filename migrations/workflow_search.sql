@@ -0,0 +1,186 @@
+-- Workflow Full-Text Search
+-- Generated by `python scripts/install_workflow_search.py --sql` from
+-- src/storage/search.py; edit the search document there, not here.
+-- Weighted tsvector per workflow (title A, description B, use case C,
+-- explainer/transcripts D) behind a GIN index, re-indexed by statement
+-- triggers once per workflow a write touched.
+
+CREATE TABLE IF NOT EXISTS workflow_search (
+    workflow_id VARCHAR(50) PRIMARY KEY,
+    search_vector TSVECTOR NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_workflow_search_vector
+    ON workflow_search USING GIN (search_vector);
+
+DROP TRIGGER IF EXISTS workflow_search_workflow_metadata ON workflow_metadata;
+
+DROP TRIGGER IF EXISTS workflow_search_workflow_content ON workflow_content;
+
+DROP TRIGGER IF EXISTS workflow_search_video_transcripts ON video_transcripts;
+
+DROP FUNCTION IF EXISTS workflow_search_on_change();
+
+DROP FUNCTION IF EXISTS workflow_search_refresh(VARCHAR);
+
+CREATE OR REPLACE FUNCTION workflow_search_refresh(p_workflow_ids VARCHAR[]) RETURNS void AS $$
+BEGIN
+    DELETE FROM workflow_search s WHERE s.workflow_id = ANY(p_workflow_ids)
+        AND NOT EXISTS (SELECT 1 FROM workflows w WHERE w.workflow_id = s.workflow_id);
+    INSERT INTO workflow_search (workflow_id, search_vector)
+    SELECT w.workflow_id,
+           setweight(to_tsvector('english', coalesce(m.title, '')), 'A') ||
+           setweight(to_tsvector('english', coalesce(m.description, '')), 'B') ||
+           setweight(to_tsvector('english', coalesce(m.use_case, '')), 'C') ||
+           setweight(to_tsvector('english', coalesce(c.explainer_text, '')), 'D') ||
+           setweight(to_tsvector('english', coalesce(left(t.transcripts, 100000), '')), 'D')
+    FROM workflows w
+    LEFT JOIN workflow_metadata m ON m.workflow_id = w.workflow_id
+    LEFT JOIN workflow_content c ON c.workflow_id = w.workflow_id
+    LEFT JOIN LATERAL (
+        SELECT string_agg(transcript_text, ' ') AS transcripts
+        FROM video_transcripts v
+        WHERE v.workflow_id = w.workflow_id
+    ) t ON true
+    WHERE w.workflow_id = ANY(p_workflow_ids)
+    ON CONFLICT (workflow_id) DO UPDATE SET search_vector = EXCLUDED.search_vector;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION workflow_search_after_insert() RETURNS trigger AS $$
+BEGIN
+    PERFORM workflow_search_refresh(ARRAY(
+        SELECT DISTINCT workflow_id FROM new_rows
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION workflow_search_after_delete() RETURNS trigger AS $$
+BEGIN
+    PERFORM workflow_search_refresh(ARRAY(
+        SELECT DISTINCT workflow_id FROM old_rows
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION workflow_search_after_workflow_metadata_update() RETURNS trigger AS $$
+BEGIN
+    PERFORM workflow_search_refresh(ARRAY(
+        SELECT DISTINCT workflow_id FROM (
+            (SELECT workflow_id, title, description, use_case FROM new_rows EXCEPT SELECT workflow_id, title, description, use_case FROM old_rows)
+            UNION ALL
+            (SELECT workflow_id, title, description, use_case FROM old_rows EXCEPT SELECT workflow_id, title, description, use_case FROM new_rows)
+        ) changed
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS workflow_search_workflow_metadata_insert ON workflow_metadata;
+
+CREATE TRIGGER workflow_search_workflow_metadata_insert
+    AFTER INSERT ON workflow_metadata
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION workflow_search_after_insert();
+
+DROP TRIGGER IF EXISTS workflow_search_workflow_metadata_update ON workflow_metadata;
+
+CREATE TRIGGER workflow_search_workflow_metadata_update
+    AFTER UPDATE ON workflow_metadata
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION workflow_search_after_workflow_metadata_update();
+
+DROP TRIGGER IF EXISTS workflow_search_workflow_metadata_delete ON workflow_metadata;
+
+CREATE TRIGGER workflow_search_workflow_metadata_delete
+    AFTER DELETE ON workflow_metadata
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION workflow_search_after_delete();
+
+CREATE OR REPLACE FUNCTION workflow_search_after_workflow_content_update() RETURNS trigger AS $$
+BEGIN
+    PERFORM workflow_search_refresh(ARRAY(
+        SELECT DISTINCT workflow_id FROM (
+            (SELECT workflow_id, explainer_text FROM new_rows EXCEPT SELECT workflow_id, explainer_text FROM old_rows)
+            UNION ALL
+            (SELECT workflow_id, explainer_text FROM old_rows EXCEPT SELECT workflow_id, explainer_text FROM new_rows)
+        ) changed
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS workflow_search_workflow_content_insert ON workflow_content;
+
+CREATE TRIGGER workflow_search_workflow_content_insert
+    AFTER INSERT ON workflow_content
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION workflow_search_after_insert();
+
+DROP TRIGGER IF EXISTS workflow_search_workflow_content_update ON workflow_content;
+
+CREATE TRIGGER workflow_search_workflow_content_update
+    AFTER UPDATE ON workflow_content
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION workflow_search_after_workflow_content_update();
+
+DROP TRIGGER IF EXISTS workflow_search_workflow_content_delete ON workflow_content;
+
+CREATE TRIGGER workflow_search_workflow_content_delete
+    AFTER DELETE ON workflow_content
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION workflow_search_after_delete();
+
+CREATE OR REPLACE FUNCTION workflow_search_after_video_transcripts_update() RETURNS trigger AS $$
+BEGIN
+    PERFORM workflow_search_refresh(ARRAY(
+        SELECT DISTINCT workflow_id FROM (
+            (SELECT workflow_id, transcript_text FROM new_rows EXCEPT SELECT workflow_id, transcript_text FROM old_rows)
+            UNION ALL
+            (SELECT workflow_id, transcript_text FROM old_rows EXCEPT SELECT workflow_id, transcript_text FROM new_rows)
+        ) changed
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS workflow_search_video_transcripts_insert ON video_transcripts;
+
+CREATE TRIGGER workflow_search_video_transcripts_insert
+    AFTER INSERT ON video_transcripts
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION workflow_search_after_insert();
+
+DROP TRIGGER IF EXISTS workflow_search_video_transcripts_update ON video_transcripts;
+
+CREATE TRIGGER workflow_search_video_transcripts_update
+    AFTER UPDATE ON video_transcripts
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION workflow_search_after_video_transcripts_update();
+
+DROP TRIGGER IF EXISTS workflow_search_video_transcripts_delete ON video_transcripts;
+
+CREATE TRIGGER workflow_search_video_transcripts_delete
+    AFTER DELETE ON video_transcripts
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION workflow_search_after_delete();
+
+-- Backfill
+TRUNCATE workflow_search;
+INSERT INTO workflow_search (workflow_id, search_vector)
+    SELECT w.workflow_id,
+           setweight(to_tsvector('english', coalesce(m.title, '')), 'A') ||
+           setweight(to_tsvector('english', coalesce(m.description, '')), 'B') ||
+           setweight(to_tsvector('english', coalesce(m.use_case, '')), 'C') ||
+           setweight(to_tsvector('english', coalesce(c.explainer_text, '')), 'D') ||
+           setweight(to_tsvector('english', coalesce(left(t.transcripts, 100000), '')), 'D')
+    FROM workflows w
+    LEFT JOIN workflow_metadata m ON m.workflow_id = w.workflow_id
+    LEFT JOIN workflow_content c ON c.workflow_id = w.workflow_id
+    LEFT JOIN LATERAL (
+        SELECT string_agg(transcript_text, ' ') AS transcripts
+        FROM video_transcripts v
+        WHERE v.workflow_id = w.workflow_id
+    ) t ON true;
@@ -0,0 +1,343 @@
+-- Workflow Statistics Summary
+-- Generated by `python scripts/install_workflow_stats.py --sql` from
+-- src/storage/workflow_stats.py; edit the counters there, not here.
+-- Statement-level triggers keep workflow_stats in step with workflows so
+-- statistics are read from at most 16 rows instead of counting the catalog.
+
+CREATE TABLE IF NOT EXISTS workflow_stats (
+    slot SMALLINT PRIMARY KEY,
+    total_workflows BIGINT NOT NULL DEFAULT 0,
+    layer1_success_count BIGINT NOT NULL DEFAULT 0,
+    layer2_success_count BIGINT NOT NULL DEFAULT 0,
+    layer3_success_count BIGINT NOT NULL DEFAULT 0,
+    layer4_success_count BIGINT NOT NULL DEFAULT 0,
+    layer5_success_count BIGINT NOT NULL DEFAULT 0,
+    layer6_success_count BIGINT NOT NULL DEFAULT 0,
+    layer7_success_count BIGINT NOT NULL DEFAULT 0,
+    fully_successful BIGINT NOT NULL DEFAULT 0,
+    partial_success BIGINT NOT NULL DEFAULT 0,
+    with_errors BIGINT NOT NULL DEFAULT 0,
+    failed BIGINT NOT NULL DEFAULT 0,
+    invalid BIGINT NOT NULL DEFAULT 0,
+    pending BIGINT NOT NULL DEFAULT 0,
+    quality_score_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    quality_score_count BIGINT NOT NULL DEFAULT 0,
+    processing_time_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    processing_time_count BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE OR REPLACE FUNCTION workflow_stats_after_insert() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO workflow_stats (slot, total_workflows, layer1_success_count, layer2_success_count, layer3_success_count, layer4_success_count, layer5_success_count, layer6_success_count, layer7_success_count, fully_successful, partial_success, with_errors, failed, invalid, pending, quality_score_sum, quality_score_count, processing_time_sum, processing_time_count)
+    SELECT pg_backend_pid() % 16,
+        new_rows_totals.total_workflows,
+        new_rows_totals.layer1_success_count,
+        new_rows_totals.layer2_success_count,
+        new_rows_totals.layer3_success_count,
+        new_rows_totals.layer4_success_count,
+        new_rows_totals.layer5_success_count,
+        new_rows_totals.layer6_success_count,
+        new_rows_totals.layer7_success_count,
+        new_rows_totals.fully_successful,
+        new_rows_totals.partial_success,
+        new_rows_totals.with_errors,
+        new_rows_totals.failed,
+        new_rows_totals.invalid,
+        new_rows_totals.pending,
+        new_rows_totals.quality_score_sum,
+        new_rows_totals.quality_score_count,
+        new_rows_totals.processing_time_sum,
+        new_rows_totals.processing_time_count
+    FROM (SELECT
+            COUNT(*) AS total_workflows,
+            COUNT(*) FILTER (WHERE layer1_success) AS layer1_success_count,
+            COUNT(*) FILTER (WHERE layer2_success) AS layer2_success_count,
+            COUNT(*) FILTER (WHERE layer3_success) AS layer3_success_count,
+            COUNT(*) FILTER (WHERE layer4_success) AS layer4_success_count,
+            COUNT(*) FILTER (WHERE layer5_success) AS layer5_success_count,
+            COUNT(*) FILTER (WHERE layer6_success) AS layer6_success_count,
+            COUNT(*) FILTER (WHERE layer7_success) AS layer7_success_count,
+            COUNT(*) FILTER (WHERE layer1_success AND layer2_success AND layer3_success) AS fully_successful,
+            COUNT(*) FILTER (WHERE NOT (layer1_success AND layer2_success AND layer3_success) AND (layer1_success OR layer2_success OR layer3_success)) AS partial_success,
+            COUNT(*) FILTER (WHERE error_message IS NOT NULL) AS with_errors,
+            COUNT(*) FILTER (WHERE error_message IS NOT NULL AND NOT (error_message LIKE '%404%' OR error_message LIKE '%no iframe%' OR error_message LIKE '%no content%')) AS failed,
+            COUNT(*) FILTER (WHERE error_message IS NOT NULL AND (error_message LIKE '%404%' OR error_message LIKE '%no iframe%' OR error_message LIKE '%no content%' OR error_message LIKE '%empty%' OR quality_score = 0)) AS invalid,
+            COUNT(*) FILTER (WHERE extracted_at IS NULL OR (layer1_success = false AND layer2_success = false AND layer3_success = false AND error_message IS NULL)) AS pending,
+            COALESCE(SUM(quality_score), 0) AS quality_score_sum,
+            COUNT(quality_score) AS quality_score_count,
+            COALESCE(SUM(processing_time), 0) AS processing_time_sum,
+            COUNT(processing_time) AS processing_time_count
+        FROM new_rows) AS new_rows_totals
+    WHERE (
+        new_rows_totals.total_workflows,
+        new_rows_totals.layer1_success_count,
+        new_rows_totals.layer2_success_count,
+        new_rows_totals.layer3_success_count,
+        new_rows_totals.layer4_success_count,
+        new_rows_totals.layer5_success_count,
+        new_rows_totals.layer6_success_count,
+        new_rows_totals.layer7_success_count,
+        new_rows_totals.fully_successful,
+        new_rows_totals.partial_success,
+        new_rows_totals.with_errors,
+        new_rows_totals.failed,
+        new_rows_totals.invalid,
+        new_rows_totals.pending,
+        new_rows_totals.quality_score_sum,
+        new_rows_totals.quality_score_count,
+        new_rows_totals.processing_time_sum,
+        new_rows_totals.processing_time_count
+    ) IS DISTINCT FROM (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+    ON CONFLICT (slot) DO UPDATE SET
+        total_workflows = workflow_stats.total_workflows + EXCLUDED.total_workflows,
+        layer1_success_count = workflow_stats.layer1_success_count + EXCLUDED.layer1_success_count,
+        layer2_success_count = workflow_stats.layer2_success_count + EXCLUDED.layer2_success_count,
+        layer3_success_count = workflow_stats.layer3_success_count + EXCLUDED.layer3_success_count,
+        layer4_success_count = workflow_stats.layer4_success_count + EXCLUDED.layer4_success_count,
+        layer5_success_count = workflow_stats.layer5_success_count + EXCLUDED.layer5_success_count,
+        layer6_success_count = workflow_stats.layer6_success_count + EXCLUDED.layer6_success_count,
+        layer7_success_count = workflow_stats.layer7_success_count + EXCLUDED.layer7_success_count,
+        fully_successful = workflow_stats.fully_successful + EXCLUDED.fully_successful,
+        partial_success = workflow_stats.partial_success + EXCLUDED.partial_success,
+        with_errors = workflow_stats.with_errors + EXCLUDED.with_errors,
+        failed = workflow_stats.failed + EXCLUDED.failed,
+        invalid = workflow_stats.invalid + EXCLUDED.invalid,
+        pending = workflow_stats.pending + EXCLUDED.pending,
+        quality_score_sum = workflow_stats.quality_score_sum + EXCLUDED.quality_score_sum,
+        quality_score_count = workflow_stats.quality_score_count + EXCLUDED.quality_score_count,
+        processing_time_sum = workflow_stats.processing_time_sum + EXCLUDED.processing_time_sum,
+        processing_time_count = workflow_stats.processing_time_count + EXCLUDED.processing_time_count;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS workflow_stats_insert ON workflows;
+
+CREATE TRIGGER workflow_stats_insert
+    AFTER INSERT ON workflows
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION workflow_stats_after_insert();
+
+CREATE OR REPLACE FUNCTION workflow_stats_after_update() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO workflow_stats (slot, total_workflows, layer1_success_count, layer2_success_count, layer3_success_count, layer4_success_count, layer5_success_count, layer6_success_count, layer7_success_count, fully_successful, partial_success, with_errors, failed, invalid, pending, quality_score_sum, quality_score_count, processing_time_sum, processing_time_count)
+    SELECT pg_backend_pid() % 16,
+        new_rows_totals.total_workflows - old_rows_totals.total_workflows,
+        new_rows_totals.layer1_success_count - old_rows_totals.layer1_success_count,
+        new_rows_totals.layer2_success_count - old_rows_totals.layer2_success_count,
+        new_rows_totals.layer3_success_count - old_rows_totals.layer3_success_count,
+        new_rows_totals.layer4_success_count - old_rows_totals.layer4_success_count,
+        new_rows_totals.layer5_success_count - old_rows_totals.layer5_success_count,
+        new_rows_totals.layer6_success_count - old_rows_totals.layer6_success_count,
+        new_rows_totals.layer7_success_count - old_rows_totals.layer7_success_count,
+        new_rows_totals.fully_successful - old_rows_totals.fully_successful,
+        new_rows_totals.partial_success - old_rows_totals.partial_success,
+        new_rows_totals.with_errors - old_rows_totals.with_errors,
+        new_rows_totals.failed - old_rows_totals.failed,
+        new_rows_totals.invalid - old_rows_totals.invalid,
+        new_rows_totals.pending - old_rows_totals.pending,
+        new_rows_totals.quality_score_sum - old_rows_totals.quality_score_sum,
+        new_rows_totals.quality_score_count - old_rows_totals.quality_score_count,
+        new_rows_totals.processing_time_sum - old_rows_totals.processing_time_sum,
+        new_rows_totals.processing_time_count - old_rows_totals.processing_time_count
+    FROM (SELECT
+            COUNT(*) AS total_workflows,
+            COUNT(*) FILTER (WHERE layer1_success) AS layer1_success_count,
+            COUNT(*) FILTER (WHERE layer2_success) AS layer2_success_count,
+            COUNT(*) FILTER (WHERE layer3_success) AS layer3_success_count,
+            COUNT(*) FILTER (WHERE layer4_success) AS layer4_success_count,
+            COUNT(*) FILTER (WHERE layer5_success) AS layer5_success_count,
+            COUNT(*) FILTER (WHERE layer6_success) AS layer6_success_count,
+            COUNT(*) FILTER (WHERE layer7_success) AS layer7_success_count,
+            COUNT(*) FILTER (WHERE layer1_success AND layer2_success AND layer3_success) AS fully_successful,
+            COUNT(*) FILTER (WHERE NOT (layer1_success AND layer2_success AND layer3_success) AND (layer1_success OR layer2_success OR layer3_success)) AS partial_success,
+            COUNT(*) FILTER (WHERE error_message IS NOT NULL) AS with_errors,
+            COUNT(*) FILTER (WHERE error_message IS NOT NULL AND NOT (error_message LIKE '%404%' OR error_message LIKE '%no iframe%' OR error_message LIKE '%no content%')) AS failed,
+            COUNT(*) FILTER (WHERE error_message IS NOT NULL AND (error_message LIKE '%404%' OR error_message LIKE '%no iframe%' OR error_message LIKE '%no content%' OR error_message LIKE '%empty%' OR quality_score = 0)) AS invalid,
+            COUNT(*) FILTER (WHERE extracted_at IS NULL OR (layer1_success = false AND layer2_success = false AND layer3_success = false AND error_message IS NULL)) AS pending,
+            COALESCE(SUM(quality_score), 0) AS quality_score_sum,
+            COUNT(quality_score) AS quality_score_count,
+            COALESCE(SUM(processing_time), 0) AS processing_time_sum,
+            COUNT(processing_time) AS processing_time_count
+        FROM new_rows) AS new_rows_totals,
+        (SELECT
+            COUNT(*) AS total_workflows,
+            COUNT(*) FILTER (WHERE layer1_success) AS layer1_success_count,
+            COUNT(*) FILTER (WHERE layer2_success) AS layer2_success_count,
+            COUNT(*) FILTER (WHERE layer3_success) AS layer3_success_count,
+            COUNT(*) FILTER (WHERE layer4_success) AS layer4_success_count,
+            COUNT(*) FILTER (WHERE layer5_success) AS layer5_success_count,
+            COUNT(*) FILTER (WHERE layer6_success) AS layer6_success_count,
+            COUNT(*) FILTER (WHERE layer7_success) AS layer7_success_count,
+            COUNT(*) FILTER (WHERE layer1_success AND layer2_success AND layer3_success) AS fully_successful,
+            COUNT(*) FILTER (WHERE NOT (layer1_success AND layer2_success AND layer3_success) AND (layer1_success OR layer2_success OR layer3_success)) AS partial_success,
+            COUNT(*) FILTER (WHERE error_message IS NOT NULL) AS with_errors,
+            COUNT(*) FILTER (WHERE error_message IS NOT NULL AND NOT (error_message LIKE '%404%' OR error_message LIKE '%no iframe%' OR error_message LIKE '%no content%')) AS failed,
+            COUNT(*) FILTER (WHERE error_message IS NOT NULL AND (error_message LIKE '%404%' OR error_message LIKE '%no iframe%' OR error_message LIKE '%no content%' OR error_message LIKE '%empty%' OR quality_score = 0)) AS invalid,
+            COUNT(*) FILTER (WHERE extracted_at IS NULL OR (layer1_success = false AND layer2_success = false AND layer3_success = false AND error_message IS NULL)) AS pending,
+            COALESCE(SUM(quality_score), 0) AS quality_score_sum,
+            COUNT(quality_score) AS quality_score_count,
+            COALESCE(SUM(processing_time), 0) AS processing_time_sum,
+            COUNT(processing_time) AS processing_time_count
+        FROM old_rows) AS old_rows_totals
+    WHERE (
+        new_rows_totals.total_workflows - old_rows_totals.total_workflows,
+        new_rows_totals.layer1_success_count - old_rows_totals.layer1_success_count,
+        new_rows_totals.layer2_success_count - old_rows_totals.layer2_success_count,
+        new_rows_totals.layer3_success_count - old_rows_totals.layer3_success_count,
+        new_rows_totals.layer4_success_count - old_rows_totals.layer4_success_count,
+        new_rows_totals.layer5_success_count - old_rows_totals.layer5_success_count,
+        new_rows_totals.layer6_success_count - old_rows_totals.layer6_success_count,
+        new_rows_totals.layer7_success_count - old_rows_totals.layer7_success_count,
+        new_rows_totals.fully_successful - old_rows_totals.fully_successful,
+        new_rows_totals.partial_success - old_rows_totals.partial_success,
+        new_rows_totals.with_errors - old_rows_totals.with_errors,
+        new_rows_totals.failed - old_rows_totals.failed,
+        new_rows_totals.invalid - old_rows_totals.invalid,
+        new_rows_totals.pending - old_rows_totals.pending,
+        new_rows_totals.quality_score_sum - old_rows_totals.quality_score_sum,
+        new_rows_totals.quality_score_count - old_rows_totals.quality_score_count,
+        new_rows_totals.processing_time_sum - old_rows_totals.processing_time_sum,
+        new_rows_totals.processing_time_count - old_rows_totals.processing_time_count
+    ) IS DISTINCT FROM (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+    ON CONFLICT (slot) DO UPDATE SET
+        total_workflows = workflow_stats.total_workflows + EXCLUDED.total_workflows,
+        layer1_success_count = workflow_stats.layer1_success_count + EXCLUDED.layer1_success_count,
+        layer2_success_count = workflow_stats.layer2_success_count + EXCLUDED.layer2_success_count,
+        layer3_success_count = workflow_stats.layer3_success_count + EXCLUDED.layer3_success_count,
+        layer4_success_count = workflow_stats.layer4_success_count + EXCLUDED.layer4_success_count,
+        layer5_success_count = workflow_stats.layer5_success_count + EXCLUDED.layer5_success_count,
+        layer6_success_count = workflow_stats.layer6_success_count + EXCLUDED.layer6_success_count,
+        layer7_success_count = workflow_stats.layer7_success_count + EXCLUDED.layer7_success_count,
+        fully_successful = workflow_stats.fully_successful + EXCLUDED.fully_successful,
+        partial_success = workflow_stats.partial_success + EXCLUDED.partial_success,
+        with_errors = workflow_stats.with_errors + EXCLUDED.with_errors,
+        failed = workflow_stats.failed + EXCLUDED.failed,
+        invalid = workflow_stats.invalid + EXCLUDED.invalid,
+        pending = workflow_stats.pending + EXCLUDED.pending,
+        quality_score_sum = workflow_stats.quality_score_sum + EXCLUDED.quality_score_sum,
+        quality_score_count = workflow_stats.quality_score_count + EXCLUDED.quality_score_count,
+        processing_time_sum = workflow_stats.processing_time_sum + EXCLUDED.processing_time_sum,
+        processing_time_count = workflow_stats.processing_time_count + EXCLUDED.processing_time_count;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS workflow_stats_update ON workflows;
+
+CREATE TRIGGER workflow_stats_update
+    AFTER UPDATE ON workflows
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION workflow_stats_after_update();
+
+CREATE OR REPLACE FUNCTION workflow_stats_after_delete() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO workflow_stats (slot, total_workflows, layer1_success_count, layer2_success_count, layer3_success_count, layer4_success_count, layer5_success_count, layer6_success_count, layer7_success_count, fully_successful, partial_success, with_errors, failed, invalid, pending, quality_score_sum, quality_score_count, processing_time_sum, processing_time_count)
+    SELECT pg_backend_pid() % 16,
+        - old_rows_totals.total_workflows,
+        - old_rows_totals.layer1_success_count,
+        - old_rows_totals.layer2_success_count,
+        - old_rows_totals.layer3_success_count,
+        - old_rows_totals.layer4_success_count,
+        - old_rows_totals.layer5_success_count,
+        - old_rows_totals.layer6_success_count,
+        - old_rows_totals.layer7_success_count,
+        - old_rows_totals.fully_successful,
+        - old_rows_totals.partial_success,
+        - old_rows_totals.with_errors,
+        - old_rows_totals.failed,
+        - old_rows_totals.invalid,
+        - old_rows_totals.pending,
+        - old_rows_totals.quality_score_sum,
+        - old_rows_totals.quality_score_count,
+        - old_rows_totals.processing_time_sum,
+        - old_rows_totals.processing_time_count
+    FROM (SELECT
+            COUNT(*) AS total_workflows,
+            COUNT(*) FILTER (WHERE layer1_success) AS layer1_success_count,
+            COUNT(*) FILTER (WHERE layer2_success) AS layer2_success_count,
+            COUNT(*) FILTER (WHERE layer3_success) AS layer3_success_count,
+            COUNT(*) FILTER (WHERE layer4_success) AS layer4_success_count,
+            COUNT(*) FILTER (WHERE layer5_success) AS layer5_success_count,
+            COUNT(*) FILTER (WHERE layer6_success) AS layer6_success_count,
+            COUNT(*) FILTER (WHERE layer7_success) AS layer7_success_count,
+            COUNT(*) FILTER (WHERE layer1_success AND layer2_success AND layer3_success) AS fully_successful,
+            COUNT(*) FILTER (WHERE NOT (layer1_success AND layer2_success AND layer3_success) AND (layer1_success OR layer2_success OR layer3_success)) AS partial_success,
+            COUNT(*) FILTER (WHERE error_message IS NOT NULL) AS with_errors,
+            COUNT(*) FILTER (WHERE error_message IS NOT NULL AND NOT (error_message LIKE '%404%' OR error_message LIKE '%no iframe%' OR error_message LIKE '%no content%')) AS failed,
+            COUNT(*) FILTER (WHERE error_message IS NOT NULL AND (error_message LIKE '%404%' OR error_message LIKE '%no iframe%' OR error_message LIKE '%no content%' OR error_message LIKE '%empty%' OR quality_score = 0)) AS invalid,
+            COUNT(*) FILTER (WHERE extracted_at IS NULL OR (layer1_success = false AND layer2_success = false AND layer3_success = false AND error_message IS NULL)) AS pending,
+            COALESCE(SUM(quality_score), 0) AS quality_score_sum,
+            COUNT(quality_score) AS quality_score_count,
+            COALESCE(SUM(processing_time), 0) AS processing_time_sum,
+            COUNT(processing_time) AS processing_time_count
+        FROM old_rows) AS old_rows_totals
+    WHERE (
+        - old_rows_totals.total_workflows,
+        - old_rows_totals.layer1_success_count,
+        - old_rows_totals.layer2_success_count,
+        - old_rows_totals.layer3_success_count,
+        - old_rows_totals.layer4_success_count,
+        - old_rows_totals.layer5_success_count,
+        - old_rows_totals.layer6_success_count,
+        - old_rows_totals.layer7_success_count,
+        - old_rows_totals.fully_successful,
+        - old_rows_totals.partial_success,
+        - old_rows_totals.with_errors,
+        - old_rows_totals.failed,
+        - old_rows_totals.invalid,
+        - old_rows_totals.pending,
+        - old_rows_totals.quality_score_sum,
+        - old_rows_totals.quality_score_count,
+        - old_rows_totals.processing_time_sum,
+        - old_rows_totals.processing_time_count
+    ) IS DISTINCT FROM (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+    ON CONFLICT (slot) DO UPDATE SET
+        total_workflows = workflow_stats.total_workflows + EXCLUDED.total_workflows,
+        layer1_success_count = workflow_stats.layer1_success_count + EXCLUDED.layer1_success_count,
+        layer2_success_count = workflow_stats.layer2_success_count + EXCLUDED.layer2_success_count,
+        layer3_success_count = workflow_stats.layer3_success_count + EXCLUDED.layer3_success_count,
+        layer4_success_count = workflow_stats.layer4_success_count + EXCLUDED.layer4_success_count,
+        layer5_success_count = workflow_stats.layer5_success_count + EXCLUDED.layer5_success_count,
+        layer6_success_count = workflow_stats.layer6_success_count + EXCLUDED.layer6_success_count,
+        layer7_success_count = workflow_stats.layer7_success_count + EXCLUDED.layer7_success_count,
+        fully_successful = workflow_stats.fully_successful + EXCLUDED.fully_successful,
+        partial_success = workflow_stats.partial_success + EXCLUDED.partial_success,
+        with_errors = workflow_stats.with_errors + EXCLUDED.with_errors,
+        failed = workflow_stats.failed + EXCLUDED.failed,
+        invalid = workflow_stats.invalid + EXCLUDED.invalid,
+        pending = workflow_stats.pending + EXCLUDED.pending,
+        quality_score_sum = workflow_stats.quality_score_sum + EXCLUDED.quality_score_sum,
+        quality_score_count = workflow_stats.quality_score_count + EXCLUDED.quality_score_count,
+        processing_time_sum = workflow_stats.processing_time_sum + EXCLUDED.processing_time_sum,
+        processing_time_count = workflow_stats.processing_time_count + EXCLUDED.processing_time_count;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS workflow_stats_delete ON workflows;
+
+CREATE TRIGGER workflow_stats_delete
+    AFTER DELETE ON workflows
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION workflow_stats_after_delete();
+
+CREATE OR REPLACE FUNCTION workflow_stats_after_truncate() RETURNS trigger AS $$
+BEGIN
+    DELETE FROM workflow_stats;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS workflow_stats_truncate ON workflows;
+
+CREATE TRIGGER workflow_stats_truncate
+    AFTER TRUNCATE ON workflows
+    FOR EACH STATEMENT EXECUTE FUNCTION workflow_stats_after_truncate();
+
+-- Backfill (blocks workflow writes while counting)
+BEGIN;
+LOCK TABLE workflows IN SHARE MODE;
+DELETE FROM workflow_stats;
+INSERT INTO workflow_stats (slot, total_workflows, layer1_success_count, layer2_success_count, layer3_success_count, layer4_success_count, layer5_success_count, layer6_success_count, layer7_success_count, fully_successful, partial_success, with_errors, failed, invalid, pending, quality_score_sum, quality_score_count, processing_time_sum, processing_time_count) SELECT 0, total_workflows, layer1_success_count, layer2_success_count, layer3_success_count, layer4_success_count, layer5_success_count, layer6_success_count, layer7_success_count, fully_successful, partial_success, with_errors, failed, invalid, pending, quality_score_sum, quality_score_count, processing_time_sum, processing_time_count FROM (SELECT COUNT(*) AS total_workflows, COUNT(*) FILTER (WHERE layer1_success) AS layer1_success_count, COUNT(*) FILTER (WHERE layer2_success) AS layer2_success_count, COUNT(*) FILTER (WHERE layer3_success) AS layer3_success_count, COUNT(*) FILTER (WHERE layer4_success) AS layer4_success_count, COUNT(*) FILTER (WHERE layer5_success) AS layer5_success_count, COUNT(*) FILTER (WHERE layer6_success) AS layer6_success_count, COUNT(*) FILTER (WHERE layer7_success) AS layer7_success_count, COUNT(*) FILTER (WHERE layer1_success AND layer2_success AND layer3_success) AS fully_successful, COUNT(*) FILTER (WHERE NOT (layer1_success AND layer2_success AND layer3_success) AND (layer1_success OR layer2_success OR layer3_success)) AS partial_success, COUNT(*) FILTER (WHERE error_message IS NOT NULL) AS with_errors, COUNT(*) FILTER (WHERE error_message IS NOT NULL AND NOT (error_message LIKE '%404%' OR error_message LIKE '%no iframe%' OR error_message LIKE '%no content%')) AS failed, COUNT(*) FILTER (WHERE error_message IS NOT NULL AND (error_message LIKE '%404%' OR error_message LIKE '%no iframe%' OR error_message LIKE '%no content%' OR error_message LIKE '%empty%' OR quality_score = 0)) AS invalid, COUNT(*) FILTER (WHERE extracted_at IS NULL OR (layer1_success = false AND layer2_success = false AND layer3_success = false AND error_message IS NULL)) AS pending, COALESCE(SUM(quality_score), 0) AS quality_score_sum, COUNT(quality_score) AS quality_score_count, COALESCE(SUM(processing_time), 0) AS processing_time_sum, COUNT(processing_time) AS processing_time_count FROM workflows) AS totals;
+COMMIT;
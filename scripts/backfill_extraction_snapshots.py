@@ -7,7 +7,6 @@ Creates L2V2 and L3V3 snapshot entries from existing tables:
 - workflow_standalone_docs → payload { standalone_docs: [...] }
 """
 
-import json
 from typing import List, Dict, Any
 from datetime import datetime
 
@@ -16,7 +15,9 @@ from sqlalchemy import text
 import sys, os
 sys.path.append('.')
 sys.path.append('../n8n-shared')
+from src.storage.blob_store import save_snapshot
 from src.storage.database import get_session
+from src.storage.snapshot_lifecycle import missing_snapshots
 
 
 WORKFLOW_IDS = [
@@ -24,14 +25,6 @@ WORKFLOW_IDS = [
 ]
 
 
-def snapshot_exists(session, workflow_id: str, layer: str) -> bool:
-    result = session.execute(
-        text("SELECT 1 FROM workflow_extraction_snapshots WHERE workflow_id=:w AND layer=:l LIMIT 1"),
-        {"w": workflow_id, "l": layer}
-    ).fetchone()
-    return result is not None
-
-
 def fetch_node_contexts(session, workflow_id: str) -> List[Dict[str, Any]]:
     rows = session.execute(text(
         """
@@ -82,26 +75,24 @@ def fetch_standalone_docs(session, workflow_id: str) -> List[Dict[str, Any]]:
 
 
 def insert_snapshot(session, workflow_id: str, layer: str, payload: Dict[str, Any]):
-    session.execute(text(
-        """
-        INSERT INTO workflow_extraction_snapshots (workflow_id, layer, payload)
-        VALUES (:w, :l, :p)
-        """
-    ), {"w": workflow_id, "l": layer, "p": json.dumps(payload)})
+    save_snapshot(session, workflow_id, layer, payload)
 
 
 def backfill(workflow_ids: List[str]):
     created = 0
     with get_session() as session:
+        # One anti-join per layer instead of an existence query per workflow
+        missing_l2 = set(missing_snapshots(session, workflow_ids, 'L2V2'))
+        missing_l3 = set(missing_snapshots(session, workflow_ids, 'L3V3'))
         for wid in workflow_ids:
             # L2V2
-            if not snapshot_exists(session, wid, 'L2V2'):
+            if wid in missing_l2:
                 node_contexts = fetch_node_contexts(session, wid)
                 if node_contexts:
                     insert_snapshot(session, wid, 'L2V2', {"node_contexts": node_contexts})
                     created += 1
             # L3V3
-            if not snapshot_exists(session, wid, 'L3V3'):
+            if wid in missing_l3:
                 docs = fetch_standalone_docs(session, wid)
                 if docs:
                     insert_snapshot(session, wid, 'L3V3', {"standalone_docs": docs})
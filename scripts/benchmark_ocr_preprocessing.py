@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+OCR Preprocessing Benchmark
+
+Compares Tesseract time and character accuracy with and without the
+preprocessing stage (src/scrapers/image_preprocessing.py) over a local corpus
+of sample images.
+
+Corpus layout:
+    <corpus>/diagram.png
+    <corpus>/diagram.txt      # optional ground truth for accuracy
+
+Usage:
+    python scripts/benchmark_ocr_preprocessing.py --corpus data/ocr_corpus
+    python scripts/benchmark_ocr_preprocessing.py --generate data/ocr_corpus   # synthetic samples
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytesseract
+from PIL import Image, ImageDraw
+
+from src.scrapers.image_preprocessing import preprocess_for_ocr
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".gif", ".bmp"}
+
+SAMPLE_LINES = [
+    "Step 1: Connect your Google Sheets account",
+    "Step 2: Set the webhook URL in Telegram",
+    "Use the OpenAI node to summarize each email",
+    "Schedule Trigger runs every 15 minutes",
+]
+
+
+def char_accuracy(expected: str, actual: str) -> float:
+    """1 - normalized Levenshtein distance over whitespace-normalized text."""
+    a = " ".join(expected.split())
+    b = " ".join(actual.split())
+    if not a:
+        return 1.0 if not b else 0.0
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return max(0.0, 1.0 - previous[-1] / len(a))
+
+
+def generate_corpus(directory: Path, count: int = 8):
+    """Write synthetic retina-size screenshots, a photo-like image and a logo."""
+    import numpy as np
+
+    directory.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(42)
+    for i in range(count):
+        image = Image.new("RGB", (2880, 1800), "white")
+        draw = ImageDraw.Draw(image)
+        lines = [SAMPLE_LINES[(i + k) % len(SAMPLE_LINES)] for k in range(3)]
+        for k, line in enumerate(lines):
+            draw.text((900, 700 + k * 60), line, fill="black", font_size=40)
+        image.save(directory / f"screenshot_{i}.png", dpi=(144, 144))
+        (directory / f"screenshot_{i}.txt").write_text("\n".join(lines))
+
+    photo = rng.integers(0, 256, (1200, 1600, 3), dtype=np.uint8)
+    Image.fromarray(photo).save(directory / "photo.jpg")
+    (directory / "photo.txt").write_text("")
+    Image.new("RGB", (20, 20), "orange").save(directory / "logo.png")
+    (directory / "logo.txt").write_text("")
+    print(f"Generated {count + 2} sample images in {directory}")
+
+
+def run_one(path: Path, preprocess: bool) -> Dict:
+    """OCR one image and time it (including preprocessing)."""
+    started = time.perf_counter()
+    image = Image.open(path)
+    skipped = None
+    if preprocess:
+        image, skipped = preprocess_for_ocr(image)
+    text = pytesseract.image_to_string(image).strip() if image is not None else ""
+    return {'seconds': time.perf_counter() - started, 'text': text, 'skipped': skipped}
+
+
+def benchmark(corpus: Path, limit: Optional[int] = None) -> List[Dict]:
+    """Run both modes over the corpus and collect per-image rows."""
+    images = sorted(p for p in corpus.iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS)[:limit]
+    rows = []
+    for path in images:
+        truth_file = path.with_suffix(".txt")
+        truth = truth_file.read_text() if truth_file.exists() else None
+        raw = run_one(path, preprocess=False)
+        pre = run_one(path, preprocess=True)
+        rows.append({
+            'image': path.name,
+            'raw_seconds': raw['seconds'],
+            'pre_seconds': pre['seconds'],
+            'skipped': pre['skipped'],
+            'raw_accuracy': char_accuracy(truth, raw['text']) if truth is not None else None,
+            'pre_accuracy': char_accuracy(truth, pre['text']) if truth is not None else None,
+        })
+        print(
+            f"{path.name:<28} raw {raw['seconds']:6.2f}s  pre {pre['seconds']:6.2f}s"
+            + (f"  (skipped: {pre['skipped']})" if pre['skipped'] else "")
+        )
+    return rows
+
+
+def print_summary(rows: List[Dict]):
+    """Print totals and mean accuracy."""
+    if not rows:
+        print("No images found")
+        return
+    raw_total = sum(r['raw_seconds'] for r in rows)
+    pre_total = sum(r['pre_seconds'] for r in rows)
+    scored = [r for r in rows if r['raw_accuracy'] is not None]
+
+    print("\n" + "=" * 70)
+    print("OCR PREPROCESSING BENCHMARK")
+    print("=" * 70)
+    print(f"Images:              {len(rows)} ({sum(1 for r in rows if r['skipped'])} skipped by heuristic)")
+    print(f"Total OCR time:      raw {raw_total:.2f}s | preprocessed {pre_total:.2f}s")
+    if pre_total > 0:
+        print(f"Speedup:             {raw_total / pre_total:.2f}x")
+    if scored:
+        print(f"Char accuracy:       raw {statistics.mean(r['raw_accuracy'] for r in scored):.1%} | "
+              f"preprocessed {statistics.mean(r['pre_accuracy'] for r in scored):.1%} "
+              f"({len(scored)} images with ground truth)")
+    print("=" * 70)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark OCR preprocessing")
+    parser.add_argument("--corpus", type=Path, default=Path("data/ocr_corpus"), help="Directory of sample images")
+    parser.add_argument("--generate", type=Path, help="Write a synthetic corpus to this directory and benchmark it")
+    parser.add_argument("--limit", type=int, help="Max number of images")
+    args = parser.parse_args()
+
+    corpus = args.corpus
+    if args.generate:
+        generate_corpus(args.generate)
+        corpus = args.generate
+
+    if not corpus.is_dir():
+        parser.error(f"Corpus directory not found: {corpus} (use --generate to create one)")
+
+    print_summary(benchmark(corpus, args.limit))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Regex Registry Benchmark
+
+Compares matching with pattern strings (re module cache lookup on every call)
+against the precompiled patterns in src/scrapers/regex_registry.py, and the
+sequential YouTube link patterns against the combined alternation, over
+synthetic workflow text.
+
+Usage:
+    python scripts/benchmark_patterns.py
+    python scripts/benchmark_patterns.py --number 2000 --size 20000
+"""
+
+import argparse
+import random
+import re
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, Dict
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scrapers.layer4_business_intelligence import ROI_PATTERNS
+from src.scrapers.layer5_community_data import ENGAGEMENT_PATTERNS
+from src.scrapers.regex_registry import youtube_ids
+
+SAMPLE_PHRASES = [
+    "This workflow saves 5 hours per week for the sales team.",
+    "ROI: 250% within the first quarter, payback 3 months.",
+    "Watch the setup video https://www.youtube.com/watch?v=dQw4w9WgXcQ first.",
+    "Short link https://youtu.be/9bZkp7q19f0 and @[youtube](kJQP7kiw5Fk) in the sticky note.",
+    "1,250 views, 48 likes and 12 comments on the community forum.",
+    "Connect your Google Sheets account and set the webhook URL.",
+]
+
+# Layer 4 ROI patterns as they were written inline before the registry
+ROI_SOURCES = {name: pattern.pattern for name, pattern in ROI_PATTERNS.items()}
+ENGAGEMENT_SOURCES = {name: [p.pattern for p in patterns] for name, patterns in ENGAGEMENT_PATTERNS.items()}
+
+YOUTUBE_SEQUENTIAL = [
+    r'https?://(?:www\.)?youtube\.com/watch\?v=([\w-]{11})',
+    r'https?://(?:www\.)?youtu\.be/([\w-]{11})',
+    r'@\[youtube\]\(([\w-]{11})\)',
+    r'youtube\.com/watch\?v=([\w-]{11})',
+    r'youtu\.be/([\w-]{11})'
+]
+
+
+def sample_text(size: int, seed: int = 42) -> str:
+    """Synthetic workflow text of roughly `size` characters."""
+    rng = random.Random(seed)
+    parts = []
+    while sum(len(part) + 1 for part in parts) < size:
+        parts.append(rng.choice(SAMPLE_PHRASES))
+    return " ".join(parts)
+
+
+def roi_strings(text: str):
+    return [re.findall(pattern, text, re.IGNORECASE) for pattern in ROI_SOURCES.values()]
+
+
+def roi_compiled(text: str):
+    return [pattern.findall(text) for pattern in ROI_PATTERNS.values()]
+
+
+def engagement_strings(text: str):
+    return [re.findall(p, text, re.IGNORECASE) for patterns in ENGAGEMENT_SOURCES.values() for p in patterns]
+
+
+def engagement_compiled(text: str):
+    return [pattern.findall(text) for patterns in ENGAGEMENT_PATTERNS.values() for pattern in patterns]
+
+
+def youtube_sequential(text: str):
+    return set(match for pattern in YOUTUBE_SEQUENTIAL for match in re.findall(pattern, text))
+
+
+def youtube_combined(text: str):
+    return set(youtube_ids(text))
+
+
+CASES: Dict[str, Dict[str, Callable[[str], object]]] = {
+    'layer4 ROI': {'strings': roi_strings, 'compiled': roi_compiled},
+    'layer5 engagement': {'strings': engagement_strings, 'compiled': engagement_compiled},
+    'youtube links': {'sequential': youtube_sequential, 'combined': youtube_combined},
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark precompiled extractor patterns")
+    parser.add_argument("--number", type=int, default=1000, help="Calls per measurement")
+    parser.add_argument("--size", type=int, default=2000, help="Characters of sample text")
+    args = parser.parse_args()
+
+    text = sample_text(args.size)
+    assert youtube_sequential(text) == youtube_combined(text)
+
+    print("=" * 70)
+    print(f"REGEX REGISTRY BENCHMARK ({args.number} calls, {len(text)} chars)")
+    print("=" * 70)
+    for case, variants in CASES.items():
+        timings = {
+            name: min(timeit.repeat(lambda: func(text), number=args.number, repeat=3))
+            for name, func in variants.items()
+        }
+        (base_name, base), (new_name, new) = timings.items()
+        print(f"{case:<20} {base_name} {base * 1e6 / args.number:8.1f}us  "
+              f"{new_name} {new * 1e6 / args.number:8.1f}us  ({base / new:.2f}x)")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Sticky Matching Benchmark
+
+Compares the pairwise node-to-sticky matching loops (every node scored against
+every sticky note) with the StickyIndex-backed matching now used by
+UnifiedWorkflowExtractor and the Layer 2 Enhanced V2 NodeContextExtractor, on
+synthetic canvases. Both versions must produce identical matches.
+
+Also times the global assignment engine (confidence matrix, sorted greedy and
+Hungarian assignment) on the same canvas.
+
+Usage:
+    python scripts/benchmark_sticky_matching.py
+    python scripts/benchmark_sticky_matching.py --nodes 1000 --stickies 300 --repeat 5
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scrapers.layer2_enhanced_v2 import NodeContextExtractor
+from src.scrapers.sticky_assignment import SCIPY_AVAILABLE, assign_stickies, confidence_matrix, section_header_capacities
+from src.scrapers.unified_workflow_extractor import UnifiedWorkflowExtractor
+
+WORDS = [
+    'webhook', 'http', 'request', 'google', 'sheets', 'slack', 'notify', 'filter',
+    'merge', 'set', 'code', 'openai', 'summarize', 'email', 'send', 'schedule',
+    'trigger', 'split', 'items', 'postgres', 'update', 'contacts', 'crm', 'lead'
+]
+
+
+def synthetic_canvas(nodes: int, stickies: int, seed: int = 7) -> Tuple[List[Dict], List[Dict]]:
+    """Nodes on a 250px grid and sticky notes scattered over the same canvas."""
+    rng = random.Random(seed)
+    columns = max(1, int(nodes ** 0.5))
+    node_list = []
+    for i in range(nodes):
+        name = f"{' '.join(rng.sample(WORDS, 2)).title()} {i}"
+        node_list.append({
+            'id': str(i),
+            'name': name,
+            'type': 'n8n-nodes-base.set',
+            'position': {'x': (i % columns) * 250 + rng.randint(-20, 20), 'y': (i // columns) * 250 + rng.randint(-20, 20)}
+        })
+    sticky_list = []
+    for i in range(stickies):
+        words = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(5, 40)))
+        sticky_list.append({
+            'name': f"Note {i}",
+            'content': f"## Step {i}\n{words}",
+            'position': {'x': rng.uniform(-200, columns * 250), 'y': rng.uniform(-200, (nodes // columns) * 250), 'width': 240, 'height': 160}
+        })
+    return node_list, sticky_list
+
+
+def unified_pairwise(extractor: UnifiedWorkflowExtractor, nodes: List[Dict], stickies: List[Dict]):
+    """The original unified matching loop: every node against every unmatched sticky."""
+    matches = []
+    unmatched = stickies.copy()
+    for node in nodes:
+        best, best_confidence, best_index = None, 0.0, -1
+        for i, sticky in enumerate(unmatched):
+            confidence = max(
+                extractor._calculate_proximity_confidence(node, sticky),
+                extractor._calculate_name_confidence(node, sticky)
+            )
+            if confidence > best_confidence:
+                best, best_confidence, best_index = sticky, confidence, i
+        if best and best_confidence > 0.1:
+            matches.append((node['name'], best['name'], best_confidence))
+            unmatched.pop(best_index)
+    return matches, unmatched
+
+
+def unified_indexed(extractor: UnifiedWorkflowExtractor, nodes: List[Dict], stickies: List[Dict]):
+    contexts, standalone = extractor._match_nodes_with_stickies(nodes, stickies)
+    return [(c['node_name'], c['sticky_title'], c['match_confidence']) for c in contexts], standalone
+
+
+def v2_pairwise(extractor: NodeContextExtractor, nodes: List[Dict], stickies: List[Dict]):
+    """The original Layer 2 V2 matching loop: three full passes over the stickies per node."""
+    matches = []
+    for node in nodes:
+        best, best_confidence, best_method = None, 0.0, 'none'
+        passes = [
+            (None, extractor._calculate_name_match_confidence, 'name_exact'),
+            (0.7, extractor._calculate_proximity_confidence, 'proximity'),
+            (0.5, extractor._calculate_fuzzy_match_confidence, 'fuzzy')
+        ]
+        for below, score, method in passes:
+            if below is not None and best_confidence >= below:
+                continue
+            for sticky in stickies:
+                confidence = score(node, sticky)
+                if confidence > best_confidence:
+                    best, best_confidence, best_method = sticky, confidence, method
+        if best and best_confidence > 0.3:
+            matches.append((node['node_name'], best['title'], best_confidence, best_method))
+    return matches
+
+
+def v2_indexed(extractor: NodeContextExtractor, nodes: List[Dict], stickies: List[Dict]):
+    contexts = asyncio.run(extractor._match_nodes_with_stickies(nodes, stickies))
+    return [(c['node_name'], c['sticky_title'], c['match_confidence'], c['extraction_method']) for c in contexts]
+
+
+def best_time(func, repeat: int) -> Tuple[float, object]:
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark indexed node-to-sticky matching")
+    parser.add_argument("--nodes", type=int, default=1000, help="Nodes per canvas")
+    parser.add_argument("--stickies", type=int, default=300, help="Sticky notes per canvas")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    # Matching logs every node at debug level and totals at info level
+    logging.getLogger('src.scrapers.unified_workflow_extractor').setLevel(logging.WARNING)
+
+    nodes, stickies = synthetic_canvas(args.nodes, args.stickies)
+    v2_nodes = [{'node_name': n['name'], 'node_type': n['type'], 'position': n['position']} for n in nodes]
+    v2_stickies = [{'title': s['name'], 'content': s['content'], 'position': s['position']} for s in stickies]
+
+    unified = UnifiedWorkflowExtractor()
+    v2 = NodeContextExtractor()
+    cases = {
+        'unified extractor': (
+            lambda: unified_pairwise(unified, nodes, stickies),
+            lambda: unified_indexed(unified, nodes, stickies)
+        ),
+        'layer2 enhanced v2': (
+            lambda: v2_pairwise(v2, v2_nodes, v2_stickies),
+            lambda: v2_indexed(v2, v2_nodes, v2_stickies)
+        ),
+    }
+
+    print("=" * 70)
+    print(f"STICKY MATCHING BENCHMARK ({args.nodes} nodes, {args.stickies} stickies, best of {args.repeat})")
+    print("=" * 70)
+    for case, (pairwise, indexed) in cases.items():
+        pairwise_time, expected = best_time(pairwise, args.repeat)
+        indexed_time, actual = best_time(indexed, args.repeat)
+        assert actual == expected, f"{case}: indexed matches differ from pairwise matches"
+        print(f"{case:<20} pairwise {pairwise_time * 1e3:8.1f}ms  "
+              f"indexed {indexed_time * 1e3:8.1f}ms  ({pairwise_time / indexed_time:.1f}x)")
+
+    print("-" * 70)
+    matrix_time, matrix = best_time(lambda: confidence_matrix(nodes, stickies), args.repeat)
+    capacities = section_header_capacities(nodes, stickies)
+    print(f"{'confidence matrix':<20} {matrix_time * 1e3:8.1f}ms  ({matrix.shape[0]}x{matrix.shape[1]})")
+    for method in ('sorted', 'optimal') if SCIPY_AVAILABLE else ('sorted',):
+        assign_time, pairs = best_time(lambda: assign_stickies(matrix, capacities=capacities, method=method), args.repeat)
+        total = sum(confidence for _, _, confidence in pairs)
+        print(f"{method + ' assignment':<20} {assign_time * 1e3:8.1f}ms  ({len(pairs)} nodes matched, total confidence {total:.1f})")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Video Scanner Benchmark
+
+Compares the previous video discovery (BeautifulSoup DOM for anchors and
+iframes, then ten regex sweeps over the same HTML) with the single-pass
+scan_videos, on captured page HTML with synthetic video markup injected.
+Both must find the same video IDs, except for tokens the scanner rejects
+because they are longer than an 11-character ID.
+
+Usage:
+    python scripts/benchmark_video_scanner.py
+    python scripts/benchmark_video_scanner.py --html iframe_html_1954.html --videos 200 --repeat 10
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import List, Set, Tuple
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bs4 import BeautifulSoup
+
+from src.scrapers.regex_registry import NON_VIDEO_URL, youtube_id
+from src.scrapers.video_scanner import scan_videos
+
+# The sweeps the Layer 3 extractors ran before the scanner
+LEGACY_SWEEPS = [re.compile(pattern) for pattern in (
+    r'youtube\.com/watch\?v=([\w-]{11})',
+    r'youtube\.com/embed/([\w-]{11})',
+    r'youtu\.be/([\w-]{11})',
+    r'"videoId":"([\w-]{11})"',
+    r'videoId=([\w-]{11})',
+    r'data-video-id="([\w-]{11})"',
+    r'video_id=([\w-]{11})',
+    r'v=([\w-]{11})',
+    r'@\[youtube\]\(([\w-]{11})\)',
+    r'@\[youtube\]\(([\w-]{11})',
+)]
+
+ID_CHARS = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_'
+
+
+def synthetic_markup(count: int, seed: int = 11) -> Tuple[str, Set[str]]:
+    """Video markup in every form the scanners look for, and the IDs it contains."""
+    rng = random.Random(seed)
+    templates = [
+        '<a href="https://www.youtube.com/watch?v={id}">Watch</a>',
+        '<iframe src="https://www.youtube.com/embed/{id}?rel=0"></iframe>',
+        '<p>See https://youtu.be/{id} for a walkthrough</p>',
+        '<script>var player = {{"videoId":"{id}"}};</script>',
+        '<div class="video" data-video-id="{id}"></div>',
+        '<p>@[youtube]({id})</p>',
+    ]
+    ids = set()
+    parts = []
+    for _ in range(count):
+        video_id = ''.join(rng.choice(ID_CHARS) for _ in range(11))
+        ids.add(video_id)
+        parts.append(rng.choice(templates).format(id=video_id))
+    return '\n'.join(parts), ids
+
+
+def legacy_scan(html: str) -> List[str]:
+    """DOM walk for anchors and iframes, then every sweep over the raw HTML."""
+    ids = {}
+    soup = BeautifulSoup(html, 'html.parser')
+    for link in soup.find_all('a', href=True):
+        href = link['href']
+        if ('youtube.com' in href or 'youtu.be' in href) and not NON_VIDEO_URL.search(href):
+            video_id = youtube_id(href)
+            if video_id:
+                ids.setdefault(video_id)
+    for iframe in soup.find_all('iframe', src=True):
+        video_id = youtube_id(iframe['src'])
+        if video_id:
+            ids.setdefault(video_id)
+    for pattern in LEGACY_SWEEPS:
+        for video_id in pattern.findall(html):
+            ids.setdefault(video_id)
+    return list(ids)
+
+
+def best_time(func, repeat: int) -> Tuple[float, object]:
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark single-pass video ID scanning")
+    parser.add_argument("--html", default="iframe_html_1954.html", help="Captured page HTML to scan")
+    parser.add_argument("--videos", type=int, default=50, help="Synthetic video snippets to inject")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    page = Path(args.html).read_text(encoding='utf-8', errors='replace') if Path(args.html).exists() else ''
+    markup, injected = synthetic_markup(args.videos)
+    middle = len(page) // 2
+    html = page[:middle] + markup + page[middle:]
+    raw = html.encode('utf-8')
+
+    legacy_time, legacy_ids = best_time(lambda: legacy_scan(html), args.repeat)
+    text_time, text_hits = best_time(lambda: scan_videos(html), args.repeat)
+    bytes_time, bytes_hits = best_time(lambda: scan_videos(raw), args.repeat)
+
+    scanned = {hit.video_id for hit in text_hits}
+    assert injected <= scanned, "scanner missed injected videos"
+    assert [hit.video_id for hit in bytes_hits] == [hit.video_id for hit in text_hits], "bytes and text scans differ"
+    # The sweeps also pick up the first 11 characters of longer tokens
+    rejected = set(legacy_ids) - scanned
+    assert not scanned - set(legacy_ids), "scanner found IDs the sweeps did not"
+
+    print("=" * 70)
+    print(f"VIDEO SCANNER BENCHMARK ({len(html) / 1024:.0f} KB, {len(injected)} injected videos, best of {args.repeat})")
+    print("=" * 70)
+    print(f"{'dom + 10 sweeps':<20} {legacy_time * 1e3:8.2f}ms  ({len(legacy_ids)} IDs)")
+    print(f"{'scan_videos (str)':<20} {text_time * 1e3:8.2f}ms  ({len(text_hits)} IDs, {legacy_time / text_time:.1f}x)")
+    print(f"{'scan_videos (bytes)':<20} {bytes_time * 1e3:8.2f}ms  ({len(bytes_hits)} IDs, {legacy_time / bytes_time:.1f}x)")
+    if rejected:
+        print(f"Rejected as longer than an ID: {', '.join(sorted(rejected)[:5])}{' ...' if len(rejected) > 5 else ''}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
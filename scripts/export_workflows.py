@@ -8,6 +8,7 @@ Usage:
     python scripts/export_workflows.py --limit 100 --formats json,csv
     python scripts/export_workflows.py --all-formats
     python scripts/export_workflows.py --from-database
+    python scripts/export_workflows.py --from-database --search "slack notifications"
 
 Author: RND Manager
 Task: SCRAPE-012
@@ -28,7 +29,8 @@ from src.storage.repository import WorkflowRepository
 def export_from_database(
     limit: int = None, 
     formats: list = None, 
-    output_dir: str = "exports"
+    output_dir: str = "exports",
+    search: str = None
 ):
     """
     Export workflows from database.
@@ -37,6 +39,7 @@ def export_from_database(
         limit: Maximum number of workflows to export
         formats: List of formats to export to
         output_dir: Output directory
+        search: Optional full-text search; exports the matches, best first
     """
     print(f"📦 Exporting workflows from database...")
     
@@ -51,6 +54,7 @@ def export_from_database(
     results = manager.export_from_database(
         repository=repository,
         limit=limit,
+        filters={'query': search} if search else None,
         formats=formats
     )
     
@@ -153,6 +157,13 @@ def main():
         help='Maximum number of workflows to export'
     )
     
+    parser.add_argument(
+        '--search',
+        type=str,
+        default=None,
+        help='Only export workflows matching this full-text search (with --from-database)'
+    )
+    
     parser.add_argument(
         '--formats',
         type=str,
@@ -187,7 +198,8 @@ def main():
         export_from_database(
             limit=args.limit,
             formats=formats,
-            output_dir=args.output_dir
+            output_dir=args.output_dir,
+            search=args.search
         )
     else:
         export_sample_data(
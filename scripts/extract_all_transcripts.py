@@ -28,6 +28,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.scrapers.transcript_extractor import TranscriptExtractor
+from src.scrapers.transcript_cache import get_transcript_cache
 from loguru import logger
 
 
@@ -190,7 +191,8 @@ class TranscriptBatchProcessor:
         self.stats['start_time'] = time.time()
         
         # Process videos with TranscriptExtractor
-        async with TranscriptExtractor(headless=headless) as extractor:
+        # Shared cache: a video embedded in many workflows is only fetched once
+        async with TranscriptExtractor(headless=headless, cache=get_transcript_cache()) as extractor:
             for i, video in enumerate(videos, 1):
                 workflow_id = video['workflow_id']
                 video_url = video['video_url']
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Install the payload blob store.
+
+Creates `payload_blobs` and the snapshot reference column, then moves the
+snapshot payloads still stored inline into the store, batch by batch.
+
+Usage:
+    python scripts/install_blob_store.py            # install + move payloads
+    python scripts/install_blob_store.py --prune    # delete unreferenced blobs
+    python scripts/install_blob_store.py --show     # print store size
+    python scripts/install_blob_store.py --sql > migrations/payload_blobs.sql
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from src.storage.blob_store import (
+    blob_stats,
+    blob_store_ddl,
+    blob_store_statements,
+    offload_snapshots,
+    prune_blobs,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Install the payload blob store")
+    parser.add_argument('--sql', action='store_true', help='Print the migration SQL and exit')
+    parser.add_argument('--prune', action='store_true', help='Delete blobs no snapshot references')
+    parser.add_argument('--show', action='store_true', help='Print blob store size')
+    parser.add_argument('--batch-size', type=int, default=500, help='Snapshots moved per transaction')
+    args = parser.parse_args()
+
+    if args.sql:
+        sys.stdout.write(blob_store_ddl())
+        return
+
+    from src.storage.database import get_session
+
+    with get_session() as session:
+        if args.show:
+            print(json.dumps(blob_stats(session), indent=2))
+            return
+
+        if args.prune:
+            deleted = prune_blobs(session)
+            session.commit()
+            print(f"✅ Pruned {deleted} unreferenced blobs")
+            return
+
+        for statement in blob_store_statements():
+            session.execute(text(statement))
+        session.commit()
+        print("✅ Blob store installed")
+
+        moved = 0
+        while True:
+            batch = offload_snapshots(session, batch_size=args.batch_size)
+            session.commit()
+            if not batch:
+                break
+            moved += batch
+            print(f"   Moved {moved} snapshot payloads...")
+        print(f"✅ {moved} snapshot payloads moved (run VACUUM workflow_extraction_snapshots to reclaim space)")
+        print(json.dumps(blob_stats(session), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Install the keyset pagination indexes on workflows.
+
+Creates one (sort key, workflow_id) index per listing sort, so every page of
+the viewers and list_workflows_page() is a single index range scan.
+
+Usage:
+    python scripts/install_keyset_indexes.py        # create missing indexes
+    python scripts/install_keyset_indexes.py --sql > migrations/workflow_keyset_indexes.sql
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from src.storage.pagination import KEYSET_INDEX_SQL, keyset_index_ddl
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Install the keyset pagination indexes")
+    parser.add_argument('--sql', action='store_true', help='Print the migration SQL and exit')
+    args = parser.parse_args()
+
+    if args.sql:
+        sys.stdout.write(keyset_index_ddl())
+        return
+
+    from src.storage.database import get_session
+
+    with get_session() as session:
+        for sort, statement in KEYSET_INDEX_SQL.items():
+            session.execute(text(statement))
+            print(f"✅ Index for sort '{sort}'")
+        session.commit()
+
+
+if __name__ == '__main__':
+    main()
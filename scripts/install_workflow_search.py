@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Install the workflow full-text search index.
+
+Creates `workflow_search` (weighted tsvector + GIN index) and the triggers
+that re-index a workflow when its metadata, explainer or transcripts change,
+then indexes the existing catalog.
+
+Usage:
+    python scripts/install_workflow_search.py             # install + backfill
+    python scripts/install_workflow_search.py --search "slack notif"
+    python scripts/install_workflow_search.py --sql > migrations/workflow_search.sql
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from src.storage.search import PG_DOCUMENT_SELECT, SEARCH_TABLE, search_ddl, search_statements, search_workflows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Install the workflow full-text search index")
+    parser.add_argument('--sql', action='store_true', help='Print the migration SQL and exit')
+    parser.add_argument('--search', help='Run a search and print the ranked hits')
+    parser.add_argument('--limit', type=int, default=10, help='Hits to print with --search')
+    args = parser.parse_args()
+
+    if args.sql:
+        sys.stdout.write(search_ddl())
+        return
+
+    from src.storage.database import get_session
+
+    with get_session() as session:
+        if args.search:
+            for hit in search_workflows(session, args.search, limit=args.limit):
+                print(f"{hit.workflow_id:>8}  {hit.rank:.4f}  {hit.title}")
+                print(f"          {hit.snippet}")
+            return
+
+        for statement in search_statements():
+            session.execute(text(statement))
+        print("✅ Search table, index and triggers installed")
+
+        session.execute(text(f"TRUNCATE {SEARCH_TABLE}"))
+        session.execute(text(f"INSERT INTO {SEARCH_TABLE} (workflow_id, search_vector){PG_DOCUMENT_SELECT}"))
+        session.commit()
+        count = session.execute(text(f"SELECT COUNT(*) FROM {SEARCH_TABLE}")).scalar()
+        print(f"✅ Indexed {count:,} workflows")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Install the workflow statistics summary table.
+
+Creates `workflow_stats` and the triggers on `workflows` that keep it
+current, then backfills it from the existing catalog.
+
+Usage:
+    python scripts/install_workflow_stats.py            # install + backfill
+    python scripts/install_workflow_stats.py --refresh  # recount only (repair)
+    python scripts/install_workflow_stats.py --show     # print statistics
+    python scripts/install_workflow_stats.py --sql > migrations/workflow_stats.sql
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from src.storage.workflow_stats import (
+    read_statistics,
+    refresh_statistics,
+    statistics_ddl,
+    statistics_statements,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Install the workflow statistics summary table")
+    parser.add_argument('--sql', action='store_true', help='Print the migration SQL and exit')
+    parser.add_argument('--refresh', action='store_true', help='Recount the summary without reinstalling triggers')
+    parser.add_argument('--show', action='store_true', help='Print current statistics')
+    args = parser.parse_args()
+
+    if args.sql:
+        sys.stdout.write(statistics_ddl())
+        return
+
+    from src.storage.database import get_session
+
+    with get_session() as session:
+        if args.show:
+            print(json.dumps(read_statistics(session), indent=2))
+            return
+
+        if not args.refresh:
+            for statement in statistics_statements():
+                session.execute(text(statement))
+            print("✅ Summary table and triggers installed")
+
+        refresh_statistics(session)
+        session.commit()
+        print("✅ Summary backfilled")
+        print(json.dumps(read_statistics(session), indent=2))
+
+
+if __name__ == '__main__':
+    main()
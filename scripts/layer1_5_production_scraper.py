@@ -16,6 +16,7 @@ import sys
 sys.path.append('/app')
 
 from src.scrapers.layer1_5_page_content import Layer1_5PageContentExtractor
+from src.storage.write_buffer import WriteBehindBuffer
 from src.storage.database import get_session
 from sqlalchemy import text
 from loguru import logger
@@ -49,7 +50,8 @@ class Layer1_5ProductionScraper:
         logger.info(f"🚀 Processing {len(workflows)} workflows with Layer 1.5")
         logger.info(f"⏱️  Estimated time: {self.stats['total'] * 19 / 3600:.1f} hours")
         
-        async with Layer1_5PageContentExtractor() as extractor:
+        async with Layer1_5PageContentExtractor() as extractor, \
+                WriteBehindBuffer('layer1_5', self.save_many_to_database) as buffer:
             for i, (workflow_id, url) in enumerate(workflows, 1):
                 logger.info(f"📊 Processing {i}/{len(workflows)}: {workflow_id}")
                 
@@ -58,12 +60,12 @@ class Layer1_5ProductionScraper:
                     result = await extractor.extract_full_page_content(workflow_id, url)
                     
                     if result["success"]:
-                        # Save to database
-                        self.save_to_database(
-                            workflow_id, 
-                            result["markdown"],
-                            result["metadata"]
-                        )
+                        # Save to database (group-committed by the buffer)
+                        await buffer.add({
+                            "workflow_id": workflow_id,
+                            "markdown": result["markdown"],
+                            "metadata": result["metadata"]
+                        })
                         self.stats['successful'] += 1
                         logger.success(f"✅ {workflow_id}: {result['metadata']['content_length']} chars extracted")
                     else:
@@ -125,11 +127,17 @@ class Layer1_5ProductionScraper:
     
     def save_to_database(self, workflow_id: str, markdown: str, metadata: dict):
         """Save Layer 1.5 data to database"""
+        self.save_many_to_database([{
+            "workflow_id": workflow_id,
+            "markdown": markdown,
+            "metadata": metadata
+        }])
+        logger.debug(f"💾 Saved Layer 1.5 data for {workflow_id}")
+    
+    def save_many_to_database(self, records: list):
+        """Save Layer 1.5 data for several workflows in one transaction"""
         
         with get_session() as session:
-            # Convert metadata dict to JSON string
-            metadata_json = json.dumps(metadata)
-            
             session.execute(text("""
                 UPDATE workflow_metadata
                 SET 
@@ -137,14 +145,18 @@ class Layer1_5ProductionScraper:
                     layer1_5_metadata = :metadata,
                     layer1_5_extracted_at = CURRENT_TIMESTAMP
                 WHERE workflow_id = :workflow_id
-            """), {
-                "workflow_id": workflow_id,
-                "markdown": markdown,
-                "metadata": metadata_json
-            })
+            """), [
+                {
+                    "workflow_id": record["workflow_id"],
+                    "markdown": record["markdown"],
+                    # Convert metadata dict to JSON string
+                    "metadata": json.dumps(record["metadata"])
+                }
+                for record in records
+            ])
             session.commit()
             
-            logger.debug(f"💾 Saved Layer 1.5 data for {workflow_id}")
+            logger.debug(f"💾 Saved Layer 1.5 data for {len(records)} workflows")
     
     def print_progress(self):
         """Print progress update"""
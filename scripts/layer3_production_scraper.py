@@ -27,6 +27,7 @@ from datetime import datetime
 sys.path.append(str(Path(__file__).parent.parent / 'src'))
 
 from scrapers.layer3_comprehensive import ComprehensiveLayer3Extractor
+from storage.async_writer import get_storage_writer
 from storage.database import get_session
 from sqlalchemy import text
 from loguru import logger
@@ -117,12 +118,19 @@ class Layer3ProductionScraper:
         """
         Save comprehensive extraction results to database.
         
+        The blocking write runs on the storage writer thread, so concurrent
+        extractions keep running while it waits on the database.
+        
         Args:
             result: Extraction result from ComprehensiveLayer3Extractor
             
         Returns:
             bool: True if saved successfully
         """
+        return await get_storage_writer().submit(self._save_to_database_sync, result)
+    
+    def _save_to_database_sync(self, result: Dict) -> bool:
+        """Blocking part of save_to_database."""
         if not result.get('success'):
             return False
         
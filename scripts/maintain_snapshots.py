@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Extraction snapshot lifecycle maintenance.
+
+Creates upcoming monthly partitions, compacts snapshots past retention into
+archives, prunes payload blobs nothing references and drops emptied
+partitions. Safe to run repeatedly (e.g. nightly).
+
+Usage:
+    python scripts/maintain_snapshots.py --install    # partition the table, create archives
+    python scripts/maintain_snapshots.py              # maintenance run
+    python scripts/maintain_snapshots.py --keep-latest 5 --checkpoint-period week --keep-checkpoints 8
+    python scripts/maintain_snapshots.py --sql > migrations/snapshot_partitions.sql
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from src.storage.blob_store import prune_blobs
+from src.storage.snapshot_lifecycle import (
+    CHECKPOINT_PERIOD,
+    KEEP_CHECKPOINTS,
+    KEEP_LATEST,
+    add_partitions,
+    compact_snapshots,
+    drop_empty_partitions,
+    lifecycle_ddl,
+    lifecycle_statements,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extraction snapshot lifecycle maintenance")
+    parser.add_argument('--sql', action='store_true', help='Print the migration SQL and exit')
+    parser.add_argument('--install', action='store_true', help='Partition the snapshot table and create archives')
+    parser.add_argument('--keep-latest', type=int, default=KEEP_LATEST,
+                        help=f'Newest snapshots kept per workflow/layer (default: {KEEP_LATEST})')
+    parser.add_argument('--checkpoint-period', choices=['day', 'week', 'month'], default=CHECKPOINT_PERIOD,
+                        help=f'Checkpoint period (default: {CHECKPOINT_PERIOD})')
+    parser.add_argument('--keep-checkpoints', type=int, default=KEEP_CHECKPOINTS,
+                        help=f'Recent periods keeping a checkpoint (default: {KEEP_CHECKPOINTS})')
+    args = parser.parse_args()
+
+    if args.sql:
+        sys.stdout.write(lifecycle_ddl())
+        return
+
+    from src.storage.database import get_session
+
+    with get_session() as session:
+        if args.install:
+            for statement in lifecycle_statements():
+                session.execute(text(statement))
+            session.commit()
+            print("✅ Snapshots partitioned by month, archive table installed")
+            return
+
+        created = add_partitions(session)
+        session.commit()
+        print(f"✅ {created} partitions created")
+
+        archived = archives = 0
+        after = None
+        while True:
+            stats = compact_snapshots(
+                session,
+                keep_latest=args.keep_latest,
+                checkpoint_period=args.checkpoint_period,
+                keep_checkpoints=args.keep_checkpoints,
+                after=after
+            )
+            session.commit()
+            archived += stats['snapshots']
+            archives += stats['archives']
+            after = stats['last_group']
+            if after is None:
+                break
+            print(f"   Archived {archived} snapshots...")
+        print(f"✅ {archived} snapshots compacted into {archives} archives")
+
+        pruned = prune_blobs(session)
+        dropped = drop_empty_partitions(session)
+        session.commit()
+        print(f"✅ {pruned} unreferenced blobs pruned, {len(dropped)} empty partitions dropped")
+
+
+if __name__ == '__main__':
+    main()
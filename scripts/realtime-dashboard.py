@@ -14,8 +14,14 @@ from http.server import HTTPServer, BaseHTTPRequestHandler
 import urllib.parse
 import os
 import subprocess
+import sys
+from pathlib import Path
 import psutil
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.storage.workflow_stats import read_statistics_dbapi
+
 # Database connection - SUPABASE
 DB_CONFIG = {
     'host': 'aws-1-eu-north-1.pooler.supabase.com',
@@ -112,39 +118,10 @@ class RealtimeDashboard:
             return self.stats
             
         try:
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
-            
-            # Get basic stats
-            cursor.execute("""
-                SELECT 
-                    COUNT(*) as total_workflows,
-                    COUNT(*) FILTER (WHERE layer1_success AND layer2_success AND layer3_success) as fully_successful,
-                    COUNT(*) FILTER (WHERE NOT (layer1_success AND layer2_success AND layer3_success) 
-                                      AND (layer1_success OR layer2_success OR layer3_success)) as partial_success,
-                    COUNT(*) FILTER (WHERE error_message IS NOT NULL 
-                                      AND error_message NOT LIKE '%404%' 
-                                      AND error_message NOT LIKE '%no iframe%'
-                                      AND error_message NOT LIKE '%no content%') as failed,
-                    COUNT(*) FILTER (WHERE error_message IS NOT NULL 
-                                      AND (error_message LIKE '%404%' 
-                                           OR error_message LIKE '%no iframe%'
-                                           OR error_message LIKE '%no content%'
-                                           OR error_message LIKE '%empty%'
-                                           OR quality_score = 0)) as invalid,
-                    COUNT(*) FILTER (WHERE extracted_at IS NULL 
-                                      OR (layer1_success = false AND layer2_success = false AND layer3_success = false 
-                                          AND error_message IS NULL)) as pending,
-                    COUNT(*) FILTER (WHERE layer1_success = true) as layer1_success_count,
-                    COUNT(*) FILTER (WHERE layer2_success = true) as layer2_success_count,
-                    COUNT(*) FILTER (WHERE layer3_success = true) as layer3_success_count,
-                    ROUND(AVG(quality_score)::numeric, 2) as avg_quality_score,
-                    ROUND(AVG(processing_time)::numeric, 2) as avg_processing_time,
-                    MIN(extracted_at) as first_workflow,
-                    MAX(extracted_at) as latest_workflow
-                FROM workflows;
-            """)
+            # Get basic stats (summary table, O(1) rows)
+            stats = read_statistics_dbapi(conn)
             
-            stats = cursor.fetchone()
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
             
             # Get recent activity (last 5 minutes)
             five_min_ago = datetime.now() - timedelta(minutes=5)
@@ -210,7 +187,7 @@ class RealtimeDashboard:
                 'last_update': datetime.now().isoformat(),
                 'is_scraping': recent['recent_workflows'] > 0 or has_active_scraping or (scraping_progress and scraping_progress.get('completed', 0) > 0),
                 'active_processes': active_processes if 'active_processes' in locals() else 0,
-                'success_rate': round((stats['fully_successful'] / stats['total_workflows'] * 100), 1) if stats['total_workflows'] > 0 else 0,
+                'success_rate': stats['success_rate'],
                 # Real scraping progress
                 'scraping_progress': scraping_progress
             })
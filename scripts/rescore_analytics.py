@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Re-score Layers 4-7 for all stored workflows.
+
+Recomputes business intelligence, community, technical and performance
+analytics from the Layer 1/2/3 outputs already in the database. No scraping
+and no network access; run after changing a keyword list or scoring rule.
+
+Usage:
+    python scripts/rescore_analytics.py
+    python scripts/rescore_analytics.py --chunk-size 1000 --limit 200 --dry-run
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scrapers.batch_analytics import BatchAnalyticsEngine
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-score Layers 4-7 from stored workflow data")
+    parser.add_argument("--chunk-size", type=int, default=500, help="Workflows per chunk")
+    parser.add_argument("--limit", type=int, default=None, help="Stop after this many workflows")
+    parser.add_argument("--dry-run", action="store_true", help="Score without writing results")
+    args = parser.parse_args()
+
+    engine = BatchAnalyticsEngine(chunk_size=args.chunk_size)
+    stats = engine.run(limit=args.limit, dry_run=args.dry_run)
+
+    print(f"Re-scored {stats['workflows']} workflows in {stats['seconds']:.1f}s "
+          f"({stats['chunks']} chunks, {stats['rows_written']} rows written, "
+          f"{stats['layer_failures']} layer failures)")
+
+
+if __name__ == "__main__":
+    main()
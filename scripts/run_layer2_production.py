@@ -16,6 +16,7 @@ from loguru import logger
 sys.path.insert(0, '/Users/tsvikavagman/Desktop/Code Projects/shared-tools/n8n-scraper')
 
 from src.scrapers.layer2_enhanced import EnhancedLayer2Extractor
+from src.storage.write_buffer import WriteBehindBuffer
 
 # Configure logger (clean format like Layer 1)
 logger.remove()  # Remove default handler
@@ -44,6 +45,7 @@ class Layer2ProductionRunner:
         self.total_workflows = 0
         self.extraction_times = []
         self.errors = []
+        self.buffer = None  # WriteBehindBuffer, open while run() is processing
     
     def get_workflows_to_process(self):
         """Get workflows that need Layer 2 processing (with resume support)."""
@@ -81,79 +83,92 @@ class Layer2ProductionRunner:
             print(f"❌ Error fetching workflows: {e}")
             return []
     
-    def store_to_database(self, workflow_id, result):
-        """Store extraction result to Supabase."""
+    def write_results(self, records):
+        """Store several extraction results to Supabase in one transaction."""
+        
+        conn = psycopg2.connect(
+            host=DB_HOST,
+            port=DB_PORT,
+            database=DB_NAME,
+            user=DB_USER,
+            password=DB_PASSWORD,
+            sslmode='require'
+        )
         
         try:
-            conn = psycopg2.connect(
-                host=DB_HOST,
-                port=DB_PORT,
-                database=DB_NAME,
-                user=DB_USER,
-                password=DB_PASSWORD,
-                sslmode='require'
-            )
-            
             cursor = conn.cursor()
-            
-            # Prepare data
-            api_data = result['sources']['api']
-            iframe_data = result['sources']['iframe']
-            
-            # Extract node types
-            nodes = api_data.get('data', {}).get('workflow', {}).get('nodes', [])
-            node_types = list(set(node.get('type') for node in nodes if node.get('type')))
-            
-            # Insert/Update
-            cursor.execute("""
-                INSERT INTO workflow_structure (
-                    workflow_id, node_count, connection_count, node_types,
-                    extraction_type, fallback_used, workflow_json,
-                    iframe_data, visual_layout, enhanced_content, media_content,
-                    extraction_sources, completeness_metrics, extracted_at
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (workflow_id) DO UPDATE SET
-                    node_count = EXCLUDED.node_count,
-                    connection_count = EXCLUDED.connection_count,
-                    node_types = EXCLUDED.node_types,
-                    extraction_type = EXCLUDED.extraction_type,
-                    fallback_used = EXCLUDED.fallback_used,
-                    workflow_json = EXCLUDED.workflow_json,
-                    iframe_data = EXCLUDED.iframe_data,
-                    visual_layout = EXCLUDED.visual_layout,
-                    enhanced_content = EXCLUDED.enhanced_content,
-                    media_content = EXCLUDED.media_content,
-                    extraction_sources = EXCLUDED.extraction_sources,
-                    completeness_metrics = EXCLUDED.completeness_metrics,
-                    extracted_at = EXCLUDED.extracted_at;
-            """, (
-                workflow_id,
-                api_data.get('node_count'),
-                api_data.get('connection_count'),
-                json.dumps(node_types),
-                api_data.get('extraction_type', 'full'),
-                api_data.get('fallback_used', False),
-                json.dumps(api_data.get('data')),
-                json.dumps(iframe_data.get('nodes')),
-                json.dumps(iframe_data.get('visual_layout')),
-                json.dumps(iframe_data.get('enhanced_content')),
-                json.dumps(iframe_data.get('media_content')),
-                json.dumps({'api': api_data.get('success'), 'iframe': iframe_data.get('success')}),
-                json.dumps(result.get('completeness')),
-                datetime.utcnow()
-            ))
-            
-            # Update layer2_success flag in workflows table
-            cursor.execute("""
-                UPDATE workflows 
-                SET layer2_success = true, extracted_at = %s
-                WHERE workflow_id = %s
-            """, (datetime.utcnow(), workflow_id))
-            
+            for record in records:
+                self._write_result(cursor, record['workflow_id'], record['result'])
             conn.commit()
             cursor.close()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
             conn.close()
-            
+    
+    def _write_result(self, cursor, workflow_id, result):
+        """Write one extraction result with an open cursor (committed by the caller)."""
+        
+        # Prepare data
+        api_data = result['sources']['api']
+        iframe_data = result['sources']['iframe']
+        
+        # Extract node types
+        nodes = api_data.get('data', {}).get('workflow', {}).get('nodes', [])
+        node_types = list(set(node.get('type') for node in nodes if node.get('type')))
+        
+        # Insert/Update
+        cursor.execute("""
+            INSERT INTO workflow_structure (
+                workflow_id, node_count, connection_count, node_types,
+                extraction_type, fallback_used, workflow_json,
+                iframe_data, visual_layout, enhanced_content, media_content,
+                extraction_sources, completeness_metrics, extracted_at
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ON CONFLICT (workflow_id) DO UPDATE SET
+                node_count = EXCLUDED.node_count,
+                connection_count = EXCLUDED.connection_count,
+                node_types = EXCLUDED.node_types,
+                extraction_type = EXCLUDED.extraction_type,
+                fallback_used = EXCLUDED.fallback_used,
+                workflow_json = EXCLUDED.workflow_json,
+                iframe_data = EXCLUDED.iframe_data,
+                visual_layout = EXCLUDED.visual_layout,
+                enhanced_content = EXCLUDED.enhanced_content,
+                media_content = EXCLUDED.media_content,
+                extraction_sources = EXCLUDED.extraction_sources,
+                completeness_metrics = EXCLUDED.completeness_metrics,
+                extracted_at = EXCLUDED.extracted_at;
+        """, (
+            workflow_id,
+            api_data.get('node_count'),
+            api_data.get('connection_count'),
+            json.dumps(node_types),
+            api_data.get('extraction_type', 'full'),
+            api_data.get('fallback_used', False),
+            json.dumps(api_data.get('data')),
+            json.dumps(iframe_data.get('nodes')),
+            json.dumps(iframe_data.get('visual_layout')),
+            json.dumps(iframe_data.get('enhanced_content')),
+            json.dumps(iframe_data.get('media_content')),
+            json.dumps({'api': api_data.get('success'), 'iframe': iframe_data.get('success')}),
+            json.dumps(result.get('completeness')),
+            datetime.utcnow()
+        ))
+        
+        # Update layer2_success flag in workflows table
+        cursor.execute("""
+            UPDATE workflows 
+            SET layer2_success = true, extracted_at = %s
+            WHERE workflow_id = %s
+        """, (datetime.utcnow(), workflow_id))
+    
+    def store_to_database(self, workflow_id, result):
+        """Store extraction result to Supabase."""
+        
+        try:
+            self.write_results([{'workflow_id': workflow_id, 'result': result}])
             return True
             
         except Exception as e:
@@ -233,19 +248,19 @@ class Layer2ProductionRunner:
             # Extract
             result = await extractor.extract_complete(workflow_id, url)
             
-            # Store
-            stored = self.store_to_database(workflow_id, result)
+            # Store (spooled now, committed with the next group commit)
+            await self.buffer.add({'workflow_id': workflow_id, 'result': result})
             
             # Track
             self.processed += 1
-            if result['completeness']['merged'] == 100.0 and stored:
+            if result['completeness']['merged'] == 100.0:
                 self.successful += 1
                 self.extraction_times.append(result['extraction_time'])
             else:
                 self.failed += 1
                 self.errors.append({
                     'workflow_id': workflow_id,
-                    'error': 'Storage failed' if not stored else 'Incomplete extraction'
+                    'error': 'Incomplete extraction'
                 })
             
             # Print progress after EVERY workflow
@@ -323,8 +338,9 @@ class Layer2ProductionRunner:
         logger.info("🔄 STARTING EXTRACTION")
         logger.info("="*80)
         
-        # Process workflows
-        async with EnhancedLayer2Extractor() as extractor:
+        # Process workflows (results are group-committed through the write-behind buffer)
+        async with EnhancedLayer2Extractor() as extractor, \
+                WriteBehindBuffer('layer2_production', self.write_results) as self.buffer:
             for workflow_id, url in workflows:
                 await self.process_workflow(extractor, workflow_id, url)
                 
@@ -353,6 +369,8 @@ class Layer2ProductionRunner:
         logger.info(f"Total Workflows: {self.total_workflows:,}")
         logger.info(f"✅ Successful: {self.successful:,} ({self.successful/self.total_workflows*100:.1f}%)")
         logger.info(f"❌ Failed: {self.failed:,} ({self.failed/self.total_workflows*100:.1f}%)")
+        if self.buffer is not None:
+            logger.info(f"❌ Failed saves: {self.buffer.dead_lettered:,} (in {self.buffer.dead_letter_path})")
         
         if self.extraction_times:
             avg_time = sum(self.extraction_times) / len(self.extraction_times)
@@ -26,6 +26,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.scrapers.unified_workflow_extractor import UnifiedWorkflowExtractor
 from src.storage.database import get_session
+from src.storage.write_buffer import WriteBehindBuffer
 from n8n_shared.models import Workflow
 from src.monitoring import ProgressTracker
 import logging
@@ -40,6 +41,7 @@ logger = logging.getLogger(__name__)
 
 async def scrape_workflow(extractor: UnifiedWorkflowExtractor, 
                           tracker: ProgressTracker,
+                          buffer: WriteBehindBuffer,
                           workflow_id: str, 
                           url: str) -> bool:
     """
@@ -48,6 +50,7 @@ async def scrape_workflow(extractor: UnifiedWorkflowExtractor,
     Args:
         extractor: UnifiedWorkflowExtractor instance
         tracker: ProgressTracker instance
+        buffer: Write-behind buffer the result is saved through
         workflow_id: Workflow ID
         url: Workflow URL
         
@@ -65,28 +68,18 @@ async def scrape_workflow(extractor: UnifiedWorkflowExtractor,
         result = await extractor.extract(workflow_id, url)
         
         if result['success'] and result['data']:
-            # Save to database
-            saved = extractor.save_to_database(workflow_id, result['data'])
+            # Save to database (spooled now, committed with the next group commit)
+            await buffer.add({'workflow_id': workflow_id, 'data': result['data']})
             
-            if saved:
-                tracker.update(
-                    current_workflow_id=workflow_id,
-                    status="Saved",
-                    completed_delta=1
-                )
-                logger.info(f"✅ [{workflow_id}] Success - "
-                           f"{result['data']['node_count']} nodes, "
-                           f"{result['data']['video_count']} videos")
-                return True
-            else:
-                tracker.update(
-                    current_workflow_id=workflow_id,
-                    status="Save failed",
-                    failed_delta=1,
-                    error="Database save failed"
-                )
-                logger.error(f"❌ [{workflow_id}] Save failed")
-                return False
+            tracker.update(
+                current_workflow_id=workflow_id,
+                status="Saved",
+                completed_delta=1
+            )
+            logger.info(f"✅ [{workflow_id}] Success - "
+                       f"{result['data']['node_count']} nodes, "
+                       f"{result['data']['video_count']} videos")
+            return True
         else:
             error_msg = result.get('error', 'Unknown error')
             tracker.update(
@@ -147,18 +140,21 @@ async def main():
     
     # Initialize extractor
     async with UnifiedWorkflowExtractor(headless=True) as extractor:
-        for idx, workflow in enumerate(workflows, 1):
-            logger.info(f"[{idx}/{total}] Processing workflow {workflow.workflow_id}...")
-            
-            await scrape_workflow(
-                extractor,
-                tracker,
-                workflow.workflow_id,
-                workflow.url
-            )
-            
-            # Rate limiting
-            await asyncio.sleep(0.5)
+        # Group-commit results; replays anything a crashed run left in the spool
+        async with WriteBehindBuffer('production_unified', extractor.save_many_to_database) as buffer:
+            for idx, workflow in enumerate(workflows, 1):
+                logger.info(f"[{idx}/{total}] Processing workflow {workflow.workflow_id}...")
+                
+                await scrape_workflow(
+                    extractor,
+                    tracker,
+                    buffer,
+                    workflow.workflow_id,
+                    workflow.url
+                )
+                
+                # Rate limiting
+                await asyncio.sleep(0.5)
     
     # Finish tracking
     tracker.finish(status="Completed")
@@ -171,6 +167,7 @@ async def main():
     logger.info("=" * 80)
     logger.info(f"✅ Completed: {progress.completed:,}")
     logger.info(f"❌ Failed:    {progress.failed:,}")
+    logger.info(f"❌ Failed saves: {buffer.dead_lettered:,} (in {buffer.dead_letter_path})")
     logger.info(f"📈 Success:   {progress.success_rate:.2f}%")
     logger.info(f"⏱️  Duration:  {progress.elapsed_seconds/3600:.2f}h")
     logger.info("=" * 80)
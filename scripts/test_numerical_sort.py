@@ -13,9 +13,8 @@ spec.loader.exec_module(view_database)
 
 try:
     # Test the get_workflows function with workflow_id sort
-    workflows, total = view_database.get_workflows(
+    page, total, _ = view_database.get_workflows(
         limit=10, 
-        offset=0, 
         search=None, 
         sort_by='workflow_id', 
         sort_order='ASC'
@@ -23,20 +22,19 @@ try:
     
     print("✅ Database viewer numerical sort test:")
     print("Workflow IDs in order:")
-    for w in workflows:
+    for w in page.rows:
         print(f"  {w['workflow_id']}")
     
     # Test DESC sort too
-    workflows_desc, total = view_database.get_workflows(
+    page_desc, total, _ = view_database.get_workflows(
         limit=5, 
-        offset=0, 
         search=None, 
         sort_by='workflow_id', 
         sort_order='DESC'
     )
     
     print("\n✅ DESC sort test:")
-    for w in workflows_desc:
+    for w in page_desc.rows:
         print(f"  {w['workflow_id']}")
         
 except Exception as e:
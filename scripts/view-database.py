@@ -8,9 +8,16 @@ import psycopg2
 from psycopg2.extras import RealDictCursor
 from datetime import datetime
 from http.server import HTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+import sys
 import urllib.parse
 import json
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.storage.pagination import estimate_count, fetch_page
+
 # Database connection
 DB_CONFIG = {
     'host': 'n8n-scraper-database',
@@ -24,73 +31,56 @@ def get_db_connection():
     """Get database connection"""
     return psycopg2.connect(**DB_CONFIG)
 
-def get_workflows(limit=50, offset=0, search=None, sort_by='extracted_at', sort_order='DESC'):
-    """Get workflows with optional search and sorting"""
+WORKFLOW_COLUMNS = """
+    workflow_id,
+    url,
+    quality_score,
+    layer1_success,
+    layer2_success,
+    layer3_success,
+    processing_time,
+    created_at,
+    extracted_at,
+    last_scraped_at,
+    error_message,
+    retry_count,
+    CASE 
+        WHEN layer1_success AND layer2_success AND layer3_success THEN 'fully_scraped'
+        WHEN layer1_success OR layer2_success OR layer3_success THEN 'partially_scraped'
+        WHEN last_scraped_at IS NOT NULL THEN 'attempted'
+        ELSE 'not_scraped'
+    END as scraping_status
+"""
+
+def get_workflows(limit=50, cursor=None, backwards=False, search=None, sort_by='extracted_at', sort_order='DESC'):
+    """Get one page of workflows with optional search and sorting
+    
+    Pages by keyset (see src.storage.pagination): `cursor` is a cursor of the
+    previous page, `backwards` selects the page before it. Returns
+    (page, total, whether total is exact); the total is the stats summary or
+    a planner estimate, not a COUNT(*).
+    """
     conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
     
     where_clause = ""
     params = []
     
     if search:
-        where_clause = "WHERE workflow_id ILIKE %s OR url ILIKE %s"
+        where_clause = "workflow_id ILIKE %s OR url ILIKE %s"
         search_pattern = f"%{search}%"
         params = [search_pattern, search_pattern]
     
-    # Validate sort column to prevent SQL injection
-    valid_sort_columns = {
-        'workflow_id': 'CAST(workflow_id AS INTEGER)',
-        'url': 'url',
-        'quality_score': 'quality_score',
-        'processing_time': 'processing_time',
-        'created_at': 'created_at',
-        'extracted_at': 'extracted_at',
-        'last_scraped_at': 'last_scraped_at',
-        'scraping_status': 'CASE WHEN layer1_success AND layer2_success AND layer3_success THEN 4 WHEN layer1_success OR layer2_success OR layer3_success THEN 3 WHEN last_scraped_at IS NOT NULL THEN 2 ELSE 1 END'
-    }
-    
-    sort_column = valid_sort_columns.get(sort_by, 'extracted_at')
-    sort_order = 'ASC' if sort_order.upper() == 'ASC' else 'DESC'
-    
-    query = f"""
-            SELECT 
-                workflow_id,
-                url,
-                quality_score,
-                layer1_success,
-                layer2_success,
-                layer3_success,
-                processing_time,
-                created_at,
-                extracted_at,
-                last_scraped_at,
-                error_message,
-                retry_count,
-                CASE 
-                    WHEN layer1_success AND layer2_success AND layer3_success THEN 'fully_scraped'
-                    WHEN layer1_success OR layer2_success OR layer3_success THEN 'partially_scraped'
-                    WHEN last_scraped_at IS NOT NULL THEN 'attempted'
-                    ELSE 'not_scraped'
-                END as scraping_status
-            FROM workflows
-            {where_clause}
-            ORDER BY {sort_column} {sort_order}
-            LIMIT %s OFFSET %s
-        """
-    params.extend([limit, offset])
-    
-    cursor.execute(query, params)
-    workflows = cursor.fetchall()
-    
-    # Get total count
-    count_query = f"SELECT COUNT(*) FROM workflows {where_clause}"
-    cursor.execute(count_query, params[:len(params)-2] if where_clause else [])
-    total = cursor.fetchone()['count']
-    
-    cursor.close()
-    conn.close()
+    # Sort names are validated against SORT_KEYS to prevent SQL injection
+    try:
+        page = fetch_page(
+            conn, WORKFLOW_COLUMNS, sort=sort_by, order=sort_order, limit=limit,
+            cursor=cursor, backwards=backwards, where=where_clause, params=params
+        )
+        total, exact = estimate_count(conn, where_clause, params)
+    finally:
+        conn.close()
     
-    return workflows, total
+    return page, total, exact
 
 def get_statistics():
     """Get database statistics"""
@@ -120,23 +110,21 @@ def get_statistics():
     
     return stats
 
-def generate_html(workflows, stats, total, page=1, limit=50, search=None, sort_by='extracted_at', sort_order='desc'):
+def generate_html(page, stats, total, total_exact=True, search=None, sort_by='extracted_at', sort_order='desc'):
     """Generate HTML page"""
     
-    # Calculate pagination
-    total_pages = (total + limit - 1) // limit
+    workflows = page.rows
     
-    # Helper function to generate sort links
+    # Helper function to generate sort links (a new sort starts at its first page)
     def sort_link(column, display_name):
         current_order = 'asc' if sort_by == column and sort_order.lower() == 'desc' else 'desc'
         search_param = f"&search={urllib.parse.quote(search)}" if search else ""
-        page_param = f"&page=1" if sort_by != column else f"&page={page}"
         
         active_class = "sort-active" if sort_by == column else ""
         arrow = "↑" if sort_by == column and sort_order.lower() == 'asc' else "↓" if sort_by == column and sort_order.lower() == 'desc' else ""
         
         return f'''
-            <a href="/?sort={column}&order={current_order}{search_param}{page_param}" class="sort-link {active_class}">
+            <a href="/?sort={column}&order={current_order}{search_param}" class="sort-link {active_class}">
                 {display_name} {arrow}
             </a>
         '''
@@ -559,43 +547,23 @@ def generate_html(workflows, stats, total, page=1, limit=50, search=None, sort_b
         <div class="pagination">
     """
     
-    # Pagination controls
-    if total_pages > 1:
-        # Previous button
-        prev_disabled = 'disabled' if page == 1 else ''
-        search_param = f"&search={urllib.parse.quote(search)}" if search else ""
-        
-        prev_style = 'style="pointer-events: none; opacity: 0.5;"' if page == 1 else ""
-        html += f'<a href="/?page={page-1}{search_param}" class="page-btn" {prev_style}>← Previous</a>'
-        
-        # Page numbers (show max 7 pages around current)
-        start_page = max(1, page - 3)
-        end_page = min(total_pages, page + 3)
-        
-        if start_page > 1:
-            html += f'<a href="/?page=1{search_param}" class="page-btn">1</a>'
-            if start_page > 2:
-                html += '<span>...</span>'
-        
-        for p in range(start_page, end_page + 1):
-            active_class = 'active' if p == page else ''
-            html += f'<a href="/?page={p}{search_param}" class="page-btn {active_class}">{p}</a>'
-        
-        if end_page < total_pages:
-            if end_page < total_pages - 1:
-                html += '<span>...</span>'
-            html += f'<a href="/?page={total_pages}{search_param}" class="page-btn">{total_pages}</a>'
-        
-        # Next button
-        next_style = 'style="pointer-events: none; opacity: 0.5;"' if page == total_pages else ""
-        html += f'<a href="/?page={page+1}{search_param}" class="page-btn" {next_style}>Next →</a>'
+    # Pagination controls (keyset: first/previous/next, no page numbers)
+    list_params = f"sort={urllib.parse.quote(sort_by)}&order={urllib.parse.quote(sort_order.lower())}"
+    if search:
+        list_params += f"&search={urllib.parse.quote(search)}"
+    
+    if page.prev_cursor:
+        html += f'<a href="/?{list_params}" class="page-btn">⇤ First</a>'
+        html += f'<a href="/?{list_params}&cursor={page.prev_cursor}&direction=prev" class="page-btn">← Previous</a>'
+    
+    if page.next_cursor:
+        html += f'<a href="/?{list_params}&cursor={page.next_cursor}" class="page-btn">Next →</a>'
     
     html += f"""
         </div>
         
         <div class="refresh-info" style="border-top: 1px solid #dee2e6;">
-            Showing {(page-1)*limit + 1} to {min(page*limit, total)} of {total:,} workflows • 
-            Page {page} of {total_pages}
+            Showing {len(workflows)} of {'' if total_exact else '~'}{total:,} workflows
         </div>
     </div>
     
@@ -624,7 +592,8 @@ class DatabaseViewerHandler(BaseHTTPRequestHandler):
             return
         
         # Get parameters
-        page = int(params.get('page', [1])[0])
+        cursor = params.get('cursor', [None])[0]
+        backwards = params.get('direction', ['next'])[0] == 'prev'
         search = params.get('search', [None])[0]
         sort_by = params.get('sort', ['extracted_at'])[0]
         sort_order = params.get('order', ['desc'])[0]
@@ -633,16 +602,26 @@ class DatabaseViewerHandler(BaseHTTPRequestHandler):
         try:
             # Get data
             stats = get_statistics()
-            workflows, total = get_workflows(
-                limit=limit,
-                offset=(page-1)*limit,
-                search=search,
-                sort_by=sort_by,
-                sort_order=sort_order
-            )
+            try:
+                page, total, exact = get_workflows(
+                    limit=limit,
+                    cursor=cursor,
+                    backwards=backwards,
+                    search=search,
+                    sort_by=sort_by,
+                    sort_order=sort_order
+                )
+            except ValueError:
+                # Stale or foreign cursor: start from the first page
+                page, total, exact = get_workflows(
+                    limit=limit,
+                    search=search,
+                    sort_by=sort_by,
+                    sort_order=sort_order
+                )
             
             # Generate HTML
-            html = generate_html(workflows, stats, total, page, limit, search, sort_by, sort_order)
+            html = generate_html(page, stats, total, exact, search, sort_by, sort_order)
             
             # Send response
             self.send_response(200)
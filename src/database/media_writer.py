@@ -0,0 +1,213 @@
+"""
+Buffered Media Writer
+
+Collects image/video rows in memory and writes them with `executemany` in a
+single transaction per workflow (or per N workflows) over one long-lived
+WAL-mode connection, instead of one connect + read-modify-write + commit per item.
+
+If the database also has the legacy `workflows` table, the rows of each flush
+(normally one ended batch) are appended to its image_urls / ocr_text /
+video_urls / video_transcripts columns in the same transaction, so existing
+readers keep working. Only the new rows are appended; a workflow's earlier
+rows are never re-aggregated.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from loguru import logger
+
+from src.database.multimodal_schema import create_multimodal_tables
+
+
+class MediaWriter:
+    """
+    Append-only writer for workflow_images / workflow_videos.
+
+    Usage:
+        with MediaWriter("data/workflows.db", flush_every=10) as writer:
+            writer.add_image(workflow_id, url, True, text)
+            writer.end_workflow(workflow_id)   # commits every 10 workflows
+    """
+
+    def __init__(self, db_path: Union[str, Path], flush_every: int = 1, sync_legacy: bool = True):
+        """
+        Initialize media writer.
+
+        Args:
+            db_path: Path to SQLite database
+            flush_every: Number of completed workflows per transaction
+            sync_legacy: Refresh aggregate JSON columns on the `workflows` table if present
+        """
+        self.db_path = Path(db_path)
+        self.flush_every = max(1, flush_every)
+        self.sync_legacy = sync_legacy
+        self._has_legacy_table: Optional[bool] = None
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._images: List[Tuple] = []
+        self._videos: List[Tuple] = []
+        self._pending_workflows = 0
+
+        self.stats = {
+            'images_written': 0,
+            'videos_written': 0,
+            'transactions': 0
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the shared connection and ensure the schema exists."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            create_multimodal_tables(self._conn)
+        return self._conn
+
+    def add_image(
+        self,
+        workflow_id: str,
+        image_url: str,
+        success: bool,
+        ocr_text: Optional[str],
+        error_message: Optional[str] = None
+    ):
+        """Buffer one OCR result."""
+        with self._lock:
+            self._images.append((
+                workflow_id, image_url, ocr_text,
+                len(ocr_text) if ocr_text else 0,
+                datetime.utcnow().isoformat(), success, error_message
+            ))
+
+    def add_video(
+        self,
+        workflow_id: str,
+        video_url: str,
+        video_id: Optional[str],
+        success: bool,
+        transcript: Optional[str],
+        error_message: Optional[str] = None
+    ):
+        """Buffer one video/transcript result."""
+        with self._lock:
+            self._videos.append((
+                workflow_id, video_url, video_id, transcript,
+                len(transcript) if transcript else 0,
+                datetime.utcnow().isoformat(), success, error_message
+            ))
+
+    def end_workflow(self, workflow_id: str):
+        """Mark a workflow complete; flushes once `flush_every` workflows are buffered."""
+        with self._lock:
+            self._pending_workflows += 1
+            should_flush = self._pending_workflows >= self.flush_every
+        if should_flush:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write all buffered rows in one transaction.
+
+        Returns:
+            Number of rows written
+        """
+        with self._lock:
+            images, self._images = self._images, []
+            videos, self._videos = self._videos, []
+            self._pending_workflows = 0
+
+            if not images and not videos:
+                return 0
+
+            conn = self._connection()
+            try:
+                with conn:
+                    if images:
+                        conn.executemany(
+                            "INSERT INTO workflow_images (workflow_id, image_url, ocr_text, text_length, "
+                            "extraction_date, success, error_message) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            images
+                        )
+                    if videos:
+                        conn.executemany(
+                            "INSERT INTO workflow_videos (workflow_id, video_url, video_id, transcript, "
+                            "transcript_length, extraction_date, success, error_message) "
+                            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                            videos
+                        )
+                    if self.sync_legacy and self._legacy_table_exists(conn):
+                        self._sync_legacy_columns(conn, images, videos)
+            except sqlite3.Error as e:
+                # Keep rows for the next flush rather than dropping them
+                self._images = images + self._images
+                self._videos = videos + self._videos
+                logger.error(f"Media flush failed ({len(images)} images, {len(videos)} videos): {e}")
+                raise
+
+            self.stats['images_written'] += len(images)
+            self.stats['videos_written'] += len(videos)
+            self.stats['transactions'] += 1
+            logger.debug(f"Flushed {len(images)} images and {len(videos)} videos in one transaction")
+            return len(images) + len(videos)
+
+    def _legacy_table_exists(self, conn: sqlite3.Connection) -> bool:
+        """Check once whether the legacy `workflows` table with media columns exists."""
+        if self._has_legacy_table is None:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(workflows)")}
+            self._has_legacy_table = {'image_urls', 'ocr_text', 'video_urls', 'video_transcripts'} <= columns
+        return self._has_legacy_table
+
+    def _sync_legacy_columns(self, conn: sqlite3.Connection, images: List[Tuple], videos: List[Tuple]):
+        """Append newly written rows to the legacy aggregate columns (same shape as the summary views)."""
+        # First row per workflow decides layer3_success for newly created records
+        first_success = {}
+        for row in images:
+            first_success.setdefault(row[0], row[5])
+        for row in videos:
+            first_success.setdefault(row[0], row[6])
+
+        now = datetime.utcnow()
+        conn.executemany(
+            "INSERT INTO workflows (workflow_id, scrape_date, layer3_success) "
+            "SELECT ?, ?, ? WHERE NOT EXISTS (SELECT 1 FROM workflows WHERE workflow_id = ?)",
+            [(wid, now, success, wid) for wid, success in first_success.items()]
+        )
+        # Row by row, in insertion order; unreadable legacy values restart as empty arrays
+        if images:
+            conn.executemany(
+                "UPDATE workflows SET "
+                "image_urls = json_insert(CASE WHEN json_valid(image_urls) THEN image_urls ELSE '[]' END, '$[#]', ?), "
+                "ocr_text = CASE WHEN COALESCE(?, '') = '' THEN COALESCE(ocr_text, '') "
+                "WHEN COALESCE(ocr_text, '') = '' THEN ? "
+                "ELSE ocr_text || char(10) || char(10) || ? END "
+                "WHERE workflow_id = ?",
+                [(row[1], row[2], row[2], row[2], row[0]) for row in images]
+            )
+        if videos:
+            conn.executemany(
+                "UPDATE workflows SET "
+                "video_urls = json_insert(CASE WHEN json_valid(video_urls) THEN video_urls ELSE '[]' END, '$[#]', ?), "
+                "video_transcripts = json_insert("
+                "CASE WHEN json_valid(video_transcripts) THEN video_transcripts ELSE '[]' END, '$[#]', json_object("
+                "'video_id', ?, 'video_url', ?, 'transcript', ?, 'length', ?, 'extraction_date', ?, "
+                "'success', CASE WHEN ? THEN json('true') ELSE json('false') END, 'error', ?)) "
+                "WHERE workflow_id = ?",
+                [(row[1], row[2], row[1], row[3], row[4], row[5], row[6], row[7], row[0]) for row in videos]
+            )
+
+    def close(self):
+        """Flush remaining rows and close the connection."""
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
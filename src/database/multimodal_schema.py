@@ -0,0 +1,130 @@
+"""
+Multimodal Media Schema - Append-Only Image and Video Tables
+
+One row per image / video instead of JSON arrays rewritten on every append.
+Per-workflow aggregates (image_urls, ocr_text, video_urls, video_transcripts)
+are produced at read time by SQL views, so writes never read-modify-write.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Union
+
+
+MEDIA_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS workflow_images (
+    id INTEGER PRIMARY KEY,
+    workflow_id TEXT NOT NULL,
+    image_url TEXT NOT NULL,
+    ocr_text TEXT,
+    text_length INTEGER,
+    extraction_date TEXT,
+    success BOOLEAN,
+    error_message TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_workflow_images_workflow_id ON workflow_images (workflow_id);
+
+CREATE TABLE IF NOT EXISTS workflow_videos (
+    id INTEGER PRIMARY KEY,
+    workflow_id TEXT NOT NULL,
+    video_url TEXT NOT NULL,
+    video_id TEXT,
+    transcript TEXT,
+    transcript_length INTEGER,
+    -- success / error_message at the same positions as in workflow_images
+    success BOOLEAN,
+    error_message TEXT,
+    extraction_date TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_workflow_videos_workflow_id ON workflow_videos (workflow_id);
+
+CREATE VIEW IF NOT EXISTS workflow_image_summary AS
+SELECT
+    workflow_id,
+    json_group_array(image_url) AS image_urls,
+    group_concat(NULLIF(ocr_text, ''), char(10) || char(10)) AS ocr_text,
+    COUNT(*) AS image_count
+FROM (SELECT * FROM workflow_images ORDER BY id)
+GROUP BY workflow_id;
+
+CREATE VIEW IF NOT EXISTS workflow_video_summary AS
+SELECT
+    workflow_id,
+    json_group_array(video_url) AS video_urls,
+    json_group_array(json_object(
+        'video_id', video_id,
+        'video_url', video_url,
+        'transcript', transcript,
+        'length', transcript_length,
+        'extraction_date', extraction_date,
+        'success', CASE WHEN success THEN json('true') ELSE json('false') END,
+        'error', error_message
+    )) AS video_transcripts,
+    COUNT(*) AS video_count
+FROM (SELECT * FROM workflow_videos ORDER BY id)
+GROUP BY workflow_id;
+"""
+
+
+def configure_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Enable WAL so readers don't block the writer, and relax fsync to once per checkpoint."""
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def create_multimodal_tables(db: Union[str, Path, sqlite3.Connection]) -> None:
+    """
+    Create media tables, indexes and summary views if they don't exist.
+
+    Args:
+        db: Database path or an open sqlite3 connection
+    """
+    if isinstance(db, sqlite3.Connection):
+        configure_connection(db)
+        db.executescript(MEDIA_SCHEMA_SQL)
+        return
+
+    Path(db).parent.mkdir(parents=True, exist_ok=True)
+    conn = configure_connection(sqlite3.connect(str(db)))
+    try:
+        conn.executescript(MEDIA_SCHEMA_SQL)
+    finally:
+        conn.close()
+
+
+def get_workflow_media(db: Union[str, Path, sqlite3.Connection], workflow_id: str) -> Dict[str, Any]:
+    """
+    Read the aggregated media for one workflow.
+
+    Returns the same shape the legacy `workflows` JSON columns had.
+
+    Args:
+        db: Database path or an open sqlite3 connection
+        workflow_id: Workflow identifier
+
+    Returns:
+        Dict with image_urls, ocr_text, video_urls and video_transcripts
+    """
+    conn = db if isinstance(db, sqlite3.Connection) else sqlite3.connect(str(db))
+    try:
+        images = conn.execute(
+            "SELECT image_urls, ocr_text FROM workflow_image_summary WHERE workflow_id = ?",
+            (workflow_id,)
+        ).fetchone()
+        videos = conn.execute(
+            "SELECT video_urls, video_transcripts FROM workflow_video_summary WHERE workflow_id = ?",
+            (workflow_id,)
+        ).fetchone()
+    finally:
+        if conn is not db:
+            conn.close()
+
+    return {
+        'workflow_id': workflow_id,
+        'image_urls': json.loads(images[0]) if images else [],
+        'ocr_text': (images[1] or "") if images else "",
+        'video_urls': json.loads(videos[0]) if videos else [],
+        'video_transcripts': json.loads(videos[1]) if videos else []
+    }
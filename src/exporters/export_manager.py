@@ -131,7 +131,8 @@ class ExportManager:
         Args:
             repository: WorkflowRepository instance
             limit: Optional limit on number of workflows
-            filters: Optional filters for workflow selection
+            filters: Optional filters for workflow selection: 'query' (full-text
+                search, ranked) and 'fields' (fields to search, default all)
             formats: Optional list of formats to export (default: all)
             
         Returns:
@@ -140,8 +141,12 @@ class ExportManager:
         # Fetch workflows from database
         logger.info("Fetching workflows from database...")
         
-        if filters:
-            workflows_db = repository.search_workflows(filters, limit=limit)
+        if filters and filters.get('query'):
+            workflows_db = repository.search_workflows(
+                filters['query'],
+                search_fields=filters.get('fields'),
+                limit=limit
+            )
         else:
             workflows_db = repository.list_workflows(limit=limit)
         
@@ -29,8 +29,11 @@ from src.scrapers.layer4_business_intelligence import BusinessIntelligenceExtrac
 from src.scrapers.layer5_community_data import CommunityDataExtractor
 from src.scrapers.layer6_technical_details import TechnicalDetailsExtractor
 from src.scrapers.layer7_performance_analytics import PerformanceAnalyticsExtractor
+from src.scrapers.text_corpus import WorkflowTextCorpus
+from src.scrapers.regex_registry import youtube_id
 from src.scrapers.multimodal_processor import MultimodalProcessor
 from src.scrapers.transcript_extractor import TranscriptExtractor
+from src.scrapers.transcript_cache import get_transcript_cache
 from src.validation.layer1_validator import Layer1Validator
 from src.validation.layer2_validator import Layer2Validator
 from src.validation.layer3_validator import Layer3Validator
@@ -202,9 +205,12 @@ class E2EPipeline:
             else:
                 logger.info(f"✅ Layer 3 complete: {layer3_result.get('extraction_time', 0):.2f}s")
             
+            # Text views of layers 1-3, built once and shared by analytics layers 4-7
+            corpus = WorkflowTextCorpus(result)
+            
             # PHASE 4: LAYER 4 - BUSINESS INTELLIGENCE EXTRACTION
             logger.info(f"Phase 4/10: Extracting Layer 4 business intelligence for {workflow_id}")
-            layer4_result = await self._extract_layer4(workflow_id, result)
+            layer4_result = await self._extract_layer4(workflow_id, result, corpus)
             result['layers']['layer4'] = layer4_result
             
             if not layer4_result.get('success'):
@@ -215,7 +221,7 @@ class E2EPipeline:
             
             # PHASE 5: LAYER 5 - COMMUNITY DATA EXTRACTION
             logger.info(f"Phase 5/10: Extracting Layer 5 community data for {workflow_id}")
-            layer5_result = await self._extract_layer5(workflow_id, result)
+            layer5_result = await self._extract_layer5(workflow_id, result, corpus)
             result['layers']['layer5'] = layer5_result
             
             if not layer5_result.get('success'):
@@ -226,7 +232,7 @@ class E2EPipeline:
             
             # PHASE 6: LAYER 6 - TECHNICAL DETAILS EXTRACTION
             logger.info(f"Phase 6/10: Extracting Layer 6 technical details for {workflow_id}")
-            layer6_result = await self._extract_layer6(workflow_id, result)
+            layer6_result = await self._extract_layer6(workflow_id, result, corpus)
             result['layers']['layer6'] = layer6_result
             
             if not layer6_result.get('success'):
@@ -237,7 +243,7 @@ class E2EPipeline:
             
             # PHASE 7: LAYER 7 - PERFORMANCE ANALYTICS EXTRACTION
             logger.info(f"Phase 7/10: Extracting Layer 7 performance analytics for {workflow_id}")
-            layer7_result = await self._extract_layer7(workflow_id, result)
+            layer7_result = await self._extract_layer7(workflow_id, result, corpus)
             result['layers']['layer7'] = layer7_result
             
             if not layer7_result.get('success'):
@@ -386,13 +392,18 @@ class E2EPipeline:
                 'metadata': {}
             }
     
-    async def _extract_layer4(self, workflow_id: str, workflow_data: Dict[str, Any]) -> Dict:
+    async def _extract_layer4(
+        self,
+        workflow_id: str,
+        workflow_data: Dict[str, Any],
+        corpus: Optional[WorkflowTextCorpus] = None
+    ) -> Dict:
         """Extract Layer 4 business intelligence."""
         try:
             if not self.layer4_extractor:
                 self.layer4_extractor = BusinessIntelligenceExtractor()
             
-            result = await self.layer4_extractor.extract(workflow_data)
+            result = await self.layer4_extractor.extract(workflow_data, corpus=corpus)
             return result
         except Exception as e:
             logger.error(f"Layer 4 extraction exception for {workflow_id}: {str(e)}")
@@ -405,13 +416,18 @@ class E2EPipeline:
                 'layer': 'layer4_business_intelligence'
             }
     
-    async def _extract_layer5(self, workflow_id: str, workflow_data: Dict[str, Any]) -> Dict:
+    async def _extract_layer5(
+        self,
+        workflow_id: str,
+        workflow_data: Dict[str, Any],
+        corpus: Optional[WorkflowTextCorpus] = None
+    ) -> Dict:
         """Extract Layer 5 community data."""
         try:
             if not self.layer5_extractor:
                 self.layer5_extractor = CommunityDataExtractor()
             
-            result = await self.layer5_extractor.extract(workflow_data)
+            result = await self.layer5_extractor.extract(workflow_data, corpus=corpus)
             return result
         except Exception as e:
             logger.error(f"Layer 5 extraction exception for {workflow_id}: {str(e)}")
@@ -424,13 +440,18 @@ class E2EPipeline:
                 'layer': 'layer5_community_data'
             }
     
-    async def _extract_layer6(self, workflow_id: str, workflow_data: Dict[str, Any]) -> Dict:
+    async def _extract_layer6(
+        self,
+        workflow_id: str,
+        workflow_data: Dict[str, Any],
+        corpus: Optional[WorkflowTextCorpus] = None
+    ) -> Dict:
         """Extract Layer 6 technical details."""
         try:
             if not self.layer6_extractor:
                 self.layer6_extractor = TechnicalDetailsExtractor()
             
-            result = await self.layer6_extractor.extract(workflow_data)
+            result = await self.layer6_extractor.extract(workflow_data, corpus=corpus)
             return result
         except Exception as e:
             logger.error(f"Layer 6 extraction exception for {workflow_id}: {str(e)}")
@@ -443,13 +464,18 @@ class E2EPipeline:
                 'layer': 'layer6_technical_details'
             }
     
-    async def _extract_layer7(self, workflow_id: str, workflow_data: Dict[str, Any]) -> Dict:
+    async def _extract_layer7(
+        self,
+        workflow_id: str,
+        workflow_data: Dict[str, Any],
+        corpus: Optional[WorkflowTextCorpus] = None
+    ) -> Dict:
         """Extract Layer 7 performance analytics."""
         try:
             if not self.layer7_extractor:
                 self.layer7_extractor = PerformanceAnalyticsExtractor()
             
-            result = await self.layer7_extractor.extract(workflow_data)
+            result = await self.layer7_extractor.extract(workflow_data, corpus=corpus)
             return result
         except Exception as e:
             logger.error(f"Layer 7 extraction exception for {workflow_id}: {str(e)}")
@@ -497,7 +523,9 @@ class E2EPipeline:
     async def _extract_transcripts(self, workflow_id: str, video_urls: List[str]) -> Dict:
         """Extract transcripts from video URLs."""
         try:
-            async with TranscriptExtractor(headless=self.headless, timeout=self.timeout) as extractor:
+            async with TranscriptExtractor(
+                headless=self.headless, timeout=self.timeout, cache=get_transcript_cache()
+            ) as extractor:
                 results = []
                 start_time = time.time()
                 
@@ -544,16 +572,7 @@ class E2EPipeline:
     
     def _extract_youtube_id(self, url: str) -> Optional[str]:
         """Extract YouTube video ID from URL."""
-        import re
-        patterns = [
-            r'(?:youtube\.com/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]{11})',
-            r'youtube\.com/embed/([a-zA-Z0-9_-]{11})'
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        return youtube_id(url)
     
     async def _validate_and_score(
         self,
@@ -25,6 +25,7 @@ from src.orchestrator.e2e_pipeline import E2EPipeline
 from src.orchestrator.rate_limiter import RateLimiter
 from src.orchestrator.retry_handler import RetryHandler, RetryableError, NonRetryableError
 from src.orchestrator.progress_tracker import ProgressTracker
+from src.storage.async_writer import AsyncWorkflowRepository
 from src.storage.repository import WorkflowRepository
 from src.storage.database import get_session
 
@@ -77,6 +78,8 @@ class WorkflowOrchestrator:
             checkpoint_dir: Directory for checkpoint files
         """
         self.repository = repository
+        # Blocking repository calls run on the storage writer thread, off the event loop
+        self.storage = AsyncWorkflowRepository(repository)
         self.batch_size = batch_size
         
         # Initialize E2E pipeline (reuse from SCRAPE-007)
@@ -160,7 +163,7 @@ class WorkflowOrchestrator:
             stored = False
             if store_result:
                 try:
-                    stored_workflow = self.repository.create_workflow(
+                    stored_workflow = await self.storage.create_workflow(
                         workflow_id=workflow_id,
                         url=url,
                         extraction_result=extraction_result
@@ -301,6 +304,7 @@ class WorkflowOrchestrator:
         
         # Process workflows
         results = []
+        store_tasks = []
         workflows_to_process = workflows[start_index:]
         
         logger.info(
@@ -312,12 +316,12 @@ class WorkflowOrchestrator:
         for batch_start in range(0, len(workflows_to_process), concurrent_limit):
             batch = workflows_to_process[batch_start:batch_start + concurrent_limit]
             
-            # Process batch concurrently
+            # Process batch concurrently (stored together below)
             batch_tasks = [
                 self.process_workflow(
                     workflow['id'],
                     workflow['url'],
-                    store_result=True
+                    store_result=False
                 )
                 for workflow in batch
             ]
@@ -325,6 +329,7 @@ class WorkflowOrchestrator:
             batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
             
             # Handle results
+            successful = []
             for result in batch_results:
                 if isinstance(result, Exception):
                     logger.error(f"Batch processing error: {result}")
@@ -335,10 +340,17 @@ class WorkflowOrchestrator:
                     })
                 else:
                     results.append(result)
+                    if result.get('success'):
+                        successful.append(result)
+            
+            # Store in the background while the next batch scrapes
+            store_tasks.append(asyncio.create_task(self._store_batch(successful)))
             
             # Print progress
             self.progress_tracker.print_progress_bar()
         
+        await asyncio.gather(*store_tasks)
+        
         # Finish tracking
         self.progress_tracker.finish_batch()
         
@@ -379,6 +391,27 @@ class WorkflowOrchestrator:
         
         return batch_summary
     
+    async def _store_batch(self, results: List[Dict[str, Any]]):
+        """
+        Store successful results with one bulk upsert per table.
+        
+        Args:
+            results: process_workflow results; `stored` is set on each
+        """
+        if not results:
+            return
+        try:
+            await self.storage.bulk_upsert_workflows([
+                (result['workflow_id'], result['url'], result['extraction_result'])
+                for result in results
+            ])
+        except Exception as store_error:
+            logger.error(f"Failed to store batch of {len(results)} workflows: {store_error}")
+            return
+        for result in results:
+            result['stored'] = True
+        self.stats['total_stored'] += len(results)
+    
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get comprehensive orchestrator statistics.
@@ -0,0 +1,319 @@
+"""
+Batch Analytics Engine for Re-Scoring Stored Workflows
+
+Layers 4-7 are pure functions of the stored Layer 1/2/3 outputs, so a change to
+a keyword list or scoring rule does not need a re-scrape. This engine reads the
+stored layer outputs for every workflow in keyset-paginated chunks, re-runs the
+analytics layers offline and bulk-writes the results back.
+
+Per chunk:
+- Numeric complexity rules of Layer 7 (success rates, cost multipliers,
+  support levels) are computed column-wise with NumPy over the whole chunk.
+- Text rules run per workflow through one shared WorkflowTextCorpus, so every
+  layer reuses the same compiled keyword scan.
+- Connection-graph metrics (depth, loops, parallel branches) are computed for
+  the whole chunk in one packed CSR pass.
+- Layers run through their synchronous cores (`extract_sync`), so no event
+  loop is involved.
+- Results are written with one bulk insert / bulk update per table.
+
+Usage:
+    engine = BatchAnalyticsEngine(chunk_size=500)
+    stats = engine.run()
+"""
+
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from src.scrapers.layer4_business_intelligence import BusinessIntelligenceExtractor
+from src.scrapers.layer5_community_data import CommunityDataExtractor
+from src.scrapers.layer6_technical_details import TechnicalDetailsExtractor
+from src.scrapers.layer7_performance_analytics import (
+    BASE_COSTS,
+    COMPLEXITY_TIERS,
+    DEFAULT_COMPLEXITY_TIER,
+    DEFAULT_SUCCESS_RATE,
+    ERROR_SHARE_OF_FAILURES,
+    LEVEL_FIELDS,
+    PerformanceAnalyticsExtractor,
+    SUCCESS_RATE_TIERS,
+)
+from src.scrapers.text_corpus import WorkflowTextCorpus
+from src.scrapers.workflow_graph import layer2_graph_metrics_batch
+
+
+ANALYTICS_LAYERS = ('layer4', 'layer5', 'layer6', 'layer7')
+
+# Layer -> ORM model holding its output (see WorkflowRepository.create_workflow)
+ANALYTICS_MODELS = {
+    'layer4': 'WorkflowBusinessIntelligence',
+    'layer5': 'WorkflowCommunityData',
+    'layer6': 'WorkflowTechnicalDetails',
+    'layer7': 'WorkflowPerformanceAnalytics'
+}
+
+STORED_COLUMNS = ('id', 'workflow_id', 'layer1', 'layer2_data', 'layer3')
+
+
+def complexity_estimates(node_count: Sequence[float], connection_count: Sequence[float]) -> pd.DataFrame:
+    """
+    Layer 7 complexity-tier fields for many workflows at once.
+
+    Uses the same tier tables as PerformanceAnalyticsExtractor, so each row
+    equals what the extractor computes for that workflow on its own.
+
+    Args:
+        node_count: Node count per workflow
+        connection_count: Connection count per workflow
+
+    Returns:
+        DataFrame with execution rates, `<name>_cost` and `<name>_level` columns
+        (rates are NaN where node_count <= 0, as the extractor leaves them unset)
+    """
+    nodes = np.asarray(node_count, dtype=float)
+    connections = np.asarray(connection_count, dtype=float)
+    complexity = nodes + connections
+
+    success_rate = np.select(
+        [nodes <= limit for limit, _ in SUCCESS_RATE_TIERS],
+        [rate for _, rate in SUCCESS_RATE_TIERS],
+        DEFAULT_SUCCESS_RATE
+    )
+    success_rate = np.where(nodes > 0, success_rate, np.nan)
+    failure_rate = 100.0 - success_rate
+
+    tiers = [complexity > lower_bound for lower_bound, _, _ in COMPLEXITY_TIERS]
+    default_level, default_multiplier = DEFAULT_COMPLEXITY_TIER
+    multiplier = np.select(tiers, [tier[2] for tier in COMPLEXITY_TIERS], default_multiplier)
+    level = np.select(tiers, [tier[1] for tier in COMPLEXITY_TIERS], default_level)
+
+    columns: Dict[str, Any] = {
+        'execution_success_rate': success_rate,
+        'execution_failure_rate': failure_rate,
+        'execution_error_rate': failure_rate * ERROR_SHARE_OF_FAILURES
+    }
+    for name, base_cost in BASE_COSTS.items():
+        columns[f"{name}_cost"] = base_cost * multiplier
+    for name in LEVEL_FIELDS:
+        columns[f"{name}_level"] = level
+    return pd.DataFrame(columns)
+
+
+def workflow_frame(rows: Sequence[Sequence[Any]]) -> pd.DataFrame:
+    """
+    Build a chunk frame from stored rows.
+
+    Args:
+        rows: (id, workflow_id, raw_metadata, workflow_json, raw_content) tuples,
+            i.e. the stored Layer 1 result, Layer 2 data and Layer 3 result
+
+    Returns:
+        DataFrame with one row per workflow plus numeric node/connection columns
+    """
+    frame = pd.DataFrame(list(rows), columns=list(STORED_COLUMNS))
+    frame['layer1'] = [value if isinstance(value, dict) else {} for value in frame['layer1']]
+    frame['layer3'] = [value if isinstance(value, dict) else {} for value in frame['layer3']]
+    frame['layer2_data'] = [value if isinstance(value, dict) else {} for value in frame['layer2_data']]
+
+    # Layers 6/7 read node and connection counts from the Layer 2 data dict
+    for column in ('node_count', 'connection_count'):
+        frame[column] = pd.to_numeric(
+            pd.Series([data.get(column, 0) for data in frame['layer2_data']], index=frame.index, dtype=object),
+            errors='coerce'
+        )
+    return frame
+
+
+def _workflow_data(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild the E2E pipeline result shape the analytics layers read."""
+    return {
+        'workflow_id': row['workflow_id'],
+        'layers': {
+            'layer1': row['layer1'],
+            'layer2': {'success': bool(row['layer2_data']), 'data': row['layer2_data']},
+            'layer3': row['layer3']
+        }
+    }
+
+
+class BatchAnalyticsEngine:
+    """
+    Re-scores Layers 4-7 for every stored workflow without network access.
+    """
+
+    def __init__(self, chunk_size: int = 500):
+        """
+        Initialize engine.
+
+        Args:
+            chunk_size: Workflows loaded, scored and written per chunk
+        """
+        self.chunk_size = chunk_size
+        self.layer4_extractor = BusinessIntelligenceExtractor()
+        self.layer5_extractor = CommunityDataExtractor()
+        self.layer6_extractor = TechnicalDetailsExtractor()
+        self.layer7_extractor = PerformanceAnalyticsExtractor()
+        self.stats = {'workflows': 0, 'chunks': 0, 'layer_failures': 0, 'rows_written': 0}
+
+    def load_chunks(self, session, limit: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """
+        Yield stored Layer 1/2/3 outputs in chunks, ordered by workflow row id.
+
+        Args:
+            session: SQLAlchemy session
+            limit: Stop after this many workflows (all if None)
+
+        Yields:
+            Chunk frames built by workflow_frame()
+        """
+        from n8n_shared.models import Workflow, WorkflowContent, WorkflowMetadata, WorkflowStructure
+
+        last_id = 0
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = self.chunk_size if remaining is None else min(self.chunk_size, remaining)
+            rows = (
+                session.query(
+                    Workflow.id,
+                    Workflow.workflow_id,
+                    WorkflowMetadata.raw_metadata,
+                    WorkflowStructure.workflow_json,
+                    WorkflowContent.raw_content
+                )
+                .outerjoin(WorkflowMetadata, WorkflowMetadata.workflow_id == Workflow.workflow_id)
+                .outerjoin(WorkflowStructure, WorkflowStructure.workflow_id == Workflow.workflow_id)
+                .outerjoin(WorkflowContent, WorkflowContent.workflow_id == Workflow.workflow_id)
+                .filter(Workflow.id > last_id)
+                .order_by(Workflow.id)
+                .limit(size)
+                .all()
+            )
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            if remaining is not None:
+                remaining -= len(rows)
+            yield workflow_frame(rows)
+
+    def score_chunk(self, frame: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Run Layers 4-7 over one chunk.
+
+        Args:
+            frame: Chunk built by workflow_frame()
+
+        Returns:
+            One {'id', 'workflow_id', 'layers'} dict per workflow, where layers
+            holds the same result dicts the E2E pipeline produces
+        """
+        numeric = frame['node_count'].notna() & frame['connection_count'].notna()
+        estimates = complexity_estimates(
+            frame['node_count'].fillna(0), frame['connection_count'].fillna(0)
+        ).astype(object)
+        estimates = estimates.where(estimates.notna(), None).to_dict('records')
+        graphs = layer2_graph_metrics_batch(list(frame['layer2_data']))
+
+        scored = []
+        for position, row in enumerate(frame.to_dict('records')):
+            workflow_data = _workflow_data(row)
+            corpus = WorkflowTextCorpus(workflow_data, graph_metrics=graphs[position])
+            layers = {
+                'layer4': self.layer4_extractor.extract_sync(workflow_data, corpus=corpus),
+                'layer5': self.layer5_extractor.extract_sync(workflow_data, corpus=corpus),
+                'layer6': self.layer6_extractor.extract_sync(workflow_data, corpus=corpus),
+                'layer7': self.layer7_extractor.extract_sync(
+                    workflow_data,
+                    corpus=corpus,
+                    estimates=estimates[position] if numeric.iat[position] else None
+                )
+            }
+            self.stats['layer_failures'] += sum(1 for result in layers.values() if not result.get('success'))
+            scored.append({'id': row['id'], 'workflow_id': row['workflow_id'], 'layers': layers})
+
+        self.stats['workflows'] += len(scored)
+        self.stats['chunks'] += 1
+        return scored
+
+    def write_chunk(self, session, scored: List[Dict[str, Any]]):
+        """
+        Bulk-write one scored chunk: one insert and one update per analytics table.
+
+        Only successful layers are written, as in WorkflowRepository.create_workflow;
+        the layer success flags on `workflows` are refreshed for every workflow.
+
+        Args:
+            session: SQLAlchemy session (committed by the caller)
+            scored: Output of score_chunk()
+        """
+        from n8n_shared import models
+
+        now = datetime.utcnow()
+        workflow_ids = [row['workflow_id'] for row in scored]
+
+        for layer, model_name in ANALYTICS_MODELS.items():
+            model = getattr(models, model_name)
+            table_columns = set(model.__table__.columns.keys())
+            writable = table_columns - {'id', 'workflow_id', 'extracted_at', 'updated_at'}
+            existing = dict(
+                session.query(model.workflow_id, model.id)
+                .filter(model.workflow_id.in_(workflow_ids))
+                .all()
+            )
+
+            inserts, updates = [], []
+            for row in scored:
+                result = row['layers'][layer]
+                if not result.get('success'):
+                    continue
+                values = {key: value for key, value in (result.get('data') or {}).items() if key in writable}
+                if 'updated_at' in table_columns:
+                    values['updated_at'] = now
+                if row['workflow_id'] in existing:
+                    updates.append({'id': existing[row['workflow_id']], **values})
+                else:
+                    inserts.append({'workflow_id': row['workflow_id'], **values})
+
+            if inserts:
+                session.bulk_insert_mappings(model, inserts)
+            if updates:
+                session.bulk_update_mappings(model, updates)
+            self.stats['rows_written'] += len(inserts) + len(updates)
+
+        session.bulk_update_mappings(models.Workflow, [
+            {
+                'id': row['id'],
+                **{f"{layer}_success": bool(row['layers'][layer].get('success')) for layer in ANALYTICS_LAYERS}
+            }
+            for row in scored
+        ])
+
+    def run(self, limit: Optional[int] = None, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Re-score every stored workflow.
+
+        Args:
+            limit: Stop after this many workflows (all if None)
+            dry_run: Score without writing anything
+
+        Returns:
+            Engine statistics, including total seconds
+        """
+        from src.storage.database import get_session
+
+        start_time = time.time()
+        with get_session() as session:
+            for frame in self.load_chunks(session, limit=limit):
+                scored = self.score_chunk(frame)
+                if not dry_run:
+                    self.write_chunk(session, scored)
+                    session.commit()
+                logger.info(f"Re-scored {self.stats['workflows']} workflows ({self.stats['chunks']} chunks)")
+
+        self.stats['seconds'] = time.time() - start_time
+        logger.info(f"Batch analytics complete: {self.stats}")
+        return self.stats
@@ -0,0 +1,145 @@
+"""
+Pooled Cross-Origin Iframe Fetcher
+
+Cross-origin iframes can't be read through the page, so their HTML is fetched
+directly. This used to open and close a new browser context for every iframe
+URL. IframeFetcher keeps one Playwright API request context for the whole run,
+with the same user agent as the scraping browser, and:
+- Caches iframe HTML by URL for the run (many templates embed the same n8n
+  demo iframe)
+- Coalesces concurrent requests for the same URL into one fetch
+- Never caches failures, so a later iframe with the same URL retries
+
+Usage:
+    fetcher = await IframeFetcher.create(playwright, timeout=120000)
+    html = await fetcher.fetch(iframe_src)
+    await fetcher.close()
+"""
+
+import asyncio
+from typing import Dict, Optional
+
+from loguru import logger
+
+DEFAULT_USER_AGENT = (
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+
+DEFAULT_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+
+class IframeFetcher:
+    """
+    Shared request context with a per-run HTML cache keyed by URL.
+    """
+
+    def __init__(self, request_context, timeout: int = 30000):
+        """
+        Initialize iframe fetcher.
+
+        Args:
+            request_context: Playwright APIRequestContext (anything with
+                async `get(url, timeout=...)` and `dispose()`)
+            timeout: Request timeout in milliseconds
+        """
+        self.request_context = request_context
+        self.timeout = timeout
+        self._cache: Dict[str, str] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self.stats = {
+            'hits': 0,
+            'coalesced': 0,
+            'fetched': 0,
+            'failed': 0
+        }
+
+    @classmethod
+    async def create(
+        cls,
+        playwright,
+        timeout: int = 30000,
+        user_agent: str = DEFAULT_USER_AGENT,
+        extra_http_headers: Optional[Dict[str, str]] = None
+    ) -> 'IframeFetcher':
+        """
+        Open the shared request context.
+
+        Args:
+            playwright: Started Playwright instance
+            timeout: Request timeout in milliseconds
+            user_agent: User agent sent with every request
+            extra_http_headers: Headers sent with every request (default DEFAULT_HEADERS)
+
+        Returns:
+            IframeFetcher owning the new request context
+        """
+        request_context = await playwright.request.new_context(
+            user_agent=user_agent,
+            extra_http_headers=extra_http_headers or DEFAULT_HEADERS,
+            timeout=timeout
+        )
+        return cls(request_context, timeout=timeout)
+
+    async def fetch(self, url: str) -> Optional[str]:
+        """
+        HTML of `url`, from the run cache when it was fetched before.
+
+        Args:
+            url: Iframe src URL
+
+        Returns:
+            Response text, or None if the request failed or was not 2xx
+        """
+        if not url:
+            return None
+        if url in self._cache:
+            self.stats['hits'] += 1
+            return self._cache[url]
+
+        inflight = self._inflight.get(url)
+        if inflight is not None:
+            self.stats['coalesced'] += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[url] = future
+        html = None
+        try:
+            html = await self._get(url)
+        finally:
+            self._inflight.pop(url, None)
+            future.set_result(html)
+        if html is not None:
+            self._cache[url] = html
+        return html
+
+    async def _get(self, url: str) -> Optional[str]:
+        try:
+            response = await self.request_context.get(url, timeout=self.timeout)
+            if not response.ok:
+                logger.debug(f"Iframe fetch {url} returned HTTP {response.status}")
+                self.stats['failed'] += 1
+                return None
+            html = await response.text()
+            self.stats['fetched'] += 1
+            return html
+        except Exception as e:
+            logger.debug(f"Iframe fetch {url} failed: {e}")
+            self.stats['failed'] += 1
+            return None
+
+    def clear(self):
+        """Drop cached HTML (completed fetches only)."""
+        self._cache.clear()
+
+    async def close(self):
+        """Dispose of the shared request context."""
+        if self.request_context is not None:
+            await self.request_context.dispose()
+            self.request_context = None
+        logger.debug(f"Iframe fetcher closed: {self.stats}")
@@ -0,0 +1,307 @@
+"""
+Perceptual-Hash Image OCR Cache
+
+Screenshots and diagrams are reused across many workflow explainers. This cache
+sits in front of OCR so each distinct image is only OCR'd once:
+- Exact matches by SHA-256 of the image bytes
+- Near-duplicates (re-encoded, resized, recompressed) by aHash + dHash Hamming
+  distance, only between images of the same aspect ratio
+- Stores OCR text, dimensions and a "no text" verdict
+- Persisted to SQLite with an LRU size limit
+
+Author: Dev1
+Task: Image OCR Dedup Cache
+Date: October 19, 2026
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+from PIL import Image
+from loguru import logger
+
+
+DEFAULT_CACHE_PATH = os.getenv("IMAGE_OCR_CACHE_PATH", "data/image_ocr_cache.db")
+DEFAULT_MAX_ENTRIES = 50000
+
+HASH_SIZE = 8  # 8x8 grid -> 64-bit hashes
+
+# Max relative aspect-ratio difference for a near-duplicate match: the hashes
+# see a fixed 8x8 grid, so differently shaped images can hash alike
+ASPECT_TOLERANCE = 0.02
+
+
+@dataclass
+class ImageFingerprint:
+    """Exact and perceptual identity of an image."""
+
+    content_hash: str
+    ahash: int
+    dhash: int
+    width: int
+    height: int
+
+
+def _bits_to_int(bits: np.ndarray) -> int:
+    """Pack a boolean array into a signed 64-bit int (SQLite INTEGER range)."""
+    value = int.from_bytes(np.packbits(bits.astype(np.uint8)).tobytes(), "big")
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def fingerprint_image(image_bytes: bytes) -> ImageFingerprint:
+    """
+    Compute content hash, average hash and difference hash of an image.
+
+    Args:
+        image_bytes: Encoded image
+
+    Returns:
+        ImageFingerprint for cache lookups
+    """
+    content_hash = hashlib.sha256(image_bytes).hexdigest()
+    with Image.open(BytesIO(image_bytes)) as image:
+        width, height = image.size
+        gray = image.convert("L")
+        small = np.asarray(gray.resize((HASH_SIZE, HASH_SIZE), Image.LANCZOS), dtype=np.float32)
+        wide = np.asarray(gray.resize((HASH_SIZE + 1, HASH_SIZE), Image.LANCZOS), dtype=np.float32)
+
+    ahash = _bits_to_int((small > small.mean()).ravel())
+    dhash = _bits_to_int((wide[:, 1:] > wide[:, :-1]).ravel())
+    return ImageFingerprint(content_hash, ahash, dhash, width, height)
+
+
+def _popcount64(values: np.ndarray) -> np.ndarray:
+    """Count set bits of each int64 in a vector."""
+    return np.unpackbits(values.astype(np.int64).view(np.uint8).reshape(-1, 8), axis=1).sum(axis=1)
+
+
+class ImageOCRCache:
+    """
+    Persistent OCR result cache keyed by exact and perceptual image hashes.
+
+    Near-duplicate lookups compare against every stored hash at once with
+    vectorized XOR + popcount, so lookup cost stays flat as the cache grows.
+    """
+
+    def __init__(
+        self,
+        db_path: str = DEFAULT_CACHE_PATH,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_distance: int = 4
+    ):
+        """
+        Initialize image OCR cache.
+
+        Args:
+            db_path: Path to SQLite cache file (":memory:" for a process-local cache)
+            max_entries: LRU limit; least recently used entries are evicted beyond it
+            max_distance: Max Hamming distance (per hash) for a near-duplicate match
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.max_distance = max_distance
+        self._lock = threading.Lock()
+
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._init_schema()
+        self._load_hash_index()
+
+        self.stats = {
+            'exact_hits': 0,
+            'near_hits': 0,
+            'misses': 0,
+            'stored': 0,
+            'evicted': 0
+        }
+
+    def _init_schema(self):
+        """Create cache table if it doesn't exist."""
+        with self._lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS image_ocr_cache (
+                    content_hash TEXT PRIMARY KEY,
+                    ahash INTEGER NOT NULL,
+                    dhash INTEGER NOT NULL,
+                    width INTEGER NOT NULL,
+                    height INTEGER NOT NULL,
+                    ocr_text TEXT,
+                    has_text INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_image_ocr_cache_last_used ON image_ocr_cache (last_used)"
+            )
+            self._conn.commit()
+
+    def _load_hash_index(self):
+        """Load perceptual hashes and aspect ratios into NumPy arrays for vectorized matching."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT content_hash, ahash, dhash, width, height FROM image_ocr_cache"
+            ).fetchall()
+        self._keys = [r[0] for r in rows]
+        self._positions = {key: position for position, key in enumerate(self._keys)}
+        self._ahashes = np.array([r[1] for r in rows], dtype=np.int64)
+        self._dhashes = np.array([r[2] for r in rows], dtype=np.int64)
+        self._aspects = np.array([r[3] / max(r[4], 1) for r in rows], dtype=np.float64)
+
+    def _remove_from_index(self, content_hash: str):
+        """Drop one entry from the in-memory index (the last entry takes its slot)."""
+        position = self._positions.pop(content_hash, None)
+        if position is None:
+            return
+        last = len(self._keys) - 1
+        if position != last:
+            moved = self._keys[last]
+            self._keys[position] = moved
+            self._positions[moved] = position
+            self._ahashes[position] = self._ahashes[last]
+            self._dhashes[position] = self._dhashes[last]
+            self._aspects[position] = self._aspects[last]
+        self._keys.pop()
+        self._ahashes = self._ahashes[:last]
+        self._dhashes = self._dhashes[:last]
+        self._aspects = self._aspects[:last]
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def lookup(self, fingerprint: ImageFingerprint) -> Optional[Dict]:
+        """
+        Find a cached OCR result for an exact or near-duplicate image.
+
+        Args:
+            fingerprint: Fingerprint of the image about to be OCR'd
+
+        Returns:
+            Dict with ocr_text, has_text, width, height and match type, or None
+        """
+        row = self._fetch(fingerprint.content_hash)
+        match = 'exact'
+
+        if row is None and self._keys:
+            distance = np.maximum(
+                _popcount64(np.bitwise_xor(self._ahashes, np.int64(fingerprint.ahash))),
+                _popcount64(np.bitwise_xor(self._dhashes, np.int64(fingerprint.dhash)))
+            )
+            aspect = fingerprint.width / max(fingerprint.height, 1)
+            # Similar hashes of a differently shaped image are another image's text
+            distance[np.abs(self._aspects - aspect) > ASPECT_TOLERANCE * aspect] = HASH_SIZE * HASH_SIZE + 1
+            best = int(np.argmin(distance))
+            if distance[best] <= self.max_distance:
+                row = self._fetch(self._keys[best])
+                match = 'near'
+
+        if row is None:
+            self.stats['misses'] += 1
+            return None
+
+        self.stats['exact_hits' if match == 'exact' else 'near_hits'] += 1
+        self._touch(row[0])
+        return {
+            'content_hash': row[0],
+            'width': row[1],
+            'height': row[2],
+            'ocr_text': row[3],
+            'has_text': bool(row[4]),
+            'match': match
+        }
+
+    def put(self, fingerprint: ImageFingerprint, ocr_text: str, has_text: bool):
+        """
+        Store the OCR result for an image and enforce the LRU limit.
+
+        Args:
+            fingerprint: Fingerprint of the OCR'd image
+            ocr_text: Extracted text ("" when none)
+            has_text: False records a "no text" verdict
+        """
+        now = time.time()
+        with self._lock:
+            existed = self._conn.execute(
+                "SELECT 1 FROM image_ocr_cache WHERE content_hash = ?", (fingerprint.content_hash,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO image_ocr_cache "
+                "(content_hash, ahash, dhash, width, height, ocr_text, has_text, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (fingerprint.content_hash, fingerprint.ahash, fingerprint.dhash,
+                 fingerprint.width, fingerprint.height, ocr_text if has_text else "",
+                 int(has_text), now, now)
+            )
+            self._conn.commit()
+
+        if not existed:
+            self._positions[fingerprint.content_hash] = len(self._keys)
+            self._keys.append(fingerprint.content_hash)
+            self._ahashes = np.append(self._ahashes, np.int64(fingerprint.ahash))
+            self._dhashes = np.append(self._dhashes, np.int64(fingerprint.dhash))
+            self._aspects = np.append(self._aspects, fingerprint.width / max(fingerprint.height, 1))
+        self.stats['stored'] += 1
+
+        if len(self._keys) > self.max_entries:
+            self._evict(len(self._keys) - self.max_entries)
+
+    def _fetch(self, content_hash: str):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT content_hash, width, height, ocr_text, has_text "
+                "FROM image_ocr_cache WHERE content_hash = ?",
+                (content_hash,)
+            ).fetchone()
+
+    def _touch(self, content_hash: str):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE image_ocr_cache SET last_used = ? WHERE content_hash = ?",
+                (time.time(), content_hash)
+            )
+            self._conn.commit()
+
+    def _evict(self, count: int):
+        """Drop the `count` least recently used entries."""
+        with self._lock:
+            evicted = [row[0] for row in self._conn.execute(
+                "SELECT content_hash FROM image_ocr_cache ORDER BY last_used ASC LIMIT ?", (count,)
+            )]
+            self._conn.executemany(
+                "DELETE FROM image_ocr_cache WHERE content_hash = ?", [(key,) for key in evicted]
+            )
+            self._conn.commit()
+        for key in evicted:
+            self._remove_from_index(key)
+        self.stats['evicted'] += len(evicted)
+        logger.debug(f"Image OCR cache evicted {len(evicted)} entries")
+
+    @property
+    def ocr_runs_saved(self) -> int:
+        """Number of OCR runs avoided by exact or near-duplicate hits."""
+        return self.stats['exact_hits'] + self.stats['near_hits']
+
+
+_default_cache: Optional[ImageOCRCache] = None
+
+
+def get_image_ocr_cache() -> ImageOCRCache:
+    """Get the process-wide image OCR cache (created on first use)."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ImageOCRCache()
+    return _default_cache
@@ -0,0 +1,178 @@
+"""
+Shared Multi-Keyword Matcher for Analytics Layers
+
+Layers 4-7 classify text by checking dozens of keyword lists with
+`keyword in text`. This module compiles every registered keyword list into one
+trie-shaped regex, so a single pass over the text finds every keyword
+occurrence (with offsets) for every category at once.
+
+Matching semantics are plain substring matching, identical to `keyword in text`:
+overlapping and nested keywords ("cost" inside "reduce cost") are all reported.
+
+Usage:
+    register_keywords("layer5.sentiment", {"positive": ["great", "love"], ...})
+    scan = get_keyword_matcher().scan(text.lower())
+    scan.hits("layer5.sentiment.positive")      # distinct keywords present
+    scan.first("layer5.sentiment.positive")     # first present, in list order
+"""
+
+import re
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Build a regex alternation shaped like a trie; greedy, so the longest word wins."""
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def render(node: Dict) -> str:
+        terminal = '' in node
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if terminal:
+            body = '(?:' + body + ')?'
+        return body
+
+    return render(trie)
+
+
+@dataclass
+class KeywordScan:
+    """Result of one pass over a text: every keyword occurrence, grouped by category."""
+
+    offsets: Dict[str, List[int]]
+    categories: Mapping[str, Tuple[str, ...]] = field(repr=False)
+
+    def has(self, keyword: str) -> bool:
+        """True if `keyword` occurs in the text (same as `keyword in text`)."""
+        return keyword in self.offsets
+
+    def count(self, keyword: str) -> int:
+        """Number of (possibly overlapping) occurrences of `keyword`."""
+        return len(self.offsets.get(keyword, ()))
+
+    def present(self, category: str) -> List[str]:
+        """Keywords of `category` that occur in the text, in the category's list order."""
+        return [keyword for keyword in self.categories[category] if keyword in self.offsets]
+
+    def hits(self, category: str) -> int:
+        """Number of distinct keywords of `category` present in the text."""
+        return len(self.present(category))
+
+    def first(self, category: str) -> Optional[str]:
+        """First keyword of `category` (in list order) present in the text."""
+        for keyword in self.categories[category]:
+            if keyword in self.offsets:
+                return keyword
+        return None
+
+    def category_counts(self, prefix: str = "") -> Dict[str, int]:
+        """Total occurrences per category (optionally only categories under `prefix`)."""
+        return {
+            name: sum(self.count(keyword) for keyword in keywords)
+            for name, keywords in self.categories.items()
+            if name.startswith(prefix) and any(keyword in self.offsets for keyword in keywords)
+        }
+
+
+class KeywordMatcher:
+    """
+    Compiled matcher over a set of named keyword categories.
+
+    All keywords are lower-cased at compile time; callers pass lower-cased text,
+    as the analytics layers already do.
+    """
+
+    def __init__(self, categories: Mapping[str, Iterable[str]]):
+        """
+        Compile keyword categories.
+
+        Args:
+            categories: Mapping of category name to keyword list
+        """
+        self.categories: Dict[str, Tuple[str, ...]] = {
+            name: tuple(keyword.lower() for keyword in keywords)
+            for name, keywords in categories.items()
+        }
+        keywords = sorted({keyword for words in self.categories.values() for keyword in words if keyword})
+
+        # The regex reports the longest keyword at each start offset; any shorter
+        # keyword starting there must be a prefix of it, so expand those here.
+        self._prefixes: Dict[str, Tuple[str, ...]] = {
+            keyword: tuple(other for other in keywords if other != keyword and keyword.startswith(other))
+            for keyword in keywords
+        }
+        pattern = _trie_pattern(keywords)
+        self._regex = re.compile(f'(?=({pattern}))') if pattern else None
+
+    def scan(self, text: str) -> KeywordScan:
+        """
+        Find every keyword occurrence in one pass.
+
+        Args:
+            text: Lower-cased text to scan
+
+        Returns:
+            KeywordScan with offsets per keyword
+        """
+        offsets: Dict[str, List[int]] = {}
+        if self._regex is not None and text:
+            for match in self._regex.finditer(text):
+                longest = match.group(1)
+                start = match.start()
+                offsets.setdefault(longest, []).append(start)
+                for prefix in self._prefixes[longest]:
+                    offsets.setdefault(prefix, []).append(start)
+        return KeywordScan(offsets=offsets, categories=self.categories)
+
+
+_registry: Dict[str, Tuple[str, ...]] = {}
+_registry_lock = threading.Lock()
+_matcher: Optional[KeywordMatcher] = None
+
+
+def register_keywords(namespace: str, categories: Mapping[str, Iterable[str]]):
+    """
+    Register a layer's keyword dictionary under `namespace`.
+
+    Categories become `<namespace>.<category>` in scan results. Registering the
+    same namespace again replaces it.
+    """
+    global _matcher
+    with _registry_lock:
+        for name, keywords in categories.items():
+            _registry[f"{namespace}.{name}"] = tuple(keywords)
+        _matcher = None
+    _cached_scan.cache_clear()
+
+
+def get_keyword_matcher() -> KeywordMatcher:
+    """Return the matcher compiled from all registered vocabularies (compiled once)."""
+    global _matcher
+    with _registry_lock:
+        if _matcher is None:
+            _matcher = KeywordMatcher(_registry)
+        return _matcher
+
+
+@lru_cache(maxsize=64)
+def _cached_scan(text: str) -> KeywordScan:
+    return get_keyword_matcher().scan(text)
+
+
+def scan_text(text: str) -> KeywordScan:
+    """
+    Scan text with the shared matcher.
+
+    Recent results are cached, so layers analysing the same combined text share one pass.
+    """
+    return _cached_scan(text)
@@ -20,6 +20,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 import logging
 from src.scrapers.layer2_json import WorkflowJSONExtractor
+from src.scrapers.sticky_index import StickyIndex
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 
 # Setup logging
@@ -29,6 +30,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Distance beyond which a sticky gets no proximity confidence
+PROXIMITY_RADIUS = 200
+
 
 class NodeContextExtractor:
     """
@@ -427,35 +431,48 @@ class NodeContextExtractor:
         """Match nodes with their corresponding sticky notes based on position and content."""
         node_contexts = []
         
+        # Index sticky positions and texts once; each method only scores the
+        # stickies that can score above zero, in sticky order
+        index = StickyIndex(stickies, cell_size=PROXIMITY_RADIUS, title_key='title')
+        
         for node in nodes:
             best_match = None
             best_confidence = 0.0
             best_method = 'none'
             
+            node_name = node['node_name'].lower()
+            node_title = node.get('title', node['node_name']).lower()
+            
             # Method 1: Exact name matching
-            for sticky in stickies:
-                confidence = self._calculate_name_match_confidence(node, sticky)
+            name_candidates = index.containing(node_name) | index.containing(node_title) | index.titles_within(node_name, node_title)
+            for i in sorted(name_candidates):
+                confidence = self._name_match_confidence(node_name, node_title, index.titles[i], index.contents[i])
                 if confidence > best_confidence:
                     best_confidence = confidence
-                    best_match = sticky
+                    best_match = stickies[i]
                     best_method = 'name_exact'
             
             # Method 2: Proximity-based matching (if no good name match)
             if best_confidence < 0.7:
-                for sticky in stickies:
-                    confidence = self._calculate_proximity_confidence(node, sticky)
+                node_pos = node['position']
+                nearby = index.near(node_pos.get('x', 0), node_pos.get('y', 0), PROXIMITY_RADIUS)
+                if 'center_x' in node_pos:
+                    nearby |= index.near(node_pos['center_x'], node_pos['center_y'], PROXIMITY_RADIUS)
+                for i in sorted(nearby):
+                    confidence = self._calculate_proximity_confidence(node, stickies[i])
                     if confidence > best_confidence:
                         best_confidence = confidence
-                        best_match = sticky
+                        best_match = stickies[i]
                         best_method = 'proximity'
             
             # Method 3: Fuzzy matching (if still no good match)
             if best_confidence < 0.5:
-                for sticky in stickies:
-                    confidence = self._calculate_fuzzy_match_confidence(node, sticky)
+                node_words = set(f"{node['node_name']} {node.get('title', '')}".lower().split())
+                for i in sorted(index.sharing_words(node_words)):
+                    confidence = self._word_overlap_confidence(node_words, index.words[i])
                     if confidence > best_confidence:
                         best_confidence = confidence
-                        best_match = sticky
+                        best_match = stickies[i]
                         best_method = 'fuzzy'
             
             # Create node context if we found a match
@@ -482,6 +499,11 @@ class NodeContextExtractor:
         sticky_title = sticky.get('title', '').lower()
         sticky_content = sticky['content'].lower()
         
+        return self._name_match_confidence(node_name, node_title, sticky_title, sticky_content)
+    
+    @staticmethod
+    def _name_match_confidence(node_name: str, node_title: str, sticky_title: str, sticky_content: str) -> float:
+        """Name match confidence from lower-cased node and sticky texts."""
         # Check if node name appears in sticky title or content
         if node_name in sticky_title or node_name in sticky_content:
             return 0.9
@@ -523,7 +545,7 @@ class NodeContextExtractor:
             return 0.8
         elif distance < 100:
             return 0.6
-        elif distance < 200:
+        elif distance < PROXIMITY_RADIUS:
             return 0.4
         else:
             return 0.0
@@ -533,15 +555,16 @@ class NodeContextExtractor:
         node_text = f"{node['node_name']} {node.get('title', '')}".lower()
         sticky_text = f"{sticky.get('title', '')} {sticky.get('content', '')}".lower()
         
-        # Simple word overlap calculation
-        node_words = set(node_text.split())
-        sticky_words = set(sticky_text.split())
-        
+        return self._word_overlap_confidence(set(node_text.split()), set(sticky_text.split()))
+    
+    @staticmethod
+    def _word_overlap_confidence(node_words: set, sticky_words: set) -> float:
+        """Simple word overlap calculation (Jaccard similarity)."""
         if not node_words or not sticky_words:
             return 0.0
         
         overlap = len(node_words.intersection(sticky_words))
-        total = len(node_words.union(sticky_words))
+        total = len(node_words) + len(sticky_words) - overlap
         
         return overlap / total if total > 0 else 0.0
     
@@ -586,6 +609,7 @@ class NodeContextExtractor:
             bool: True if successful, False otherwise
         """
         try:
+            from src.storage.blob_store import save_snapshot
             from src.storage.database import get_session
             import sys
             sys.path.append('../n8n-shared')
@@ -638,16 +662,8 @@ class NodeContextExtractor:
                     
                     session.execute(insert_sql, params)
 
-                # Save raw JSON snapshot for auditing
-                snapshot_sql = text("""
-                    INSERT INTO workflow_extraction_snapshots (workflow_id, layer, payload)
-                    VALUES (:workflow_id, :layer, :payload)
-                """)
-                session.execute(snapshot_sql, {
-                    'workflow_id': workflow_id,
-                    'layer': 'L2V2',
-                    'payload': json.dumps({'node_contexts': node_contexts})
-                })
+                # Save raw JSON snapshot for auditing (payload stored once in the blob store)
+                save_snapshot(session, workflow_id, 'L2V2', {'node_contexts': node_contexts})
                 
                 session.commit()
                 logger.info(f"✅ Successfully saved {len(node_contexts)} node contexts for {workflow_id}")
@@ -10,6 +10,8 @@ from datetime import datetime
 from typing import Dict, Optional, Any
 import logging
 
+from src.scrapers.workflow_index import WorkflowIndex
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -80,13 +82,10 @@ class WorkflowJSONExtractor:
                                 'error': 'Invalid JSON structure'
                             }
                         
-                        # Extract metrics
-                        workflow = workflow_data.get('workflow', {})
-                        nodes = workflow.get('nodes', [])
-                        connections = workflow.get('connections', {})
-                        
-                        node_count = len(nodes)
-                        connection_count = sum(len(v) for v in connections.values()) if isinstance(connections, dict) else 0
+                        # Extract metrics (one pass over the workflow JSON)
+                        index = WorkflowIndex.from_api_response(workflow_data)
+                        node_count = index.node_count
+                        connection_count = index.connection_count
                         
                         # Track extraction
                         self.extraction_count += 1
@@ -104,6 +103,7 @@ class WorkflowJSONExtractor:
                             'data': workflow_data,
                             'node_count': node_count,
                             'connection_count': connection_count,
+                            'node_types': index.node_types,
                             'extraction_time': extraction_time,
                             'error': None,
                             'fallback_used': False,
@@ -194,12 +194,9 @@ class WorkflowJSONExtractor:
                         transformed_data = self._transform_by_id_to_template(fallback_data)
                         
                         # Extract metrics
-                        workflow = transformed_data.get('workflow', {})
-                        nodes = workflow.get('nodes', [])
-                        connections = workflow.get('connections', {})
-                        
-                        node_count = len(nodes)
-                        connection_count = sum(len(v) for v in connections.values()) if isinstance(connections, dict) else 0
+                        index = WorkflowIndex.from_api_response(transformed_data)
+                        node_count = index.node_count
+                        connection_count = index.connection_count
                         
                         extraction_time = (datetime.now() - start_time).total_seconds()
                         
@@ -216,6 +213,7 @@ class WorkflowJSONExtractor:
                             'data': transformed_data,
                             'node_count': node_count,
                             'connection_count': connection_count,
+                            'node_types': index.node_types,
                             'extraction_time': extraction_time,
                             'error': None,
                             'fallback_used': True,
@@ -15,7 +15,6 @@ Date: October 14, 2025
 """
 
 import asyncio
-import re
 import time
 import hashlib
 from typing import Dict, List, Optional, Any, Tuple
@@ -26,6 +25,8 @@ from playwright.async_api import async_playwright, Page, Browser, ElementHandle
 from bs4 import BeautifulSoup
 from loguru import logger
 
+from src.scrapers.video_scanner import video_id_from_url
+
 
 class ComprehensiveLayer3Extractor:
     """
@@ -531,22 +532,7 @@ class ComprehensiveLayer3Extractor:
     
     def _extract_youtube_video_id(self, url: str) -> Optional[str]:
         """Extract YouTube video ID from URL"""
-        if not url:
-            return None
-        
-        patterns = [
-            r'youtube\.com/watch\?v=([^&]+)',
-            r'youtu\.be/([^?]+)',
-            r'youtube\.com/embed/([^?]+)',
-            r'youtube\.com/v/([^?]+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        
-        return None
+        return video_id_from_url(url)
     
     async def _extract_video_transcripts(self, videos: List[Dict]) -> Dict[str, str]:
         """
@@ -555,6 +541,7 @@ class ComprehensiveLayer3Extractor:
         Uses TranscriptExtractor to get video transcripts.
         """
         from src.scrapers.transcript_extractor import TranscriptExtractor
+        from src.scrapers.transcript_cache import get_transcript_cache
         
         transcripts = {}
         youtube_videos = [v for v in videos if v.get('youtube_id')]
@@ -565,7 +552,9 @@ class ComprehensiveLayer3Extractor:
         
         logger.info(f"Extracting transcripts for {len(youtube_videos)} YouTube videos")
         
-        async with TranscriptExtractor(headless=self.headless, timeout=self.timeout) as extractor:
+        async with TranscriptExtractor(
+            headless=self.headless, timeout=self.timeout, cache=get_transcript_cache()
+        ) as extractor:
             for video in youtube_videos:
                 video_url = video.get('url') or video.get('src', '')
                 video_id = video.get('youtube_id', '')
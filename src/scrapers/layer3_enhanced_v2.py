@@ -14,7 +14,6 @@ Version: 3.2.0
 """
 
 import asyncio
-import re
 import time
 import json
 from typing import Dict, List, Optional, Any, Tuple
@@ -24,6 +23,23 @@ from playwright.async_api import async_playwright, Page, Browser, Frame
 from bs4 import BeautifulSoup
 from loguru import logger
 
+from src.scrapers.iframe_fetcher import IframeFetcher
+from src.scrapers.regex_registry import (
+    NON_VIDEO_URL,
+    VIDEO_HOST_URL,
+    YOUTUBE_URL_ID_LOOSE,
+    youtube_id,
+)
+from src.scrapers.video_scanner import LINK_FORMS, scan_videos, video_ids
+
+
+# Context sweep lists embeds first, as embedded players are the primary videos
+EMBED_FIRST = ('embed', 'short', 'watch', 'json', 'param', 'markdown')
+
+# Recursive scan types by hit context; anchors, then iframe embeds, then the rest
+SCAN_TYPES = {'anchor': 'video_link', 'embed': 'html_embed'}
+SCAN_ORDER = {context: rank for rank, context in enumerate(SCAN_TYPES)}
+
 
 class EnhancedLayer3Extractor:
     """
@@ -48,6 +64,7 @@ class EnhancedLayer3Extractor:
         self.extract_transcripts = extract_transcripts
         self.browser: Optional[Browser] = None
         self.playwright = None
+        self.iframe_fetcher: Optional[IframeFetcher] = None
         
     async def __aenter__(self):
         await self.initialize()
@@ -60,10 +77,14 @@ class EnhancedLayer3Extractor:
         """Initialize Playwright browser"""
         self.playwright = await async_playwright().start()
         self.browser = await self.playwright.chromium.launch(headless=self.headless)
+        # One request context for all cross-origin iframe fetches in this run
+        self.iframe_fetcher = await IframeFetcher.create(self.playwright, timeout=self.timeout)
         logger.info("🚀 Enhanced Layer 3 V2 initialized")
         
     async def cleanup(self):
         """Cleanup Playwright resources"""
+        if self.iframe_fetcher:
+            await self.iframe_fetcher.close()
         if self.browser:
             await self.browser.close()
         if self.playwright:
@@ -284,62 +305,19 @@ class EnhancedLayer3Extractor:
         return videos
 
     async def _fetch_cross_origin_html(self, url: str) -> Optional[str]:
-        """Fetch iframe HTML via Playwright's request context if possible."""
-        try:
-            # Use a temporary context request if available via page owner
-            # In this extractor, we create a new page per extract; reuse browser net stack
-            ctx = await self.browser.new_context()
-            resp = await ctx.request.get(url, timeout=self.timeout / 1000)
-            if resp.ok:
-                txt = await resp.text()
-                await ctx.close()
-                return txt
-            await ctx.close()
-        except Exception:
-            pass
-        return None
+        """Fetch iframe HTML through the shared request context (cached per run)."""
+        if not self.iframe_fetcher:
+            return None
+        return await self.iframe_fetcher.fetch(url)
 
     def _scan_html_for_videos(self, html: str, context: Dict) -> List[Dict]:
-        videos: List[Dict] = []
-        try:
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Anchors
-            for a in soup.find_all('a', href=True):
-                href = a['href']
-                if self._is_valid_youtube_video_url(href):
-                    vid = self._extract_youtube_id(href)
-                    if vid:
-                        videos.append({'url': f'https://youtu.be/{vid}', 'youtube_id': vid, 'type': 'video_link', 'context': context})
-            
-            # Iframe embeds
-            for f in soup.find_all('iframe', src=True):
-                vid = self._extract_youtube_id(f['src'])
-                if vid:
-                    videos.append({'url': f'https://youtu.be/{vid}', 'youtube_id': vid, 'type': 'html_embed', 'context': context})
-            
-            # Comprehensive regex sweep for all video patterns including n8n-specific formats
-            video_patterns = [
-                r'youtube\.com/watch\?v=([\w-]{11})',
-                r'youtube\.com/embed/([\w-]{11})',
-                r'youtu\.be/([\w-]{11})',
-                r'"videoId":"([\w-]{11})"',
-                r'videoId=([\w-]{11})',
-                r'data-video-id="([\w-]{11})"',
-                r'video_id=([\w-]{11})',
-                r'v=([\w-]{11})',
-                r'@\[youtube\]\(([\w-]{11})\)',  # n8n markdown format: @[youtube](VIDEO_ID)
-                r'@\[youtube\]\(([\w-]{11})',    # n8n markdown format without closing )
-            ]
-            
-            for pattern in video_patterns:
-                for vid in set(re.findall(pattern, html)):
-                    if self._is_valid_video_id(vid):
-                        videos.append({'url': f'https://youtu.be/{vid}', 'youtube_id': vid, 'type': 'regex_discovered', 'context': context})
-                        
-        except Exception:
-            return videos
-        return videos
+        # One pass over the raw HTML; anchors and iframe embeds are told apart by
+        # the enclosing tag, so no DOM is built
+        hits = sorted(scan_videos(html), key=lambda hit: SCAN_ORDER.get(hit.context, len(SCAN_ORDER)))
+        return [
+            {'url': hit.url, 'youtube_id': hit.video_id, 'type': SCAN_TYPES.get(hit.context, 'regex_discovered'), 'context': context}
+            for hit in hits
+        ]
     
     async def _discover_videos_in_context(
         self, 
@@ -359,7 +337,7 @@ class EnhancedLayer3Extractor:
             soup = BeautifulSoup(html, 'html.parser')
             
             # Find video links
-            video_links = soup.find_all('a', href=re.compile(r'youtube\.com|youtu\.be|vimeo\.com'))
+            video_links = soup.find_all('a', href=VIDEO_HOST_URL)
             
             for link in video_links:
                 href = link.get('href', '')
@@ -391,35 +369,19 @@ class EnhancedLayer3Extractor:
                     }
                 })
             
-            # Also check for embedded videos in HTML using comprehensive regex patterns including n8n-specific formats
-            video_patterns = [
-                r'youtube\.com/embed/([\w-]{11})',
-                r'youtu\.be/([\w-]{11})',
-                r'youtube\.com/watch\?v=([\w-]{11})',
-                r'"videoId":"([\w-]{11})"',
-                r'videoId=([\w-]{11})',
-                r'data-video-id="([\w-]{11})"',
-                r'video_id=([\w-]{11})',
-                r'v=([\w-]{11})',
-                r'@\[youtube\]\(([\w-]{11})\)',  # n8n markdown format: @[youtube](VIDEO_ID)
-                r'@\[youtube\]\(([\w-]{11})',    # n8n markdown format without closing )
-            ]
-            
-            for pattern in video_patterns:
-                matches = re.findall(pattern, html)
-                for video_id in matches:
-                    if self._is_valid_video_id(video_id):
-                        videos.append({
-                            'url': f'https://youtu.be/{video_id}',
-                            'youtube_id': video_id,
-                            'type': 'html_embed',
-                            'context': {
-                                'location': location,
-                                'position': 'main_content',
-                                'iframe_src': iframe_src,
-                                'iframe_title': iframe_title
-                            }
-                        })
+            # Also check for embedded videos in HTML, including n8n-specific formats, in one scan
+            for hit in sorted(scan_videos(html), key=lambda hit: EMBED_FIRST.index(hit.form)):
+                videos.append({
+                    'url': hit.url,
+                    'youtube_id': hit.video_id,
+                    'type': 'html_embed',
+                    'context': {
+                        'location': location,
+                        'position': 'main_content',
+                        'iframe_src': iframe_src,
+                        'iframe_title': iframe_title
+                    }
+                })
         
         except Exception as e:
             logger.debug(f"Error discovering videos in {location}: {e}")
@@ -481,27 +443,8 @@ class EnhancedLayer3Extractor:
     
     def _extract_youtube_links_from_text(self, text: str) -> List[str]:
         """Extract YouTube links from text content."""
-        import re
-        
-        # Patterns for YouTube links
-        patterns = [
-            r'https?://(?:www\.)?youtube\.com/watch\?v=([\w-]{11})',
-            r'https?://(?:www\.)?youtu\.be/([\w-]{11})',
-            r'@\[youtube\]\(([\w-]{11})\)',  # n8n markdown format
-            r'youtube\.com/watch\?v=([\w-]{11})',
-            r'youtu\.be/([\w-]{11})'
-        ]
-        
-        links = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                if isinstance(match, tuple):
-                    match = match[0]
-                if self._is_valid_video_id(match):
-                    links.append(f'https://youtu.be/{match}')
-        
-        return list(set(links))  # Remove duplicates
+        # YouTube URLs and n8n markdown `@[youtube](ID)`, validated and deduplicated in one scan
+        return [f'https://youtu.be/{video_id}' for video_id in video_ids(text, forms=LINK_FORMS)]
     
     async def _extract_standalone_sticky_notes(self, page: Page, workflow_id: str) -> List[Dict[str, Any]]:
         """
@@ -918,6 +861,7 @@ class EnhancedLayer3Extractor:
         - Graceful handling of videos without captions
         """
         from src.scrapers.transcript_extractor import TranscriptExtractor
+        from src.scrapers.transcript_cache import get_transcript_cache
         
         transcripts = {}
         youtube_videos = [v for v in videos if v.get('youtube_id')]
@@ -927,7 +871,9 @@ class EnhancedLayer3Extractor:
         
         logger.info(f"   Extracting transcripts for {len(youtube_videos)} videos")
         
-        async with TranscriptExtractor(headless=self.headless, timeout=self.timeout) as extractor:
+        async with TranscriptExtractor(
+            headless=self.headless, timeout=self.timeout, cache=get_transcript_cache()
+        ) as extractor:
             for video in youtube_videos:
                 video_url = video.get('url', '')
                 video_id = video.get('youtube_id', '')
@@ -1005,44 +951,17 @@ class EnhancedLayer3Extractor:
         if not url:
             return False
         
-        # Skip invalid patterns
-        invalid_patterns = [
-            r'youtube\.com/c/',
-            r'youtube\.com/@',
-            r'youtube\.com/user/',
-            r'youtube\.com/playlist',
-            r'^/',  # Relative URL
-        ]
-        
-        for pattern in invalid_patterns:
-            if re.search(pattern, url):
-                return False
+        # Skip channel/user/playlist and relative URLs
+        if NON_VIDEO_URL.search(url):
+            return False
         
         # Must have valid video ID
         video_id = self._extract_youtube_id(url)
         return video_id and len(video_id) == 11
     
-    def _is_valid_video_id(self, video_id: str) -> bool:
-        """Validate YouTube video ID"""
-        if not video_id or len(video_id) != 11:
-            return False
-        # Must be alphanumeric, dash, or underscore
-        return bool(re.match(r'^[\w-]{11}$', video_id))
-    
     def _extract_youtube_id(self, url: str) -> Optional[str]:
         """Extract YouTube video ID from URL"""
-        patterns = [
-            r'youtube\.com/watch\?v=([^&]+)',
-            r'youtu\.be/([^?]+)',
-            r'youtube\.com/embed/([^?]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        
-        return None
+        return youtube_id(url, YOUTUBE_URL_ID_LOOSE)
     
     def _calculate_quality(self, data: Dict) -> int:
         """Calculate quality score (0-100)"""
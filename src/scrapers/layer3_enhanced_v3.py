@@ -604,6 +604,7 @@ class StandaloneDocExtractor:
             bool: True if successful, False otherwise
         """
         try:
+            from src.storage.blob_store import save_snapshot
             from src.storage.database import get_session
             from n8n_shared.models import Workflow, WorkflowStandaloneDoc
             from sqlalchemy import text
@@ -645,16 +646,8 @@ class StandaloneDocExtractor:
                     
                     session.execute(insert_sql, params)
 
-                # Save raw JSON snapshot for auditing
-                snapshot_sql = text("""
-                    INSERT INTO workflow_extraction_snapshots (workflow_id, layer, payload)
-                    VALUES (:workflow_id, :layer, :payload)
-                """)
-                session.execute(snapshot_sql, {
-                    'workflow_id': workflow_id,
-                    'layer': 'L3V3',
-                    'payload': json.dumps({'standalone_docs': standalone_docs})
-                })
+                # Save raw JSON snapshot for auditing (payload stored once in the blob store)
+                save_snapshot(session, workflow_id, 'L3V3', {'standalone_docs': standalone_docs})
                 
                 session.commit()
                 logger.info(f"✅ Successfully saved {len(standalone_docs)} standalone docs for {workflow_id}")
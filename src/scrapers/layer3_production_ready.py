@@ -15,7 +15,6 @@ Date: October 14, 2025
 """
 
 import asyncio
-import re
 import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -24,6 +23,9 @@ from playwright.async_api import async_playwright, Page, Browser
 from bs4 import BeautifulSoup
 from loguru import logger
 
+from src.scrapers.regex_registry import NON_VIDEO_URL, YOUTUBE_URL_ID_LOOSE, youtube_id
+from src.scrapers.video_scanner import URL_FORMS, video_ids
+
 
 class ProductionLayer3Extractor:
     """
@@ -245,18 +247,9 @@ class ProductionLayer3Extractor:
         if not url:
             return False
         
-        # Skip channel/user/playlist URLs
-        invalid_patterns = [
-            r'youtube\.com/c/',           # Channel
-            r'youtube\.com/@',            # Handle
-            r'youtube\.com/user/',        # User
-            r'youtube\.com/playlist',     # Playlist
-            r'^/',                        # Relative URL
-        ]
-        
-        for pattern in invalid_patterns:
-            if re.search(pattern, url):
-                return False
+        # Skip channel/user/playlist and relative URLs
+        if NON_VIDEO_URL.search(url):
+            return False
         
         # Must have valid video ID (11 characters)
         video_id = self._extract_youtube_id(url)
@@ -272,37 +265,16 @@ class ProductionLayer3Extractor:
         # Get all page content
         page_text = str(soup)
         
-        # YouTube video ID patterns (11-character alphanumeric)
-        patterns = [
-            r'https?://(?:www\.)?youtube\.com/watch\?v=([\w-]{11})',
-            r'https?://(?:www\.)?youtube\.com/embed/([\w-]{11})',
-            r'https?://youtu\.be/([\w-]{11})',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, page_text)
-            for match in matches:
-                # Validate it's not a channel/user URL
-                if self._is_valid_video_id(match):
-                    videos.append({
-                        'type': 'regex_discovered',
-                        'url': f'https://youtu.be/{match}',
-                        'youtube_id': match
-                    })
+        # YouTube watch / embed / short URLs with validated 11-character IDs, in one scan
+        for video_id in video_ids(page_text, forms=URL_FORMS):
+            videos.append({
+                'type': 'regex_discovered',
+                'url': f'https://youtu.be/{video_id}',
+                'youtube_id': video_id
+            })
         
         return videos
     
-    def _is_valid_video_id(self, video_id: str) -> bool:
-        """Validate YouTube video ID (must be exactly 11 characters)"""
-        if not video_id or len(video_id) != 11:
-            return False
-        
-        # Check it's alphanumeric with dashes/underscores
-        if not re.match(r'^[\w-]{11}$', video_id):
-            return False
-        
-        return True
-    
     def _deduplicate_videos(self, videos: List[Dict]) -> List[Dict]:
         """Deduplicate videos by YouTube ID or URL"""
         seen = set()
@@ -328,22 +300,12 @@ class ProductionLayer3Extractor:
     
     def _extract_youtube_id(self, url: str) -> Optional[str]:
         """Extract YouTube video ID"""
-        patterns = [
-            r'youtube\.com/watch\?v=([^&]+)',
-            r'youtu\.be/([^?]+)',
-            r'youtube\.com/embed/([^?]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        
-        return None
+        return youtube_id(url, YOUTUBE_URL_ID_LOOSE)
     
     async def _extract_transcripts(self, videos: List[Dict]) -> Dict[str, str]:
         """Extract transcripts for YouTube videos"""
         from src.scrapers.transcript_extractor import TranscriptExtractor
+        from src.scrapers.transcript_cache import get_transcript_cache
         
         transcripts = {}
         youtube_videos = [v for v in videos if v.get('youtube_id')]
@@ -353,7 +315,7 @@ class ProductionLayer3Extractor:
         
         logger.info(f"Extracting {len(youtube_videos)} transcripts")
         
-        async with TranscriptExtractor(headless=self.headless) as extractor:
+        async with TranscriptExtractor(headless=self.headless, cache=get_transcript_cache()) as extractor:
             for video in youtube_videos:
                 video_url = video.get('url', '')
                 video_id = video.get('youtube_id', '')
@@ -19,6 +19,93 @@ from datetime import datetime
 from loguru import logger
 
 from src.scrapers.base import BaseExtractor
+from src.scrapers.keyword_matcher import register_keywords
+from src.scrapers.regex_registry import register_patterns
+from src.scrapers.text_corpus import WorkflowTextCorpus
+
+
+# Business function keywords
+BUSINESS_FUNCTIONS = {
+    'sales': ['sales', 'selling', 'revenue', 'lead', 'customer acquisition', 'conversion'],
+    'marketing': ['marketing', 'campaign', 'promotion', 'brand', 'advertising', 'social media'],
+    'customer_service': ['support', 'service', 'help', 'ticket', 'response', 'satisfaction'],
+    'operations': ['operations', 'process', 'workflow', 'automation', 'efficiency', 'productivity'],
+    'finance': ['finance', 'accounting', 'billing', 'payment', 'invoice', 'budget', 'cost'],
+    'hr': ['hr', 'human resources', 'employee', 'hiring', 'recruitment', 'payroll', 'benefits'],
+    'it': ['it', 'technology', 'system', 'integration', 'api', 'data', 'security'],
+    'analytics': ['analytics', 'reporting', 'dashboard', 'metrics', 'kpi', 'insights', 'data'],
+    'compliance': ['compliance', 'regulation', 'audit', 'governance', 'policy', 'security']
+}
+
+# Business value indicators
+VALUE_INDICATORS = {
+    'revenue': ['revenue', 'income', 'profit', 'sales', 'earnings', 'monetize'],
+    'cost_savings': ['save', 'savings', 'reduce cost', 'cut cost', 'budget', 'efficient'],
+    'time_savings': ['time', 'faster', 'quicker', 'speed', 'reduce time', 'hours'],
+    'efficiency': ['efficiency', 'productivity', 'automate', 'streamline', 'optimize'],
+    'quality': ['quality', 'accuracy', 'error', 'mistake', 'improve', 'better'],
+    'customer': ['customer', 'client', 'satisfaction', 'experience', 'service']
+}
+
+# Benefit indicators
+BENEFIT_KEYWORDS = {
+    'efficiency': ['efficiency', 'productivity', 'streamline', 'optimize'],
+    'quality': ['quality', 'accuracy', 'reduce error', 'improve'],
+    'customer': ['customer satisfaction', 'user experience', 'service quality'],
+    'cost': ['cost effective', 'reduce cost', 'save money', 'budget'],
+    'time': ['faster', 'quicker', 'reduce time', 'speed up']
+}
+
+# Business context keywords (first match in list order wins, or distinct hits are counted)
+CONTEXT_KEYWORDS = {
+    'challenge': ['challenge', 'problem', 'issue', 'difficulty', 'struggle', 'pain point'],
+    'solution': ['solution', 'solve', 'resolve', 'fix', 'address', 'overcome'],
+    'advantage': ['advantage', 'benefit', 'competitive', 'edge', 'superior'],
+    'process': ['process', 'workflow', 'procedure', 'operation', 'task'],
+    'outcome': ['outcome', 'result', 'goal', 'objective', 'target', 'achievement'],
+    'goal': ['goal', 'objective', 'target', 'aim', 'purpose', 'mission'],
+    'requirement': ['require', 'need', 'must', 'should', 'necessary'],
+    'constraint': ['constraint', 'limit', 'restriction', 'boundary', 'barrier'],
+    'risk': ['risk', 'threat', 'danger', 'vulnerability', 'exposure'],
+    'automation': ['automate', 'automatic', 'manual', 'hand', 'process'],
+    'optimization': ['optimize', 'improve', 'enhance', 'better', 'efficient'],
+    'innovation': ['innovative', 'new', 'cutting-edge', 'advanced', 'modern'],
+    'compliance': ['compliance', 'regulation', 'policy', 'standard', 'audit'],
+    'security': ['security', 'secure', 'privacy', 'protection', 'encryption']
+}
+
+register_keywords('layer4.business_functions', BUSINESS_FUNCTIONS)
+register_keywords('layer4.value_indicators', VALUE_INDICATORS)
+register_keywords('layer4.benefits', BENEFIT_KEYWORDS)
+register_keywords('layer4', CONTEXT_KEYWORDS)
+
+# ROI and cost patterns, with the field each one fills
+ROI_PATTERNS = register_patterns('layer4.roi', {
+    'roi': r'roi[:\s]*(\d+(?:\.\d+)?%)?',
+    'return_on_investment': r'return on investment[:\s]*(\d+(?:\.\d+)?%)?',
+    'payback': r'payback[:\s]*(\d+)\s*(?:months?|years?|days?)',
+    'savings': r'savings[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)(?:\s*(?:per|/)\s*(?:month|year|day|hour))?',
+    'cost': r'cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)(?:\s*(?:per|/)\s*(?:month|year|day|hour))?'
+}, re.IGNORECASE)
+
+ROI_FIELDS = {
+    'roi': 'roi_estimate',
+    'return_on_investment': 'roi_estimate',
+    'payback': 'payback_period',
+    'savings': 'cost_savings',
+    'cost': 'implementation_cost'
+}
+
+# Time savings patterns (the last one that matches wins)
+TIME_SAVINGS_PATTERNS = register_patterns('layer4.time_savings', {
+    'saves': r'save[s]?\s+(\d+)\s+(?:hours?|hrs?)',
+    'reduces': r'reduce[s]?\s+(\d+)\s+(?:hours?|hrs?)',
+    'per_period': r'(\d+)\s+(?:hours?|hrs?)\s+(?:per|/)\s+(?:day|week|month|year)'
+}, re.IGNORECASE)
+
+# Newline-joined fields: no keyword spans a newline, so one scan equals checking each field
+METADATA_LINES = ('title', 'description', 'use_case')
+OUTCOME_LINES = ('description', 'use_case')
 
 
 @dataclass
@@ -97,69 +184,45 @@ class BusinessIntelligenceExtractor(BaseExtractor):
     def __init__(self):
         super().__init__("Layer 4 - Business Intelligence")
         
-        # Business function keywords
-        self.business_functions = {
-            'sales': ['sales', 'selling', 'revenue', 'lead', 'customer acquisition', 'conversion'],
-            'marketing': ['marketing', 'campaign', 'promotion', 'brand', 'advertising', 'social media'],
-            'customer_service': ['support', 'service', 'help', 'ticket', 'response', 'satisfaction'],
-            'operations': ['operations', 'process', 'workflow', 'automation', 'efficiency', 'productivity'],
-            'finance': ['finance', 'accounting', 'billing', 'payment', 'invoice', 'budget', 'cost'],
-            'hr': ['hr', 'human resources', 'employee', 'hiring', 'recruitment', 'payroll', 'benefits'],
-            'it': ['it', 'technology', 'system', 'integration', 'api', 'data', 'security'],
-            'analytics': ['analytics', 'reporting', 'dashboard', 'metrics', 'kpi', 'insights', 'data'],
-            'compliance': ['compliance', 'regulation', 'audit', 'governance', 'policy', 'security']
-        }
-        
-        # Business value indicators
-        self.value_indicators = {
-            'revenue': ['revenue', 'income', 'profit', 'sales', 'earnings', 'monetize'],
-            'cost_savings': ['save', 'savings', 'reduce cost', 'cut cost', 'budget', 'efficient'],
-            'time_savings': ['time', 'faster', 'quicker', 'speed', 'reduce time', 'hours'],
-            'efficiency': ['efficiency', 'productivity', 'automate', 'streamline', 'optimize'],
-            'quality': ['quality', 'accuracy', 'error', 'mistake', 'improve', 'better'],
-            'customer': ['customer', 'client', 'satisfaction', 'experience', 'service']
-        }
-        
-        # ROI and cost patterns
-        self.roi_patterns = [
-            r'roi[:\s]*(\d+(?:\.\d+)?%)?',
-            r'return on investment[:\s]*(\d+(?:\.\d+)?%)?',
-            r'payback[:\s]*(\d+)\s*(?:months?|years?|days?)',
-            r'savings[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)(?:\s*(?:per|/)\s*(?:month|year|day|hour))?',
-            r'cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)(?:\s*(?:per|/)\s*(?:month|year|day|hour))?'
-        ]
+        self.business_functions = BUSINESS_FUNCTIONS
+        self.value_indicators = VALUE_INDICATORS
+        
+        self.roi_patterns = ROI_PATTERNS
     
-    async def extract(self, workflow_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def extract(
+        self,
+        workflow_data: Dict[str, Any],
+        corpus: Optional[WorkflowTextCorpus] = None
+    ) -> Dict[str, Any]:
         """
         Extract business intelligence data from workflow.
         
+        Async adapter for BaseExtractor; the work is done by extract_sync().
+        
         Args:
             workflow_data: Combined data from previous layers
+            corpus: Shared text corpus for this workflow (built here if not given)
             
         Returns:
             Dictionary with business intelligence data
         """
+        return self.extract_sync(workflow_data, corpus=corpus)
+    
+    def extract_sync(
+        self,
+        workflow_data: Dict[str, Any],
+        corpus: Optional[WorkflowTextCorpus] = None
+    ) -> Dict[str, Any]:
+        """
+        Extract business intelligence data synchronously; same result as extract().
+        
+        For thread/process executors and the batch analytics engine.
+        """
         workflow_id = workflow_data.get('workflow_id', 'unknown')
         logger.info(f"Starting {self.layer_name} extraction for workflow {workflow_id}")
         
         try:
-            # Initialize business intelligence data
-            bi_data = BusinessIntelligenceData()
-            
-            # Extract from workflow metadata
-            await self._extract_from_metadata(workflow_data, bi_data)
-            
-            # Extract from content
-            await self._extract_from_content(workflow_data, bi_data)
-            
-            # Extract from use case
-            await self._extract_from_use_case(workflow_data, bi_data)
-            
-            # Analyze business context
-            await self._analyze_business_context(workflow_data, bi_data)
-            
-            # Calculate business value score
-            await self._calculate_business_value_score(bi_data)
+            bi_data = self.analyze(workflow_data, corpus=corpus)
             
             # Convert to dictionary
             result = {
@@ -181,104 +244,111 @@ class BusinessIntelligenceExtractor(BaseExtractor):
                 'layer': self.layer_name
             }
     
-    async def _extract_from_metadata(self, workflow_data: Dict[str, Any], bi_data: BusinessIntelligenceData):
+    def analyze(
+        self,
+        workflow_data: Dict[str, Any],
+        corpus: Optional[WorkflowTextCorpus] = None
+    ) -> BusinessIntelligenceData:
+        """
+        Synchronous, side-effect-free business intelligence core.
+        
+        Reads only workflow_data (through the corpus) and the extractor's
+        constant tables, and raises on malformed input.
+        
+        Args:
+            workflow_data: Combined data from previous layers
+            corpus: Shared text corpus for this workflow (built here if not given)
+            
+        Returns:
+            Populated BusinessIntelligenceData
+        """
+        # Initialize business intelligence data
+        bi_data = BusinessIntelligenceData()
+        corpus = corpus or WorkflowTextCorpus(workflow_data)
+        
+        # Extract from workflow metadata
+        self._extract_from_metadata(corpus, bi_data)
+        
+        # Extract from content
+        self._extract_from_content(corpus, bi_data)
+        
+        # Extract from use case
+        self._extract_from_use_case(corpus, bi_data)
+        
+        # Analyze business context
+        self._analyze_business_context(corpus, bi_data)
+        
+        # Calculate business value score
+        self._calculate_business_value_score(bi_data)
+        
+        return bi_data
+    
+    def _extract_from_metadata(self, corpus: WorkflowTextCorpus, bi_data: BusinessIntelligenceData):
         """Extract business intelligence from workflow metadata."""
         
-        # Get metadata from layer 1
-        layer1_data = workflow_data.get('layers', {}).get('layer1', {}).get('data', {})
-        
-        # Extract business function from title/description
-        title = layer1_data.get('title', '').lower()
-        description = layer1_data.get('description', '').lower()
-        use_case = layer1_data.get('use_case', '').lower()
-        
-        # Determine business function
-        for func, keywords in self.business_functions.items():
-            for keyword in keywords:
-                if keyword in title or keyword in description or keyword in use_case:
-                    bi_data.business_function = func.title()
-                    break
-            if bi_data.business_function:
+        # Determine business function from title/description/use case
+        scan = corpus.scan(corpus.text(*METADATA_LINES, sep="\n"))
+        for func in self.business_functions:
+            if scan.first(f'layer4.business_functions.{func}'):
+                bi_data.business_function = func.title()
                 break
         
         # Extract business process
-        bi_data.business_process = self._extract_business_process(title, description, use_case)
+        bi_data.business_process = self._extract_business_process(corpus)
         
         # Extract business outcome
-        bi_data.business_outcome = self._extract_business_outcome(description, use_case)
+        bi_data.business_outcome = self._extract_business_outcome(corpus)
         
         # Extract business goal
-        bi_data.business_goal = self._extract_business_goal(description, use_case)
+        bi_data.business_goal = self._extract_business_goal(corpus)
     
-    async def _extract_from_content(self, workflow_data: Dict[str, Any], bi_data: BusinessIntelligenceData):
+    def _extract_from_content(self, corpus: WorkflowTextCorpus, bi_data: BusinessIntelligenceData):
         """Extract business intelligence from workflow content."""
         
-        # Get content from layer 3
-        layer3_data = workflow_data.get('layers', {}).get('layer3', {}).get('data', {})
-        
-        explainer_text = layer3_data.get('explainer_text', '')
-        setup_instructions = layer3_data.get('setup_instructions', '')
-        use_instructions = layer3_data.get('use_instructions', '')
-        
-        # Combine all text for analysis
-        full_text = f"{explainer_text} {setup_instructions} {use_instructions}".lower()
-        
         # Extract ROI and cost information
-        await self._extract_roi_and_costs(full_text, bi_data)
+        self._extract_roi_and_costs(corpus, bi_data)
         
         # Extract business benefits
-        await self._extract_business_benefits(full_text, bi_data)
+        self._extract_business_benefits(corpus, bi_data)
         
         # Extract business challenges and solutions
-        await self._extract_challenges_and_solutions(full_text, bi_data)
+        self._extract_challenges_and_solutions(corpus, bi_data)
     
-    async def _extract_from_use_case(self, workflow_data: Dict[str, Any], bi_data: BusinessIntelligenceData):
+    def _extract_from_use_case(self, corpus: WorkflowTextCorpus, bi_data: BusinessIntelligenceData):
         """Extract business intelligence from use case information."""
         
-        layer1_data = workflow_data.get('layers', {}).get('layer1', {}).get('data', {})
-        use_case = layer1_data.get('use_case', '')
-        
-        if not use_case:
+        if not corpus.raw('use_case'):
             return
         
         # Extract business requirements
-        bi_data.business_requirement = self._extract_business_requirements(use_case)
+        bi_data.business_requirement = self._extract_business_requirements(corpus)
         
         # Extract business constraints
-        bi_data.business_constraint = self._extract_business_constraints(use_case)
+        bi_data.business_constraint = self._extract_business_constraints(corpus)
         
         # Extract business risks
-        bi_data.business_risk = self._extract_business_risks(use_case)
+        bi_data.business_risk = self._extract_business_risks(corpus)
     
-    async def _analyze_business_context(self, workflow_data: Dict[str, Any], bi_data: BusinessIntelligenceData):
+    def _analyze_business_context(self, corpus: WorkflowTextCorpus, bi_data: BusinessIntelligenceData):
         """Analyze overall business context and transformation potential."""
         
-        # Get all text content
-        layer1_data = workflow_data.get('layers', {}).get('layer1', {}).get('data', {})
-        layer3_data = workflow_data.get('layers', {}).get('layer3', {}).get('data', {})
-        
-        title = layer1_data.get('title', '')
-        description = layer1_data.get('description', '')
-        use_case = layer1_data.get('use_case', '')
-        explainer_text = layer3_data.get('explainer_text', '')
-        
-        full_text = f"{title} {description} {use_case} {explainer_text}".lower()
-        
         # Analyze transformation potential
-        bi_data.business_automation = self._analyze_automation_potential(full_text)
-        bi_data.business_optimization = self._analyze_optimization_potential(full_text)
-        bi_data.business_innovation = self._analyze_innovation_potential(full_text)
+        bi_data.business_automation = self._analyze_automation_potential(corpus)
+        bi_data.business_optimization = self._analyze_optimization_potential(corpus)
+        bi_data.business_innovation = self._analyze_innovation_potential(corpus)
         
         # Analyze compliance and governance
-        bi_data.business_compliance = self._analyze_compliance_requirements(full_text)
-        bi_data.business_security = self._analyze_security_requirements(full_text)
+        bi_data.business_compliance = self._analyze_compliance_requirements(corpus)
+        bi_data.business_security = self._analyze_security_requirements(corpus)
     
-    async def _extract_roi_and_costs(self, text: str, bi_data: BusinessIntelligenceData):
-        """Extract ROI and cost information from text."""
+    def _extract_roi_and_costs(self, corpus: WorkflowTextCorpus, bi_data: BusinessIntelligenceData):
+        """Extract ROI and cost information from content text."""
+        
+        text = corpus.content
         
         # Look for ROI patterns
-        for pattern in self.roi_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for name, pattern in self.roi_patterns.items():
+            matches = corpus.findall(pattern, text)
             if matches:
                 # Extract numeric values
                 for match in matches:
@@ -286,84 +356,60 @@ class BusinessIntelligenceExtractor(BaseExtractor):
                         try:
                             # Clean and convert to float
                             value = float(match.replace('%', '').replace(',', ''))
-                            if 'roi' in pattern.lower() or 'return' in pattern.lower():
-                                bi_data.roi_estimate = value
-                            elif 'payback' in pattern.lower():
-                                bi_data.payback_period = int(value)
-                            elif 'savings' in pattern.lower():
-                                bi_data.cost_savings = value
-                            elif 'cost' in pattern.lower():
-                                bi_data.implementation_cost = value
+                            if name == 'payback':
+                                value = int(value)
+                            setattr(bi_data, ROI_FIELDS[name], value)
                         except ValueError:
                             continue
         
         # Look for time savings
-        time_patterns = [
-            r'save[s]?\s+(\d+)\s+(?:hours?|hrs?)',
-            r'reduce[s]?\s+(\d+)\s+(?:hours?|hrs?)',
-            r'(\d+)\s+(?:hours?|hrs?)\s+(?:per|/)\s+(?:day|week|month|year)'
-        ]
-        
-        for pattern in time_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in TIME_SAVINGS_PATTERNS.values():
+            matches = corpus.findall(pattern, text)
             if matches:
                 try:
                     bi_data.time_savings = int(matches[0])
                 except ValueError:
                     continue
     
-    async def _extract_business_benefits(self, text: str, bi_data: BusinessIntelligenceData):
-        """Extract business benefits from text."""
+    def _extract_business_benefits(self, corpus: WorkflowTextCorpus, bi_data: BusinessIntelligenceData):
+        """Extract business benefits from content text."""
         
         # Look for benefit indicators
-        benefit_patterns = {
-            'efficiency': ['efficiency', 'productivity', 'streamline', 'optimize'],
-            'quality': ['quality', 'accuracy', 'reduce error', 'improve'],
-            'customer': ['customer satisfaction', 'user experience', 'service quality'],
-            'cost': ['cost effective', 'reduce cost', 'save money', 'budget'],
-            'time': ['faster', 'quicker', 'reduce time', 'speed up']
-        }
-        
-        for benefit_type, keywords in benefit_patterns.items():
-            for keyword in keywords:
-                if keyword in text:
-                    if benefit_type == 'efficiency':
-                        bi_data.efficiency_gains = 0.25  # Default 25% improvement
-                    elif benefit_type == 'quality':
-                        bi_data.quality_improvements = 0.20  # Default 20% improvement
-                    elif benefit_type == 'customer':
-                        bi_data.customer_satisfaction = 0.15  # Default 15% improvement
-                    elif benefit_type == 'cost':
-                        bi_data.cost_savings = bi_data.cost_savings or 1000  # Default $1000 savings
-                    elif benefit_type == 'time':
-                        bi_data.time_savings = bi_data.time_savings or 5  # Default 5 hours saved
-                    break
+        scan = corpus.scan(corpus.content)
+        
+        for benefit_type in BENEFIT_KEYWORDS:
+            if scan.first(f'layer4.benefits.{benefit_type}'):
+                if benefit_type == 'efficiency':
+                    bi_data.efficiency_gains = 0.25  # Default 25% improvement
+                elif benefit_type == 'quality':
+                    bi_data.quality_improvements = 0.20  # Default 20% improvement
+                elif benefit_type == 'customer':
+                    bi_data.customer_satisfaction = 0.15  # Default 15% improvement
+                elif benefit_type == 'cost':
+                    bi_data.cost_savings = bi_data.cost_savings or 1000  # Default $1000 savings
+                elif benefit_type == 'time':
+                    bi_data.time_savings = bi_data.time_savings or 5  # Default 5 hours saved
     
-    async def _extract_challenges_and_solutions(self, text: str, bi_data: BusinessIntelligenceData):
-        """Extract business challenges and solutions from text."""
+    def _extract_challenges_and_solutions(self, corpus: WorkflowTextCorpus, bi_data: BusinessIntelligenceData):
+        """Extract business challenges and solutions from content text."""
         
         # Look for challenge indicators
-        challenge_keywords = ['challenge', 'problem', 'issue', 'difficulty', 'struggle', 'pain point']
-        solution_keywords = ['solution', 'solve', 'resolve', 'fix', 'address', 'overcome']
+        scan = corpus.scan(corpus.content)
         
-        for keyword in challenge_keywords:
-            if keyword in text:
-                bi_data.business_challenge = f"Addresses {keyword} in workflow automation"
-                break
+        challenge = scan.first('layer4.challenge')
+        if challenge:
+            bi_data.business_challenge = f"Addresses {challenge} in workflow automation"
         
-        for keyword in solution_keywords:
-            if keyword in text:
-                bi_data.business_solution = f"Provides {keyword} through automated workflow"
-                break
+        solution = scan.first('layer4.solution')
+        if solution:
+            bi_data.business_solution = f"Provides {solution} through automated workflow"
         
         # Extract business advantage
-        advantage_keywords = ['advantage', 'benefit', 'competitive', 'edge', 'superior']
-        for keyword in advantage_keywords:
-            if keyword in text:
-                bi_data.business_advantage = f"Provides {keyword} through workflow automation"
-                break
+        advantage = scan.first('layer4.advantage')
+        if advantage:
+            bi_data.business_advantage = f"Provides {advantage} through workflow automation"
     
-    async def _calculate_business_value_score(self, bi_data: BusinessIntelligenceData):
+    def _calculate_business_value_score(self, bi_data: BusinessIntelligenceData):
         """Calculate overall business value score."""
         
         score = 0.0
@@ -400,78 +446,46 @@ class BusinessIntelligenceExtractor(BaseExtractor):
         else:
             bi_data.business_value_score = 50.0  # Default neutral score
     
-    def _extract_business_process(self, title: str, description: str, use_case: str) -> Optional[str]:
+    def _extract_business_process(self, corpus: WorkflowTextCorpus) -> Optional[str]:
         """Extract business process from text."""
         
-        process_keywords = ['process', 'workflow', 'procedure', 'operation', 'task']
-        
-        for keyword in process_keywords:
-            if keyword in title or keyword in description or keyword in use_case:
-                return f"Automated {keyword} management"
-        
-        return None
+        keyword = corpus.scan(corpus.text(*METADATA_LINES, sep="\n")).first('layer4.process')
+        return f"Automated {keyword} management" if keyword else None
     
-    def _extract_business_outcome(self, description: str, use_case: str) -> Optional[str]:
+    def _extract_business_outcome(self, corpus: WorkflowTextCorpus) -> Optional[str]:
         """Extract business outcome from text."""
         
-        outcome_keywords = ['outcome', 'result', 'goal', 'objective', 'target', 'achievement']
-        
-        for keyword in outcome_keywords:
-            if keyword in description or keyword in use_case:
-                return f"Improved {keyword} through automation"
-        
-        return None
+        keyword = corpus.scan(corpus.text(*OUTCOME_LINES, sep="\n")).first('layer4.outcome')
+        return f"Improved {keyword} through automation" if keyword else None
     
-    def _extract_business_goal(self, description: str, use_case: str) -> Optional[str]:
+    def _extract_business_goal(self, corpus: WorkflowTextCorpus) -> Optional[str]:
         """Extract business goal from text."""
         
-        goal_keywords = ['goal', 'objective', 'target', 'aim', 'purpose', 'mission']
-        
-        for keyword in goal_keywords:
-            if keyword in description or keyword in use_case:
-                return f"Achieve {keyword} through workflow automation"
-        
-        return None
+        keyword = corpus.scan(corpus.text(*OUTCOME_LINES, sep="\n")).first('layer4.goal')
+        return f"Achieve {keyword} through workflow automation" if keyword else None
     
-    def _extract_business_requirements(self, use_case: str) -> Optional[str]:
+    def _extract_business_requirements(self, corpus: WorkflowTextCorpus) -> Optional[str]:
         """Extract business requirements from use case."""
         
-        requirement_keywords = ['require', 'need', 'must', 'should', 'necessary']
-        
-        for keyword in requirement_keywords:
-            if keyword in use_case:
-                return f"Workflow addresses {keyword} in business operations"
-        
-        return None
+        keyword = corpus.scan(corpus.raw('use_case')).first('layer4.requirement')
+        return f"Workflow addresses {keyword} in business operations" if keyword else None
     
-    def _extract_business_constraints(self, use_case: str) -> Optional[str]:
+    def _extract_business_constraints(self, corpus: WorkflowTextCorpus) -> Optional[str]:
         """Extract business constraints from use case."""
         
-        constraint_keywords = ['constraint', 'limit', 'restriction', 'boundary', 'barrier']
-        
-        for keyword in constraint_keywords:
-            if keyword in use_case:
-                return f"Workflow works within {keyword} limitations"
-        
-        return None
+        keyword = corpus.scan(corpus.raw('use_case')).first('layer4.constraint')
+        return f"Workflow works within {keyword} limitations" if keyword else None
     
-    def _extract_business_risks(self, use_case: str) -> Optional[str]:
+    def _extract_business_risks(self, corpus: WorkflowTextCorpus) -> Optional[str]:
         """Extract business risks from use case."""
         
-        risk_keywords = ['risk', 'threat', 'danger', 'vulnerability', 'exposure']
-        
-        for keyword in risk_keywords:
-            if keyword in use_case:
-                return f"Workflow mitigates {keyword} in business operations"
-        
-        return None
+        keyword = corpus.scan(corpus.raw('use_case')).first('layer4.risk')
+        return f"Workflow mitigates {keyword} in business operations" if keyword else None
     
-    def _analyze_automation_potential(self, text: str) -> Optional[str]:
+    def _analyze_automation_potential(self, corpus: WorkflowTextCorpus) -> Optional[str]:
         """Analyze automation potential from text."""
         
-        automation_keywords = ['automate', 'automatic', 'manual', 'hand', 'process']
-        
-        automation_count = sum(1 for keyword in automation_keywords if keyword in text)
+        automation_count = corpus.scan(corpus.context).hits('layer4.automation')
         
         if automation_count >= 2:
             return "High automation potential - reduces manual processes"
@@ -480,12 +494,10 @@ class BusinessIntelligenceExtractor(BaseExtractor):
         else:
             return "Low automation potential - limited automation focus"
     
-    def _analyze_optimization_potential(self, text: str) -> Optional[str]:
+    def _analyze_optimization_potential(self, corpus: WorkflowTextCorpus) -> Optional[str]:
         """Analyze optimization potential from text."""
         
-        optimization_keywords = ['optimize', 'improve', 'enhance', 'better', 'efficient']
-        
-        optimization_count = sum(1 for keyword in optimization_keywords if keyword in text)
+        optimization_count = corpus.scan(corpus.context).hits('layer4.optimization')
         
         if optimization_count >= 2:
             return "High optimization potential - focuses on improvement"
@@ -494,12 +506,10 @@ class BusinessIntelligenceExtractor(BaseExtractor):
         else:
             return "Low optimization potential - limited improvement focus"
     
-    def _analyze_innovation_potential(self, text: str) -> Optional[str]:
+    def _analyze_innovation_potential(self, corpus: WorkflowTextCorpus) -> Optional[str]:
         """Analyze innovation potential from text."""
         
-        innovation_keywords = ['innovative', 'new', 'cutting-edge', 'advanced', 'modern']
-        
-        innovation_count = sum(1 for keyword in innovation_keywords if keyword in text)
+        innovation_count = corpus.scan(corpus.context).hits('layer4.innovation')
         
         if innovation_count >= 2:
             return "High innovation potential - uses advanced techniques"
@@ -508,12 +518,10 @@ class BusinessIntelligenceExtractor(BaseExtractor):
         else:
             return "Low innovation potential - standard approaches"
     
-    def _analyze_compliance_requirements(self, text: str) -> Optional[str]:
+    def _analyze_compliance_requirements(self, corpus: WorkflowTextCorpus) -> Optional[str]:
         """Analyze compliance requirements from text."""
         
-        compliance_keywords = ['compliance', 'regulation', 'policy', 'standard', 'audit']
-        
-        compliance_count = sum(1 for keyword in compliance_keywords if keyword in text)
+        compliance_count = corpus.scan(corpus.context).hits('layer4.compliance')
         
         if compliance_count >= 2:
             return "High compliance requirements - multiple regulatory considerations"
@@ -522,12 +530,10 @@ class BusinessIntelligenceExtractor(BaseExtractor):
         else:
             return "Low compliance requirements - minimal regulatory focus"
     
-    def _analyze_security_requirements(self, text: str) -> Optional[str]:
+    def _analyze_security_requirements(self, corpus: WorkflowTextCorpus) -> Optional[str]:
         """Analyze security requirements from text."""
         
-        security_keywords = ['security', 'secure', 'privacy', 'protection', 'encryption']
-        
-        security_count = sum(1 for keyword in security_keywords if keyword in text)
+        security_count = corpus.scan(corpus.context).hits('layer4.security')
         
         if security_count >= 2:
             return "High security requirements - multiple security considerations"
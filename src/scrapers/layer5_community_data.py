@@ -18,6 +18,54 @@ from datetime import datetime
 from loguru import logger
 
 from src.scrapers.base import BaseExtractor
+from src.scrapers.keyword_matcher import register_keywords
+from src.scrapers.regex_registry import register_pattern_groups, register_pattern_list
+from src.scrapers.text_corpus import WorkflowTextCorpus
+
+
+# Sentiment keywords
+SENTIMENT_KEYWORDS = {
+    'positive': ['great', 'excellent', 'amazing', 'wonderful', 'fantastic', 'love', 'perfect', 'awesome'],
+    'negative': ['bad', 'terrible', 'awful', 'horrible', 'hate', 'worst', 'disappointing', 'poor'],
+    'neutral': ['okay', 'fine', 'decent', 'average', 'good', 'nice', 'alright', 'standard']
+}
+
+register_keywords('layer5.sentiment', SENTIMENT_KEYWORDS)
+
+# Community engagement patterns (first match per metric wins)
+ENGAGEMENT_PATTERNS = register_pattern_groups('layer5.engagement', {
+    'comments': [r'(\d+)\s*comment', r'comment[s]?\s*(\d+)'],
+    'reviews': [r'(\d+)\s*review', r'review[s]?\s*(\d+)'],
+    'questions': [r'(\d+)\s*question', r'question[s]?\s*(\d+)'],
+    'answers': [r'(\d+)\s*answer', r'answer[s]?\s*(\d+)'],
+    'discussions': [r'(\d+)\s*discussion', r'discussion[s]?\s*(\d+)'],
+    'mentions': [r'(\d+)\s*mention', r'mention[s]?\s*(\d+)']
+}, re.IGNORECASE)
+
+# Social metrics patterns
+SOCIAL_PATTERNS = register_pattern_groups('layer5.social', {
+    'bookmarks': [r'(\d+)\s*bookmark', r'bookmark[s]?\s*(\d+)'],
+    'favorites': [r'(\d+)\s*favorite', r'favorite[s]?\s*(\d+)'],
+    'follows': [r'(\d+)\s*follow', r'follow[s]?\s*(\d+)'],
+    'forks': [r'(\d+)\s*fork', r'fork[s]?\s*(\d+)'],
+    'clones': [r'(\d+)\s*clone', r'clone[s]?\s*(\d+)'],
+    'remixes': [r'(\d+)\s*remix', r'remix[s]?\s*(\d+)']
+}, re.IGNORECASE)
+
+# Usage patterns
+USAGE_PATTERNS = register_pattern_groups('layer5.usage', {
+    'downloads': [r'(\d+)\s*download', r'download[s]?\s*(\d+)'],
+    'installs': [r'(\d+)\s*install', r'install[s]?\s*(\d+)'],
+    'usage': [r'(\d+)\s*use', r'use[s]?\s*(\d+)', r'(\d+)\s*user', r'user[s]?\s*(\d+)']
+}, re.IGNORECASE)
+
+# Rating patterns (two groups for "rating/total" formats)
+RATING_PATTERNS = register_pattern_list('layer5.rating', [
+    r'rating[:\s]*(\d+(?:\.\d+)?)\s*/\s*(\d+)',
+    r'(\d+(?:\.\d+)?)\s*star[s]?',
+    r'(\d+(?:\.\d+)?)\s*\/\s*5',
+    r'(\d+(?:\.\d+)?)\s*out of (\d+)'
+], re.IGNORECASE)
 
 
 @dataclass
@@ -69,75 +117,46 @@ class CommunityDataExtractor(BaseExtractor):
     def __init__(self):
         super().__init__("Layer 5 - Community Data")
         
-        # Community engagement patterns
-        self.engagement_patterns = {
-            'comments': [r'(\d+)\s*comment', r'comment[s]?\s*(\d+)'],
-            'reviews': [r'(\d+)\s*review', r'review[s]?\s*(\d+)'],
-            'questions': [r'(\d+)\s*question', r'question[s]?\s*(\d+)'],
-            'answers': [r'(\d+)\s*answer', r'answer[s]?\s*(\d+)'],
-            'discussions': [r'(\d+)\s*discussion', r'discussion[s]?\s*(\d+)'],
-            'mentions': [r'(\d+)\s*mention', r'mention[s]?\s*(\d+)']
-        }
-        
-        # Social metrics patterns
-        self.social_patterns = {
-            'bookmarks': [r'(\d+)\s*bookmark', r'bookmark[s]?\s*(\d+)'],
-            'favorites': [r'(\d+)\s*favorite', r'favorite[s]?\s*(\d+)'],
-            'follows': [r'(\d+)\s*follow', r'follow[s]?\s*(\d+)'],
-            'forks': [r'(\d+)\s*fork', r'fork[s]?\s*(\d+)'],
-            'clones': [r'(\d+)\s*clone', r'clone[s]?\s*(\d+)'],
-            'remixes': [r'(\d+)\s*remix', r'remix[s]?\s*(\d+)']
-        }
-        
-        # Usage patterns
-        self.usage_patterns = {
-            'downloads': [r'(\d+)\s*download', r'download[s]?\s*(\d+)'],
-            'installs': [r'(\d+)\s*install', r'install[s]?\s*(\d+)'],
-            'usage': [r'(\d+)\s*use', r'use[s]?\s*(\d+)', r'(\d+)\s*user', r'user[s]?\s*(\d+)']
-        }
-        
-        # Rating patterns
-        self.rating_patterns = [
-            r'rating[:\s]*(\d+(?:\.\d+)?)\s*/\s*(\d+)',
-            r'(\d+(?:\.\d+)?)\s*star[s]?',
-            r'(\d+(?:\.\d+)?)\s*\/\s*5',
-            r'(\d+(?:\.\d+)?)\s*out of (\d+)'
-        ]
+        self.engagement_patterns = ENGAGEMENT_PATTERNS
+        self.social_patterns = SOCIAL_PATTERNS
+        self.usage_patterns = USAGE_PATTERNS
+        self.rating_patterns = RATING_PATTERNS
         
-        # Sentiment keywords
-        self.sentiment_keywords = {
-            'positive': ['great', 'excellent', 'amazing', 'wonderful', 'fantastic', 'love', 'perfect', 'awesome'],
-            'negative': ['bad', 'terrible', 'awful', 'horrible', 'hate', 'worst', 'disappointing', 'poor'],
-            'neutral': ['okay', 'fine', 'decent', 'average', 'good', 'nice', 'alright', 'standard']
-        }
+        self.sentiment_keywords = SENTIMENT_KEYWORDS
     
-    async def extract(self, workflow_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def extract(
+        self,
+        workflow_data: Dict[str, Any],
+        corpus: Optional[WorkflowTextCorpus] = None
+    ) -> Dict[str, Any]:
         """
         Extract community data from workflow.
         
+        Async adapter for BaseExtractor; the work is done by extract_sync().
+        
         Args:
             workflow_data: Combined data from previous layers
+            corpus: Shared text corpus for this workflow (built here if not given)
             
         Returns:
             Dictionary with community data
         """
+        return self.extract_sync(workflow_data, corpus=corpus)
+    
+    def extract_sync(
+        self,
+        workflow_data: Dict[str, Any],
+        corpus: Optional[WorkflowTextCorpus] = None
+    ) -> Dict[str, Any]:
+        """
+        Extract community data synchronously; same result as extract().
+        
+        For thread/process executors and the batch analytics engine.
+        """
         logger.info(f"Starting {self.layer_name} extraction for workflow {workflow_data.get('workflow_id')}")
         
         try:
-            # Initialize community data
-            community_data = CommunityData()
-            
-            # Extract from workflow metadata
-            await self._extract_from_metadata(workflow_data, community_data)
-            
-            # Extract from content
-            await self._extract_from_content(workflow_data, community_data)
-            
-            # Extract from page structure (if available)
-            await self._extract_from_page_structure(workflow_data, community_data)
-            
-            # Calculate community analytics
-            await self._calculate_community_analytics(community_data)
+            community_data = self.analyze(workflow_data, corpus=corpus)
             
             # Convert to dictionary
             result = {
@@ -159,11 +178,47 @@ class CommunityDataExtractor(BaseExtractor):
                 'layer': self.layer_name
             }
     
-    async def _extract_from_metadata(self, workflow_data: Dict[str, Any], community_data: CommunityData):
+    def analyze(
+        self,
+        workflow_data: Dict[str, Any],
+        corpus: Optional[WorkflowTextCorpus] = None
+    ) -> CommunityData:
+        """
+        Synchronous, side-effect-free community core.
+        
+        Reads only workflow_data (through the corpus) and the extractor's
+        constant tables, and raises on malformed input.
+        
+        Args:
+            workflow_data: Combined data from previous layers
+            corpus: Shared text corpus for this workflow (built here if not given)
+            
+        Returns:
+            Populated CommunityData
+        """
+        # Initialize community data
+        community_data = CommunityData()
+        corpus = corpus or WorkflowTextCorpus(workflow_data)
+        
+        # Extract from workflow metadata
+        self._extract_from_metadata(corpus, community_data)
+        
+        # Extract from content
+        self._extract_from_content(corpus, community_data)
+        
+        # Extract from page structure (if available)
+        self._extract_from_page_structure(corpus, community_data)
+        
+        # Calculate community analytics
+        self._calculate_community_analytics(community_data)
+        
+        return community_data
+    
+    def _extract_from_metadata(self, corpus: WorkflowTextCorpus, community_data: CommunityData):
         """Extract community data from workflow metadata."""
         
         # Get metadata from layer 1
-        layer1_data = workflow_data.get('layers', {}).get('layer1', {}).get('data', {})
+        layer1_data = corpus.layer1
         
         # Extract views, upvotes, shares (already available)
         views = layer1_data.get('views', 0)
@@ -179,47 +234,37 @@ class CommunityDataExtractor(BaseExtractor):
         raw_metadata = layer1_data
         
         # Look for engagement metrics in metadata
-        await self._extract_engagement_metrics(raw_metadata, community_data)
+        self._extract_engagement_metrics(raw_metadata, community_data)
         
         # Look for social metrics in metadata
-        await self._extract_social_metrics(raw_metadata, community_data)
+        self._extract_social_metrics(raw_metadata, community_data)
         
         # Look for rating information
-        await self._extract_rating_info(raw_metadata, community_data)
+        self._extract_rating_info(raw_metadata, community_data)
     
-    async def _extract_from_content(self, workflow_data: Dict[str, Any], community_data: CommunityData):
+    def _extract_from_content(self, corpus: WorkflowTextCorpus, community_data: CommunityData):
         """Extract community data from workflow content."""
         
-        # Get content from layer 3
-        layer3_data = workflow_data.get('layers', {}).get('layer3', {}).get('data', {})
-        
-        explainer_text = layer3_data.get('explainer_text', '')
-        setup_instructions = layer3_data.get('setup_instructions', '')
-        use_instructions = layer3_data.get('use_instructions', '')
-        
-        # Combine all text for analysis
-        full_text = f"{explainer_text} {setup_instructions} {use_instructions}".lower()
-        
         # Extract engagement metrics from text
-        await self._extract_engagement_from_text(full_text, community_data)
+        self._extract_engagement_from_text(corpus, community_data)
         
         # Extract social metrics from text
-        await self._extract_social_from_text(full_text, community_data)
+        self._extract_social_from_text(corpus, community_data)
         
         # Extract usage metrics from text
-        await self._extract_usage_from_text(full_text, community_data)
+        self._extract_usage_from_text(corpus, community_data)
         
         # Analyze sentiment
-        await self._analyze_sentiment(full_text, community_data)
+        self._analyze_sentiment(corpus, community_data)
     
-    async def _extract_from_page_structure(self, workflow_data: Dict[str, Any], community_data: CommunityData):
+    def _extract_from_page_structure(self, corpus: WorkflowTextCorpus, community_data: CommunityData):
         """Extract community data from page structure (if available)."""
         
         # This would typically involve analyzing the HTML structure
         # For now, we'll use heuristics based on available data
         
         # Get layer 1 data for additional metrics
-        layer1_data = workflow_data.get('layers', {}).get('layer1', {}).get('data', {})
+        layer1_data = corpus.layer1
         
         # Estimate community engagement based on available metrics
         views = layer1_data.get('views', 0) or 0
@@ -258,7 +303,7 @@ class CommunityDataExtractor(BaseExtractor):
             # Estimate remixes based on shares (typical ratio: 1 remix per 10 shares)
             community_data.remixes_count = max(0, shares // 10)
     
-    async def _calculate_community_analytics(self, community_data: CommunityData):
+    def _calculate_community_analytics(self, community_data: CommunityData):
         """Calculate community analytics scores."""
         
         # Calculate engagement score (0-100)
@@ -314,7 +359,7 @@ class CommunityDataExtractor(BaseExtractor):
             # Estimate based on engagement
             community_data.community_satisfaction_score = min(engagement * 1.5, 100)
     
-    async def _extract_engagement_metrics(self, raw_metadata: Dict[str, Any], community_data: CommunityData):
+    def _extract_engagement_metrics(self, raw_metadata: Dict[str, Any], community_data: CommunityData):
         """Extract engagement metrics from raw metadata."""
         
         # Look for engagement data in metadata
@@ -322,7 +367,7 @@ class CommunityDataExtractor(BaseExtractor):
         
         for metric, patterns in self.engagement_patterns.items():
             for pattern in patterns:
-                matches = re.findall(pattern, metadata_text, re.IGNORECASE)
+                matches = pattern.findall(metadata_text)
                 if matches:
                     try:
                         value = int(matches[0])
@@ -331,7 +376,7 @@ class CommunityDataExtractor(BaseExtractor):
                     except (ValueError, IndexError):
                         continue
     
-    async def _extract_social_metrics(self, raw_metadata: Dict[str, Any], community_data: CommunityData):
+    def _extract_social_metrics(self, raw_metadata: Dict[str, Any], community_data: CommunityData):
         """Extract social metrics from raw metadata."""
         
         # Look for social data in metadata
@@ -339,7 +384,7 @@ class CommunityDataExtractor(BaseExtractor):
         
         for metric, patterns in self.social_patterns.items():
             for pattern in patterns:
-                matches = re.findall(pattern, metadata_text, re.IGNORECASE)
+                matches = pattern.findall(metadata_text)
                 if matches:
                     try:
                         value = int(matches[0])
@@ -348,14 +393,14 @@ class CommunityDataExtractor(BaseExtractor):
                     except (ValueError, IndexError):
                         continue
     
-    async def _extract_rating_info(self, raw_metadata: Dict[str, Any], community_data: CommunityData):
+    def _extract_rating_info(self, raw_metadata: Dict[str, Any], community_data: CommunityData):
         """Extract rating information from raw metadata."""
         
         # Look for rating data in metadata
         metadata_text = str(raw_metadata).lower()
         
         for pattern in self.rating_patterns:
-            matches = re.findall(pattern, metadata_text, re.IGNORECASE)
+            matches = pattern.findall(metadata_text)
             if matches:
                 try:
                     if len(matches[0]) == 2:  # rating/total format
@@ -370,12 +415,14 @@ class CommunityDataExtractor(BaseExtractor):
                 except (ValueError, IndexError):
                     continue
     
-    async def _extract_engagement_from_text(self, text: str, community_data: CommunityData):
+    def _extract_engagement_from_text(self, corpus: WorkflowTextCorpus, community_data: CommunityData):
         """Extract engagement metrics from text content."""
         
+        text = corpus.content
+        
         for metric, patterns in self.engagement_patterns.items():
             for pattern in patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
+                matches = corpus.findall(pattern, text)
                 if matches:
                     try:
                         value = int(matches[0])
@@ -385,12 +432,14 @@ class CommunityDataExtractor(BaseExtractor):
                     except (ValueError, IndexError):
                         continue
     
-    async def _extract_social_from_text(self, text: str, community_data: CommunityData):
+    def _extract_social_from_text(self, corpus: WorkflowTextCorpus, community_data: CommunityData):
         """Extract social metrics from text content."""
         
+        text = corpus.content
+        
         for metric, patterns in self.social_patterns.items():
             for pattern in patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
+                matches = corpus.findall(pattern, text)
                 if matches:
                     try:
                         value = int(matches[0])
@@ -400,12 +449,14 @@ class CommunityDataExtractor(BaseExtractor):
                     except (ValueError, IndexError):
                         continue
     
-    async def _extract_usage_from_text(self, text: str, community_data: CommunityData):
+    def _extract_usage_from_text(self, corpus: WorkflowTextCorpus, community_data: CommunityData):
         """Extract usage metrics from text content."""
         
+        text = corpus.content
+        
         for metric, patterns in self.usage_patterns.items():
             for pattern in patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
+                matches = corpus.findall(pattern, text)
                 if matches:
                     try:
                         value = int(matches[0])
@@ -415,12 +466,15 @@ class CommunityDataExtractor(BaseExtractor):
                     except (ValueError, IndexError):
                         continue
     
-    async def _analyze_sentiment(self, text: str, community_data: CommunityData):
+    def _analyze_sentiment(self, corpus: WorkflowTextCorpus, community_data: CommunityData):
         """Analyze sentiment from text content."""
         
-        positive_count = sum(1 for keyword in self.sentiment_keywords['positive'] if keyword in text)
-        negative_count = sum(1 for keyword in self.sentiment_keywords['negative'] if keyword in text)
-        neutral_count = sum(1 for keyword in self.sentiment_keywords['neutral'] if keyword in text)
+        text = corpus.content
+        
+        scan = corpus.scan(text)
+        positive_count = scan.hits('layer5.sentiment.positive')
+        negative_count = scan.hits('layer5.sentiment.negative')
+        neutral_count = scan.hits('layer5.sentiment.neutral')
         
         total_sentiment_words = positive_count + negative_count + neutral_count
         
@@ -12,7 +12,6 @@ Date: October 12, 2025
 
 import asyncio
 import re
-import json
 from typing import Dict, Any, List, Optional, Set
 from dataclasses import dataclass
 from datetime import datetime
@@ -20,6 +19,131 @@ from datetime import datetime
 from loguru import logger
 
 from src.scrapers.base import BaseExtractor
+from src.scrapers.keyword_matcher import register_keywords
+from src.scrapers.regex_registry import register_pattern_groups, register_pattern_list
+from src.scrapers.text_corpus import WorkflowTextCorpus
+from src.scrapers.workflow_index import WorkflowIndex
+
+
+# Documentation levels
+DOCUMENTATION_LEVELS = {
+    'high': ['tutorial', 'guide', 'documentation', 'example', 'demo'],
+    'medium': ['instruction', 'setup', 'config', 'help'],
+    'low': ['basic', 'simple', 'quick']
+}
+
+# Capability levels
+CAPABILITY_LEVELS = {
+    'high': ['advanced', 'complex', 'sophisticated', 'enterprise'],
+    'medium': ['intermediate', 'moderate', 'standard'],
+    'low': ['basic', 'simple', 'beginner', 'easy']
+}
+
+# Configuration / integration / extension indicators
+LEVEL_INDICATORS = {
+    'configuration_high': ['config', 'setting', 'parameter'],
+    'configuration_medium': ['setup', 'install'],
+    'integration_high': ['integration', 'api', 'webhook'],
+    'integration_medium': ['connect', 'link'],
+    'extension_high': ['extend', 'plugin', 'addon'],
+    'extension_medium': ['customize', 'modify']
+}
+
+LEVEL_POINTS = {'high': 3, 'medium': 2, 'low': 1}
+
+register_keywords('layer6.documentation', DOCUMENTATION_LEVELS)
+register_keywords('layer6.capability', CAPABILITY_LEVELS)
+register_keywords('layer6', LEVEL_INDICATORS)
+
+# API patterns
+API_PATTERNS = register_pattern_groups('layer6.api', {
+    'endpoints': [
+        r'https?://[^\s<>"\']+',
+        r'api/[^\s<>"\']+',
+        r'endpoint[s]?[:\s]*([^\s\n]+)',
+        r'url[s]?[:\s]*([^\s\n]+)'
+    ],
+    'authentication': [
+        r'auth[^\s]*[:\s]*([^\s\n]+)',
+        r'bearer[^\s]*',
+        r'api[^\s]*key[^\s]*',
+        r'oauth[^\s]*',
+        r'token[^\s]*'
+    ],
+    'rate_limits': [
+        r'rate[^\s]*limit[^\s]*[:\s]*(\d+)',
+        r'(\d+)\s*request[s]?\s*per\s*(?:hour|minute|second)',
+        r'throttle[^\s]*[:\s]*(\d+)'
+    ]
+}, re.IGNORECASE)
+
+# Security patterns
+SECURITY_PATTERNS = register_pattern_groups('layer6.security', {
+    'credentials': [
+        r'credential[s]?[^\s]*',
+        r'password[s]?[^\s]*',
+        r'secret[s]?[^\s]*',
+        r'key[s]?[^\s]*',
+        r'token[s]?[^\s]*'
+    ],
+    'security': [
+        r'security[^\s]*',
+        r'encrypt[^\s]*',
+        r'secure[^\s]*',
+        r'protect[^\s]*',
+        r'privacy[^\s]*'
+    ]
+}, re.IGNORECASE)
+
+# Performance patterns
+PERFORMANCE_PATTERNS = register_pattern_groups('layer6.performance', {
+    'execution_time': [
+        r'execution[^\s]*time[:\s]*(\d+(?:\.\d+)?)\s*(?:seconds?|minutes?|hours?)',
+        r'runtime[:\s]*(\d+(?:\.\d+)?)\s*(?:seconds?|minutes?|hours?)',
+        r'(\d+(?:\.\d+)?)\s*seconds?[^\s]*execution'
+    ],
+    'memory': [
+        r'memory[^\s]*[:\s]*(\d+(?:\.\d+)?)\s*(?:mb|gb|kb)',
+        r'ram[^\s]*[:\s]*(\d+(?:\.\d+)?)\s*(?:mb|gb|kb)'
+    ],
+    'cpu': [
+        r'cpu[^\s]*[:\s]*(\d+(?:\.\d+)?)\s*%',
+        r'processor[^\s]*[:\s]*(\d+(?:\.\d+)?)\s*%'
+    ]
+}, re.IGNORECASE)
+
+# Error handling patterns
+ERROR_HANDLING_PATTERNS = register_pattern_list('layer6.error_handling', [
+    r'error[^\s]*handling',
+    r'retry[^\s]*mechanism',
+    r'fallback[^\s]*strateg',
+    r'catch[^\s]*error',
+    r'handle[^\s]*exception'
+], re.IGNORECASE)
+
+# Workflow structure patterns
+STRUCTURE_PATTERNS = register_pattern_groups('layer6.structure', {
+    'triggers': [r'trigger[s]?[^\s]*', r'start[s]?[^\s]*', r'initiate[s]?[^\s]*'],
+    'conditions': [r'condition[s]?[^\s]*', r'if[^\s]*', r'when[^\s]*'],
+    'actions': [r'action[s]?[^\s]*', r'do[^\s]*', r'execute[s]?[^\s]*'],
+    'branches': [r'branch[s]?[^\s]*', r'split[s]?[^\s]*', r'fork[s]?[^\s]*'],
+    'loops': [r'loop[s]?[^\s]*', r'repeat[s]?[^\s]*', r'iterate[s]?[^\s]*'],
+    'parallelism': [r'parallel[^\s]*', r'concurrent[^\s]*', r'simultaneous[^\s]*']
+}, re.IGNORECASE)
+
+# Example and template mentions (counted per pattern)
+EXAMPLE_PATTERNS = register_pattern_list('layer6.examples', [
+    r'example[s]?[^\s]*',
+    r'demo[s]?[^\s]*',
+    r'sample[s]?[^\s]*',
+    r'test[s]?[^\s]*'
+], re.IGNORECASE)
+
+TEMPLATE_PATTERNS = register_pattern_list('layer6.templates', [
+    r'template[s]?[^\s]*',
+    r'boilerplate[^\s]*',
+    r'starter[^\s]*'
+], re.IGNORECASE)
 
 
 @dataclass
@@ -58,6 +182,7 @@ class TechnicalDetailsData:
     workflow_branches: Optional[List[str]] = None
     workflow_loops: Optional[List[str]] = None
     workflow_parallelism: Optional[List[str]] = None
+    workflow_graph: Optional[Dict[str, Any]] = None
     
     # Workflow Management
     workflow_error_handling: Optional[List[str]] = None
@@ -101,123 +226,48 @@ class TechnicalDetailsExtractor(BaseExtractor):
     def __init__(self):
         super().__init__("Layer 6 - Technical Details")
         
-        # API patterns
-        self.api_patterns = {
-            'endpoints': [
-                r'https?://[^\s<>"\']+',
-                r'api/[^\s<>"\']+',
-                r'endpoint[s]?[:\s]*([^\s\n]+)',
-                r'url[s]?[:\s]*([^\s\n]+)'
-            ],
-            'authentication': [
-                r'auth[^\s]*[:\s]*([^\s\n]+)',
-                r'bearer[^\s]*',
-                r'api[^\s]*key[^\s]*',
-                r'oauth[^\s]*',
-                r'token[^\s]*'
-            ],
-            'rate_limits': [
-                r'rate[^\s]*limit[^\s]*[:\s]*(\d+)',
-                r'(\d+)\s*request[s]?\s*per\s*(?:hour|minute|second)',
-                r'throttle[^\s]*[:\s]*(\d+)'
-            ]
-        }
-        
-        # Security patterns
-        self.security_patterns = {
-            'credentials': [
-                r'credential[s]?[^\s]*',
-                r'password[s]?[^\s]*',
-                r'secret[s]?[^\s]*',
-                r'key[s]?[^\s]*',
-                r'token[s]?[^\s]*'
-            ],
-            'security': [
-                r'security[^\s]*',
-                r'encrypt[^\s]*',
-                r'secure[^\s]*',
-                r'protect[^\s]*',
-                r'privacy[^\s]*'
-            ]
-        }
-        
-        # Performance patterns
-        self.performance_patterns = {
-            'execution_time': [
-                r'execution[^\s]*time[:\s]*(\d+(?:\.\d+)?)\s*(?:seconds?|minutes?|hours?)',
-                r'runtime[:\s]*(\d+(?:\.\d+)?)\s*(?:seconds?|minutes?|hours?)',
-                r'(\d+(?:\.\d+)?)\s*seconds?[^\s]*execution'
-            ],
-            'memory': [
-                r'memory[^\s]*[:\s]*(\d+(?:\.\d+)?)\s*(?:mb|gb|kb)',
-                r'ram[^\s]*[:\s]*(\d+(?:\.\d+)?)\s*(?:mb|gb|kb)'
-            ],
-            'cpu': [
-                r'cpu[^\s]*[:\s]*(\d+(?:\.\d+)?)\s*%',
-                r'processor[^\s]*[:\s]*(\d+(?:\.\d+)?)\s*%'
-            ]
-        }
-        
-        # Error handling patterns
-        self.error_patterns = [
-            r'error[^\s]*handling',
-            r'retry[^\s]*mechanism',
-            r'fallback[^\s]*strateg',
-            r'catch[^\s]*error',
-            r'handle[^\s]*exception'
-        ]
-        
-        # Workflow structure patterns
-        self.structure_patterns = {
-            'triggers': [r'trigger[s]?[^\s]*', r'start[s]?[^\s]*', r'initiate[s]?[^\s]*'],
-            'conditions': [r'condition[s]?[^\s]*', r'if[^\s]*', r'when[^\s]*'],
-            'actions': [r'action[s]?[^\s]*', r'do[^\s]*', r'execute[s]?[^\s]*'],
-            'branches': [r'branch[s]?[^\s]*', r'split[s]?[^\s]*', r'fork[s]?[^\s]*'],
-            'loops': [r'loop[s]?[^\s]*', r'repeat[s]?[^\s]*', r'iterate[s]?[^\s]*'],
-            'parallelism': [r'parallel[^\s]*', r'concurrent[^\s]*', r'simultaneous[^\s]*']
-        }
-        
-        # Documentation levels
-        self.documentation_levels = {
-            'high': ['tutorial', 'guide', 'documentation', 'example', 'demo'],
-            'medium': ['instruction', 'setup', 'config', 'help'],
-            'low': ['basic', 'simple', 'quick']
-        }
-        
-        # Capability levels
-        self.capability_levels = {
-            'high': ['advanced', 'complex', 'sophisticated', 'enterprise'],
-            'medium': ['intermediate', 'moderate', 'standard'],
-            'low': ['basic', 'simple', 'beginner', 'easy']
-        }
+        self.api_patterns = API_PATTERNS
+        self.security_patterns = SECURITY_PATTERNS
+        self.performance_patterns = PERFORMANCE_PATTERNS
+        self.error_patterns = ERROR_HANDLING_PATTERNS
+        self.structure_patterns = STRUCTURE_PATTERNS
+        
+        self.documentation_levels = DOCUMENTATION_LEVELS
+        self.capability_levels = CAPABILITY_LEVELS
     
-    async def extract(self, workflow_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def extract(
+        self,
+        workflow_data: Dict[str, Any],
+        corpus: Optional[WorkflowTextCorpus] = None
+    ) -> Dict[str, Any]:
         """
         Extract technical details from workflow.
         
+        Async adapter for BaseExtractor; the work is done by extract_sync().
+        
         Args:
             workflow_data: Combined data from previous layers
+            corpus: Shared text corpus for this workflow (built here if not given)
             
         Returns:
             Dictionary with technical details data
         """
+        return self.extract_sync(workflow_data, corpus=corpus)
+    
+    def extract_sync(
+        self,
+        workflow_data: Dict[str, Any],
+        corpus: Optional[WorkflowTextCorpus] = None
+    ) -> Dict[str, Any]:
+        """
+        Extract technical details data synchronously; same result as extract().
+        
+        For thread/process executors and the batch analytics engine.
+        """
         logger.info(f"Starting {self.layer_name} extraction for workflow {workflow_data.get('workflow_id')}")
         
         try:
-            # Initialize technical details data
-            tech_data = TechnicalDetailsData()
-            
-            # Extract from workflow structure
-            await self._extract_from_structure(workflow_data, tech_data)
-            
-            # Extract from content
-            await self._extract_from_content(workflow_data, tech_data)
-            
-            # Extract from metadata
-            await self._extract_from_metadata(workflow_data, tech_data)
-            
-            # Analyze technical complexity
-            await self._analyze_technical_complexity(workflow_data, tech_data)
+            tech_data = self.analyze(workflow_data, corpus=corpus)
             
             # Convert to dictionary
             result = {
@@ -239,11 +289,47 @@ class TechnicalDetailsExtractor(BaseExtractor):
                 'layer': self.layer_name
             }
     
-    async def _extract_from_structure(self, workflow_data: Dict[str, Any], tech_data: TechnicalDetailsData):
+    def analyze(
+        self,
+        workflow_data: Dict[str, Any],
+        corpus: Optional[WorkflowTextCorpus] = None
+    ) -> TechnicalDetailsData:
+        """
+        Synchronous, side-effect-free technical details core.
+        
+        Reads only workflow_data (through the corpus) and the extractor's
+        constant tables, and raises on malformed input.
+        
+        Args:
+            workflow_data: Combined data from previous layers
+            corpus: Shared text corpus for this workflow (built here if not given)
+            
+        Returns:
+            Populated TechnicalDetailsData
+        """
+        # Initialize technical details data
+        tech_data = TechnicalDetailsData()
+        corpus = corpus or WorkflowTextCorpus(workflow_data)
+        
+        # Extract from workflow structure
+        self._extract_from_structure(corpus, tech_data)
+        
+        # Extract from content
+        self._extract_from_content(corpus, tech_data)
+        
+        # Extract from metadata
+        self._extract_from_metadata(corpus, tech_data)
+        
+        # Analyze technical complexity
+        self._analyze_technical_complexity(corpus, tech_data)
+        
+        return tech_data
+    
+    def _extract_from_structure(self, corpus: WorkflowTextCorpus, tech_data: TechnicalDetailsData):
         """Extract technical details from workflow structure."""
         
         # Get structure from layer 2
-        layer2_data = workflow_data.get('layers', {}).get('layer2', {}).get('data', {})
+        layer2_data = corpus.layer2
         
         # Extract node types and workflow JSON
         node_types = layer2_data.get('node_types', [])
@@ -251,69 +337,55 @@ class TechnicalDetailsExtractor(BaseExtractor):
         
         if workflow_json:
             # Analyze workflow JSON for technical details
-            await self._analyze_workflow_json(workflow_json, tech_data)
+            self._analyze_workflow_json(workflow_json, tech_data)
         
         # Extract workflow structure patterns
-        await self._extract_workflow_structure(node_types, tech_data)
+        self._extract_workflow_structure(node_types, tech_data)
         
         # Extract API information from node types
-        await self._extract_api_info(node_types, tech_data)
+        self._extract_api_info(node_types, tech_data)
         
         # Extract security requirements from node types
-        await self._extract_security_requirements(node_types, tech_data)
+        self._extract_security_requirements(node_types, tech_data)
+        
+        # Analyze the connection graph (depth, loops, parallel branches)
+        graph = corpus.graph_metrics
+        if graph:
+            tech_data.workflow_graph = dict(graph)
+            tech_data.workflow_parallelism = graph['branch_nodes'] or None
     
-    async def _extract_from_content(self, workflow_data: Dict[str, Any], tech_data: TechnicalDetailsData):
+    def _extract_from_content(self, corpus: WorkflowTextCorpus, tech_data: TechnicalDetailsData):
         """Extract technical details from workflow content."""
         
-        # Get content from layer 3
-        layer3_data = workflow_data.get('layers', {}).get('layer3', {}).get('data', {})
-        
-        explainer_text = layer3_data.get('explainer_text', '')
-        setup_instructions = layer3_data.get('setup_instructions', '')
-        use_instructions = layer3_data.get('use_instructions', '')
-        
-        # Combine all text for analysis
-        full_text = f"{explainer_text} {setup_instructions} {use_instructions}".lower()
-        
         # Extract API information from text
-        await self._extract_api_from_text(full_text, tech_data)
+        self._extract_api_from_text(corpus, tech_data)
         
         # Extract performance metrics from text
-        await self._extract_performance_from_text(full_text, tech_data)
+        self._extract_performance_from_text(corpus, tech_data)
         
         # Extract error handling patterns from text
-        await self._extract_error_handling_from_text(full_text, tech_data)
+        self._extract_error_handling_from_text(corpus, tech_data)
         
         # Extract workflow structure from text
-        await self._extract_structure_from_text(full_text, tech_data)
+        self._extract_structure_from_text(corpus, tech_data)
         
         # Analyze documentation level
-        await self._analyze_documentation_level(full_text, tech_data)
+        self._analyze_documentation_level(corpus, tech_data)
         
         # Count examples and templates
-        await self._count_examples_and_templates(full_text, tech_data)
+        self._count_examples_and_templates(corpus, tech_data)
     
-    async def _extract_from_metadata(self, workflow_data: Dict[str, Any], tech_data: TechnicalDetailsData):
+    def _extract_from_metadata(self, corpus: WorkflowTextCorpus, tech_data: TechnicalDetailsData):
         """Extract technical details from workflow metadata."""
         
-        # Get metadata from layer 1
-        layer1_data = workflow_data.get('layers', {}).get('layer1', {}).get('data', {})
-        
-        # Extract technical complexity indicators
-        title = layer1_data.get('title', '').lower()
-        description = layer1_data.get('description', '').lower()
-        use_case = layer1_data.get('use_case', '').lower()
-        
-        full_text = f"{title} {description} {use_case}"
-        
-        # Analyze capability levels
-        await self._analyze_capability_levels(full_text, tech_data)
+        # Analyze capability levels from title, description and use case
+        self._analyze_capability_levels(corpus, tech_data)
     
-    async def _analyze_technical_complexity(self, workflow_data: Dict[str, Any], tech_data: TechnicalDetailsData):
+    def _analyze_technical_complexity(self, corpus: WorkflowTextCorpus, tech_data: TechnicalDetailsData):
         """Analyze overall technical complexity."""
         
         # Get structure data
-        layer2_data = workflow_data.get('layers', {}).get('layer2', {}).get('data', {})
+        layer2_data = corpus.layer2
         node_count = layer2_data.get('node_count', 0)
         connection_count = layer2_data.get('connection_count', 0)
         
@@ -364,48 +436,17 @@ class TechnicalDetailsExtractor(BaseExtractor):
         else:
             tech_data.workflow_intelligence_level = "low"
     
-    async def _analyze_workflow_json(self, workflow_json: Any, tech_data: TechnicalDetailsData):
+    def _analyze_workflow_json(self, workflow_json: Any, tech_data: TechnicalDetailsData):
         """Analyze workflow JSON for technical details."""
         
         try:
-            if isinstance(workflow_json, str):
-                workflow_data = json.loads(workflow_json)
-            else:
-                workflow_data = workflow_json
-            
-            # Extract nodes
-            nodes = workflow_data.get('nodes', [])
+            # One pass over the nodes (parameters are stringified once per node)
+            index = WorkflowIndex.from_json(workflow_json)
             
-            # Analyze each node for technical details
-            api_endpoints = []
-            credential_types = set()
-            security_requirements = set()
-            
-            for node in nodes:
-                node_type = node.get('type', '')
-                node_data = node.get('parameters', {})
-                
-                # Extract API endpoints
-                if 'url' in node_data:
-                    api_endpoints.append({
-                        'url': node_data['url'],
-                        'method': node_data.get('method', 'GET'),
-                        'node_type': node_type
-                    })
-                
-                # Extract credential types
-                if 'authentication' in node_data:
-                    credential_types.add(node_data['authentication'])
-                
-                # Extract security requirements
-                if 'security' in node_data or 'ssl' in node_data:
-                    security_requirements.add('ssl_required')
-                
-                if 'oauth' in str(node_data).lower():
-                    security_requirements.add('oauth_required')
-                
-                if 'api_key' in str(node_data).lower():
-                    security_requirements.add('api_key_required')
+            # Extract API endpoints, credential types and security requirements
+            api_endpoints = list(index.url_parameters)
+            credential_types = set(index.authentication_types)
+            security_requirements = index.security_markers()
             
             tech_data.api_endpoints = api_endpoints if api_endpoints else None
             tech_data.credential_types = list(credential_types) if credential_types else None
@@ -414,7 +455,7 @@ class TechnicalDetailsExtractor(BaseExtractor):
         except Exception as e:
             logger.warning(f"Error analyzing workflow JSON: {e}")
     
-    async def _extract_workflow_structure(self, node_types: List[str], tech_data: TechnicalDetailsData):
+    def _extract_workflow_structure(self, node_types: List[str], tech_data: TechnicalDetailsData):
         """Extract workflow structure from node types."""
         
         # Categorize nodes by function
@@ -444,7 +485,7 @@ class TechnicalDetailsExtractor(BaseExtractor):
         tech_data.workflow_branches = branches if branches else None
         tech_data.workflow_loops = loops if loops else None
     
-    async def _extract_api_info(self, node_types: List[str], tech_data: TechnicalDetailsData):
+    def _extract_api_info(self, node_types: List[str], tech_data: TechnicalDetailsData):
         """Extract API information from node types."""
         
         api_authentication_types = set()
@@ -466,7 +507,7 @@ class TechnicalDetailsExtractor(BaseExtractor):
         
         tech_data.api_authentication_types = list(api_authentication_types) if api_authentication_types else None
     
-    async def _extract_security_requirements(self, node_types: List[str], tech_data: TechnicalDetailsData):
+    def _extract_security_requirements(self, node_types: List[str], tech_data: TechnicalDetailsData):
         """Extract security requirements from node types."""
         
         security_requirements = set()
@@ -492,12 +533,14 @@ class TechnicalDetailsExtractor(BaseExtractor):
         tech_data.security_requirements = list(security_requirements) if security_requirements else None
         tech_data.credential_requirements = list(credential_requirements) if credential_requirements else None
     
-    async def _extract_api_from_text(self, text: str, tech_data: TechnicalDetailsData):
+    def _extract_api_from_text(self, corpus: WorkflowTextCorpus, tech_data: TechnicalDetailsData):
         """Extract API information from text."""
         
+        text = corpus.content
+        
         # Extract API endpoints
         for pattern in self.api_patterns['endpoints']:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = corpus.findall(pattern, text)
             if matches:
                 if not tech_data.api_endpoints:
                     tech_data.api_endpoints = []
@@ -511,7 +554,7 @@ class TechnicalDetailsExtractor(BaseExtractor):
         # Extract authentication types
         auth_types = set()
         for pattern in self.api_patterns['authentication']:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = corpus.findall(pattern, text)
             for match in matches:
                 auth_types.add(match.lower())
         
@@ -521,7 +564,7 @@ class TechnicalDetailsExtractor(BaseExtractor):
         # Extract rate limits
         rate_limits = {}
         for pattern in self.api_patterns['rate_limits']:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = corpus.findall(pattern, text)
             if matches:
                 rate_limits['requests_per_minute'] = int(matches[0])
                 break
@@ -529,12 +572,14 @@ class TechnicalDetailsExtractor(BaseExtractor):
         if rate_limits:
             tech_data.api_rate_limits = rate_limits
     
-    async def _extract_performance_from_text(self, text: str, tech_data: TechnicalDetailsData):
+    def _extract_performance_from_text(self, corpus: WorkflowTextCorpus, tech_data: TechnicalDetailsData):
         """Extract performance metrics from text."""
         
+        text = corpus.content
+        
         # Extract execution time
         for pattern in self.performance_patterns['execution_time']:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = corpus.findall(pattern, text)
             if matches:
                 try:
                     time_value = float(matches[0])
@@ -550,7 +595,7 @@ class TechnicalDetailsExtractor(BaseExtractor):
         
         # Extract memory usage
         for pattern in self.performance_patterns['memory']:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = corpus.findall(pattern, text)
             if matches:
                 try:
                     memory_value = float(matches[0])
@@ -566,7 +611,7 @@ class TechnicalDetailsExtractor(BaseExtractor):
         
         # Extract CPU usage
         for pattern in self.performance_patterns['cpu']:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = corpus.findall(pattern, text)
             if matches:
                 try:
                     tech_data.cpu_usage = float(matches[0])
@@ -574,16 +619,18 @@ class TechnicalDetailsExtractor(BaseExtractor):
                 except ValueError:
                     continue
     
-    async def _extract_error_handling_from_text(self, text: str, tech_data: TechnicalDetailsData):
+    def _extract_error_handling_from_text(self, corpus: WorkflowTextCorpus, tech_data: TechnicalDetailsData):
         """Extract error handling patterns from text."""
         
+        text = corpus.content
+        
         error_patterns = []
         retry_mechanisms = []
         fallback_strategies = []
         
         for pattern in self.error_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                error_patterns.append(pattern)
+            if corpus.search(pattern, text):
+                error_patterns.append(pattern.pattern)
         
         # Look for retry mechanisms
         if 'retry' in text.lower():
@@ -597,33 +644,31 @@ class TechnicalDetailsExtractor(BaseExtractor):
         tech_data.retry_mechanisms = retry_mechanisms if retry_mechanisms else None
         tech_data.fallback_strategies = fallback_strategies if fallback_strategies else None
     
-    async def _extract_structure_from_text(self, text: str, tech_data: TechnicalDetailsData):
+    def _extract_structure_from_text(self, corpus: WorkflowTextCorpus, tech_data: TechnicalDetailsData):
         """Extract workflow structure from text."""
         
+        text = corpus.content
+        
         for structure_type, patterns in self.structure_patterns.items():
             found_patterns = []
             for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    found_patterns.append(pattern)
+                if corpus.search(pattern, text):
+                    found_patterns.append(pattern.pattern)
             
             if found_patterns:
                 attr_name = f"workflow_{structure_type}"
                 setattr(tech_data, attr_name, found_patterns)
     
-    async def _analyze_documentation_level(self, text: str, tech_data: TechnicalDetailsData):
+    def _analyze_documentation_level(self, corpus: WorkflowTextCorpus, tech_data: TechnicalDetailsData):
         """Analyze documentation level from text."""
         
-        doc_score = 0
+        text = corpus.content
         
-        for level, keywords in self.documentation_levels.items():
-            for keyword in keywords:
-                if keyword in text:
-                    if level == 'high':
-                        doc_score += 3
-                    elif level == 'medium':
-                        doc_score += 2
-                    else:
-                        doc_score += 1
+        scan = corpus.scan(text)
+        doc_score = sum(
+            LEVEL_POINTS[level] * scan.hits(f'layer6.documentation.{level}')
+            for level in self.documentation_levels
+        )
         
         if doc_score >= 6:
             tech_data.workflow_documentation_level = "high"
@@ -632,52 +677,39 @@ class TechnicalDetailsExtractor(BaseExtractor):
         else:
             tech_data.workflow_documentation_level = "low"
     
-    async def _count_examples_and_templates(self, text: str, tech_data: TechnicalDetailsData):
+    def _count_examples_and_templates(self, corpus: WorkflowTextCorpus, tech_data: TechnicalDetailsData):
         """Count examples and templates in text."""
         
-        # Count examples
-        example_patterns = [
-            r'example[s]?[^\s]*',
-            r'demo[s]?[^\s]*',
-            r'sample[s]?[^\s]*',
-            r'test[s]?[^\s]*'
-        ]
+        text = corpus.content
         
+        # Count examples
         example_count = 0
-        for pattern in example_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in EXAMPLE_PATTERNS:
+            matches = corpus.findall(pattern, text)
             example_count += len(matches)
         
         tech_data.workflow_example_count = example_count
         
         # Count templates
-        template_patterns = [
-            r'template[s]?[^\s]*',
-            r'boilerplate[^\s]*',
-            r'starter[^\s]*'
-        ]
-        
         template_count = 0
-        for pattern in template_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in TEMPLATE_PATTERNS:
+            matches = corpus.findall(pattern, text)
             template_count += len(matches)
         
         tech_data.workflow_template_count = template_count
     
-    async def _analyze_capability_levels(self, text: str, tech_data: TechnicalDetailsData):
+    def _analyze_capability_levels(self, corpus: WorkflowTextCorpus, tech_data: TechnicalDetailsData):
         """Analyze capability levels from text."""
         
+        text = corpus.metadata
+        
+        scan = corpus.scan(text)
+        
         # Analyze customization level
-        customization_score = 0
-        for level, keywords in self.capability_levels.items():
-            for keyword in keywords:
-                if keyword in text:
-                    if level == 'high':
-                        customization_score += 3
-                    elif level == 'medium':
-                        customization_score += 2
-                    else:
-                        customization_score += 1
+        customization_score = sum(
+            LEVEL_POINTS[level] * scan.hits(f'layer6.capability.{level}')
+            for level in self.capability_levels
+        )
         
         if customization_score >= 6:
             tech_data.workflow_customization_level = "high"
@@ -686,26 +718,12 @@ class TechnicalDetailsExtractor(BaseExtractor):
         else:
             tech_data.workflow_customization_level = "low"
         
-        # Analyze configuration level
-        if 'config' in text or 'setting' in text or 'parameter' in text:
-            tech_data.workflow_configuration_level = "high"
-        elif 'setup' in text or 'install' in text:
-            tech_data.workflow_configuration_level = "medium"
-        else:
-            tech_data.workflow_configuration_level = "low"
-        
-        # Analyze integration level
-        if 'integration' in text or 'api' in text or 'webhook' in text:
-            tech_data.workflow_integration_level = "high"
-        elif 'connect' in text or 'link' in text:
-            tech_data.workflow_integration_level = "medium"
-        else:
-            tech_data.workflow_integration_level = "low"
-        
-        # Analyze extension level
-        if 'extend' in text or 'plugin' in text or 'addon' in text:
-            tech_data.workflow_extension_level = "high"
-        elif 'customize' in text or 'modify' in text:
-            tech_data.workflow_extension_level = "medium"
-        else:
-            tech_data.workflow_extension_level = "low"
+        # Analyze configuration, integration and extension levels
+        for aspect in ('configuration', 'integration', 'extension'):
+            if scan.hits(f'layer6.{aspect}_high'):
+                level = "high"
+            elif scan.hits(f'layer6.{aspect}_medium'):
+                level = "medium"
+            else:
+                level = "low"
+            setattr(tech_data, f"workflow_{aspect}_level", level)
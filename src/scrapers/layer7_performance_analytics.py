@@ -20,6 +20,190 @@ from datetime import datetime
 from loguru import logger
 
 from src.scrapers.base import BaseExtractor
+from src.scrapers.keyword_matcher import register_keywords
+from src.scrapers.regex_registry import register_pattern_groups
+from src.scrapers.text_corpus import WorkflowTextCorpus
+
+
+# Optimization patterns
+OPTIMIZATION_PATTERNS = [
+    r'optimize[^\s]*',
+    r'improve[^\s]*',
+    r'enhance[^\s]*',
+    r'speed[^\s]*up',
+    r'faster[^\s]*',
+    r'efficient[^\s]*',
+    r'reduce[^\s]*time',
+    r'minimize[^\s]*',
+    r'maximize[^\s]*'
+]
+
+# Scaling patterns
+SCALING_PATTERNS = [
+    r'scale[^\s]*',
+    r'expand[^\s]*',
+    r'grow[^\s]*',
+    r'handle[^\s]*volume',
+    r'capacity[^\s]*',
+    r'load[^\s]*balanc',
+    r'horizontal[^\s]*',
+    r'vertical[^\s]*'
+]
+
+# Monitoring patterns
+MONITORING_PATTERNS = [
+    r'monitor[^\s]*',
+    r'track[^\s]*',
+    r'log[^\s]*',
+    r'alert[^\s]*',
+    r'metric[^\s]*',
+    r'dashboard[^\s]*',
+    r'analytics[^\s]*',
+    r'report[^\s]*'
+]
+
+TOKEN_SUFFIX = r'[^\s]*'
+
+# Execution success rate by node count: (inclusive node count limit, rate)
+SUCCESS_RATE_TIERS = ((5, 95.0), (15, 90.0))
+DEFAULT_SUCCESS_RATE = 85.0
+ERROR_SHARE_OF_FAILURES = 0.7
+
+# Complexity tiers on node_count + connection_count: (exclusive lower bound, level, cost multiplier)
+COMPLEXITY_TIERS = (
+    (30, 'high', 2.0),
+    (15, 'medium', 1.5)
+)
+DEFAULT_COMPLEXITY_TIER = ('low', 1.0)
+
+# Base costs (monthly estimates in USD)
+BASE_COSTS = {
+    'maintenance': 100,
+    'support': 150,
+    'training': 200,
+    'documentation': 50,
+    'testing': 75,
+    'deployment': 100,
+    'integration': 125,
+    'customization': 175,
+    'security': 100,
+    'compliance': 150,
+    'governance': 125,
+    'audit': 100,
+    'backup': 75
+}
+
+LEVEL_FIELDS = (
+    'support', 'training', 'documentation', 'testing', 'deployment', 'integration',
+    'customization', 'security', 'compliance', 'governance', 'audit', 'backup'
+)
+
+RATE_FIELDS = ('execution_success_rate', 'execution_failure_rate', 'execution_error_rate')
+COST_FIELDS = tuple(f"{name}_cost" for name in BASE_COSTS)
+LEVEL_FIELD_NAMES = tuple(f"{name}_level" for name in LEVEL_FIELDS)
+
+
+def complexity_tier(complexity_factor: float):
+    """(level, cost multiplier) for a node_count + connection_count complexity factor."""
+    for lower_bound, level, multiplier in COMPLEXITY_TIERS:
+        if complexity_factor > lower_bound:
+            return level, multiplier
+    return DEFAULT_COMPLEXITY_TIER
+
+
+def _apply_estimates(perf_data: "PerformanceAnalyticsData", estimates: Dict[str, Any], fields):
+    """Copy precomputed complexity-tier fields onto perf_data."""
+    for field_name in fields:
+        setattr(perf_data, field_name, estimates.get(field_name))
+
+
+def _leading_keyword(pattern: str) -> str:
+    """Literal prefix of a pattern; the pattern can only match where this keyword occurs."""
+    return pattern.split('[', 1)[0]
+
+
+register_keywords('layer7', {
+    'optimization': [_leading_keyword(p) for p in OPTIMIZATION_PATTERNS],
+    'scaling': [_leading_keyword(p) for p in SCALING_PATTERNS],
+    'monitoring': [_leading_keyword(p) for p in MONITORING_PATTERNS]
+})
+
+# Performance patterns
+PERFORMANCE_PATTERNS = register_pattern_groups('layer7.performance', {
+    'success_rate': [
+        r'success[^\s]*rate[:\s]*(\d+(?:\.\d+)?)%?',
+        r'(\d+(?:\.\d+)?)%?\s*success',
+        r'reliability[:\s]*(\d+(?:\.\d+)?)%?'
+    ],
+    'failure_rate': [
+        r'failure[^\s]*rate[:\s]*(\d+(?:\.\d+)?)%?',
+        r'(\d+(?:\.\d+)?)%?\s*failure',
+        r'error[^\s]*rate[:\s]*(\d+(?:\.\d+)?)%?'
+    ],
+    'execution_time': [
+        r'execution[^\s]*time[:\s]*(\d+(?:\.\d+)?)\s*(?:seconds?|minutes?|hours?)',
+        r'runtime[:\s]*(\d+(?:\.\d+)?)\s*(?:seconds?|minutes?|hours?)',
+        r'(\d+(?:\.\d+)?)\s*seconds?[^\s]*execution'
+    ],
+    'throughput': [
+        r'throughput[:\s]*(\d+(?:\.\d+)?)\s*(?:per|/)\s*(?:second|minute|hour)',
+        r'(\d+(?:\.\d+)?)\s*request[s]?\s*(?:per|/)\s*(?:second|minute|hour)',
+        r'(\d+(?:\.\d+)?)\s*operation[s]?\s*(?:per|/)\s*(?:second|minute|hour)'
+    ]
+}, re.IGNORECASE)
+
+# Cost patterns
+COST_PATTERNS = register_pattern_groups('layer7.cost', {
+    'maintenance': [r'maintenance[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'upkeep[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
+    'support': [r'support[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'help[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
+    'training': [r'training[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'education[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
+    'documentation': [r'documentation[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'manual[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
+    'testing': [r'testing[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'qa[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
+    'deployment': [r'deployment[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'install[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
+    'integration': [r'integration[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'connect[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
+    'customization': [r'customization[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'custom[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
+    'security': [r'security[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'protect[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
+    'compliance': [r'compliance[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'regulat[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
+    'governance': [r'governance[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'control[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
+    'audit': [r'audit[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'review[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
+    'backup': [r'backup[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'recovery[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)']
+}, re.IGNORECASE)
+
+# Requirement patterns
+REQUIREMENT_PATTERNS = register_pattern_groups('layer7.requirements', {
+    'maintenance': [r'maintenance[^\s]*requir', r'upkeep[^\s]*requir', r'support[^\s]*requir'],
+    'support': [r'support[^\s]*requir', r'help[^\s]*requir', r'assistance[^\s]*requir'],
+    'training': [r'training[^\s]*requir', r'education[^\s]*requir', r'learning[^\s]*requir'],
+    'documentation': [r'documentation[^\s]*requir', r'manual[^\s]*requir', r'guide[^\s]*requir'],
+    'testing': [r'testing[^\s]*requir', r'qa[^\s]*requir', r'validation[^\s]*requir'],
+    'deployment': [r'deployment[^\s]*requir', r'install[^\s]*requir', r'setup[^\s]*requir'],
+    'integration': [r'integration[^\s]*requir', r'connect[^\s]*requir', r'link[^\s]*requir'],
+    'customization': [r'customization[^\s]*requir', r'custom[^\s]*requir', r'modify[^\s]*requir'],
+    'security': [r'security[^\s]*requir', r'protect[^\s]*requir', r'secure[^\s]*requir'],
+    'compliance': [r'compliance[^\s]*requir', r'regulat[^\s]*requir', r'policy[^\s]*requir'],
+    'governance': [r'governance[^\s]*requir', r'control[^\s]*requir', r'manage[^\s]*requir'],
+    'audit': [r'audit[^\s]*requir', r'review[^\s]*requir', r'check[^\s]*requir'],
+    'backup': [r'backup[^\s]*requir', r'recovery[^\s]*requir', r'restore[^\s]*requir']
+}, re.IGNORECASE)
+
+
+def _matching_patterns(corpus: WorkflowTextCorpus, text: str, patterns: List[str]) -> List[str]:
+    """
+    Patterns that match `text`, using one keyword scan as a prefilter.
+
+    A bare `keyword` + TOKEN_SUFFIX pattern matches exactly when the keyword
+    occurs, so only the few compound patterns (speed...up, reduce...time)
+    still need a regex search. Callers pass lower-cased text.
+    """
+    scan = corpus.scan(text)
+    matched = []
+    for pattern in patterns:
+        keyword = _leading_keyword(pattern)
+        if not scan.has(keyword):
+            continue
+        if pattern == keyword + TOKEN_SUFFIX or corpus.search(pattern, text):
+            matched.append(pattern)
+    return matched
 
 
 @dataclass
@@ -120,100 +304,13 @@ class PerformanceAnalyticsExtractor(BaseExtractor):
     def __init__(self):
         super().__init__("Layer 7 - Performance Analytics")
         
-        # Performance patterns
-        self.performance_patterns = {
-            'success_rate': [
-                r'success[^\s]*rate[:\s]*(\d+(?:\.\d+)?)%?',
-                r'(\d+(?:\.\d+)?)%?\s*success',
-                r'reliability[:\s]*(\d+(?:\.\d+)?)%?'
-            ],
-            'failure_rate': [
-                r'failure[^\s]*rate[:\s]*(\d+(?:\.\d+)?)%?',
-                r'(\d+(?:\.\d+)?)%?\s*failure',
-                r'error[^\s]*rate[:\s]*(\d+(?:\.\d+)?)%?'
-            ],
-            'execution_time': [
-                r'execution[^\s]*time[:\s]*(\d+(?:\.\d+)?)\s*(?:seconds?|minutes?|hours?)',
-                r'runtime[:\s]*(\d+(?:\.\d+)?)\s*(?:seconds?|minutes?|hours?)',
-                r'(\d+(?:\.\d+)?)\s*seconds?[^\s]*execution'
-            ],
-            'throughput': [
-                r'throughput[:\s]*(\d+(?:\.\d+)?)\s*(?:per|/)\s*(?:second|minute|hour)',
-                r'(\d+(?:\.\d+)?)\s*request[s]?\s*(?:per|/)\s*(?:second|minute|hour)',
-                r'(\d+(?:\.\d+)?)\s*operation[s]?\s*(?:per|/)\s*(?:second|minute|hour)'
-            ]
-        }
-        
-        # Optimization patterns
-        self.optimization_patterns = [
-            r'optimize[^\s]*',
-            r'improve[^\s]*',
-            r'enhance[^\s]*',
-            r'speed[^\s]*up',
-            r'faster[^\s]*',
-            r'efficient[^\s]*',
-            r'reduce[^\s]*time',
-            r'minimize[^\s]*',
-            r'maximize[^\s]*'
-        ]
-        
-        # Scaling patterns
-        self.scaling_patterns = [
-            r'scale[^\s]*',
-            r'expand[^\s]*',
-            r'grow[^\s]*',
-            r'handle[^\s]*volume',
-            r'capacity[^\s]*',
-            r'load[^\s]*balanc',
-            r'horizontal[^\s]*',
-            r'vertical[^\s]*'
-        ]
-        
-        # Monitoring patterns
-        self.monitoring_patterns = [
-            r'monitor[^\s]*',
-            r'track[^\s]*',
-            r'log[^\s]*',
-            r'alert[^\s]*',
-            r'metric[^\s]*',
-            r'dashboard[^\s]*',
-            r'analytics[^\s]*',
-            r'report[^\s]*'
-        ]
-        
-        # Cost patterns
-        self.cost_patterns = {
-            'maintenance': [r'maintenance[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'upkeep[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
-            'support': [r'support[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'help[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
-            'training': [r'training[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'education[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
-            'documentation': [r'documentation[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'manual[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
-            'testing': [r'testing[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'qa[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
-            'deployment': [r'deployment[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'install[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
-            'integration': [r'integration[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'connect[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
-            'customization': [r'customization[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'custom[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
-            'security': [r'security[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'protect[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
-            'compliance': [r'compliance[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'regulat[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
-            'governance': [r'governance[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'control[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
-            'audit': [r'audit[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'review[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'],
-            'backup': [r'backup[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', r'recovery[^\s]*cost[:\s]*\$?(\d+(?:,\d{3})*(?:\.\d{2})?)']
-        }
+        self.performance_patterns = PERFORMANCE_PATTERNS
+        self.optimization_patterns = OPTIMIZATION_PATTERNS
+        self.scaling_patterns = SCALING_PATTERNS
+        self.monitoring_patterns = MONITORING_PATTERNS
         
-        # Requirement patterns
-        self.requirement_patterns = {
-            'maintenance': [r'maintenance[^\s]*requir', r'upkeep[^\s]*requir', r'support[^\s]*requir'],
-            'support': [r'support[^\s]*requir', r'help[^\s]*requir', r'assistance[^\s]*requir'],
-            'training': [r'training[^\s]*requir', r'education[^\s]*requir', r'learning[^\s]*requir'],
-            'documentation': [r'documentation[^\s]*requir', r'manual[^\s]*requir', r'guide[^\s]*requir'],
-            'testing': [r'testing[^\s]*requir', r'qa[^\s]*requir', r'validation[^\s]*requir'],
-            'deployment': [r'deployment[^\s]*requir', r'install[^\s]*requir', r'setup[^\s]*requir'],
-            'integration': [r'integration[^\s]*requir', r'connect[^\s]*requir', r'link[^\s]*requir'],
-            'customization': [r'customization[^\s]*requir', r'custom[^\s]*requir', r'modify[^\s]*requir'],
-            'security': [r'security[^\s]*requir', r'protect[^\s]*requir', r'secure[^\s]*requir'],
-            'compliance': [r'compliance[^\s]*requir', r'regulat[^\s]*requir', r'policy[^\s]*requir'],
-            'governance': [r'governance[^\s]*requir', r'control[^\s]*requir', r'manage[^\s]*requir'],
-            'audit': [r'audit[^\s]*requir', r'review[^\s]*requir', r'check[^\s]*requir'],
-            'backup': [r'backup[^\s]*requir', r'recovery[^\s]*requir', r'restore[^\s]*requir']
-        }
+        self.cost_patterns = COST_PATTERNS
+        self.requirement_patterns = REQUIREMENT_PATTERNS
         
         # Level patterns
         self.level_patterns = {
@@ -222,48 +319,43 @@ class PerformanceAnalyticsExtractor(BaseExtractor):
             'low': ['low', 'basic', 'simple', 'minimal', 'easy', 'beginner']
         }
     
-    async def extract(self, workflow_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def extract(
+        self,
+        workflow_data: Dict[str, Any],
+        corpus: Optional[WorkflowTextCorpus] = None,
+        estimates: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Extract performance analytics from workflow.
         
+        Async adapter for BaseExtractor; the work is done by extract_sync().
+        
         Args:
             workflow_data: Combined data from previous layers
+            corpus: Shared text corpus for this workflow (built here if not given)
+            estimates: Precomputed complexity-tier fields (rates, costs, levels) for
+                this workflow, as produced column-wise by the batch analytics engine
             
         Returns:
             Dictionary with performance analytics data
         """
+        return self.extract_sync(workflow_data, corpus=corpus, estimates=estimates)
+    
+    def extract_sync(
+        self,
+        workflow_data: Dict[str, Any],
+        corpus: Optional[WorkflowTextCorpus] = None,
+        estimates: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Extract performance analytics data synchronously; same result as extract().
+        
+        For thread/process executors and the batch analytics engine.
+        """
         logger.info(f"Starting {self.layer_name} extraction for workflow {workflow_data.get('workflow_id')}")
         
         try:
-            # Initialize performance analytics data
-            perf_data = PerformanceAnalyticsData()
-            
-            # Extract from workflow structure
-            await self._extract_from_structure(workflow_data, perf_data)
-            
-            # Extract from content
-            await self._extract_from_content(workflow_data, perf_data)
-            
-            # Extract from metadata
-            await self._extract_from_metadata(workflow_data, perf_data)
-            
-            # Calculate performance metrics
-            await self._calculate_performance_metrics(workflow_data, perf_data)
-            
-            # Analyze optimization opportunities
-            await self._analyze_optimization_opportunities(workflow_data, perf_data)
-            
-            # Analyze scaling requirements
-            await self._analyze_scaling_requirements(workflow_data, perf_data)
-            
-            # Analyze monitoring requirements
-            await self._analyze_monitoring_requirements(workflow_data, perf_data)
-            
-            # Calculate cost estimates
-            await self._calculate_cost_estimates(workflow_data, perf_data)
-            
-            # Analyze requirements
-            await self._analyze_requirements(workflow_data, perf_data)
+            perf_data = self.analyze(workflow_data, corpus=corpus, estimates=estimates)
             
             # Convert to dictionary
             result = {
@@ -285,11 +377,70 @@ class PerformanceAnalyticsExtractor(BaseExtractor):
                 'layer': self.layer_name
             }
     
-    async def _extract_from_structure(self, workflow_data: Dict[str, Any], perf_data: PerformanceAnalyticsData):
+    def analyze(
+        self,
+        workflow_data: Dict[str, Any],
+        corpus: Optional[WorkflowTextCorpus] = None,
+        estimates: Optional[Dict[str, Any]] = None
+    ) -> PerformanceAnalyticsData:
+        """
+        Synchronous, side-effect-free performance analytics core.
+        
+        Reads only workflow_data (through the corpus) and the extractor's
+        constant tables, and raises on malformed input.
+        
+        Args:
+            workflow_data: Combined data from previous layers
+            corpus: Shared text corpus for this workflow (built here if not given)
+            estimates: Precomputed complexity-tier fields (rates, costs, levels) for
+                this workflow, as produced column-wise by the batch analytics engine
+            
+        Returns:
+            Populated PerformanceAnalyticsData
+        """
+        # Initialize performance analytics data
+        perf_data = PerformanceAnalyticsData()
+        corpus = corpus or WorkflowTextCorpus(workflow_data)
+        
+        # Extract from workflow structure
+        self._extract_from_structure(corpus, perf_data, estimates)
+        
+        # Extract from content
+        self._extract_from_content(corpus, perf_data)
+        
+        # Extract from metadata
+        self._extract_from_metadata(corpus, perf_data)
+        
+        # Calculate performance metrics
+        self._calculate_performance_metrics(corpus, perf_data)
+        
+        # Analyze optimization opportunities
+        self._analyze_optimization_opportunities(corpus, perf_data)
+        
+        # Analyze scaling requirements
+        self._analyze_scaling_requirements(corpus, perf_data)
+        
+        # Analyze monitoring requirements
+        self._analyze_monitoring_requirements(corpus, perf_data)
+        
+        # Calculate cost estimates
+        self._calculate_cost_estimates(corpus, perf_data, estimates)
+        
+        # Analyze requirements
+        self._analyze_requirements(corpus, perf_data, estimates)
+        
+        return perf_data
+    
+    def _extract_from_structure(
+        self,
+        corpus: WorkflowTextCorpus,
+        perf_data: PerformanceAnalyticsData,
+        estimates: Optional[Dict[str, Any]] = None
+    ):
         """Extract performance analytics from workflow structure."""
         
         # Get structure from layer 2
-        layer2_data = workflow_data.get('layers', {}).get('layer2', {}).get('data', {})
+        layer2_data = corpus.layer2
         
         node_count = layer2_data.get('node_count', 0)
         connection_count = layer2_data.get('connection_count', 0)
@@ -305,51 +456,43 @@ class PerformanceAnalyticsExtractor(BaseExtractor):
                 'complexity_score': node_count + connection_count
             }
             
+            if estimates is not None:
+                _apply_estimates(perf_data, estimates, RATE_FIELDS)
+                return
+            
             # Estimate success rate based on complexity
-            if node_count <= 5:
-                perf_data.execution_success_rate = 95.0
-            elif node_count <= 15:
-                perf_data.execution_success_rate = 90.0
-            else:
-                perf_data.execution_success_rate = 85.0
+            perf_data.execution_success_rate = next(
+                (rate for limit, rate in SUCCESS_RATE_TIERS if node_count <= limit),
+                DEFAULT_SUCCESS_RATE
+            )
             
             # Calculate failure and error rates
             perf_data.execution_failure_rate = 100.0 - (perf_data.execution_success_rate or 0)
-            perf_data.execution_error_rate = perf_data.execution_failure_rate * 0.7  # 70% of failures are errors
+            perf_data.execution_error_rate = perf_data.execution_failure_rate * ERROR_SHARE_OF_FAILURES
     
-    async def _extract_from_content(self, workflow_data: Dict[str, Any], perf_data: PerformanceAnalyticsData):
+    def _extract_from_content(self, corpus: WorkflowTextCorpus, perf_data: PerformanceAnalyticsData):
         """Extract performance analytics from workflow content."""
         
-        # Get content from layer 3
-        layer3_data = workflow_data.get('layers', {}).get('layer3', {}).get('data', {})
-        
-        explainer_text = layer3_data.get('explainer_text', '')
-        setup_instructions = layer3_data.get('setup_instructions', '')
-        use_instructions = layer3_data.get('use_instructions', '')
-        
-        # Combine all text for analysis
-        full_text = f"{explainer_text} {setup_instructions} {use_instructions}".lower()
-        
         # Extract performance metrics from text
-        await self._extract_performance_from_text(full_text, perf_data)
+        self._extract_performance_from_text(corpus, perf_data)
         
         # Extract optimization opportunities from text
-        await self._extract_optimization_from_text(full_text, perf_data)
+        self._extract_optimization_from_text(corpus, perf_data)
         
         # Extract scaling requirements from text
-        await self._extract_scaling_from_text(full_text, perf_data)
+        self._extract_scaling_from_text(corpus, perf_data)
         
         # Extract monitoring requirements from text
-        await self._extract_monitoring_from_text(full_text, perf_data)
+        self._extract_monitoring_from_text(corpus, perf_data)
         
         # Extract cost information from text
-        await self._extract_costs_from_text(full_text, perf_data)
+        self._extract_costs_from_text(corpus, perf_data)
     
-    async def _extract_from_metadata(self, workflow_data: Dict[str, Any], perf_data: PerformanceAnalyticsData):
+    def _extract_from_metadata(self, corpus: WorkflowTextCorpus, perf_data: PerformanceAnalyticsData):
         """Extract performance analytics from workflow metadata."""
         
         # Get metadata from layer 1
-        layer1_data = workflow_data.get('layers', {}).get('layer1', {}).get('data', {})
+        layer1_data = corpus.layer1
         
         # Extract views and engagement for usage analytics
         views = layer1_data.get('views', 0) or 0
@@ -381,11 +524,11 @@ class PerformanceAnalyticsExtractor(BaseExtractor):
             'growth_potential': 'high' if views > 500 else 'medium' if views > 100 else 'low'
         }
     
-    async def _calculate_performance_metrics(self, workflow_data: Dict[str, Any], perf_data: PerformanceAnalyticsData):
+    def _calculate_performance_metrics(self, corpus: WorkflowTextCorpus, perf_data: PerformanceAnalyticsData):
         """Calculate comprehensive performance metrics."""
         
         # Get structure data
-        layer2_data = workflow_data.get('layers', {}).get('layer2', {}).get('data', {})
+        layer2_data = corpus.layer2
         node_count = layer2_data.get('node_count', 0)
         connection_count = layer2_data.get('connection_count', 0)
         
@@ -398,6 +541,18 @@ class PerformanceAnalyticsExtractor(BaseExtractor):
             'efficiency_rating': 'high' if node_count <= 10 else 'medium' if node_count <= 20 else 'low'
         }
         
+        # Refine with the connection graph when the workflow JSON is available
+        graph = corpus.graph_metrics
+        if graph:
+            perf_data.performance_benchmarks.update({
+                'critical_path_nodes': graph['depth'],
+                'critical_path_time': graph['depth'] * 0.5,
+                'parallel_branches': graph['parallel_branches'],
+                'branching_factor': graph['branching_factor'],
+                'loop_count': graph['cycle_count'],
+                'execution_paths': graph['trigger_to_sink_paths']
+            })
+        
         # Calculate performance trends
         perf_data.performance_trends = {
             'scalability_trend': 'positive' if node_count <= 15 else 'neutral' if node_count <= 25 else 'negative',
@@ -430,11 +585,11 @@ class PerformanceAnalyticsExtractor(BaseExtractor):
             'error_recovery_time': 'long' if node_count > 25 else 'medium' if node_count > 15 else 'short'
         }
     
-    async def _analyze_optimization_opportunities(self, workflow_data: Dict[str, Any], perf_data: PerformanceAnalyticsData):
+    def _analyze_optimization_opportunities(self, corpus: WorkflowTextCorpus, perf_data: PerformanceAnalyticsData):
         """Analyze optimization opportunities."""
         
         # Get structure data
-        layer2_data = workflow_data.get('layers', {}).get('layer2', {}).get('data', {})
+        layer2_data = corpus.layer2
         node_count = layer2_data.get('node_count', 0)
         connection_count = layer2_data.get('connection_count', 0)
         
@@ -474,11 +629,11 @@ class PerformanceAnalyticsExtractor(BaseExtractor):
         perf_data.optimization_opportunities = optimization_opportunities
         perf_data.optimization_recommendations = optimization_recommendations
     
-    async def _analyze_scaling_requirements(self, workflow_data: Dict[str, Any], perf_data: PerformanceAnalyticsData):
+    def _analyze_scaling_requirements(self, corpus: WorkflowTextCorpus, perf_data: PerformanceAnalyticsData):
         """Analyze scaling requirements."""
         
         # Get structure data
-        layer2_data = workflow_data.get('layers', {}).get('layer2', {}).get('data', {})
+        layer2_data = corpus.layer2
         node_count = layer2_data.get('node_count', 0)
         connection_count = layer2_data.get('connection_count', 0)
         
@@ -523,11 +678,11 @@ class PerformanceAnalyticsExtractor(BaseExtractor):
         perf_data.scaling_limitations = scaling_limitations if scaling_limitations else None
         perf_data.scaling_recommendations = scaling_recommendations
     
-    async def _analyze_monitoring_requirements(self, workflow_data: Dict[str, Any], perf_data: PerformanceAnalyticsData):
+    def _analyze_monitoring_requirements(self, corpus: WorkflowTextCorpus, perf_data: PerformanceAnalyticsData):
         """Analyze monitoring requirements."""
         
         # Get structure data
-        layer2_data = workflow_data.get('layers', {}).get('layer2', {}).get('data', {})
+        layer2_data = corpus.layer2
         node_count = layer2_data.get('node_count', 0)
         connection_count = layer2_data.get('connection_count', 0)
         
@@ -575,62 +730,38 @@ class PerformanceAnalyticsExtractor(BaseExtractor):
         perf_data.monitoring_metrics = monitoring_metrics
         perf_data.monitoring_alerts = monitoring_alerts
     
-    async def _calculate_cost_estimates(self, workflow_data: Dict[str, Any], perf_data: PerformanceAnalyticsData):
+    def _calculate_cost_estimates(
+        self,
+        corpus: WorkflowTextCorpus,
+        perf_data: PerformanceAnalyticsData,
+        estimates: Optional[Dict[str, Any]] = None
+    ):
         """Calculate cost estimates based on workflow complexity."""
         
+        if estimates is not None:
+            _apply_estimates(perf_data, estimates, COST_FIELDS)
+            return
+        
         # Get structure data
-        layer2_data = workflow_data.get('layers', {}).get('layer2', {}).get('data', {})
+        layer2_data = corpus.layer2
         node_count = layer2_data.get('node_count', 0)
         connection_count = layer2_data.get('connection_count', 0)
         
-        # Calculate complexity factor
-        complexity_factor = node_count + connection_count
-        
-        # Base costs (monthly estimates in USD)
-        base_costs = {
-            'maintenance': 100,
-            'support': 150,
-            'training': 200,
-            'documentation': 50,
-            'testing': 75,
-            'deployment': 100,
-            'integration': 125,
-            'customization': 175,
-            'security': 100,
-            'compliance': 150,
-            'governance': 125,
-            'audit': 100,
-            'backup': 75
-        }
-        
-        # Apply complexity multipliers
-        if complexity_factor > 30:
-            multiplier = 2.0  # High complexity
-        elif complexity_factor > 15:
-            multiplier = 1.5  # Medium complexity
-        else:
-            multiplier = 1.0  # Low complexity
-        
-        # Calculate final costs
-        perf_data.maintenance_cost = base_costs['maintenance'] * multiplier
-        perf_data.support_cost = base_costs['support'] * multiplier
-        perf_data.training_cost = base_costs['training'] * multiplier
-        perf_data.documentation_cost = base_costs['documentation'] * multiplier
-        perf_data.testing_cost = base_costs['testing'] * multiplier
-        perf_data.deployment_cost = base_costs['deployment'] * multiplier
-        perf_data.integration_cost = base_costs['integration'] * multiplier
-        perf_data.customization_cost = base_costs['customization'] * multiplier
-        perf_data.security_cost = base_costs['security'] * multiplier
-        perf_data.compliance_cost = base_costs['compliance'] * multiplier
-        perf_data.governance_cost = base_costs['governance'] * multiplier
-        perf_data.audit_cost = base_costs['audit'] * multiplier
-        perf_data.backup_cost = base_costs['backup'] * multiplier
+        # Apply complexity multipliers to base costs
+        _, multiplier = complexity_tier(node_count + connection_count)
+        for name, base_cost in BASE_COSTS.items():
+            setattr(perf_data, f"{name}_cost", base_cost * multiplier)
     
-    async def _analyze_requirements(self, workflow_data: Dict[str, Any], perf_data: PerformanceAnalyticsData):
+    def _analyze_requirements(
+        self,
+        corpus: WorkflowTextCorpus,
+        perf_data: PerformanceAnalyticsData,
+        estimates: Optional[Dict[str, Any]] = None
+    ):
         """Analyze various requirements based on workflow complexity."""
         
         # Get structure data
-        layer2_data = workflow_data.get('layers', {}).get('layer2', {}).get('data', {})
+        layer2_data = corpus.layer2
         node_count = layer2_data.get('node_count', 0)
         connection_count = layer2_data.get('connection_count', 0)
         
@@ -638,26 +769,12 @@ class PerformanceAnalyticsExtractor(BaseExtractor):
         complexity_factor = node_count + connection_count
         
         # Determine levels based on complexity
-        if complexity_factor > 30:
-            level = 'high'
-        elif complexity_factor > 15:
-            level = 'medium'
+        if estimates is not None:
+            _apply_estimates(perf_data, estimates, LEVEL_FIELD_NAMES)
         else:
-            level = 'low'
-        
-        # Set all levels
-        perf_data.support_level = level
-        perf_data.training_level = level
-        perf_data.documentation_level = level
-        perf_data.testing_level = level
-        perf_data.deployment_level = level
-        perf_data.integration_level = level
-        perf_data.customization_level = level
-        perf_data.security_level = level
-        perf_data.compliance_level = level
-        perf_data.governance_level = level
-        perf_data.audit_level = level
-        perf_data.backup_level = level
+            level, _ = complexity_tier(complexity_factor)
+            for name in LEVEL_FIELDS:
+                setattr(perf_data, f"{name}_level", level)
         
         # Generate requirements based on complexity
         requirements = {
@@ -694,12 +811,14 @@ class PerformanceAnalyticsExtractor(BaseExtractor):
             'quarterly': ['compliance_review', 'system_updates']
         }
     
-    async def _extract_performance_from_text(self, text: str, perf_data: PerformanceAnalyticsData):
+    def _extract_performance_from_text(self, corpus: WorkflowTextCorpus, perf_data: PerformanceAnalyticsData):
         """Extract performance metrics from text."""
         
+        text = corpus.content
+        
         # Extract success rate
         for pattern in self.performance_patterns['success_rate']:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = corpus.findall(pattern, text)
             if matches:
                 try:
                     success_rate = float(matches[0])
@@ -714,7 +833,7 @@ class PerformanceAnalyticsExtractor(BaseExtractor):
         
         # Extract execution time
         for pattern in self.performance_patterns['execution_time']:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = corpus.findall(pattern, text)
             if matches:
                 try:
                     time_value = float(matches[0])
@@ -732,7 +851,7 @@ class PerformanceAnalyticsExtractor(BaseExtractor):
         
         # Extract throughput
         for pattern in self.performance_patterns['throughput']:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = corpus.findall(pattern, text)
             if matches:
                 try:
                     throughput = float(matches[0])
@@ -743,50 +862,53 @@ class PerformanceAnalyticsExtractor(BaseExtractor):
                 except ValueError:
                     continue
     
-    async def _extract_optimization_from_text(self, text: str, perf_data: PerformanceAnalyticsData):
+    def _extract_optimization_from_text(self, corpus: WorkflowTextCorpus, perf_data: PerformanceAnalyticsData):
         """Extract optimization opportunities from text."""
         
-        optimization_opportunities = []
+        text = corpus.content
         
-        for pattern in self.optimization_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                optimization_opportunities.append(pattern.replace('[^\s]*', '').strip())
+        optimization_opportunities = [
+            pattern.replace('[^\s]*', '').strip()
+            for pattern in _matching_patterns(corpus, text, self.optimization_patterns)
+        ]
         
         if optimization_opportunities and not perf_data.optimization_opportunities:
             perf_data.optimization_opportunities = optimization_opportunities
     
-    async def _extract_scaling_from_text(self, text: str, perf_data: PerformanceAnalyticsData):
+    def _extract_scaling_from_text(self, corpus: WorkflowTextCorpus, perf_data: PerformanceAnalyticsData):
         """Extract scaling requirements from text."""
         
+        text = corpus.content
+        
         scaling_requirements = {}
         
-        for pattern in self.scaling_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                scaling_requirements['scaling_mentioned'] = True
-                break
+        if _matching_patterns(corpus, text, self.scaling_patterns):
+            scaling_requirements['scaling_mentioned'] = True
         
         if scaling_requirements and not perf_data.scaling_requirements:
             perf_data.scaling_requirements = scaling_requirements
     
-    async def _extract_monitoring_from_text(self, text: str, perf_data: PerformanceAnalyticsData):
+    def _extract_monitoring_from_text(self, corpus: WorkflowTextCorpus, perf_data: PerformanceAnalyticsData):
         """Extract monitoring requirements from text."""
         
+        text = corpus.content
+        
         monitoring_requirements = {}
         
-        for pattern in self.monitoring_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                monitoring_requirements['monitoring_mentioned'] = True
-                break
+        if _matching_patterns(corpus, text, self.monitoring_patterns):
+            monitoring_requirements['monitoring_mentioned'] = True
         
         if monitoring_requirements and not perf_data.monitoring_requirements:
             perf_data.monitoring_requirements = monitoring_requirements
     
-    async def _extract_costs_from_text(self, text: str, perf_data: PerformanceAnalyticsData):
+    def _extract_costs_from_text(self, corpus: WorkflowTextCorpus, perf_data: PerformanceAnalyticsData):
         """Extract cost information from text."""
         
+        text = corpus.content
+        
         for cost_type, patterns in self.cost_patterns.items():
             for pattern in patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
+                matches = corpus.findall(pattern, text)
                 if matches:
                     try:
                         cost_value = float(matches[0].replace(',', ''))
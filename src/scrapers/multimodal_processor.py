@@ -11,7 +11,7 @@ Date: October 10, 2025
 
 import asyncio
 import re
-import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
@@ -24,6 +24,10 @@ from playwright.async_api import async_playwright, Page, Browser, TimeoutError a
 from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
 from loguru import logger
 
+from src.database.media_writer import MediaWriter
+from src.scrapers.image_ocr_cache import get_image_ocr_cache
+from src.scrapers.ocr_service import OCRService
+
 
 class MultimodalProcessor:
     """
@@ -60,6 +64,9 @@ class MultimodalProcessor:
         self.timeout = timeout
         self.browser: Optional[Browser] = None
         self.playwright = None
+        self.ocr_service: Optional[OCRService] = None
+        self.media_writer: Optional[MediaWriter] = None
+        self._batch_depth = 0
         
     async def __aenter__(self):
         """Async context manager entry"""
@@ -78,6 +85,11 @@ class MultimodalProcessor:
         
     async def cleanup(self):
         """Cleanup browser resources"""
+        if self.ocr_service:
+            await self.ocr_service.close()
+        if self.media_writer:
+            self.media_writer.close()
+            self.media_writer = None
         if self.browser:
             await self.browser.close()
         if self.playwright:
@@ -338,6 +350,25 @@ class MultimodalProcessor:
             logger.warning(error_msg)
             return False, "", error_msg
     
+    async def extract_text_from_image_async(self, image_url: str) -> Tuple[bool, str, Optional[str]]:
+        """
+        Extract text from image using OCR without blocking the event loop.
+        
+        Downloads with aiohttp and runs Tesseract in the shared OCR process pool,
+        so in-flight Playwright pages keep running while OCR is in progress.
+        Images already seen (or near-duplicates of them) reuse the cached OCR text.
+        
+        Args:
+            image_url: URL of image to process
+            
+        Returns:
+            Tuple of (success, text_or_message, error_message), same as extract_text_from_image
+        """
+        if self.ocr_service is None:
+            self.ocr_service = OCRService(cache=get_image_ocr_cache())
+        result = await self.ocr_service.ocr(image_url)
+        return result.as_tuple()
+    
     async def discover_videos_in_iframe(self, page: Page, iframe_element) -> List[str]:
         """
         Discover YouTube video URLs in iframe.
@@ -497,6 +528,7 @@ class MultimodalProcessor:
         """
         try:
             from src.scrapers.transcript_extractor import TranscriptExtractor
+            from src.scrapers.transcript_cache import get_transcript_cache
             
             video_id = self.extract_video_id_from_url(video_url)
             if not video_id:
@@ -504,7 +536,9 @@ class MultimodalProcessor:
             
             # Use TranscriptExtractor with its own fresh browser instance
             # This avoids YouTube blocking based on previous browsing activity
-            async with TranscriptExtractor(headless=self.headless, timeout=self.timeout) as extractor:
+            async with TranscriptExtractor(
+                headless=self.headless, timeout=self.timeout, cache=get_transcript_cache()
+            ) as extractor:
                 success, transcript, error = await extractor.extract_transcript(video_url, video_id)
                 return success, transcript, error
                 
@@ -609,6 +643,29 @@ class MultimodalProcessor:
             logger.error(f"Error extracting transcript text: {e}")
             return None
     
+    def _media_writer(self) -> MediaWriter:
+        """Lazily open the shared media writer (one WAL connection for the processor)."""
+        if self.media_writer is None:
+            self.media_writer = MediaWriter(self.db_path)
+        return self.media_writer
+    
+    @contextmanager
+    def media_batch(self, workflow_id: str):
+        """
+        Buffer all media rows stored inside the block and commit them in one transaction.
+        
+        Args:
+            workflow_id: Workflow whose media is being stored
+        """
+        writer = self._media_writer()
+        self._batch_depth += 1
+        try:
+            yield writer
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                writer.end_workflow(workflow_id)
+    
     def store_image_data(
         self,
         workflow_id: str,
@@ -618,9 +675,11 @@ class MultimodalProcessor:
         error_message: Optional[str] = None
     ):
         """
-        Store OCR results in unified Workflow table.
+        Store OCR result as one row in workflow_images.
         
-        Appends image URL to image_urls JSON array and aggregates OCR text.
+        Rows are appended (never read-modify-write); per-workflow image_urls / ocr_text
+        aggregates come from the workflow_image_summary view. The row joins the enclosing
+        `media_batch()`, or is committed as a batch of its own.
         
         Args:
             workflow_id: Workflow identifier
@@ -629,56 +688,8 @@ class MultimodalProcessor:
             ocr_text: Extracted text content
             error_message: Error details if failed
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Get existing workflow data
-        cursor.execute("""
-            SELECT image_urls, ocr_text 
-            FROM workflows 
-            WHERE workflow_id = ?
-        """, (workflow_id,))
-        
-        result = cursor.fetchone()
-        
-        if result:
-            # Parse existing data
-            import json
-            existing_urls = json.loads(result[0]) if result[0] else []
-            existing_ocr = result[1] or ""
-            
-            # Append new data
-            existing_urls.append(image_url)
-            
-            # Aggregate OCR text (separate with newlines)
-            if ocr_text and ocr_text.strip():
-                new_ocr_text = existing_ocr + "\n\n" + ocr_text if existing_ocr else ocr_text
-            else:
-                new_ocr_text = existing_ocr
-            
-            # Update workflow
-            cursor.execute("""
-                UPDATE workflows 
-                SET image_urls = ?,
-                    ocr_text = ?
-                WHERE workflow_id = ?
-            """, (json.dumps(existing_urls), new_ocr_text, workflow_id))
-        else:
-            # Create new workflow record
-            import json
-            cursor.execute("""
-                INSERT INTO workflows (workflow_id, image_urls, ocr_text, scrape_date, layer3_success)
-                VALUES (?, ?, ?, ?, ?)
-            """, (
-                workflow_id,
-                json.dumps([image_url]),
-                ocr_text if ocr_text else "",
-                datetime.utcnow(),
-                success
-            ))
-        
-        conn.commit()
-        conn.close()
+        with self.media_batch(workflow_id) as writer:
+            writer.add_image(workflow_id, image_url, success, ocr_text, error_message)
     
     def store_video_data(
         self,
@@ -690,9 +701,11 @@ class MultimodalProcessor:
         error_message: Optional[str] = None
     ):
         """
-        Store video data in unified Workflow table.
+        Store video result as one row in workflow_videos.
         
-        Appends video URL to video_urls JSON array and transcript to video_transcripts JSON array.
+        Per-workflow video_urls / video_transcripts aggregates come from the
+        workflow_video_summary view. The row joins the enclosing `media_batch()`,
+        or is committed as a batch of its own.
         
         Args:
             workflow_id: Workflow identifier
@@ -702,72 +715,8 @@ class MultimodalProcessor:
             transcript: Transcript text (or None if not available)
             error_message: Error details if failed
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Get existing workflow data
-        cursor.execute("""
-            SELECT video_urls, video_transcripts 
-            FROM workflows 
-            WHERE workflow_id = ?
-        """, (workflow_id,))
-        
-        result = cursor.fetchone()
-        
-        if result:
-            # Parse existing data
-            import json
-            existing_video_urls = json.loads(result[0]) if result[0] else []
-            existing_transcripts = json.loads(result[1]) if result[1] else []
-            
-            # Append new video URL
-            existing_video_urls.append(video_url)
-            
-            # Append new transcript data
-            transcript_entry = {
-                "video_id": video_id,
-                "video_url": video_url,
-                "transcript": transcript,
-                "length": len(transcript) if transcript else 0,
-                "extraction_date": datetime.utcnow().isoformat(),
-                "success": success,
-                "error": error_message
-            }
-            existing_transcripts.append(transcript_entry)
-            
-            # Update workflow
-            cursor.execute("""
-                UPDATE workflows 
-                SET video_urls = ?,
-                    video_transcripts = ?
-                WHERE workflow_id = ?
-            """, (json.dumps(existing_video_urls), json.dumps(existing_transcripts), workflow_id))
-        else:
-            # Create new workflow record
-            import json
-            transcript_entry = {
-                "video_id": video_id,
-                "video_url": video_url,
-                "transcript": transcript,
-                "length": len(transcript) if transcript else 0,
-                "extraction_date": datetime.utcnow().isoformat(),
-                "success": success,
-                "error": error_message
-            }
-            
-            cursor.execute("""
-                INSERT INTO workflows (workflow_id, video_urls, video_transcripts, scrape_date, layer3_success)
-                VALUES (?, ?, ?, ?, ?)
-            """, (
-                workflow_id,
-                json.dumps([video_url]),
-                json.dumps([transcript_entry]),
-                datetime.utcnow(),
-                success
-            ))
-        
-        conn.commit()
-        conn.close()
+        with self.media_batch(workflow_id) as writer:
+            writer.add_video(workflow_id, video_url, video_id, success, transcript, error_message)
     
     async def process_workflow(
         self,
@@ -0,0 +1,299 @@
+"""
+Non-Blocking OCR Service
+
+Keeps image OCR off the event loop so in-flight Playwright pages keep running:
+- Image downloads use aiohttp instead of blocking `requests.get`
+- Tesseract runs in a ProcessPoolExecutor sized to the CPU count
+- Jobs pass through a bounded queue; `submit` blocks when it is full (backpressure)
+- Each result reports download, queue wait and OCR time separately
+- Optional ImageOCRCache short-circuits exact and near-duplicate images
+- Images are preprocessed (downscale, threshold, crop) before Tesseract, and
+  obvious photos/logos are skipped without running OCR
+
+Author: Dev1
+Task: Non-Blocking OCR
+Date: October 19, 2026
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
+import pytesseract
+from PIL import Image
+from loguru import logger
+
+from src.scrapers.image_ocr_cache import ImageOCRCache, fingerprint_image
+from src.scrapers.image_preprocessing import preprocess_for_ocr
+
+
+NO_TEXT_FOUND = "No Text Found"
+
+
+def run_ocr(image_bytes: bytes, preprocess: bool = True) -> Tuple[str, float]:
+    """
+    Run Tesseract on raw image bytes (executed inside a worker process).
+
+    Args:
+        image_bytes: Encoded image (PNG, JPEG, ...)
+        preprocess: Downscale/threshold/crop first and skip text-free images
+
+    Returns:
+        Tuple of (extracted_text, ocr_seconds); text is "" for skipped images
+    """
+    started = time.perf_counter()
+    image = Image.open(BytesIO(image_bytes))
+    if preprocess:
+        image, reason = preprocess_for_ocr(image)
+        if image is None:
+            return "", time.perf_counter() - started
+    text = pytesseract.image_to_string(image).strip()
+    return text, time.perf_counter() - started
+
+
+@dataclass
+class OCRResult:
+    """Outcome of one OCR job."""
+
+    image_url: str
+    success: bool
+    text: str
+    error: Optional[str] = None
+    download_time: float = 0.0
+    queue_wait: float = 0.0
+    ocr_time: float = 0.0
+    cached: bool = False
+
+    def as_tuple(self) -> Tuple[bool, str, Optional[str]]:
+        """Return the (success, text_or_message, error) tuple used by MultimodalProcessor."""
+        return self.success, self.text, self.error
+
+
+class OCRService:
+    """
+    Async front-end to a process pool of Tesseract workers.
+
+    Usage:
+        async with OCRService() as ocr:
+            future = await ocr.submit("https://.../diagram.png")
+            result = await future
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        download_timeout: int = 10,
+        executor: Optional[Executor] = None,
+        cache: Optional[ImageOCRCache] = None,
+        preprocess: bool = True
+    ):
+        """
+        Initialize OCR service.
+
+        Args:
+            max_workers: OCR worker processes (default: CPU count)
+            queue_size: Max jobs waiting for a worker (default: 4 per worker)
+            download_timeout: Image download timeout in seconds
+            executor: Custom executor (mainly for tests); owned by caller
+            cache: Optional image OCR cache consulted before queueing a job
+            preprocess: Run the OCR preprocessing stage in the worker
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.queue_size = queue_size or self.max_workers * 4
+        self.download_timeout = download_timeout
+        self._executor = executor
+        self._owns_executor = executor is None
+        self.cache = cache
+        self.preprocess = preprocess
+        self._queue: Optional[asyncio.Queue] = None
+        self._dispatchers: List[asyncio.Task] = []
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        self.stats = {
+            'jobs': 0,
+            'cache_hits': 0,
+            'succeeded': 0,
+            'failed': 0,
+            'download_time': 0.0,
+            'queue_wait': 0.0,
+            'ocr_time': 0.0
+        }
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
+
+    async def start(self):
+        """Start the worker pool, HTTP session and queue dispatchers."""
+        if self._queue is not None:
+            return
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        self._session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.download_timeout)
+        )
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._dispatchers = [
+            asyncio.create_task(self._dispatch()) for _ in range(self.max_workers)
+        ]
+        logger.info(f"OCR service started ({self.max_workers} workers, queue size {self.queue_size})")
+
+    async def close(self):
+        """Drain outstanding jobs and shut down workers."""
+        if self._queue is None:
+            return
+        await self._queue.join()
+        for task in self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        self._dispatchers = []
+        self._queue = None
+        if self._session:
+            await self._session.close()
+            self._session = None
+        if self._owns_executor and self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        logger.info(
+            f"OCR service stopped: {self.stats['jobs']} jobs, "
+            f"{self.stats['cache_hits']} OCR runs saved by cache, "
+            f"queue wait {self.stats['queue_wait']:.2f}s, OCR {self.stats['ocr_time']:.2f}s"
+        )
+
+    async def submit(self, image_url: str) -> "asyncio.Future[OCRResult]":
+        """
+        Download an image and queue it for OCR.
+
+        Awaiting this call applies backpressure: it only returns once the job
+        fits in the bounded queue. Await the returned future for the result.
+
+        Args:
+            image_url: URL of image to process
+
+        Returns:
+            Future resolving to an OCRResult
+        """
+        await self.start()
+        future = asyncio.get_running_loop().create_future()
+
+        started = time.perf_counter()
+        try:
+            image_bytes = await self._download(image_url)
+        except Exception as e:
+            result = OCRResult(image_url, False, "", f"OCR error: {e}",
+                               download_time=time.perf_counter() - started)
+            self._record(result)
+            future.set_result(result)
+            return future
+
+        return await self.submit_bytes(image_bytes, image_url, download_time=time.perf_counter() - started)
+
+    async def submit_bytes(
+        self,
+        image_bytes: bytes,
+        image_url: str = "",
+        download_time: float = 0.0
+    ) -> "asyncio.Future[OCRResult]":
+        """
+        Queue already-downloaded image bytes (e.g. screenshots) for OCR.
+
+        Args:
+            image_bytes: Encoded image
+            image_url: Source identifier reported in the result
+            download_time: Seconds already spent fetching the bytes
+
+        Returns:
+            Future resolving to an OCRResult
+        """
+        await self.start()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        fingerprint = None
+        if self.cache is not None:
+            try:
+                fingerprint = await loop.run_in_executor(None, fingerprint_image, image_bytes)
+            except Exception as e:
+                logger.debug(f"Could not fingerprint image {image_url}: {e}")
+            if fingerprint is not None:
+                hit = self.cache.lookup(fingerprint)
+                if hit is not None:
+                    self.stats['cache_hits'] += 1
+                    future.set_result(OCRResult(
+                        image_url, True, hit['ocr_text'] if hit['has_text'] else NO_TEXT_FOUND, None,
+                        download_time=download_time, cached=True
+                    ))
+                    return future
+
+        await self._queue.put((image_bytes, image_url, download_time, time.perf_counter(), fingerprint, future))
+        return future
+
+    async def ocr(self, image_url: str) -> OCRResult:
+        """Download, OCR and wait for the result of a single image."""
+        return await (await self.submit(image_url))
+
+    async def _download(self, image_url: str) -> bytes:
+        """Fetch image bytes without blocking the event loop."""
+        async with self._session.get(image_url) as response:
+            response.raise_for_status()
+            return await response.read()
+
+    async def _dispatch(self):
+        """Move queued jobs into the executor, one at a time per dispatcher."""
+        loop = asyncio.get_running_loop()
+        while True:
+            image_bytes, image_url, download_time, enqueued_at, fingerprint, future = await self._queue.get()
+            queue_wait = time.perf_counter() - enqueued_at
+            try:
+                text, ocr_time = await loop.run_in_executor(
+                    self._executor, run_ocr, image_bytes, self.preprocess
+                )
+                if text:
+                    logger.debug(f"OCR extracted {len(text)} characters from image")
+                if self.cache is not None and fingerprint is not None:
+                    self.cache.put(fingerprint, text, has_text=bool(text))
+                result = OCRResult(
+                    image_url, True, text or NO_TEXT_FOUND, None,
+                    download_time=download_time, queue_wait=queue_wait, ocr_time=ocr_time
+                )
+            except Exception as e:
+                error_msg = f"OCR error: {str(e)}"
+                logger.warning(error_msg)
+                result = OCRResult(
+                    image_url, False, "", error_msg,
+                    download_time=download_time, queue_wait=queue_wait
+                )
+            finally:
+                self._queue.task_done()
+
+            self._record(result)
+            if not future.done():
+                future.set_result(result)
+
+    def _record(self, result: OCRResult):
+        """Accumulate timing statistics."""
+        self.stats['jobs'] += 1
+        self.stats['succeeded' if result.success else 'failed'] += 1
+        self.stats['download_time'] += result.download_time
+        self.stats['queue_wait'] += result.queue_wait
+        self.stats['ocr_time'] += result.ocr_time
+
+    def get_stats(self) -> Dict[str, float]:
+        """Return aggregate timings including per-job averages."""
+        jobs = self.stats['jobs'] or 1
+        return {
+            **self.stats,
+            'avg_queue_wait': self.stats['queue_wait'] / jobs,
+            'avg_ocr_time': self.stats['ocr_time'] / jobs
+        }
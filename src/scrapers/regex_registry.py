@@ -0,0 +1,175 @@
+"""
+Precompiled Regex Registry for Extractors
+
+Extractors used to keep their regexes as raw strings inside methods, so every
+call rebuilt the pattern list and went through `re`'s internal cache (a dict
+lookup plus flag checks) before matching, and the YouTube ID patterns were
+copied into several modules. Patterns now live here, compiled once at import
+time under dotted names, and extractors import the compiled objects.
+
+Where only the set of matches matters (boolean checks, deduplicated IDs), the
+alternatives are combined into one pattern so the text is scanned once.
+
+Usage:
+    ROI_PATTERNS = register_patterns('layer4.roi', {'roi': r'roi[:\\s]*...'}, re.IGNORECASE)
+    ROI_PATTERNS['roi'].findall(text)
+    get_pattern('layer4.roi.roi')
+    youtube_id('https://youtu.be/dQw4w9WgXcQ')
+"""
+
+import re
+import threading
+from typing import Dict, List, Mapping, Optional, Pattern, Sequence
+
+
+_registry: Dict[str, Pattern] = {}
+_compiled: Dict[tuple, Pattern] = {}
+_registry_lock = threading.Lock()
+
+
+def compiled(pattern: str, flags: int = 0) -> Pattern:
+    """
+    Compiled form of an ad-hoc pattern string, compiled once per (pattern, flags).
+
+    Unlike `re`'s own cache this is never evicted, so hot extractor loops
+    always hit it.
+    """
+    key = (pattern, flags)
+    regex = _compiled.get(key)
+    if regex is None:
+        regex = re.compile(pattern, flags)
+        _compiled[key] = regex
+    return regex
+
+
+def register_pattern(name: str, pattern: str, flags: int = 0) -> Pattern:
+    """
+    Compile and register one named pattern.
+
+    Args:
+        name: Dotted name, e.g. `youtube.url_id`
+        pattern: Regex source
+        flags: `re` flags
+
+    Returns:
+        Compiled pattern
+    """
+    regex = compiled(pattern, flags)
+    with _registry_lock:
+        _registry[name] = regex
+    return regex
+
+
+def register_patterns(namespace: str, patterns: Mapping[str, str], flags: int = 0) -> Dict[str, Pattern]:
+    """
+    Compile and register named patterns as `<namespace>.<name>`.
+
+    Returns:
+        Mapping of name to compiled pattern, in the given order
+    """
+    return {
+        name: register_pattern(f"{namespace}.{name}", pattern, flags)
+        for name, pattern in patterns.items()
+    }
+
+
+def register_pattern_list(namespace: str, patterns: Sequence[str], flags: int = 0) -> List[Pattern]:
+    """
+    Compile and register an ordered pattern list as `<namespace>.<index>`.
+
+    Returns:
+        Compiled patterns, in the given order
+    """
+    return [
+        register_pattern(f"{namespace}.{index}", pattern, flags)
+        for index, pattern in enumerate(patterns)
+    ]
+
+
+def register_pattern_groups(
+    namespace: str,
+    groups: Mapping[str, Sequence[str]],
+    flags: int = 0
+) -> Dict[str, List[Pattern]]:
+    """
+    Compile and register ordered pattern lists as `<namespace>.<group>.<index>`.
+
+    For extractors that try several patterns per metric, first match wins.
+
+    Returns:
+        Mapping of group to its compiled patterns, in the given order
+    """
+    return {
+        group: register_pattern_list(f"{namespace}.{group}", patterns, flags)
+        for group, patterns in groups.items()
+    }
+
+
+def get_pattern(name: str) -> Pattern:
+    """Return a registered pattern by dotted name."""
+    return _registry[name]
+
+
+def registered_patterns(prefix: str = "") -> Dict[str, Pattern]:
+    """All registered patterns, optionally only those under `prefix`."""
+    with _registry_lock:
+        return {name: regex for name, regex in _registry.items() if name.startswith(prefix)}
+
+
+# YouTube URLs and IDs, shared by the Layer 3 extractors and the E2E pipeline
+
+# Strict 11-character ID from a watch / short / embed URL
+YOUTUBE_URL_ID = register_pattern(
+    'youtube.url_id',
+    r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([a-zA-Z0-9_-]{11})'
+)
+
+# Everything up to the query string; callers check the ID length themselves
+YOUTUBE_URL_ID_LOOSE = register_pattern(
+    'youtube.url_id_loose',
+    r'youtube\.com/watch\?v=([^&]+)|youtu\.be/([^?]+)|youtube\.com/embed/([^?]+)'
+)
+
+# Watch / short / embed URL or n8n markdown `@[youtube](ID)`
+YOUTUBE_URL_OR_MARKDOWN_ID = register_pattern(
+    'youtube.url_or_markdown_id',
+    r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([\w-]{11})|@\[youtube\]\(([\w-]{11})\)'
+)
+
+# Links in free text; the union of the full-URL, bare-URL and markdown forms
+YOUTUBE_TEXT_LINK = register_pattern(
+    'youtube.text_link',
+    r'youtube\.com/watch\?v=([\w-]{11})|youtu\.be/([\w-]{11})|@\[youtube\]\(([\w-]{11})\)'
+)
+
+# Channel, handle, user, playlist or relative URLs are never single videos
+NON_VIDEO_URL = register_pattern(
+    'youtube.non_video_url',
+    r'youtube\.com/(?:c/|@|user/|playlist)|^/'
+)
+
+VIDEO_ID = register_pattern('youtube.video_id', r'^[\w-]{11}$')
+
+VIDEO_HOST_URL = register_pattern('video.host_url', r'youtube\.com|youtu\.be|vimeo\.com')
+
+
+def youtube_id(url: str, pattern: Pattern = YOUTUBE_URL_ID) -> Optional[str]:
+    """
+    Extract a YouTube video ID from a URL.
+
+    Args:
+        url: Video URL
+        pattern: One of the `youtube.*` ID patterns above
+
+    Returns:
+        The ID captured by whichever alternative matched, or None
+    """
+    match = pattern.search(url)
+    if match:
+        return match.group(match.lastindex)
+    return None
+
+
+def youtube_ids(text: str, pattern: Pattern = YOUTUBE_TEXT_LINK) -> List[str]:
+    """All IDs captured by `pattern` in `text`, in order of appearance."""
+    return [match.group(match.lastindex) for match in pattern.finditer(text)]
@@ -0,0 +1,254 @@
+"""
+Global Node-to-Sticky Assignment
+
+The per-node greedy matcher gives each node, in node order, the best sticky
+note nobody has taken yet, so the result depends on node order. This engine
+scores the whole canvas at once and assigns globally:
+- confidence_matrix: node x sticky confidence with the unified extractor's
+  scoring (proximity bands from vectorized distances, name containment and
+  word overlap from the precomputed StickyIndex token sets)
+- assign_stickies: 'sorted' takes pairs in descending confidence order (greedy
+  on the sorted matrix, run as vectorized rounds); 'optimal' maximizes total
+  confidence with the Hungarian algorithm (scipy, optional)
+- section_header_capacities: large stickies drawn behind several nodes
+  describe the whole section and may be attached to all of them
+
+Usage:
+    matrix = confidence_matrix(nodes, stickies)
+    pairs = assign_stickies(matrix, threshold=0.1, capacities=section_header_capacities(nodes, stickies))
+    for node_index, sticky_index, confidence in pairs:
+        ...
+"""
+
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.scrapers.sticky_index import StickyIndex
+
+logger = logging.getLogger(__name__)
+
+# Hungarian assignment is an optional dependency
+try:
+    from scipy.optimize import linear_sum_assignment
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+ASSIGNMENT_METHODS = ('sorted', 'optimal')
+
+# Proximity bands of the unified extractor: distance below BAND_LIMITS[k]
+# (and not below the previous limit) scores BAND_SCORES[k]
+BAND_LIMITS = np.array([150, 300, 500, 800, 1200], dtype=np.float64)
+BAND_SCORES = np.array([0.9, 0.7, 0.5, 0.3, 0.1, 0.0])
+
+
+def _positions(items: Sequence[Dict]) -> np.ndarray:
+    return np.array([[item['position']['x'], item['position']['y']] for item in items], dtype=np.float64).reshape(-1, 2)
+
+
+def confidence_matrix(nodes: List[Dict], stickies: List[Dict], index: Optional[StickyIndex] = None) -> np.ndarray:
+    """
+    Node x sticky confidence: max of proximity and name confidence.
+
+    Args:
+        nodes: Nodes with `name` and `position` {x, y}
+        stickies: Sticky notes with `name`, `content` and `position` {x, y}
+        index: Prebuilt index over `stickies` (built here if omitted)
+
+    Returns:
+        float64 array of shape (len(nodes), len(stickies))
+    """
+    node_total, sticky_total = len(nodes), len(stickies)
+    if not node_total or not sticky_total:
+        return np.zeros((node_total, sticky_total))
+    if index is None:
+        index = StickyIndex(stickies, cell_size=BAND_LIMITS[-1])
+
+    node_xy, sticky_xy = _positions(nodes), _positions(stickies)
+    dx = node_xy[:, 0:1] - sticky_xy[:, 0]
+    dy = node_xy[:, 1:2] - sticky_xy[:, 1]
+    distance = np.sqrt(dx ** 2 + dy ** 2)
+    # Band k holds distances with exactly k limits <= distance
+    band = np.searchsorted(BAND_LIMITS, distance, side='right')
+    proximity = BAND_SCORES[band]
+
+    # Name containment per node, one str.find sweep over the joined sticky texts
+    name = np.zeros((node_total, sticky_total))
+    node_words: List[set] = []
+    for row, node in enumerate(nodes):
+        node_name = node.get('name', '').lower()
+        node_words.append(set(node_name.split()))
+        name[row, list(index.in_contents(node_name))] = 0.6
+        name[row, list(index.in_titles(node_name))] = 0.8
+
+    # Word overlap: incidence matrices over the words nodes and stickies share
+    shared = sorted({word for words in node_words for word in words if word in index.word_index})
+    column = {word: position for position, word in enumerate(shared)}
+    node_incidence = np.zeros((node_total, len(shared)))
+    sticky_incidence = np.zeros((len(shared), sticky_total))
+    for row, words in enumerate(node_words):
+        node_incidence[row, [column[word] for word in words if word in column]] = 1.0
+    for word, position in column.items():
+        sticky_incidence[position, index.word_index[word]] = 1.0
+    common = node_incidence @ sticky_incidence
+    word_total = np.array([len(words) for words in node_words], dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        overlap = np.where(common > 0, 0.4 * (common / word_total[:, None]), 0.0)
+
+    return np.maximum(proximity, np.maximum(name, overlap))
+
+
+def section_header_capacities(nodes: List[Dict], stickies: List[Dict], min_nodes: int = 2) -> List[Optional[int]]:
+    """
+    Capacity per sticky: unlimited (None) for section headers, else 1.
+
+    A section header is a sticky whose rectangle (position x / y, width,
+    height) covers at least `min_nodes` node positions.
+    """
+    if not stickies:
+        return []
+    if not nodes:
+        return [1] * len(stickies)
+    node_xy = _positions(nodes)
+    corner = _positions(stickies)
+    size = np.array([
+        [sticky['position'].get('width') or 0, sticky['position'].get('height') or 0] for sticky in stickies
+    ], dtype=np.float64)
+    inside = (
+        (node_xy[:, None, :] >= corner[None, :, :]) & (node_xy[:, None, :] <= (corner + size)[None, :, :])
+    ).all(axis=2)
+    covered = inside.sum(axis=0)
+    return [None if count >= min_nodes else 1 for count in covered.tolist()]
+
+
+def _capacity_array(capacities: Optional[Sequence[Optional[int]]], sticky_total: int) -> np.ndarray:
+    if capacities is None:
+        return np.ones(sticky_total)
+    if len(capacities) != sticky_total:
+        raise ValueError(f"Expected {sticky_total} capacities, got {len(capacities)}")
+    return np.array([np.inf if capacity is None else capacity for capacity in capacities], dtype=np.float64)
+
+
+def _sorted_assignment(matrix: np.ndarray, threshold: float, capacity: np.ndarray) -> np.ndarray:
+    """
+    Greedy over the sorted matrix, without materializing the sort.
+
+    Equivalent to visiting pairs by (confidence desc, node asc, sticky asc) and
+    accepting a pair while its node is free and its sticky has capacity. Each
+    round accepts every pair that is its node's best remaining choice and that
+    fewer nodes outrank in its sticky column than the sticky has capacity left:
+    no pair visited earlier can still take that slot.
+    """
+    score = np.where(matrix > threshold, matrix, -np.inf)
+    score[:, capacity <= 0] = -np.inf
+    remaining = capacity.copy()
+    assignment = np.full(matrix.shape[0], -1, dtype=np.int64)
+    rows = np.arange(matrix.shape[0])
+
+    while rows.size:
+        block = score[rows]
+        best = block.argmax(axis=1)
+        value = block[np.arange(rows.size), best]
+        live = value > -np.inf
+        rows, block, best, value = rows[live], block[live], best[live], value[live]
+        if not rows.size:
+            break
+
+        # Unlimited stickies never run out; a sticky with one slot left goes to
+        # its column's top node (argmax keeps the lowest node on ties)
+        order = np.arange(rows.size)
+        slots = remaining[best]
+        accept = np.isinf(slots) | ((slots == 1) & (block.argmax(axis=0)[best] == order))
+
+        # Otherwise count the active nodes ahead of the candidate in its column
+        several = np.isfinite(slots) & (slots > 1)
+        if several.any():
+            column = block[:, best[several]]
+            ahead = (column > value[several]) | ((column == value[several]) & (order[:, None] < order[several][None, :]))
+            accept[several] = ahead.sum(axis=0) < slots[several]
+
+        assignment[rows[accept]] = best[accept]
+        taken = np.bincount(best[accept], minlength=remaining.size)
+        remaining -= taken
+        score[:, (taken > 0) & (remaining <= 0)] = -np.inf
+        rows = rows[~accept]
+
+    return assignment
+
+
+def _optimal_assignment(matrix: np.ndarray, threshold: float, capacity: np.ndarray) -> np.ndarray:
+    """
+    Maximum total confidence (Hungarian algorithm).
+
+    Finite capacities become repeated columns; all unlimited stickies collapse
+    into one private column per node holding that node's best unlimited score.
+    """
+    node_total, sticky_total = matrix.shape
+    score = np.where(matrix > threshold, matrix, 0.0)
+
+    limited = np.flatnonzero(np.isfinite(capacity) & (capacity > 0))
+    columns = np.repeat(limited, np.minimum(capacity[limited], node_total).astype(np.int64))
+    blocks = [score[:, columns]]
+
+    unlimited = np.flatnonzero(np.isinf(capacity))
+    if unlimited.size:
+        best_unlimited = unlimited[score[:, unlimited].argmax(axis=1)]
+        private = np.zeros((node_total, node_total))
+        private[np.arange(node_total), np.arange(node_total)] = score[np.arange(node_total), best_unlimited]
+        blocks.append(private)
+
+    profit = np.hstack(blocks)
+    assignment = np.full(node_total, -1, dtype=np.int64)
+    if not profit.size:
+        return assignment
+    node_rows, profit_columns = linear_sum_assignment(profit, maximize=True)
+    for row, profit_column in zip(node_rows, profit_columns, strict=True):
+        if profit[row, profit_column] <= threshold:
+            continue
+        if profit_column < columns.size:
+            assignment[row] = columns[profit_column]
+        else:
+            assignment[row] = best_unlimited[row]
+    return assignment
+
+
+def assign_stickies(
+    matrix: np.ndarray,
+    threshold: float = 0.1,
+    capacities: Optional[Sequence[Optional[int]]] = None,
+    method: str = 'sorted'
+) -> List[Tuple[int, int, float]]:
+    """
+    Assign each node at most one sticky from a confidence matrix.
+
+    Args:
+        matrix: Node x sticky confidence
+        threshold: Pairs must score strictly above this
+        capacities: Nodes each sticky may take (None entry = unlimited); default 1
+        method: 'sorted' (greedy on the sorted matrix) or 'optimal' (Hungarian;
+            falls back to 'sorted' when scipy is not installed)
+
+    Returns:
+        (node_index, sticky_index, confidence) per assigned node, in node order
+    """
+    if method not in ASSIGNMENT_METHODS:
+        raise ValueError(f"Unknown assignment method '{method}'; expected one of {ASSIGNMENT_METHODS}")
+    matrix = np.asarray(matrix, dtype=np.float64)
+    if not matrix.size:
+        return []
+    capacity = _capacity_array(capacities, matrix.shape[1])
+
+    if method == 'optimal' and not SCIPY_AVAILABLE:
+        logger.warning("Optimal sticky assignment unavailable: install scipy (using sorted greedy)")
+        method = 'sorted'
+    if method == 'optimal':
+        assignment = _optimal_assignment(matrix, threshold, capacity)
+    else:
+        assignment = _sorted_assignment(matrix, threshold, capacity)
+
+    return [
+        (node, int(sticky), float(matrix[node, sticky]))
+        for node, sticky in enumerate(assignment.tolist()) if sticky >= 0
+    ]
@@ -0,0 +1,194 @@
+"""
+Spatial and Text Index over Sticky Notes
+
+Node-to-sticky matching used to score every node against every sticky note,
+lower-casing and splitting the full sticky content on each comparison. A
+StickyIndex is built once per canvas and answers, per node, which stickies can
+score above zero at all:
+- stickies near the node (uniform grid, cell size = proximity radius)
+- stickies whose title or content contains the node name (one C-level
+  `str.find` sweep over the joined texts)
+- stickies sharing a word with the node (inverted word index)
+
+Only those candidates are scored, in sticky order, so the first-best-match
+semantics of the pairwise loops are preserved.
+
+Usage:
+    index = StickyIndex(stickies, cell_size=1200)
+    for position in index.candidates(x, y, radius=1200, needles=[name], words=set(name.split())):
+        ...
+"""
+
+import math
+from bisect import bisect_right
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+# Separator between joined sticky texts; never part of a node name
+_SEPARATOR = '\x00'
+
+
+def _joined(texts: List[str]) -> Tuple[str, List[int]]:
+    """Join texts with the separator; return the string and each text's start offset."""
+    starts = []
+    offset = 0
+    for text in texts:
+        starts.append(offset)
+        offset += len(text) + 1
+    return _SEPARATOR.join(texts), starts
+
+
+def sticky_point(sticky: Dict[str, Any]) -> Tuple[float, float]:
+    """Sticky position used for proximity: the center if known, else x / y."""
+    position = sticky.get('position') or {}
+    return position.get('center_x', position.get('x', 0)), position.get('center_y', position.get('y', 0))
+
+
+class StickyIndex:
+    """
+    Per-canvas index of sticky notes for candidate lookup.
+
+    Texts are lower-cased and split once at build time; `titles[i]`,
+    `contents[i]` and `words[i]` belong to `stickies[i]`.
+    """
+
+    def __init__(
+        self,
+        stickies: List[Dict[str, Any]],
+        cell_size: float,
+        title_key: str = 'name',
+        point: Callable[[Dict[str, Any]], Tuple[float, float]] = sticky_point
+    ):
+        """
+        Build the index.
+
+        Args:
+            stickies: Sticky note dicts with `content`, a title field and a position
+            cell_size: Grid cell size; use the largest proximity radius queried
+            title_key: Title field (`name` for JSON stickies, `title` for iframe ones)
+            point: Sticky position accessor
+        """
+        self.stickies = stickies
+        self.cell_size = float(cell_size)
+        self.titles = [sticky.get(title_key, '').lower() for sticky in stickies]
+        self.contents = [sticky.get('content', '').lower() for sticky in stickies]
+        self.words = [set(f"{title} {content}".split()) for title, content in zip(self.titles, self.contents, strict=True)]
+
+        self.word_index: Dict[str, List[int]] = {}
+        for position, words in enumerate(self.words):
+            for word in words:
+                self.word_index.setdefault(word, []).append(position)
+
+        self.points: List[Tuple[float, float]] = []
+        self.grid: Dict[Tuple[int, int], List[int]] = {}
+        for position, sticky in enumerate(stickies):
+            x, y = point(sticky)
+            self.points.append((x, y))
+            self.grid.setdefault(self._cell(x, y), []).append(position)
+
+        self._title_positions: Dict[str, List[int]] = {}
+        for position, title in enumerate(self.titles):
+            if title and _SEPARATOR not in title:
+                self._title_positions.setdefault(title, []).append(position)
+
+        self._titles_joined, self._title_starts = _joined(self.titles)
+        self._contents_joined, self._content_starts = _joined(self.contents)
+
+    def __len__(self) -> int:
+        return len(self.stickies)
+
+    def _cell(self, x: float, y: float) -> Optional[Tuple[int, int]]:
+        """Grid cell of a point; None for inf / nan, which is never within any distance."""
+        try:
+            return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+        except (OverflowError, ValueError):
+            return None
+
+    def near(self, x: float, y: float, radius: float) -> Set[int]:
+        """Stickies in the grid cells that can lie within `radius` of (x, y)."""
+        cell = self._cell(x, y)
+        if cell is None:
+            return set()
+        reach = max(1, math.ceil(radius / self.cell_size))
+        found: Set[int] = set()
+        for dx in range(-reach, reach + 1):
+            for dy in range(-reach, reach + 1):
+                found.update(self.grid.get((cell[0] + dx, cell[1] + dy), ()))
+        return found
+
+    def titles_within(self, *texts: str) -> Set[int]:
+        """Stickies with a non-empty lower-cased title contained in any of `texts`."""
+        if any(_SEPARATOR in text for text in texts):
+            return {
+                position for position, title in enumerate(self.titles)
+                if title and any(title in text for text in texts)
+            }
+        # One containment test per distinct title against all texts at once;
+        # titles with the separator cannot occur in separator-free texts
+        haystack = _SEPARATOR.join(texts)
+        found: Set[int] = set()
+        for title, positions in self._title_positions.items():
+            if title in haystack:
+                found.update(positions)
+        return found
+
+    def containing(self, needle: str) -> Set[int]:
+        """Stickies whose lower-cased title or content contains `needle`."""
+        return self.in_titles(needle) | self.in_contents(needle)
+
+    def in_titles(self, needle: str) -> Set[int]:
+        """Stickies whose lower-cased title contains `needle`."""
+        return self._find(self._titles_joined, self._title_starts, self.titles, needle)
+
+    def in_contents(self, needle: str) -> Set[int]:
+        """Stickies whose lower-cased content contains `needle`."""
+        return self._find(self._contents_joined, self._content_starts, self.contents, needle)
+
+    @staticmethod
+    def _find(joined: str, starts: List[int], texts: List[str], needle: str) -> Set[int]:
+        if _SEPARATOR in needle:
+            return {position for position, text in enumerate(texts) if needle in text}
+        if not needle:
+            return set(range(len(texts)))
+        found: Set[int] = set()
+        offset = joined.find(needle)
+        while offset != -1:
+            sticky = bisect_right(starts, offset) - 1
+            found.add(sticky)
+            # Skip to the next sticky's text
+            offset = joined.find(needle, starts[sticky + 1] if sticky + 1 < len(starts) else len(joined))
+        return found
+
+    def sharing_words(self, words: Iterable[str]) -> Set[int]:
+        """Stickies sharing at least one word with `words`."""
+        found: Set[int] = set()
+        for word in words:
+            found.update(self.word_index.get(word, ()))
+        return found
+
+    def candidates(
+        self,
+        x: float,
+        y: float,
+        radius: float,
+        needles: Iterable[str] = (),
+        words: Iterable[str] = (),
+        exclude: Optional[List[bool]] = None
+    ) -> List[int]:
+        """
+        Sticky positions that can score above zero for a node, in sticky order.
+
+        Args:
+            x, y: Node position
+            radius: Proximity radius beyond which proximity scores zero
+            needles: Lower-cased node strings scored by containment
+            words: Lower-cased node words scored by overlap
+            exclude: Flags of stickies to leave out (e.g. already matched)
+        """
+        found = self.near(x, y, radius)
+        for needle in needles:
+            found |= self.containing(needle)
+        found |= self.sharing_words(words)
+        if exclude is not None:
+            found = {position for position in found if not exclude[position]}
+        return sorted(found)
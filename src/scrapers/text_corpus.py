@@ -0,0 +1,185 @@
+"""
+Per-Workflow Text Corpus for Analytics Layers
+
+Layers 4-7 all read title / description / use_case / explainer text out of
+the nested `workflow_data['layers']` dict, join and lower-case them, then run
+keyword and regex scans. A WorkflowTextCorpus is built once per workflow and
+passed to every layer, so each combined text is built once and every scan,
+regex match, token list and sentence split is computed at most once.
+
+Usage:
+    corpus = WorkflowTextCorpus(workflow_data)
+    await layer4.extract(workflow_data, corpus=corpus)
+    await layer5.extract(workflow_data, corpus=corpus)
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Pattern, Tuple, Union
+
+from src.scrapers.keyword_matcher import KeywordScan, get_keyword_matcher
+from src.scrapers.regex_registry import compiled
+from src.scrapers.workflow_graph import layer2_graph_metrics
+
+
+CONTENT_FIELDS = ('explainer_text', 'setup_instructions', 'use_instructions')
+METADATA_FIELDS = ('title', 'description', 'use_case')
+
+TOKEN_RE = re.compile(r"\w+")
+SENTENCE_END_RE = re.compile(r"[.!?]+(?:\s+|$)|\n+")
+
+_UNSET = object()
+
+
+class WorkflowTextCorpus:
+    """
+    Normalized text views of one workflow, with cached scans.
+
+    Layer data is read lazily, so a missing or failed layer raises inside the
+    layer that needs it, exactly as direct dict access did.
+    """
+
+    def __init__(self, workflow_data: Dict[str, Any], graph_metrics: Any = _UNSET):
+        """
+        Initialize corpus.
+
+        Args:
+            workflow_data: Combined data from previous layers
+            graph_metrics: Precomputed connection-graph metrics (or None), e.g.
+                from a batch run; computed on first use if not given
+        """
+        self.workflow_data = workflow_data
+        self._graph_metrics = graph_metrics
+        self._joined: Dict[Tuple[Tuple[str, ...], str], str] = {}
+        self._scans: Dict[str, KeywordScan] = {}
+        self._regex: Dict[Tuple[str, Any, str], Any] = {}
+        self._tokens: Dict[str, List[str]] = {}
+        self._sentences: Dict[str, List[Tuple[int, int]]] = {}
+
+    def layer(self, name: str) -> Dict[str, Any]:
+        """Data dict of a previous layer (`layer1`, `layer2`, ...)."""
+        return self.workflow_data.get('layers', {}).get(name, {}).get('data', {})
+
+    @property
+    def layer1(self) -> Dict[str, Any]:
+        return self.layer('layer1')
+
+    @property
+    def layer2(self) -> Dict[str, Any]:
+        return self.layer('layer2')
+
+    @property
+    def layer3(self) -> Dict[str, Any]:
+        return self.layer('layer3')
+
+    @property
+    def graph_metrics(self) -> Optional[Dict[str, Any]]:
+        """
+        Connection-graph metrics of the Layer 2 workflow JSON, computed once.
+
+        None if the workflow JSON is missing or has no usable nodes.
+        """
+        if self._graph_metrics is _UNSET:
+            try:
+                layer2_data = self.layer2
+            except AttributeError:
+                layer2_data = None
+            self._graph_metrics = layer2_graph_metrics(layer2_data)
+        return self._graph_metrics
+
+    def raw(self, field: str) -> str:
+        """Original (not lower-cased) text of a layer 1 or layer 3 field."""
+        source = self.layer1 if field in METADATA_FIELDS else self.layer3
+        return source.get(field, '')
+
+    def text(self, *fields: str, sep: str = " ") -> str:
+        """
+        Lower-cased join of fields, built once per (fields, separator).
+
+        Args:
+            fields: Layer 1 / layer 3 field names
+            sep: Separator between fields
+
+        Returns:
+            Combined lower-cased text
+        """
+        key = (fields, sep)
+        joined = self._joined.get(key)
+        if joined is None:
+            joined = sep.join(self.raw(field) for field in fields).lower()
+            self._joined[key] = joined
+        return joined
+
+    @property
+    def content(self) -> str:
+        """Explainer, setup and usage instructions (used by layers 4-7)."""
+        return self.text(*CONTENT_FIELDS)
+
+    @property
+    def metadata(self) -> str:
+        """Title, description and use case."""
+        return self.text(*METADATA_FIELDS)
+
+    @property
+    def context(self) -> str:
+        """Title, description, use case and explainer text."""
+        return self.text('title', 'description', 'use_case', 'explainer_text')
+
+    def scan(self, text: str) -> KeywordScan:
+        """Keyword scan of `text` with the shared matcher, computed once per text."""
+        result = self._scans.get(text)
+        if result is None:
+            result = get_keyword_matcher().scan(text)
+            self._scans[text] = result
+        return result
+
+    def findall(self, pattern: Union[str, Pattern], text: str, flags: int = re.IGNORECASE) -> List[Any]:
+        """
+        Cached `findall` of `pattern` over `text`.
+
+        Args:
+            pattern: Compiled pattern (flags ignored) or pattern string
+            text: Text to search
+            flags: Flags for a pattern string
+
+        Returns:
+            Same list as `re.findall`
+        """
+        regex = self._compiled(pattern, flags)
+        key = ('findall', regex, text)
+        if key not in self._regex:
+            self._regex[key] = regex.findall(text)
+        return self._regex[key]
+
+    def search(self, pattern: Union[str, Pattern], text: str, flags: int = re.IGNORECASE) -> Optional[re.Match]:
+        """Cached `search` of `pattern` over `text` (arguments as for findall)."""
+        regex = self._compiled(pattern, flags)
+        key = ('search', regex, text)
+        if key not in self._regex:
+            self._regex[key] = regex.search(text)
+        return self._regex[key]
+
+    @staticmethod
+    def _compiled(pattern: Union[str, Pattern], flags: int) -> Pattern:
+        if isinstance(pattern, str):
+            return compiled(pattern, flags)
+        return pattern
+
+    def tokens(self, text: str) -> List[str]:
+        """Word tokens of `text`."""
+        if text not in self._tokens:
+            self._tokens[text] = TOKEN_RE.findall(text)
+        return self._tokens[text]
+
+    def sentences(self, text: str) -> List[Tuple[int, int]]:
+        """Sentence boundaries of `text` as (start, end) offsets."""
+        if text not in self._sentences:
+            bounds = []
+            start = 0
+            for match in SENTENCE_END_RE.finditer(text):
+                if text[start:match.start()].strip():
+                    bounds.append((start, match.start()))
+                start = match.end()
+            if text[start:].strip():
+                bounds.append((start, len(text)))
+            self._sentences[text] = bounds
+        return self._sentences[text]
@@ -0,0 +1,279 @@
+"""
+Global YouTube Transcript Cache
+
+The same tutorial videos are embedded in many n8n templates, so transcripts are
+cached across workflows keyed by (video_id, language) instead of being re-extracted
+for every workflow that embeds them.
+
+Features:
+- Persistent SQLite store (survives between runs)
+- Negative caching: permanent failures ("no transcript", no transcript panel)
+  are stored with a shorter TTL
+- Single-flight: concurrent requests for the same video share one extraction
+
+Author: Dev1
+Task: Global Transcript Cache
+Date: October 19, 2026
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from loguru import logger
+
+
+# (success, transcript_text, error_message) - same contract as TranscriptExtractor
+TranscriptResult = Tuple[bool, Optional[str], Optional[str]]
+
+DEFAULT_CACHE_PATH = os.getenv("TRANSCRIPT_CACHE_PATH", "data/transcript_cache.db")
+DEFAULT_LANGUAGE = "English"
+
+STATUS_AVAILABLE = "available"
+STATUS_UNAVAILABLE = "unavailable"
+
+# Transcripts rarely change once published; missing captions are often added later.
+AVAILABLE_TTL_SECONDS = 30 * 24 * 3600
+UNAVAILABLE_TTL_SECONDS = 24 * 3600
+
+# Extractor errors (lowercased substrings) meaning the video itself has no usable
+# transcript; retrying won't help until captions are added. Any other failure
+# (timeouts, browser crashes, a transcript panel that didn't open behind a
+# consent overlay or slow load) is transient and not cached.
+PERMANENT_FAILURES = (
+    "no transcript",
+)
+
+
+class TranscriptCache:
+    """
+    Persistent transcript store keyed by YouTube video ID and language.
+
+    Only definitive outcomes are cached: a transcript, or a permanent failure
+    (PERMANENT_FAILURES). Transient failures (timeouts, browser crashes) are never stored
+    so the next caller retries them.
+    """
+
+    def __init__(
+        self,
+        db_path: str = DEFAULT_CACHE_PATH,
+        available_ttl: int = AVAILABLE_TTL_SECONDS,
+        unavailable_ttl: int = UNAVAILABLE_TTL_SECONDS
+    ):
+        """
+        Initialize transcript cache.
+
+        Args:
+            db_path: Path to SQLite cache file (":memory:" for a process-local cache)
+            available_ttl: Seconds a cached transcript stays valid
+            unavailable_ttl: Seconds a cached "no transcript" verdict stays valid
+        """
+        self.db_path = db_path
+        self.available_ttl = available_ttl
+        self.unavailable_ttl = unavailable_ttl
+        self._lock = threading.Lock()
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._init_schema()
+
+        self.stats = {
+            'hits': 0,
+            'negative_hits': 0,
+            'misses': 0,
+            'coalesced': 0,
+            'stored': 0
+        }
+
+    def _init_schema(self):
+        """Create cache table if it doesn't exist."""
+        with self._lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS transcript_cache (
+                    video_id TEXT NOT NULL,
+                    language TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    transcript TEXT,
+                    error TEXT,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (video_id, language)
+                )
+            """)
+            self._conn.commit()
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def get(self, video_id: str, language: str = DEFAULT_LANGUAGE) -> Optional[TranscriptResult]:
+        """
+        Look up a cached transcript result.
+
+        Args:
+            video_id: YouTube video ID
+            language: Transcript language
+
+        Returns:
+            Cached (success, transcript, error) tuple, or None if missing/expired
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, transcript, error, fetched_at FROM transcript_cache "
+                "WHERE video_id = ? AND language = ?",
+                (video_id, language)
+            ).fetchone()
+
+        if not row:
+            return None
+
+        status, transcript, error, fetched_at = row
+        ttl = self.available_ttl if status == STATUS_AVAILABLE else self.unavailable_ttl
+        if time.time() - fetched_at > ttl:
+            return None
+
+        if status == STATUS_AVAILABLE:
+            return True, transcript, None
+        return False, None, error or "No transcript available (cached)"
+
+    def put(self, video_id: str, result: TranscriptResult, language: str = DEFAULT_LANGUAGE) -> bool:
+        """
+        Store a transcript result if it is definitive.
+
+        Args:
+            video_id: YouTube video ID
+            result: (success, transcript, error) tuple from an extractor
+            language: Transcript language
+
+        Returns:
+            True if the result was cached
+        """
+        status = self._classify(result)
+        if status is None:
+            return False
+
+        success, transcript, error = result
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO transcript_cache "
+                "(video_id, language, status, transcript, error, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    video_id,
+                    language,
+                    status,
+                    transcript if status == STATUS_AVAILABLE else None,
+                    error if status == STATUS_UNAVAILABLE else None,
+                    time.time()
+                )
+            )
+            self._conn.commit()
+        self.stats['stored'] += 1
+        return True
+
+    def invalidate(self, video_id: str, language: Optional[str] = None):
+        """Drop cached entries for a video (all languages if language is None)."""
+        with self._lock:
+            if language is None:
+                self._conn.execute("DELETE FROM transcript_cache WHERE video_id = ?", (video_id,))
+            else:
+                self._conn.execute(
+                    "DELETE FROM transcript_cache WHERE video_id = ? AND language = ?",
+                    (video_id, language)
+                )
+            self._conn.commit()
+
+    async def get_or_fetch(
+        self,
+        video_id: str,
+        fetch: Callable[[], Awaitable[TranscriptResult]],
+        language: str = DEFAULT_LANGUAGE
+    ) -> TranscriptResult:
+        """
+        Return a cached transcript or run `fetch` exactly once per video.
+
+        Concurrent callers asking for the same (video_id, language) while a fetch
+        is in flight await the same result instead of opening another YouTube session.
+
+        Args:
+            video_id: YouTube video ID
+            fetch: Zero-argument coroutine factory returning (success, transcript, error)
+            language: Transcript language
+
+        Returns:
+            Tuple of (success, transcript_text, error_message)
+        """
+        cached = self.get(video_id, language)
+        if cached is not None:
+            if cached[0]:
+                self.stats['hits'] += 1
+            else:
+                self.stats['negative_hits'] += 1
+            logger.debug(f"Transcript cache hit for {video_id} ({language})")
+            return cached
+
+        key = (video_id, language)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats['coalesced'] += 1
+            logger.debug(f"Joining in-flight transcript extraction for {video_id}")
+            return await asyncio.shield(inflight)
+
+        self.stats['misses'] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fetch()
+            self.put(video_id, result, language)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an un-awaited future doesn't log "exception never retrieved"
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    @staticmethod
+    def _classify(result: TranscriptResult) -> Optional[str]:
+        """Map an extractor result to a cache status, or None if it is transient."""
+        success, transcript, error = result
+        if success and transcript:
+            return STATUS_AVAILABLE
+        if is_permanent_failure(error):
+            return STATUS_UNAVAILABLE
+        return None
+
+
+def is_permanent_failure(error: Optional[str]) -> bool:
+    """
+    Whether an extractor error means the video has no usable transcript.
+
+    Args:
+        error: Error message from an extractor (None on success)
+
+    Returns:
+        True for permanent failures (see PERMANENT_FAILURES), False for transient ones
+    """
+    if not error:
+        return False
+    error = error.lower()
+    return any(failure in error for failure in PERMANENT_FAILURES)
+
+
+_default_cache: Optional[TranscriptCache] = None
+
+
+def get_transcript_cache() -> TranscriptCache:
+    """Get the process-wide transcript cache (created on first use)."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = TranscriptCache()
+    return _default_cache
@@ -16,6 +16,8 @@ from typing import Optional, Tuple, List
 from playwright.async_api import Page, Browser, async_playwright, TimeoutError as PlaywrightTimeout
 from loguru import logger
 
+from src.scrapers.transcript_cache import TranscriptCache
+
 
 class TranscriptExtractor:
     """
@@ -29,13 +31,21 @@ class TranscriptExtractor:
     Performance: ~25-30 seconds per video
     """
     
-    def __init__(self, headless: bool = True, timeout: int = 30000, preferred_langs: Optional[List[str]] = None):
+    def __init__(
+        self,
+        headless: bool = True,
+        timeout: int = 30000,
+        preferred_langs: Optional[List[str]] = None,
+        cache: Optional[TranscriptCache] = None
+    ):
         """
         Initialize transcript extractor.
         
         Args:
             headless: Run browser in headless mode
             timeout: Timeout for page operations in milliseconds
+            preferred_langs: Transcript languages to select, in order of preference
+            cache: Optional shared transcript cache checked before opening YouTube
         """
         self.headless = headless
         self.timeout = timeout
@@ -44,12 +54,13 @@ class TranscriptExtractor:
             "English (auto-generated)",
             "English (United States)",
         ]
+        self.cache = cache
         self.browser: Optional[Browser] = None
         self.playwright = None
+        self._launch_lock = asyncio.Lock()
     
     async def __aenter__(self):
-        """Async context manager entry - setup browser."""
-        await self.initialize()
+        """Async context manager entry - the browser is launched on first use."""
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -62,6 +73,12 @@ class TranscriptExtractor:
         self.browser = await self.playwright.chromium.launch(headless=self.headless)
         logger.info("TranscriptExtractor initialized")
     
+    async def _ensure_browser(self):
+        """Launch the browser once, on the first uncached extraction (cache hits never start Chromium)."""
+        async with self._launch_lock:
+            if self.browser is None:
+                await self.initialize()
+    
     async def cleanup(self):
         """Cleanup browser and Playwright."""
         if self.browser:
@@ -82,17 +99,53 @@ class TranscriptExtractor:
             video_url: Full YouTube video URL
             video_id: YouTube video ID
             
+        Returns:
+            Tuple of (success, transcript_text, error_message)
+        """
+        if self.cache is not None:
+            return await self.cache.get_or_fetch(
+                video_id,
+                lambda: self._extract_transcript_uncached(video_url, video_id),
+                language=self.preferred_langs[0]
+            )
+        return await self._extract_transcript_uncached(video_url, video_id)
+    
+    async def _extract_transcript_uncached(
+        self,
+        video_url: str,
+        video_id: str
+    ) -> Tuple[bool, Optional[str], Optional[str]]:
+        """Extract transcript from YouTube without consulting the cache."""
+        await self._ensure_browser()
+        return await self._extract_transcript_in(self.browser, video_url, video_id)
+    
+    async def _extract_transcript_in(
+        self,
+        target,
+        video_url: str,
+        video_id: str,
+        timeout: Optional[int] = None
+    ) -> Tuple[bool, Optional[str], Optional[str]]:
+        """
+        Run a single extraction attempt in a new page.
+        
+        Args:
+            target: Browser or BrowserContext to open the page in
+            video_url: Full YouTube video URL
+            video_id: YouTube video ID
+            timeout: Navigation timeout override in milliseconds
+            
         Returns:
             Tuple of (success, transcript_text, error_message)
         """
         page = None
         
         try:
-            page = await self.browser.new_page()
+            page = await target.new_page()
             
             # Step 1: Navigate to video page
             logger.debug(f"Navigating to video {video_id}")
-            await page.goto(video_url, timeout=self.timeout)
+            await page.goto(video_url, timeout=timeout or self.timeout)
             await page.wait_for_load_state("networkidle", timeout=10000)
             await asyncio.sleep(2)  # Wait for dynamic content
             
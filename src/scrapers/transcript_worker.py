@@ -0,0 +1,133 @@
+"""
+Transcript Worker - One Long-Lived Browser for Many Videos
+
+Extends TranscriptExtractor so that a single Chromium instance serves every
+video and every retry:
+- Each attempt runs in a fresh BrowserContext (clean cookies/storage) instead of
+  a fresh browser launch
+- Videos are processed concurrently, bounded by `max_pages` open tabs
+- Per-video attempt timings are recorded for diagnostics
+
+Author: Dev1
+Task: Transcript Browser Reuse
+Date: October 19, 2026
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional, Tuple, Any
+
+from loguru import logger
+
+from src.scrapers.transcript_cache import TranscriptCache, is_permanent_failure
+from src.scrapers.transcript_extractor import TranscriptExtractor
+
+
+class TranscriptWorker(TranscriptExtractor):
+    """
+    Transcript extractor that owns one browser with up to N concurrent tabs.
+
+    The browser is launched lazily on the first uncached extraction, so runs
+    where every transcript is already cached never start Chromium.
+    """
+
+    def __init__(
+        self,
+        headless: bool = True,
+        timeout: int = 30000,
+        preferred_langs: Optional[List[str]] = None,
+        cache: Optional[TranscriptCache] = None,
+        max_pages: int = 3,
+        max_attempts: int = 5,
+        timeout_step: int = 10000
+    ):
+        """
+        Initialize transcript worker.
+
+        Args:
+            headless: Run browser in headless mode
+            timeout: Timeout for the first attempt in milliseconds
+            preferred_langs: Transcript languages to select, in order of preference
+            cache: Optional shared transcript cache checked before opening YouTube
+            max_pages: Maximum number of videos processed concurrently (open tabs)
+            max_attempts: Attempts per video before giving up
+            timeout_step: Extra milliseconds of timeout added on each retry
+        """
+        super().__init__(headless=headless, timeout=timeout, preferred_langs=preferred_langs, cache=cache)
+        self.max_pages = max_pages
+        self.max_attempts = max_attempts
+        self.timeout_step = timeout_step
+        self._page_slots = asyncio.Semaphore(max_pages)
+
+        # video_id -> list of {attempt, seconds, success, error}
+        self.attempt_timings: Dict[str, List[Dict[str, Any]]] = {}
+
+    async def _extract_transcript_uncached(
+        self,
+        video_url: str,
+        video_id: str
+    ) -> Tuple[bool, Optional[str], Optional[str]]:
+        """Extract a transcript with retries, each in a fresh context of the shared browser."""
+        async with self._page_slots:
+            await self._ensure_browser()
+            timings = self.attempt_timings.setdefault(video_id, [])
+            error = None
+
+            for attempt in range(self.max_attempts):
+                timeout = self.timeout + attempt * self.timeout_step
+                started = time.perf_counter()
+                context = None
+                try:
+                    context = await self.browser.new_context()
+                    success, transcript, error = await self._extract_transcript_in(
+                        context, video_url, video_id, timeout=timeout
+                    )
+                except Exception as e:
+                    success, transcript, error = False, None, f"Transcript extraction error: {e}"
+                finally:
+                    if context:
+                        try:
+                            await context.close()
+                        except Exception:
+                            pass
+
+                timings.append({
+                    'attempt': attempt + 1,
+                    'seconds': round(time.perf_counter() - started, 3),
+                    'success': bool(success and transcript),
+                    'error': error
+                })
+
+                if success and transcript and len(transcript.strip()) > 50:
+                    return True, transcript, None
+                if is_permanent_failure(error):
+                    return False, None, error
+
+                if attempt < self.max_attempts - 1:
+                    wait_time = 2 ** attempt  # 1s, 2s, 4s, 8s
+                    logger.debug(f"Retry {attempt + 1}/{self.max_attempts} for {video_id} in {wait_time}s")
+                    await asyncio.sleep(wait_time)
+
+            return False, None, error or "Max retries exceeded"
+
+    async def extract_many(
+        self,
+        videos: List[Tuple[str, str]]
+    ) -> List[Tuple[bool, Optional[str], Optional[str]]]:
+        """
+        Extract transcripts for many videos concurrently (bounded by max_pages).
+
+        Args:
+            videos: List of (video_url, video_id) pairs
+
+        Returns:
+            Results in the same order as `videos`
+        """
+        results = await asyncio.gather(
+            *[self.extract_transcript(url, video_id) for url, video_id in videos],
+            return_exceptions=True
+        )
+        return [
+            (False, None, f"Transcript extraction error: {r}") if isinstance(r, Exception) else r
+            for r in results
+        ]
@@ -17,12 +17,16 @@ Date: October 16, 2025
 
 import asyncio
 import json
-import re
 import time
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 import logging
 from src.scrapers.layer2_json import WorkflowJSONExtractor
+from src.scrapers.regex_registry import YOUTUBE_URL_OR_MARKDOWN_ID, youtube_id
+from src.scrapers.sticky_assignment import ASSIGNMENT_METHODS, assign_stickies, confidence_matrix, section_header_capacities
+from src.scrapers.sticky_index import StickyIndex
+from src.scrapers.video_scanner import LINK_FORMS, video_ids
+from src.scrapers.workflow_index import WorkflowIndex
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 
 # Setup logging
@@ -32,6 +36,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Distance beyond which a sticky note gets no proximity confidence
+PROXIMITY_RADIUS = 1200
+
 
 class UnifiedWorkflowExtractor:
     """
@@ -45,7 +52,14 @@ class UnifiedWorkflowExtractor:
     - Database storage with proper relationships
     """
     
-    def __init__(self, headless: bool = True, timeout: int = 60000, extract_transcripts: bool = True):
+    def __init__(
+        self,
+        headless: bool = True,
+        timeout: int = 60000,
+        extract_transcripts: bool = True,
+        transcript_pages: int = 3,
+        sticky_assignment: str = 'greedy'
+    ):
         """
         Initialize the unified workflow extractor.
         
@@ -53,12 +67,21 @@ class UnifiedWorkflowExtractor:
             headless: Run browser in headless mode
             timeout: Browser timeout in milliseconds
             extract_transcripts: Whether to extract video transcripts
+            transcript_pages: Maximum videos transcribed concurrently (browser tabs)
+            sticky_assignment: Node-to-sticky matching: 'greedy' (per node, in
+                node order), 'sorted' or 'optimal' (global, see sticky_assignment)
         """
+        if sticky_assignment != 'greedy' and sticky_assignment not in ASSIGNMENT_METHODS:
+            raise ValueError(f"Unknown sticky assignment '{sticky_assignment}'")
         self.headless = headless
         self.timeout = timeout
         self.extract_transcripts = extract_transcripts
+        self.transcript_pages = transcript_pages
+        self.sticky_assignment = sticky_assignment
         self.browser = None
         self.context = None
+        # Shared by every workflow of the run; its browser starts on the first uncached transcript
+        self.transcript_worker = None
         self.json_extractor = WorkflowJSONExtractor()
         
         # Statistics
@@ -68,6 +91,8 @@ class UnifiedWorkflowExtractor:
             'sticky_notes_found': 0,
             'videos_found': 0,
             'transcripts_extracted': 0,
+            'transcript_attempts': 0,
+            'transcript_seconds': 0.0,
             'node_contexts_created': 0,
             'standalone_notes_found': 0
         }
@@ -82,11 +107,13 @@ class UnifiedWorkflowExtractor:
         await self.cleanup()
     
     async def initialize(self):
-        """Initialize the browser and JSON extractor."""
+        """Initialize the browser, JSON extractor and transcript worker."""
         try:
             playwright = await async_playwright().start()
             self.browser = await playwright.chromium.launch(headless=self.headless)
             self.context = await self.browser.new_context()
+            if self.extract_transcripts:
+                self.transcript_worker = await self._open_transcript_worker()
             logger.info("🚀 Unified Workflow Extractor initialized")
         except Exception as e:
             logger.error(f"❌ Failed to initialize: {e}")
@@ -95,6 +122,9 @@ class UnifiedWorkflowExtractor:
     async def cleanup(self):
         """Clean up browser resources."""
         try:
+            if self.transcript_worker:
+                worker, self.transcript_worker = self.transcript_worker, None
+                await worker.__aexit__(None, None, None)
             if self.context:
                 await self.context.close()
             if self.browser:
@@ -132,15 +162,14 @@ class UnifiedWorkflowExtractor:
                     'workflow_id': workflow_id
                 }
             
-            workflow_data = json_result['data'].get('workflow', {})
-            json_nodes = workflow_data.get('nodes', [])
-            connections = workflow_data.get('connections', {})
+            index = WorkflowIndex.from_api_response(json_result['data'])
+            connections = index.connections
             
-            logger.info(f"   📊 JSON contains {len(json_nodes)} total items")
+            logger.info(f"   📊 JSON contains {index.node_count} total items")
             
             # Phase 2: Extract and classify all items from JSON
             logger.info(f"   🔍 Extracting and classifying items from JSON")
-            nodes, sticky_notes = self._extract_and_classify_items(json_nodes)
+            nodes, sticky_notes = self._extract_and_classify_items(index)
             
             # Phase 3: Match nodes with their sticky notes
             logger.info(f"   🔗 Matching nodes with sticky notes")
@@ -170,9 +199,11 @@ class UnifiedWorkflowExtractor:
             
             # Phase 5: Extract transcripts for videos
             transcripts = {}
+            # video_id -> per-attempt timings, for this workflow's metadata only
+            transcript_timings: Dict[str, List[Dict[str, Any]]] = {}
             if self.extract_transcripts and videos:
                 logger.info(f"   📝 Extracting transcripts for {len(videos)} videos")
-                transcripts = await self._extract_transcripts_robust(videos)
+                transcripts = await self._extract_transcripts_robust(videos, transcript_timings)
             
             # Phase 6: Compile results
             extraction_time = time.time() - start_time
@@ -205,7 +236,7 @@ class UnifiedWorkflowExtractor:
                     
                     # Statistics
                     'stats': {
-                        'total_json_items': len(json_nodes),
+                        'total_json_items': index.node_count,
                         'workflow_nodes': len(nodes),
                         'sticky_notes': len(sticky_notes),
                         'node_contexts': len(node_contexts),
@@ -218,7 +249,8 @@ class UnifiedWorkflowExtractor:
                     'extraction_time': extraction_time,
                     'extractor_version': '1.0.0-unified',
                     'extracted_at': datetime.utcnow().isoformat(),
-                    'json_source': 'n8n_api'
+                    'json_source': 'n8n_api',
+                    'transcript_timings': transcript_timings
                 }
             }
             
@@ -242,48 +274,46 @@ class UnifiedWorkflowExtractor:
                 'workflow_id': workflow_id
             }
     
-    def _extract_and_classify_items(self, json_nodes: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
-        """Extract and classify nodes vs sticky notes from JSON."""
+    def _extract_and_classify_items(self, index: WorkflowIndex) -> Tuple[List[Dict], List[Dict]]:
+        """Extract and classify nodes vs sticky notes from the indexed JSON."""
         nodes = []
         sticky_notes = []
         
-        for item in json_nodes:
-            node_type = item.get('type', 'unknown')
-            
-            if node_type == 'n8n-nodes-base.stickyNote':
-                # This is a sticky note (annotation)
-                sticky_notes.append({
+        # Sticky notes (annotations)
+        for item in index.nodes_at(index.sticky_notes):
+            sticky_notes.append({
+                'id': item.get('id', ''),
+                'name': item.get('name', ''),
+                'content': item.get('parameters', {}).get('content', ''),
+                'position': {
+                    'x': (item.get('position') or [0, 0])[0],
+                    'y': (item.get('position') or [0, 0])[1],
+                    'width': item.get('parameters', {}).get('width', 0),
+                    'height': item.get('parameters', {}).get('height', 0)
+                },
+                'color': item.get('parameters', {}).get('color', 0),
+                'creator': item.get('creator', ''),
+                'notes': item.get('notes', '')
+            })
+        
+        for item in index.nodes_at(index.workflow_nodes):
+            # Filter out non-workflow nodes (UI elements, system nodes, etc.)
+            if self._is_valid_workflow_node(item):
+                nodes.append({
                     'id': item.get('id', ''),
                     'name': item.get('name', ''),
-                    'content': item.get('parameters', {}).get('content', ''),
+                    'type': item['type'],
                     'position': {
                         'x': (item.get('position') or [0, 0])[0],
-                        'y': (item.get('position') or [0, 0])[1],
-                        'width': item.get('parameters', {}).get('width', 0),
-                        'height': item.get('parameters', {}).get('height', 0)
+                        'y': (item.get('position') or [0, 0])[1]
                     },
-                    'color': item.get('parameters', {}).get('color', 0),
-                    'creator': item.get('creator', ''),
-                    'notes': item.get('notes', '')
+                    'parameters': item.get('parameters', {}),
+                    'credentials': item.get('credentials', {}),
+                    'webhook_id': item.get('webhook_id', ''),
+                    'type_version': item.get('typeVersion', 1)
                 })
             else:
-                # Filter out non-workflow nodes (UI elements, system nodes, etc.)
-                if self._is_valid_workflow_node(item):
-                    nodes.append({
-                        'id': item.get('id', ''),
-                        'name': item.get('name', ''),
-                        'type': node_type,
-                        'position': {
-                            'x': (item.get('position') or [0, 0])[0],
-                            'y': (item.get('position') or [0, 0])[1]
-                        },
-                        'parameters': item.get('parameters', {}),
-                        'credentials': item.get('credentials', {}),
-                        'webhook_id': item.get('webhook_id', ''),
-                        'type_version': item.get('typeVersion', 1)
-                    })
-                else:
-                    logger.debug(f"   ⚠️  Skipping non-workflow node: {node_type}")
+                logger.debug(f"   ⚠️  Skipping non-workflow node: {item.get('type', 'unknown')}")
         
         self.stats['nodes_found'] += len(nodes)
         self.stats['sticky_notes_found'] += len(sticky_notes)
@@ -338,74 +368,112 @@ class UnifiedWorkflowExtractor:
         return True
     
     def _match_nodes_with_stickies(self, nodes: List[Dict], sticky_notes: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
-        """Match nodes with their sticky notes using position proximity."""
+        """
+        Match nodes with their sticky notes using position proximity.
+        
+        In 'greedy' mode each node, in node order, takes the best sticky note
+        nobody has taken yet. 'sorted' and 'optimal' assign over the whole
+        canvas (see sticky_assignment) and let section-header sticky notes
+        describe every node they cover.
+        """
+        if self.sticky_assignment == 'greedy':
+            pairs = self._greedy_sticky_pairs(nodes, sticky_notes)
+        else:
+            pairs = assign_stickies(
+                confidence_matrix(nodes, sticky_notes),
+                threshold=0.1,
+                capacities=section_header_capacities(nodes, sticky_notes),
+                method=self.sticky_assignment
+            )
+        assigned = {node_index: (sticky_index, confidence) for node_index, sticky_index, confidence in pairs}
+        
         node_contexts = []
-        standalone_notes = []
+        matched = [False] * len(sticky_notes)
+        for node_index, node in enumerate(nodes):
+            if node_index not in assigned:
+                logger.debug(f"   ⚠️ No sticky note found for node '{node['name']}'")
+                continue
+            sticky_index, confidence = assigned[node_index]
+            sticky = sticky_notes[sticky_index]
+            node_contexts.append({
+                'workflow_id': '',  # Will be set by caller
+                'node_id': node['id'],
+                'node_name': node['name'],
+                'node_type': node['type'],
+                'node_position': node['position'],
+                'sticky_title': sticky['name'],
+                'sticky_content': sticky['content'],
+                'sticky_markdown': self._format_as_markdown(sticky['name'], sticky['content']),
+                'match_confidence': confidence,
+                'extraction_method': 'json_proximity'
+            })
+            matched[sticky_index] = True
+            logger.debug(f"   🔗 Matched '{node['name']}' with sticky note (confidence: {confidence:.2f})")
         
-        # Create a copy of sticky notes to track which ones are matched
-        unmatched_stickies = sticky_notes.copy()
+        # Remaining unmatched sticky notes are standalone
+        standalone_notes = [sticky for sticky, is_matched in zip(sticky_notes, matched, strict=True) if not is_matched]
+        
+        self.stats['node_contexts_created'] += len(node_contexts)
+        self.stats['standalone_notes_found'] += len(standalone_notes)
+        
+        logger.info(f"   🔗 Created {len(node_contexts)} node contexts")
+        logger.info(f"   📌 Found {len(standalone_notes)} standalone notes")
         
-        for node in nodes:
-            best_match = None
+        return node_contexts, standalone_notes
+    
+    def _greedy_sticky_pairs(self, nodes: List[Dict], sticky_notes: List[Dict]) -> List[Tuple[int, int, float]]:
+        """Per-node greedy matching; returns (node_index, sticky_index, confidence) pairs."""
+        pairs = []
+        
+        # Index sticky positions and texts once; each node only scores stickies
+        # that are within proximity range or share text with its name
+        index = StickyIndex(
+            sticky_notes,
+            cell_size=PROXIMITY_RADIUS,
+            point=lambda sticky: (sticky['position']['x'], sticky['position']['y'])
+        )
+        matched = [False] * len(sticky_notes)
+        
+        for node_index, node in enumerate(nodes):
             best_confidence = 0.0
             best_sticky_index = -1
             
-            # Find the closest sticky note to this node
-            for i, sticky in enumerate(unmatched_stickies):
-                # Calculate proximity confidence
-                proximity_confidence = self._calculate_proximity_confidence(node, sticky)
-                
-                # Calculate name-based confidence as fallback
-                name_confidence = self._calculate_name_confidence(node, sticky)
+            node_name = node.get('name', '').lower()
+            node_words = set(node_name.split())
+            node_x, node_y = node['position']['x'], node['position']['y']
+            
+            # Candidates come in sticky order, so ties keep the first sticky
+            for i in index.candidates(node_x, node_y, PROXIMITY_RADIUS, needles=[node_name], words=node_words, exclude=matched):
+                sticky_x, sticky_y = index.points[i]
+                proximity_confidence = self._distance_confidence(((node_x - sticky_x) ** 2 + (node_y - sticky_y) ** 2) ** 0.5)
+                name_confidence = self._name_confidence(node_name, node_words, index.titles[i], index.contents[i], index.words[i])
                 
                 # Use the higher of the two confidences
                 total_confidence = max(proximity_confidence, name_confidence)
                 
                 if total_confidence > best_confidence:
                     best_confidence = total_confidence
-                    best_match = sticky
                     best_sticky_index = i
             
-            # If we found a good match, create a node context
-            if best_match and best_confidence > 0.1:
-                node_context = {
-                    'workflow_id': '',  # Will be set by caller
-                    'node_id': node['id'],
-                    'node_name': node['name'],
-                    'node_type': node['type'],
-                    'node_position': node['position'],
-                    'sticky_title': best_match['name'],
-                    'sticky_content': best_match['content'],
-                    'sticky_markdown': self._format_as_markdown(best_match['name'], best_match['content']),
-                    'match_confidence': best_confidence,
-                    'extraction_method': 'json_proximity'
-                }
-                node_contexts.append(node_context)
-                
-                # Remove the matched sticky note from unmatched list
-                unmatched_stickies.pop(best_sticky_index)
-                
-                logger.debug(f"   🔗 Matched '{node['name']}' with sticky note (confidence: {best_confidence:.2f})")
-            else:
-                logger.debug(f"   ⚠️ No sticky note found for node '{node['name']}'")
-        
-        # Remaining unmatched sticky notes are standalone
-        standalone_notes = unmatched_stickies
-        
-        self.stats['node_contexts_created'] += len(node_contexts)
-        self.stats['standalone_notes_found'] += len(standalone_notes)
+            # Each sticky note is attached to at most one node
+            if best_sticky_index >= 0 and best_confidence > 0.1:
+                pairs.append((node_index, best_sticky_index, best_confidence))
+                matched[best_sticky_index] = True
         
-        logger.info(f"   🔗 Created {len(node_contexts)} node contexts")
-        logger.info(f"   📌 Found {len(standalone_notes)} standalone notes")
-        
-        return node_contexts, standalone_notes
+        return pairs
     
     def _calculate_name_confidence(self, node: Dict, sticky: Dict) -> float:
         """Calculate confidence based on name similarity between node and sticky note."""
         node_name = node.get('name', '').lower()
         sticky_name = sticky.get('name', '').lower()
         sticky_content = sticky.get('content', '').lower()
+        sticky_words = set((sticky_name + ' ' + sticky_content).split())
         
+        return self._name_confidence(node_name, set(node_name.split()), sticky_name, sticky_content, sticky_words)
+    
+    @staticmethod
+    def _name_confidence(node_name: str, node_words: set, sticky_name: str, sticky_content: str, sticky_words: set) -> float:
+        """Name confidence from lower-cased node and sticky texts."""
         # Check if node name appears in sticky title or content
         if node_name in sticky_name:
             return 0.8
@@ -413,9 +481,6 @@ class UnifiedWorkflowExtractor:
             return 0.6
         
         # Check for partial matches (common words)
-        node_words = set(node_name.split())
-        sticky_words = set((sticky_name + ' ' + sticky_content).split())
-        
         if node_words and sticky_words:
             common_words = node_words.intersection(sticky_words)
             if len(common_words) > 0:
@@ -431,7 +496,11 @@ class UnifiedWorkflowExtractor:
         # Calculate distance between centers
         distance = ((node_pos['x'] - sticky_pos['x']) ** 2 + (node_pos['y'] - sticky_pos['y']) ** 2) ** 0.5
         
-        # Convert distance to confidence (closer = higher confidence)
+        return self._distance_confidence(distance)
+    
+    @staticmethod
+    def _distance_confidence(distance: float) -> float:
+        """Convert distance to confidence (closer = higher confidence)."""
         # More lenient thresholds for better matching
         if distance < 150:
             return 0.9
@@ -441,7 +510,7 @@ class UnifiedWorkflowExtractor:
             return 0.5
         elif distance < 800:
             return 0.3
-        elif distance < 1200:
+        elif distance < PROXIMITY_RADIUS:
             return 0.1
         else:
             return 0.0
@@ -561,57 +630,47 @@ class UnifiedWorkflowExtractor:
     
     def _extract_youtube_links_from_text(self, text: str) -> List[str]:
         """Extract YouTube links from text content."""
-        # Patterns for YouTube links
-        patterns = [
-            r'https?://(?:www\.)?youtube\.com/watch\?v=([\w-]{11})',
-            r'https?://(?:www\.)?youtu\.be/([\w-]{11})',
-            r'@\[youtube\]\(([\w-]{11})\)',  # n8n markdown format
-            r'youtube\.com/watch\?v=([\w-]{11})',
-            r'youtu\.be/([\w-]{11})'
-        ]
-        
-        links = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                if isinstance(match, tuple):
-                    match = match[0]
-                if self._is_valid_video_id(match):
-                    links.append(f'https://youtu.be/{match}')
-        
-        return list(set(links))  # Remove duplicates
+        # YouTube URLs and n8n markdown `@[youtube](ID)`, validated and deduplicated in one scan
+        return [f'https://youtu.be/{video_id}' for video_id in video_ids(text, forms=LINK_FORMS)]
     
     def _extract_youtube_id(self, url: str) -> Optional[str]:
         """Extract YouTube video ID from URL."""
-        patterns = [
-            r'youtube\.com/watch\?v=([\w-]{11})',
-            r'youtu\.be/([\w-]{11})',
-            r'@\[youtube\]\(([\w-]{11})\)',
-            r'youtube\.com/embed/([\w-]{11})'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        return youtube_id(url, YOUTUBE_URL_OR_MARKDOWN_ID)
     
-    def _is_valid_video_id(self, video_id: str) -> bool:
-        """Check if a YouTube video ID is valid."""
-        return len(video_id) == 11 and video_id.replace('-', '').replace('_', '').isalnum()
+    async def _open_transcript_worker(self):
+        """Transcript worker with one browser and up to transcript_pages tabs."""
+        from src.scrapers.transcript_cache import get_transcript_cache
+        from src.scrapers.transcript_worker import TranscriptWorker
+        
+        worker = TranscriptWorker(
+            headless=self.headless,
+            timeout=self.timeout,
+            cache=get_transcript_cache(),
+            max_pages=self.transcript_pages
+        )
+        return await worker.__aenter__()
     
-    async def _extract_transcripts_robust(self, videos: List[Dict]) -> Dict[str, str]:
-        """Extract transcripts with parallel processing and robust error handling."""
-        from src.scrapers.transcript_extractor import TranscriptExtractor
+    async def _extract_transcripts_robust(
+        self,
+        videos: List[Dict],
+        timings: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    ) -> Dict[str, str]:
+        """
+        Extract transcripts concurrently through the run's shared browser, with cache and retries.
         
+        Args:
+            videos: Video dicts (with youtube_id); updated with transcript fields
+            timings: Optional dict receiving per-attempt timings by video ID
+            
+        Returns:
+            Transcripts by video URL
+        """
         transcripts = {}
         youtube_videos = [v for v in videos if v.get('youtube_id')]
         
         if not youtube_videos:
             return transcripts
         
-        logger.info(f"   📝 Extracting transcripts for {len(youtube_videos)} videos (parallel processing)")
-        
         # Track processed video IDs to avoid duplicate transcript extraction
         processed_video_ids = set()
         unique_videos = []
@@ -622,85 +681,46 @@ class UnifiedWorkflowExtractor:
                 processed_video_ids.add(video_id)
                 unique_videos.append(video)
         
-        # For critical reliability, process videos sequentially to avoid resource conflicts
-        # This ensures 100% success rate even if it's slightly slower
-        results = []
+        logger.info(f"   📝 Extracting transcripts for {len(unique_videos)} videos (up to {self.transcript_pages} concurrent tabs)")
+        
+        # One browser for every workflow, video and retry; each attempt gets a fresh context
+        if self.transcript_worker is None:
+            self.transcript_worker = await self._open_transcript_worker()
+        results = await self.transcript_worker.extract_many(
+            [(v.get('url', ''), v.get('youtube_id', '')) for v in unique_videos]
+        )
+        # Take this workflow's timings off the worker so they don't pile up over the run
+        attempt_timings = {
+            video_id: self.transcript_worker.attempt_timings.pop(video_id)
+            for video_id in processed_video_ids
+            if video_id in self.transcript_worker.attempt_timings
+        }
         
-        for video in unique_videos:
-            try:
-                result = await self._extract_single_transcript_with_retry(video)
-                results.append(result)
-                
-                # Small delay between videos to avoid rate limiting
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                logger.warning(f"   ❌ Video processing error: {e}")
-                results.append((False, None, str(e)))
+        # Only run totals are kept on the extractor; per-attempt detail goes to the caller
+        for video_attempts in attempt_timings.values():
+            self.stats['transcript_attempts'] += len(video_attempts)
+            self.stats['transcript_seconds'] += sum(attempt['seconds'] for attempt in video_attempts)
+        if timings is not None:
+            timings.update(attempt_timings)
         
         # Process results
-        for i, result in enumerate(results):
-            video = unique_videos[i]
+        for video, (success, transcript, error) in zip(unique_videos, results, strict=True):
             video_url = video.get('url', '')
             video_id = video.get('youtube_id', '')
             
-            if isinstance(result, Exception):
-                logger.warning(f"   ❌ Transcript extraction error for {video_id}: {result}")
+            if success and transcript:
+                transcripts[video_url] = transcript
+                video['transcript'] = transcript
+                video['has_transcript'] = True
+                logger.info(f"   ✅ Transcript for {video_id}: {len(transcript)} chars")
+            else:
                 video['has_transcript'] = False
-            elif result and isinstance(result, tuple):
-                success, transcript, error = result
-                if success and transcript:
-                    transcripts[video_url] = transcript
-                    video['transcript'] = transcript
-                    video['has_transcript'] = True
-                    logger.info(f"   ✅ Transcript for {video_id}: {len(transcript)} chars")
-                else:
-                    video['has_transcript'] = False
-                    if error and 'no transcript' not in error.lower():
-                        logger.debug(f"   ℹ️  No transcript available for {video_id}")
+                if error and 'no transcript' not in error.lower():
+                    logger.debug(f"   ℹ️  No transcript available for {video_id}: {error}")
         
         self.stats['transcripts_extracted'] += len(transcripts)
         return transcripts
     
-    async def _extract_single_transcript_with_retry(self, video: Dict) -> tuple:
-        """Extract transcript for a single video with robust retry logic."""
-        from src.scrapers.transcript_extractor import TranscriptExtractor
-        
-        video_url = video.get('url', '')
-        video_id = video.get('youtube_id', '')
-        
-        # Try up to 5 times with exponential backoff and different strategies
-        for attempt in range(5):
-            try:
-                # Use different browser settings for each attempt
-                headless_mode = self.headless if attempt < 3 else False  # Try non-headless on later attempts
-                timeout = self.timeout + (attempt * 10000)  # Increase timeout with each attempt
-                
-                async with TranscriptExtractor(headless=headless_mode, timeout=timeout) as extractor:
-                    success, transcript, error = await extractor.extract_transcript(video_url, video_id)
-                    
-                    if success and transcript and len(transcript.strip()) > 50:
-                        return (True, transcript, None)
-                    elif error and 'no transcript' in error.lower():
-                        return (False, None, error)
-                    else:
-                        if attempt < 4:
-                            wait_time = 2 ** attempt  # 1s, 2s, 4s, 8s
-                            logger.debug(f"   Retry {attempt+1}/5 for {video_id} in {wait_time}s (headless={headless_mode})")
-                            await asyncio.sleep(wait_time)
-                        else:
-                            return (False, None, error or "Max retries exceeded")
-            
-            except Exception as e:
-                if attempt < 4:
-                    wait_time = 2 ** attempt
-                    logger.debug(f"   Retry {attempt+1}/5 for {video_id} after error: {e}")
-                    await asyncio.sleep(wait_time)
-                else:
-                    return (False, None, f"Transcript extraction error after 5 attempts: {e}")
-        
-        return (False, None, "Max retries exceeded")
-    
     def _format_as_markdown(self, title: str, content: str) -> str:
         """Format sticky note content as markdown."""
         if not title and not content:
@@ -737,113 +757,20 @@ class UnifiedWorkflowExtractor:
         
         return min(score, 1.0)
     
+    async def save_to_database_async(self, workflow_id: str, data: Dict) -> bool:
+        """Save extracted data on the storage writer thread, without blocking the event loop."""
+        from src.storage.async_writer import get_storage_writer
+        return await get_storage_writer().submit(self.save_to_database, workflow_id, data)
+    
     def save_to_database(self, workflow_id: str, data: Dict) -> bool:
         """Save extracted data to database."""
         try:
             from src.storage.database import get_session
-            import sys
-            sys.path.append('../n8n-shared')
-            from n8n_shared.models import Workflow, WorkflowNodeContext, WorkflowStandaloneDoc
-            from sqlalchemy import text
             
             logger.info(f"💾 Saving unified extraction data for workflow {workflow_id}")
             
             with get_session() as session:
-                # Update or create workflow table entry
-                workflow = session.query(Workflow).filter_by(workflow_id=workflow_id).first()
-                if workflow:
-                    # Update existing workflow
-                    workflow.layer2_success = True
-                    workflow.layer3_success = True
-                    workflow.layer2_extracted_at = datetime.utcnow()
-                    workflow.layer3_extracted_at = datetime.utcnow()
-                    workflow.unified_extraction_success = True
-                    workflow.unified_extraction_at = datetime.utcnow()
-                    workflow.quality_score = self._calculate_quality(data)
-                    workflow.updated_at = datetime.utcnow()
-                else:
-                    # Create new workflow entry
-                    workflow = Workflow(
-                        workflow_id=workflow_id,
-                        url=data.get('url', ''),
-                        extracted_at=datetime.utcnow(),
-                        updated_at=datetime.utcnow(),
-                        layer1_success=False,
-                        layer2_success=True,
-                        layer3_success=True,
-                        layer2_extracted_at=datetime.utcnow(),
-                        layer3_extracted_at=datetime.utcnow(),
-                        unified_extraction_success=True,
-                        unified_extraction_at=datetime.utcnow(),
-                        quality_score=self._calculate_quality(data)
-                    )
-                    session.add(workflow)
-                    logger.info(f"   📝 Created new workflow entry for {workflow_id}")
-                    # Flush to ensure workflow exists before foreign key inserts
-                    session.flush()
-                
-                # Clear existing data
-                session.execute(text("DELETE FROM workflow_node_contexts WHERE workflow_id = :workflow_id"), 
-                              {'workflow_id': workflow_id})
-                session.execute(text("DELETE FROM workflow_standalone_docs WHERE workflow_id = :workflow_id"), 
-                              {'workflow_id': workflow_id})
-                
-                # Save node contexts
-                node_contexts = data.get('node_contexts', [])
-                for ctx in node_contexts:
-                    ctx['workflow_id'] = workflow_id
-                    
-                    insert_sql = text("""
-                        INSERT INTO workflow_node_contexts (
-                            workflow_id, node_name, node_type, node_position,
-                            sticky_title, sticky_content, sticky_markdown,
-                            match_confidence, extraction_method, extracted_at
-                        ) VALUES (
-                            :workflow_id, :node_name, :node_type, :node_position,
-                            :sticky_title, :sticky_content, :sticky_markdown,
-                            :match_confidence, :extraction_method, :extracted_at
-                        )
-                    """)
-                    
-                    session.execute(insert_sql, {
-                        'workflow_id': ctx['workflow_id'],
-                        'node_name': ctx['node_name'],
-                        'node_type': ctx['node_type'],
-                        'node_position': json.dumps(ctx['node_position']),
-                        'sticky_title': ctx['sticky_title'],
-                        'sticky_content': ctx['sticky_content'],
-                        'sticky_markdown': ctx['sticky_markdown'],
-                        'match_confidence': ctx['match_confidence'],
-                        'extraction_method': ctx['extraction_method'],
-                        'extracted_at': datetime.utcnow()
-                    })
-                
-                # Save standalone notes
-                standalone_notes = data.get('standalone_notes', [])
-                for note in standalone_notes:
-                    standalone_doc = WorkflowStandaloneDoc(
-                        workflow_id=workflow_id,
-                        doc_type='standalone_sticky_note',
-                        doc_title=note['name'][:500],
-                        doc_content=note['content'],
-                        doc_markdown=note['content'],
-                        confidence_score=0.9,
-                        doc_position=note['position'],
-                        extracted_at=datetime.utcnow()
-                    )
-                    session.add(standalone_doc)
-                
-                # Save raw JSON snapshot
-                snapshot_sql = text("""
-                    INSERT INTO workflow_extraction_snapshots (workflow_id, layer, payload)
-                    VALUES (:workflow_id, :layer, :payload)
-                """)
-                session.execute(snapshot_sql, {
-                    'workflow_id': workflow_id,
-                    'layer': 'UNIFIED',
-                    'payload': json.dumps(data)
-                })
-                
+                self._save_in_session(session, workflow_id, data)
                 session.commit()
                 logger.info(f"✅ Successfully saved unified data for {workflow_id}")
                 return True
@@ -851,6 +778,120 @@ class UnifiedWorkflowExtractor:
         except Exception as e:
             logger.error(f"❌ Failed to save unified data for {workflow_id}: {e}")
             return False
+    
+    def save_many_to_database(self, records: List[Dict]) -> None:
+        """
+        Save several extractions in one transaction (WriteBehindBuffer batch write).
+        
+        Args:
+            records: Dicts with 'workflow_id' and 'data' (the extract() result)
+            
+        Raises:
+            Exception: Any database error; nothing of the batch is committed
+        """
+        from src.storage.database import get_session
+        
+        with get_session() as session:
+            for record in records:
+                self._save_in_session(session, record['workflow_id'], record['data'])
+            session.commit()
+        logger.info(f"✅ Saved unified data for {len(records)} workflows in one transaction")
+    
+    def _save_in_session(self, session, workflow_id: str, data: Dict):
+        """Write one workflow's unified data into an open session (committed by the caller)."""
+        import sys
+        if '../n8n-shared' not in sys.path:
+            sys.path.append('../n8n-shared')
+        from n8n_shared.models import Workflow, WorkflowNodeContext, WorkflowStandaloneDoc
+        from src.storage.blob_store import save_snapshot
+        from sqlalchemy import text
+        
+        # Update or create workflow table entry
+        workflow = session.query(Workflow).filter_by(workflow_id=workflow_id).first()
+        if workflow:
+            # Update existing workflow
+            workflow.layer2_success = True
+            workflow.layer3_success = True
+            workflow.layer2_extracted_at = datetime.utcnow()
+            workflow.layer3_extracted_at = datetime.utcnow()
+            workflow.unified_extraction_success = True
+            workflow.unified_extraction_at = datetime.utcnow()
+            workflow.quality_score = self._calculate_quality(data)
+            workflow.updated_at = datetime.utcnow()
+        else:
+            # Create new workflow entry
+            workflow = Workflow(
+                workflow_id=workflow_id,
+                url=data.get('url', ''),
+                extracted_at=datetime.utcnow(),
+                updated_at=datetime.utcnow(),
+                layer1_success=False,
+                layer2_success=True,
+                layer3_success=True,
+                layer2_extracted_at=datetime.utcnow(),
+                layer3_extracted_at=datetime.utcnow(),
+                unified_extraction_success=True,
+                unified_extraction_at=datetime.utcnow(),
+                quality_score=self._calculate_quality(data)
+            )
+            session.add(workflow)
+            logger.info(f"   📝 Created new workflow entry for {workflow_id}")
+            # Flush to ensure workflow exists before foreign key inserts
+            session.flush()
+        
+        # Clear existing data
+        session.execute(text("DELETE FROM workflow_node_contexts WHERE workflow_id = :workflow_id"), 
+                      {'workflow_id': workflow_id})
+        session.execute(text("DELETE FROM workflow_standalone_docs WHERE workflow_id = :workflow_id"), 
+                      {'workflow_id': workflow_id})
+        
+        # Save node contexts
+        node_contexts = data.get('node_contexts', [])
+        for ctx in node_contexts:
+            ctx['workflow_id'] = workflow_id
+            
+            insert_sql = text("""
+                INSERT INTO workflow_node_contexts (
+                    workflow_id, node_name, node_type, node_position,
+                    sticky_title, sticky_content, sticky_markdown,
+                    match_confidence, extraction_method, extracted_at
+                ) VALUES (
+                    :workflow_id, :node_name, :node_type, :node_position,
+                    :sticky_title, :sticky_content, :sticky_markdown,
+                    :match_confidence, :extraction_method, :extracted_at
+                )
+            """)
+            
+            session.execute(insert_sql, {
+                'workflow_id': ctx['workflow_id'],
+                'node_name': ctx['node_name'],
+                'node_type': ctx['node_type'],
+                'node_position': json.dumps(ctx['node_position']),
+                'sticky_title': ctx['sticky_title'],
+                'sticky_content': ctx['sticky_content'],
+                'sticky_markdown': ctx['sticky_markdown'],
+                'match_confidence': ctx['match_confidence'],
+                'extraction_method': ctx['extraction_method'],
+                'extracted_at': datetime.utcnow()
+            })
+        
+        # Save standalone notes
+        standalone_notes = data.get('standalone_notes', [])
+        for note in standalone_notes:
+            standalone_doc = WorkflowStandaloneDoc(
+                workflow_id=workflow_id,
+                doc_type='standalone_sticky_note',
+                doc_title=note['name'][:500],
+                doc_content=note['content'],
+                doc_markdown=note['content'],
+                confidence_score=0.9,
+                doc_position=note['position'],
+                extracted_at=datetime.utcnow()
+            )
+            session.add(standalone_doc)
+        
+        # Save raw JSON snapshot (payload stored once in the blob store)
+        save_snapshot(session, workflow_id, 'UNIFIED', data)
 
 
 # Convenience function for single workflow extraction
@@ -872,7 +913,7 @@ async def extract_workflow_unified(workflow_id: str, workflow_url: str, headless
         
         # Save to database if requested and extraction was successful
         if save_to_db and result['success'] and result['data']:
-            extractor.save_to_database(workflow_id, result['data'])
+            await extractor.save_to_database_async(workflow_id, result['data'])
         
         return result
 
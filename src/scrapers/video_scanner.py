@@ -0,0 +1,182 @@
+"""
+Single-Pass Video ID Scanner
+
+Video discovery used to parse page HTML into a BeautifulSoup DOM to look at
+anchors and iframes, then run ten separate regex sweeps over the same HTML,
+with near-identical scans copied into the Layer 3 extractors and the unified
+extractor. scan_videos makes one pass with one combined pattern over text or
+raw bytes, validates IDs inline (exactly 11 ID characters, not part of a
+longer token), deduplicates them, and classifies each hit by its context by
+looking back to the enclosing tag (quote-aware, so `>` or `<` inside an
+attribute value don't end it) instead of building a DOM:
+- anchor: YouTube video URL in an `<a href>` (channel, playlist and relative
+  links excluded)
+- embed: YouTube URL in an `<iframe src>`
+- markdown: n8n `@[youtube](ID)` sticky note markup
+- json: `"videoId": "ID"` in embedded JSON
+- url: YouTube watch (v= in any query position) / embed / short URL anywhere else
+- param: `videoId=`, `video_id=`, `data-video-id="` or `v=` parameters
+
+Usage:
+    for hit in scan_videos(html):
+        hit.video_id, hit.form, hit.context
+    video_ids(sticky_note_content)
+    video_id_from_url('https://youtu.be/dQw4w9WgXcQ?t=42')
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Union
+
+from src.scrapers.regex_registry import NON_VIDEO_URL, compiled, register_pattern
+
+# Contexts from most to least specific; a deduplicated ID keeps the first one seen here
+CONTEXT_PRIORITY = ('anchor', 'embed', 'markdown', 'json', 'url', 'param')
+
+# Forms whose match is a YouTube URL
+URL_FORMS = ('watch', 'embed', 'short')
+
+# Forms that are links a person wrote (URLs and n8n markdown), e.g. in sticky notes
+LINK_FORMS = URL_FORMS + ('markdown',)
+
+# An ID is exactly 11 characters, so the next character may not continue it
+_ID = r'[\w-]{11}(?![\w-])'
+
+# The leading lookahead lets the engine skip positions that cannot start any
+# alternative instead of trying all six at every character
+SCAN_SOURCE = (
+    r'(?=[yv@"d])(?:'
+    rf'youtube\.com/watch\?(?:[^\s"\'<>#]*?&(?:amp;)?)??v=(?P<watch>{_ID})'
+    rf'|youtube(?:-nocookie)?\.com/(?:embed|v)/(?P<embed>{_ID})'
+    rf'|youtu\.be/(?P<short>{_ID})'
+    rf'|@\[youtube\]\((?P<markdown>{_ID})'
+    rf'|"videoId"\s*:\s*"(?P<json>{_ID})"'
+    rf'|(?:videoId=|video_id=|data-video-id="|(?<![\w-])v=)(?P<param>{_ID})'
+    r')'
+)
+
+VIDEO_SCAN = register_pattern('video.scan', SCAN_SOURCE)
+VIDEO_SCAN_BYTES = compiled(SCAN_SOURCE.encode())
+
+# Start of an opening tag up to a position inside one of its attribute values:
+# tag name, complete attributes (quoted values may hold `>` and `<`), then the
+# attribute being read, whose (double-, single- or un-quoted) value runs to the end
+_TAG_PREFIX = (
+    r'<([A-Za-z][\w-]*)'
+    r'(?:\s+[\w:-]+(?:\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s"\'<>]+))?)*'
+    r'\s+([\w:-]+)\s*=\s*(?:"([^"]*)|\'([^\']*)|([^\s"\'<>]*))'
+)
+_SYNTAX = {
+    str: ('<', compiled(_TAG_PREFIX)),
+    bytes: (b'<', compiled(_TAG_PREFIX.encode())),
+}
+
+# How far back to look for the opening `<` of the enclosing tag
+TAG_LOOKBEHIND = 2048
+
+
+@dataclass
+class VideoHit:
+    """One video ID found in scanned content."""
+    video_id: str
+    form: str      # which pattern alternative matched (watch, embed, short, markdown, json, param)
+    context: str   # one of CONTEXT_PRIORITY
+    offset: int    # start of the match in the content
+
+    @property
+    def url(self) -> str:
+        return f'https://youtu.be/{self.video_id}'
+
+
+def _text(value: Union[str, bytes]) -> str:
+    return value.decode('latin-1') if isinstance(value, bytes) else value
+
+
+def _enclosing_attribute(content: Union[str, bytes], offset: int):
+    """(tag, attribute, value up to offset) when offset lies inside a tag attribute, else None."""
+    open_tag, tag_prefix = _SYNTAX[type(content)]
+    floor = max(0, offset - TAG_LOOKBEHIND)
+    tag_start = offset
+    # A `<` not followed by a tag name ("1 < 2", "</p") may sit inside an earlier
+    # tag's attribute value, so look further back; a tag that doesn't reach offset
+    # means offset is in text
+    while True:
+        tag_start = content.rfind(open_tag, floor, tag_start)
+        if tag_start == -1:
+            return None
+        prefix = tag_prefix.fullmatch(content, tag_start, offset)
+        if prefix:
+            value = next(v for v in prefix.group(3, 4, 5) if v is not None)
+            return _text(prefix.group(1)).lower(), _text(prefix.group(2)).lower(), _text(value)
+        if content[tag_start + 1:tag_start + 2].isalpha():
+            return None
+
+
+def _context(content: Union[str, bytes], form: str, match) -> str:
+    if form not in URL_FORMS:
+        return form
+    enclosing = _enclosing_attribute(content, match.start())
+    if enclosing:
+        tag, attribute, value = enclosing
+        if tag == 'a' and attribute == 'href' and not NON_VIDEO_URL.search(value + _text(match.group(0))):
+            return 'anchor'
+        if tag == 'iframe' and attribute == 'src':
+            return 'embed'
+    return 'url'
+
+
+def scan_videos(content: Union[str, bytes, None], dedupe: bool = True) -> List[VideoHit]:
+    """
+    Find video IDs in HTML or text in one pass.
+
+    Args:
+        content: Page HTML, sticky note text or raw response bytes
+        dedupe: One hit per ID (its most specific context), ordered by first
+            appearance; otherwise every hit in document order
+
+    Returns:
+        Video hits
+    """
+    if not content:
+        return []
+    pattern = VIDEO_SCAN_BYTES if isinstance(content, bytes) else VIDEO_SCAN
+
+    hits: List[VideoHit] = []
+    position: Dict[str, int] = {}
+    for match in pattern.finditer(content):
+        form = match.lastgroup
+        hit = VideoHit(_text(match.group(form)), form, _context(content, form, match), match.start())
+        if not dedupe:
+            hits.append(hit)
+        elif hit.video_id not in position:
+            position[hit.video_id] = len(hits)
+            hits.append(hit)
+        else:
+            kept = hits[position[hit.video_id]]
+            if CONTEXT_PRIORITY.index(hit.context) < CONTEXT_PRIORITY.index(kept.context):
+                hits[position[hit.video_id]] = hit
+    return hits
+
+
+def video_ids(content: Union[str, bytes, None], forms: Optional[Sequence[str]] = None) -> List[str]:
+    """
+    Distinct video IDs in `content`, in order of first appearance.
+
+    Args:
+        content: Text or HTML to scan
+        forms: Only count IDs found in these forms (e.g. LINK_FORMS); default all
+    """
+    if forms is None:
+        return [hit.video_id for hit in scan_videos(content)]
+    ids: Dict[str, None] = {}
+    for hit in scan_videos(content, dedupe=False):
+        if hit.form in forms:
+            ids.setdefault(hit.video_id)
+    return list(ids)
+
+
+def video_id_from_url(url: Optional[str]) -> Optional[str]:
+    """Video ID of a YouTube watch / embed / short URL, or None."""
+    for hit in scan_videos(url, dedupe=False):
+        if hit.form in URL_FORMS:
+            return hit.video_id
+    return None
@@ -0,0 +1,319 @@
+"""
+Graph Analytics over n8n Workflow Connections
+
+Layer 6/7 complexity used to be a function of node and connection counts only.
+This engine analyses the actual `connections` graph.
+
+Workflows are mapped to integer node IDs and stored as CSR arrays
+(`indptr`, `indices`). Many workflows can be packed into one disjoint graph,
+so a whole chunk of the catalog is analysed in one linear pass:
+- fan-in / fan-out, branch and merge points, branching factor
+- loops, as strongly connected components (iterative Tarjan)
+- depth (longest path over the component DAG; a loop counts as one step)
+- parallel branches (widest level of that DAG)
+- trigger-to-sink path count
+
+Usage:
+    metrics = graph_metrics(WorkflowIndex.from_api_response(api_response))
+    rows = graph_metrics_batch([index_a, index_b, ...])
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.scrapers.workflow_index import WorkflowIndex
+
+
+class WorkflowGraph:
+    """
+    CSR adjacency for one or more workflows packed as a disjoint graph.
+
+    Node IDs are contiguous per workflow; `graph_of[node]` is the position of
+    the node's workflow in the input sequence.
+    """
+
+    def __init__(self, indexes: Sequence[WorkflowIndex]):
+        """
+        Pack workflows into one CSR graph.
+
+        Args:
+            indexes: Indexed workflows; sticky notes are left out, and nodes that
+                only appear in `connections` are added
+        """
+        names: List[str] = []
+        graph_of: List[int] = []
+        sources: List[int] = []
+        targets: List[int] = []
+
+        for graph_id, index in enumerate(indexes):
+            ids: Dict[str, int] = {}
+
+            # Defaults bind this workflow's ids and graph_id (not the loop's latest)
+            def node_id(name: str, ids: Dict[str, int] = ids, graph_id: int = graph_id) -> int:
+                if name not in ids:
+                    ids[name] = len(names)
+                    names.append(name)
+                    graph_of.append(graph_id)
+                return ids[name]
+
+            for node in index.nodes_at(index.workflow_nodes):
+                node_id(node.get('name') or node.get('id') or f"#{len(names)}")
+            for source, target in index.edges:
+                sources.append(node_id(source))
+                targets.append(node_id(target))
+
+        self.names = names
+        self.graph_count = len(indexes)
+        self.graph_of = np.asarray(graph_of, dtype=np.int64)
+
+        node_total = len(names)
+        sources_array = np.asarray(sources, dtype=np.int64)
+        order = np.argsort(sources_array, kind='stable')
+        self.indices = np.asarray(targets, dtype=np.int64)[order]
+        self.indptr = np.zeros(node_total + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources_array, minlength=node_total), out=self.indptr[1:])
+
+        self.out_degree = np.diff(self.indptr)
+        self.in_degree = np.bincount(self.indices, minlength=node_total)
+
+    @property
+    def node_count(self) -> int:
+        return len(self.names)
+
+    def successors(self, node: int) -> np.ndarray:
+        """Targets of `node`'s outgoing edges."""
+        return self.indices[self.indptr[node]:self.indptr[node + 1]]
+
+    def strongly_connected_components(self) -> np.ndarray:
+        """
+        Component ID per node (iterative Tarjan, O(V + E)).
+
+        Components are numbered in Tarjan's emission order, which is a reverse
+        topological order of the component DAG: every edge between components
+        goes from a higher ID to a lower one.
+        """
+        node_total = self.node_count
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+        order = [-1] * node_total
+        low = [0] * node_total
+        component = [-1] * node_total
+        on_stack = [False] * node_total
+        stack: List[int] = []
+        counter = 0
+        components = 0
+
+        for root in range(node_total):
+            if order[root] != -1:
+                continue
+            work = [(root, indptr[root])]
+            order[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            while work:
+                node, edge = work[-1]
+                if edge < indptr[node + 1]:
+                    work[-1] = (node, edge + 1)
+                    target = indices[edge]
+                    if order[target] == -1:
+                        order[target] = low[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        on_stack[target] = True
+                        work.append((target, indptr[target]))
+                    elif on_stack[target]:
+                        low[node] = min(low[node], order[target])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == order[node]:
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component[member] = components
+                        if member == node:
+                            break
+                    components += 1
+
+        return np.asarray(component, dtype=np.int64)
+
+
+def _empty_metrics() -> Dict[str, Any]:
+    return {
+        'graph_nodes': 0,
+        'graph_edges': 0,
+        'depth': 0,
+        'max_fan_out': 0,
+        'max_fan_in': 0,
+        'branching_factor': 0.0,
+        'branch_points': 0,
+        'merge_points': 0,
+        'parallel_branches': 0,
+        'cycle_count': 0,
+        'cyclic_nodes': 0,
+        'trigger_count': 0,
+        'sink_count': 0,
+        'isolated_nodes': 0,
+        'trigger_to_sink_paths': 0,
+        'branch_nodes': [],
+        'loop_nodes': []
+    }
+
+
+def analyze_graph(graph: WorkflowGraph) -> List[Dict[str, Any]]:
+    """
+    Metrics for every workflow packed into `graph`, in input order.
+
+    Args:
+        graph: Packed CSR graph
+
+    Returns:
+        One metrics dict per workflow (see _empty_metrics for the keys)
+    """
+    results = [_empty_metrics() for _ in range(graph.graph_count)]
+    if graph.node_count == 0:
+        return results
+
+    graph_of = graph.graph_of
+    out_degree = graph.out_degree
+    in_degree = graph.in_degree
+    edge_graph = graph_of[graph.indices]
+
+    # Degree statistics, reduced per workflow
+    counts = {
+        'graph_nodes': np.bincount(graph_of, minlength=graph.graph_count),
+        'graph_edges': np.bincount(edge_graph, minlength=graph.graph_count),
+        'branch_points': np.bincount(graph_of, weights=out_degree > 1, minlength=graph.graph_count),
+        'merge_points': np.bincount(graph_of, weights=in_degree > 1, minlength=graph.graph_count),
+        'isolated_nodes': np.bincount(graph_of, weights=(out_degree == 0) & (in_degree == 0), minlength=graph.graph_count)
+    }
+    max_fan_out = np.zeros(graph.graph_count, dtype=np.int64)
+    max_fan_in = np.zeros(graph.graph_count, dtype=np.int64)
+    np.maximum.at(max_fan_out, graph_of, out_degree)
+    np.maximum.at(max_fan_in, graph_of, in_degree)
+    fanning = np.bincount(graph_of, weights=out_degree > 0, minlength=graph.graph_count)
+
+    # Component DAG: Tarjan IDs are reverse-topological
+    component = graph.strongly_connected_components()
+    component_total = int(component.max()) + 1
+    component_size = np.bincount(component, minlength=component_total)
+    component_graph = np.zeros(component_total, dtype=np.int64)
+    component_graph[component] = graph_of
+
+    edge_source = np.repeat(np.arange(graph.node_count), out_degree)
+    source_component = component[edge_source]
+    target_component = component[graph.indices]
+    self_loop = np.bincount(source_component[graph.indices == edge_source], minlength=component_total) > 0
+    cyclic = (component_size > 1) | self_loop
+
+    between = source_component != target_component
+    links = sorted(set(zip(source_component[between].tolist(), target_component[between].tolist(), strict=True)))
+    successors: List[List[int]] = [[] for _ in range(component_total)]
+    predecessors: List[List[int]] = [[] for _ in range(component_total)]
+    for source, target in links:
+        successors[source].append(target)
+        predecessors[target].append(source)
+
+    # Longest path to a sink and path counts, sinks first (ascending IDs)
+    height = [1] * component_total
+    paths = [1] * component_total
+    for current in range(component_total):
+        if successors[current]:
+            height[current] = 1 + max(height[target] for target in successors[current])
+            paths[current] = sum(paths[target] for target in successors[current])
+
+    # Longest path from a source, sources first (descending IDs)
+    level = [0] * component_total
+    for current in range(component_total - 1, -1, -1):
+        for target in successors[current]:
+            level[target] = max(level[target], level[current] + 1)
+
+    cyclic_nodes = np.bincount(graph_of, weights=cyclic[component], minlength=graph.graph_count)
+    widths: Dict[tuple, int] = {}
+    for current in range(component_total):
+        graph_id = int(component_graph[current])
+        result = results[graph_id]
+        result['depth'] = max(result['depth'], height[current])
+        if cyclic[current]:
+            result['cycle_count'] += 1
+        connected = successors[current] or predecessors[current]
+        if connected:
+            key = (graph_id, level[current])
+            widths[key] = widths.get(key, 0) + 1
+        if connected and not predecessors[current]:
+            result['trigger_count'] += 1
+            result['trigger_to_sink_paths'] += paths[current]
+        if connected and not successors[current]:
+            result['sink_count'] += 1
+    for (graph_id, _), width in widths.items():
+        results[graph_id]['parallel_branches'] = max(results[graph_id]['parallel_branches'], width)
+
+    for node in range(graph.node_count):
+        graph_id = int(graph_of[node])
+        if out_degree[node] > 1:
+            results[graph_id]['branch_nodes'].append(graph.names[node])
+        if cyclic[component[node]]:
+            results[graph_id]['loop_nodes'].append(graph.names[node])
+
+    for graph_id, result in enumerate(results):
+        for name, values in counts.items():
+            result[name] = int(values[graph_id])
+        result['max_fan_out'] = int(max_fan_out[graph_id])
+        result['max_fan_in'] = int(max_fan_in[graph_id])
+        result['cyclic_nodes'] = int(cyclic_nodes[graph_id])
+        result['branching_factor'] = (
+            round(float(result['graph_edges'] / fanning[graph_id]), 2) if fanning[graph_id] else 0.0
+        )
+    return results
+
+
+def graph_metrics(index: WorkflowIndex) -> Dict[str, Any]:
+    """Graph metrics of one indexed workflow."""
+    return analyze_graph(WorkflowGraph([index]))[0]
+
+
+def graph_metrics_batch(indexes: Sequence[Optional[WorkflowIndex]]) -> List[Dict[str, Any]]:
+    """
+    Graph metrics for many workflows in one packed pass.
+
+    Args:
+        indexes: Indexed workflows (None for a workflow without JSON)
+
+    Returns:
+        One metrics dict per input, in order
+    """
+    return analyze_graph(WorkflowGraph([index or WorkflowIndex({}) for index in indexes]))
+
+
+def _layer2_index(layer2_data: Any) -> Optional[WorkflowIndex]:
+    """Index of the workflow in Layer 2 data, or None if it has no usable nodes."""
+    try:
+        index = WorkflowIndex.from_layer2(layer2_data)
+    except (AttributeError, TypeError):
+        # Malformed node or connection entries
+        return None
+    return index if index.node_count else None
+
+
+def layer2_graph_metrics(layer2_data: Any) -> Optional[Dict[str, Any]]:
+    """Graph metrics of the workflow stored in Layer 2 data (None without nodes)."""
+    return layer2_graph_metrics_batch([layer2_data])[0]
+
+
+def layer2_graph_metrics_batch(layer2_rows: Sequence[Any]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Graph metrics for many Layer 2 data dicts in one packed pass.
+
+    Args:
+        layer2_rows: Layer 2 data per workflow, in any shape from_layer2 accepts
+
+    Returns:
+        Metrics per input, None where the workflow JSON has no usable nodes
+    """
+    indexes = [_layer2_index(data) for data in layer2_rows]
+    metrics = graph_metrics_batch(indexes)
+    return [row if index is not None else None for index, row in zip(indexes, metrics, strict=True)]
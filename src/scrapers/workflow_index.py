@@ -0,0 +1,182 @@
+"""
+Single-Pass Workflow JSON Index
+
+The n8n workflow JSON used to be walked by every consumer: Layer 2 counted
+nodes and connections, Layer 2 storage collected node types, Layer 6 walked the
+nodes again and stringified each node's parameters twice, and the unified
+extractor split nodes from sticky notes in yet another loop.
+
+WorkflowIndex walks the nodes and connections once and keeps what those
+consumers need: node positions grouped by type, sticky notes, credential and
+auth usage, URL parameters and the connection adjacency.
+
+Usage:
+    index = WorkflowIndex.from_api_response(api_response)   # {'workflow': {...}}
+    index = WorkflowIndex(workflow)                          # {'nodes': [...], 'connections': {...}}
+    index.node_count, index.connection_count, index.node_types
+    index.of_type('n8n-nodes-base.httpRequest')
+    index.adjacency['Webhook']
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+
+STICKY_NOTE_TYPE = 'n8n-nodes-base.stickyNote'
+
+
+class WorkflowIndex:
+    """
+    Read-only index over one n8n workflow, built in a single traversal.
+
+    `items` keeps every entry of `nodes` in order (sticky notes included);
+    the other fields refer to items by position in that list.
+    """
+
+    def __init__(self, workflow: Optional[Dict[str, Any]]):
+        """
+        Index a workflow dict.
+
+        Args:
+            workflow: Workflow with `nodes` and `connections` (not the API
+                response wrapper; see from_api_response)
+        """
+        workflow = workflow or {}
+        nodes = workflow.get('nodes') or []
+        connections = workflow.get('connections') or {}
+
+        self.items: List[Dict[str, Any]] = list(nodes)
+        self.by_type: Dict[str, List[int]] = {}
+        self.sticky_notes: List[int] = []
+        self.workflow_nodes: List[int] = []
+        self.by_name: Dict[str, int] = {}
+
+        # Parameter-derived facts, in node order
+        self.url_parameters: List[Dict[str, Any]] = []
+        self.authentication_types: List[Any] = []
+        self.credential_types: Dict[str, List[int]] = {}
+        self.ssl_nodes: List[int] = []
+        self.oauth_nodes: List[int] = []
+        self.api_key_nodes: List[int] = []
+
+        for position, node in enumerate(self.items):
+            node_type = node.get('type', '')
+            parameters = node.get('parameters') or {}
+
+            self.by_type.setdefault(node_type, []).append(position)
+            if node_type == STICKY_NOTE_TYPE:
+                self.sticky_notes.append(position)
+            else:
+                self.workflow_nodes.append(position)
+            if node.get('name'):
+                self.by_name.setdefault(node['name'], position)
+
+            if 'url' in parameters:
+                self.url_parameters.append({
+                    'url': parameters['url'],
+                    'method': parameters.get('method', 'GET'),
+                    'node_type': node_type
+                })
+            if 'authentication' in parameters:
+                self.authentication_types.append(parameters['authentication'])
+            if 'security' in parameters or 'ssl' in parameters:
+                self.ssl_nodes.append(position)
+
+            # One stringification per node, shared by all substring checks
+            parameter_text = str(parameters).lower()
+            if 'oauth' in parameter_text:
+                self.oauth_nodes.append(position)
+            if 'api_key' in parameter_text:
+                self.api_key_nodes.append(position)
+
+            for credential_type in (node.get('credentials') or {}):
+                self.credential_types.setdefault(credential_type, []).append(position)
+
+        # Connections: {source: {output_type: [[{'node': target, ...}, ...], ...]}}
+        self.connections: Dict[str, Any] = connections if isinstance(connections, dict) else {}
+        self.adjacency: Dict[str, List[str]] = {}
+        self.edges: List[Tuple[str, str]] = []
+        for source, outputs in self.connections.items():
+            targets = self.adjacency.setdefault(source, [])
+            for branches in (outputs or {}).values() if isinstance(outputs, dict) else ():
+                for branch in branches or []:
+                    for link in branch or []:
+                        target = link.get('node') if isinstance(link, dict) else None
+                        if target:
+                            targets.append(target)
+                            self.edges.append((source, target))
+
+    @classmethod
+    def from_api_response(cls, response: Optional[Dict[str, Any]]) -> "WorkflowIndex":
+        """Index the `workflow` of a templates API response (Layer 2 `data`)."""
+        return cls((response or {}).get('workflow') or {})
+
+    @classmethod
+    def from_json(cls, workflow: Union[str, Dict[str, Any], None]) -> "WorkflowIndex":
+        """Index a workflow given as a dict or a JSON string."""
+        if isinstance(workflow, str):
+            workflow = json.loads(workflow)
+        return cls(workflow)
+
+    @classmethod
+    def from_layer2(cls, layer2_data: Optional[Dict[str, Any]]) -> "WorkflowIndex":
+        """
+        Index the workflow found in Layer 2 data, whichever shape it was stored in.
+
+        Accepts a templates API response (`{'workflow': ...}`), a bare workflow
+        (`{'nodes': ...}`) or a dict whose `data` holds either, possibly as a
+        JSON string. Anything else, including unparseable JSON, has no nodes.
+        """
+        data = layer2_data
+        for _ in range(2):
+            if isinstance(data, str):
+                try:
+                    data = json.loads(data)
+                except ValueError:
+                    return cls({})
+            if not isinstance(data, dict):
+                break
+            if isinstance(data.get('workflow'), dict):
+                return cls.from_api_response(data)
+            if 'nodes' in data:
+                return cls(data)
+            data = data.get('data')
+        return cls({})
+
+    @property
+    def node_count(self) -> int:
+        """Number of entries in `nodes`, sticky notes included (Layer 2 metric)."""
+        return len(self.items)
+
+    @property
+    def connection_count(self) -> int:
+        """
+        Layer 2 connection metric: output types summed over source nodes.
+
+        Use `edges` for the number of node-to-node links.
+        """
+        return sum(len(outputs) for outputs in self.connections.values())
+
+    @property
+    def node_types(self) -> List[str]:
+        """Distinct non-empty node types, in order of first appearance."""
+        return [node_type for node_type in self.by_type if node_type]
+
+    def of_type(self, node_type: str) -> List[Dict[str, Any]]:
+        """All nodes of one type, in workflow order."""
+        return [self.items[position] for position in self.by_type.get(node_type, [])]
+
+    def nodes_at(self, positions: List[int]) -> List[Dict[str, Any]]:
+        """Nodes at the given positions of `items`."""
+        return [self.items[position] for position in positions]
+
+    def security_markers(self) -> Set[str]:
+        """Security requirements implied by node parameters (Layer 6 vocabulary)."""
+        markers = set()
+        if self.ssl_nodes:
+            markers.add('ssl_required')
+        if self.oauth_nodes:
+            markers.add('oauth_required')
+        if self.api_key_nodes:
+            markers.add('api_key_required')
+        return markers
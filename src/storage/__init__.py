@@ -9,26 +9,35 @@ Task: SCRAPE-008
 Date: October 11, 2025
 """
 
-from src.storage.database import (
-    engine,
-    SessionLocal,
-    get_session,
-    init_database,
-    drop_all_tables,
-    get_database_stats
-)
-
-from src.models import (
-    Base,
-    Workflow,
-    WorkflowMetadata,
-    WorkflowStructure,
-    WorkflowContent,
-    VideoTranscript,
-    WorkflowBusinessIntelligence,
-    WorkflowCommunityData,
-    WorkflowTechnicalDetails,
-)
+import importlib
+
+# Exported name -> defining module. Imported on first access (PEP 562): importing
+# src.storage.database builds the connection pool and connects, which helpers
+# such as src.storage.pagination or src.storage.search must not trigger.
+_EXPORTS = {
+    "engine": "src.storage.database",
+    "SessionLocal": "src.storage.database",
+    "get_session": "src.storage.database",
+    "init_database": "src.storage.database",
+    "drop_all_tables": "src.storage.database",
+    "get_database_stats": "src.storage.database",
+    "Base": "src.models",
+    "Workflow": "src.models",
+    "WorkflowMetadata": "src.models",
+    "WorkflowStructure": "src.models",
+    "WorkflowContent": "src.models",
+    "VideoTranscript": "src.models",
+    "WorkflowBusinessIntelligence": "src.models",
+    "WorkflowCommunityData": "src.models",
+    "WorkflowTechnicalDetails": "src.models",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "engine",
@@ -0,0 +1,195 @@
+"""
+Async storage writer.
+
+Repository and session calls are blocking SQLAlchemy round trips to the remote
+Postgres; awaited from a coroutine they stall every scrape on the event loop.
+StorageWriter runs them on one dedicated writer thread instead:
+- Callers await the result without blocking the loop
+- Writes run one at a time, in submission order
+- Backpressure: at most `max_pending` calls may be queued or running; further
+  callers wait for a slot before their call is queued
+
+AsyncWorkflowRepository offers the WorkflowRepository API as coroutines on top
+of a writer.
+
+Usage:
+    writer = get_storage_writer()
+    saved = await writer.submit(extractor.save_to_database, workflow_id, data)
+
+    repo = AsyncWorkflowRepository(WorkflowRepository())
+    workflow = await repo.create_workflow('2462', url, result)
+"""
+
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+DEFAULT_MAX_PENDING = 100
+
+
+class StorageWriter:
+    """
+    Bounded queue of blocking storage calls, drained by one writer thread.
+    """
+
+    def __init__(self, max_pending: int = DEFAULT_MAX_PENDING, name: str = 'storage-writer'):
+        """
+        Initialize storage writer.
+
+        Args:
+            max_pending: Calls that may be queued or running before submit() waits
+            name: Writer thread name
+        """
+        self.max_pending = max_pending
+        self.name = name
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.pending = 0
+
+        self.stats = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'waited': 0,
+            'max_pending': 0,
+            'write_seconds': 0.0
+        }
+
+    def _ensure_started(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.name)
+        # The slot semaphore belongs to one event loop (scripts may call asyncio.run repeatedly)
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_pending)
+            self._loop = loop
+
+    async def submit(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking call on the writer thread and await its result.
+
+        Waits for a free slot first when `max_pending` calls are outstanding.
+
+        Args:
+            func: Blocking callable (repository method, save function, ...)
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Whatever func returns; exceptions raised by func propagate
+        """
+        self._ensure_started()
+        if self._slots.locked():
+            self.stats['waited'] += 1
+        async with self._slots:
+            self.pending += 1
+            self.stats['submitted'] += 1
+            self.stats['max_pending'] = max(self.stats['max_pending'], self.pending)
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._executor, functools.partial(self._timed, func, *args, **kwargs)
+                )
+            finally:
+                self.pending -= 1
+
+    def _timed(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        start_time = time.time()
+        try:
+            result = func(*args, **kwargs)
+            self.stats['completed'] += 1
+            return result
+        except Exception:
+            self.stats['failed'] += 1
+            raise
+        finally:
+            self.stats['write_seconds'] += time.time() - start_time
+
+    async def close(self):
+        """Wait for queued writes to finish and stop the writer thread."""
+        if self._executor is None:
+            return
+        executor, self._executor = self._executor, None
+        self._slots = self._loop = None
+        await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+        logger.info(f"Storage writer '{self.name}' closed: {self.stats}")
+
+    async def __aenter__(self):
+        self._ensure_started()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class AsyncWorkflowRepository:
+    """
+    WorkflowRepository API as coroutines, executed on a StorageWriter thread.
+    """
+
+    def __init__(self, repository, writer: Optional[StorageWriter] = None):
+        """
+        Initialize async repository.
+
+        Args:
+            repository: WorkflowRepository to run on the writer thread
+            writer: Writer to use (default: the shared get_storage_writer())
+        """
+        self.repository = repository
+        self.writer = writer or get_storage_writer()
+
+    async def create_workflow(self, workflow_id: str, url: str, extraction_result: Dict[str, Any]):
+        """WorkflowRepository.create_workflow on the writer thread."""
+        return await self.writer.submit(self.repository.create_workflow, workflow_id, url, extraction_result)
+
+    async def bulk_upsert_workflows(
+        self,
+        results: Sequence[Tuple[str, str, Dict[str, Any]]],
+        batch_size: int = 500
+    ) -> Dict[str, Any]:
+        """WorkflowRepository.bulk_upsert_workflows on the writer thread."""
+        return await self.writer.submit(self.repository.bulk_upsert_workflows, results, batch_size=batch_size)
+
+    async def get_workflow(self, workflow_id: str, include_relationships: bool = True):
+        """WorkflowRepository.get_workflow on the writer thread."""
+        return await self.writer.submit(self.repository.get_workflow, workflow_id, include_relationships)
+
+    async def list_workflows(self, *args, **kwargs) -> List[Any]:
+        """WorkflowRepository.list_workflows on the writer thread."""
+        return await self.writer.submit(self.repository.list_workflows, *args, **kwargs)
+
+    async def list_workflows_page(self, *args, **kwargs) -> Tuple[List[Any], Optional[str]]:
+        """WorkflowRepository.list_workflows_page on the writer thread."""
+        return await self.writer.submit(self.repository.list_workflows_page, *args, **kwargs)
+
+    async def update_workflow(self, workflow_id: str, updates: Dict[str, Any]):
+        """WorkflowRepository.update_workflow on the writer thread."""
+        return await self.writer.submit(self.repository.update_workflow, workflow_id, updates)
+
+    async def delete_workflow(self, workflow_id: str) -> bool:
+        """WorkflowRepository.delete_workflow on the writer thread."""
+        return await self.writer.submit(self.repository.delete_workflow, workflow_id)
+
+    async def get_statistics(self) -> Dict[str, Any]:
+        """WorkflowRepository.get_statistics on the writer thread."""
+        return await self.writer.submit(self.repository.get_statistics)
+
+    async def search_workflows(self, *args, **kwargs) -> List[Any]:
+        """WorkflowRepository.search_workflows on the writer thread."""
+        return await self.writer.submit(self.repository.search_workflows, *args, **kwargs)
+
+
+# Shared writer for the process (one writer thread, like the shared engine)
+_storage_writer: Optional[StorageWriter] = None
+
+
+def get_storage_writer() -> StorageWriter:
+    """Get the process-wide storage writer."""
+    global _storage_writer
+    if _storage_writer is None:
+        _storage_writer = StorageWriter()
+    return _storage_writer
@@ -0,0 +1,339 @@
+"""
+Content-addressed blob store for large JSON payloads.
+
+Extraction snapshots stored their whole payload as JSONB in
+workflow_extraction_snapshots, and every extraction inserted it again even
+when nothing had changed, so the table grew with duplicates that every scan,
+VACUUM and backup had to read. Payloads now live in `payload_blobs`:
+- Keyed by the SHA-256 of the canonical JSON (sorted keys, no whitespace), so
+  identical payloads are stored once however often they are written
+- Compressed with zstd (JSON shrinks ~5-10x); the column is stored EXTERNAL so
+  Postgres doesn't try to compress it again
+- Referencing rows hold only the 64-character digest (`payload_sha256`)
+- Readers decompress on demand, as a stream (open_blob) or parsed (load_json)
+
+Blobs are immutable; unreferenced ones are removed by prune_blobs() after
+referencing rows (BLOB_REFERENCES) are deleted.
+
+The DDL in migrations/payload_blobs.sql is generated by
+`python scripts/install_blob_store.py --sql`; the same script moves existing
+snapshot payloads into the store.
+
+Usage:
+    with get_session() as session:
+        save_snapshot(session, '2462', 'L2V2', {'node_contexts': contexts})
+        payload = load_snapshot(session, snapshot_id)
+"""
+
+import hashlib
+import io
+import json
+from typing import Any, BinaryIO, Dict, List, Optional
+
+import zstandard
+from sqlalchemy import inspect, text
+
+BLOB_TABLE = 'payload_blobs'
+
+# Level 10 compresses JSON markedly better than the default 3 and still takes
+# milliseconds per payload; blobs are written once and read rarely
+ZSTD_LEVEL = 10
+
+# (table, column) pairs holding blob digests; prune_blobs() keeps what they reference
+BLOB_REFERENCES = (
+    ('workflow_extraction_snapshots', 'payload_sha256'),
+    ('workflow_snapshot_archives', 'archive_sha256'),
+)
+
+SNAPSHOT_INSERT_SQL = """
+    INSERT INTO workflow_extraction_snapshots (workflow_id, layer, payload_sha256)
+    VALUES (:workflow_id, :layer, :sha256)
+"""
+
+
+def canonical_json(payload: Any) -> bytes:
+    """
+    Canonical JSON encoding: equal payloads give equal bytes.
+
+    Args:
+        payload: JSON-serializable value (datetimes are stored as strings)
+
+    Returns:
+        UTF-8 JSON with sorted keys and no insignificant whitespace
+    """
+    return json.dumps(
+        payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str
+    ).encode('utf-8')
+
+
+def blob_digest(data: bytes) -> str:
+    """Hex SHA-256 of blob content (its key in the store)."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def put_blob(session, data: bytes) -> str:
+    """
+    Store bytes, once.
+
+    Content already in the store isn't compressed or written again. The
+    caller commits.
+
+    Args:
+        session: SQLAlchemy session
+        data: Uncompressed content
+
+    Returns:
+        SHA-256 digest referencing the blob
+    """
+    digest = blob_digest(data)
+    exists = session.execute(
+        text(f"SELECT 1 FROM {BLOB_TABLE} WHERE sha256 = :sha256"), {'sha256': digest}
+    ).first()
+    if exists is None:
+        # ON CONFLICT: a concurrent writer may store the same payload first
+        session.execute(
+            text(
+                f"INSERT INTO {BLOB_TABLE} (sha256, raw_size, data) VALUES (:sha256, :raw_size, :data) "
+                "ON CONFLICT (sha256) DO NOTHING"
+            ),
+            {
+                'sha256': digest,
+                'raw_size': len(data),
+                'data': zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data),
+            }
+        )
+    return digest
+
+
+def put_json(session, payload: Any) -> str:
+    """
+    Store a JSON payload in canonical form, once.
+
+    Args:
+        session: SQLAlchemy session
+        payload: JSON-serializable value
+
+    Returns:
+        SHA-256 digest of the canonical JSON
+    """
+    return put_blob(session, canonical_json(payload))
+
+
+def open_blob(session, digest: str) -> BinaryIO:
+    """
+    Stream a blob's content, decompressing as it is read.
+
+    Only the compressed bytes are held in memory; callers reading in chunks
+    (or json.load) never materialize the whole decompressed payload at once.
+
+    Args:
+        session: SQLAlchemy session
+        digest: SHA-256 digest from put_blob()
+
+    Returns:
+        Readable binary stream of the uncompressed content
+
+    Raises:
+        KeyError: If no blob has this digest
+    """
+    data = session.execute(
+        text(f"SELECT data FROM {BLOB_TABLE} WHERE sha256 = :sha256"), {'sha256': digest}
+    ).scalar()
+    if data is None:
+        raise KeyError(f"No blob {digest}")
+    return zstandard.ZstdDecompressor().stream_reader(io.BytesIO(bytes(data)))
+
+
+def read_blob(session, digest: str) -> bytes:
+    """
+    A blob's whole uncompressed content.
+
+    Args:
+        session: SQLAlchemy session
+        digest: SHA-256 digest from put_blob()
+
+    Returns:
+        Uncompressed bytes
+
+    Raises:
+        KeyError: If no blob has this digest
+    """
+    with open_blob(session, digest) as stream:
+        return stream.read()
+
+
+def load_json(session, digest: str) -> Any:
+    """
+    Parse a JSON blob, decompressing while parsing.
+
+    Args:
+        session: SQLAlchemy session
+        digest: SHA-256 digest from put_json()
+
+    Returns:
+        The payload
+
+    Raises:
+        KeyError: If no blob has this digest
+    """
+    with open_blob(session, digest) as stream:
+        return json.load(io.TextIOWrapper(stream, encoding='utf-8'))
+
+
+def save_snapshot(session, workflow_id: str, layer: str, payload: Any) -> str:
+    """
+    Record an extraction snapshot; the payload goes to the blob store.
+
+    The caller commits.
+
+    Args:
+        session: SQLAlchemy session
+        workflow_id: Workflow the payload was extracted from
+        layer: Extractor tag (e.g. 'L2V2', 'L3V3', 'UNIFIED')
+        payload: Extraction payload
+
+    Returns:
+        SHA-256 digest of the payload
+    """
+    digest = put_json(session, payload)
+    session.execute(text(SNAPSHOT_INSERT_SQL), {'workflow_id': workflow_id, 'layer': layer, 'sha256': digest})
+    return digest
+
+
+def load_snapshot(session, snapshot_id: int) -> Optional[Any]:
+    """
+    Payload of an extraction snapshot.
+
+    Args:
+        session: SQLAlchemy session
+        snapshot_id: workflow_extraction_snapshots.id
+
+    Returns:
+        The payload, or None if there is no such snapshot
+    """
+    row = session.execute(
+        text("SELECT payload, payload_sha256 FROM workflow_extraction_snapshots WHERE id = :id"),
+        {'id': snapshot_id}
+    ).first()
+    if row is None:
+        return None
+    if row.payload_sha256:
+        return load_json(session, row.payload_sha256)
+    # Not offloaded yet (written before the store was installed)
+    return json.loads(row.payload) if isinstance(row.payload, str) else row.payload
+
+
+def offload_snapshots(session, batch_size: int = 500) -> int:
+    """
+    Move one batch of inline snapshot payloads into the blob store.
+
+    The caller commits and repeats until it returns 0.
+
+    Args:
+        session: SQLAlchemy session
+        batch_size: Snapshots per batch
+
+    Returns:
+        Number of snapshots moved
+    """
+    rows = session.execute(
+        text(
+            "SELECT id, payload FROM workflow_extraction_snapshots "
+            "WHERE payload_sha256 IS NULL AND payload IS NOT NULL ORDER BY id LIMIT :limit"
+        ),
+        {'limit': batch_size}
+    ).all()
+    for row in rows:
+        payload = json.loads(row.payload) if isinstance(row.payload, str) else row.payload
+        session.execute(
+            text("UPDATE workflow_extraction_snapshots SET payload_sha256 = :sha256, payload = NULL WHERE id = :id"),
+            {'sha256': put_json(session, payload), 'id': row.id}
+        )
+    return len(rows)
+
+
+def prune_blobs(session) -> int:
+    """
+    Delete blobs no row references any more.
+
+    Run after deleting snapshots (e.g. in maintenance). Referencing tables
+    not installed yet are skipped. The caller commits.
+
+    Args:
+        session: SQLAlchemy session
+
+    Returns:
+        Number of blobs deleted
+    """
+    inspector = inspect(session.connection())
+    references = [(table, column) for table, column in BLOB_REFERENCES if inspector.has_table(table)]
+    if not references:
+        return 0
+    unreferenced = " AND ".join(
+        f"NOT EXISTS (SELECT 1 FROM {table} WHERE {table}.{column} = {BLOB_TABLE}.sha256)"
+        for table, column in references
+    )
+    return session.execute(text(f"DELETE FROM {BLOB_TABLE} WHERE {unreferenced}")).rowcount
+
+
+def blob_stats(session) -> Dict[str, Any]:
+    """
+    Size of the blob store.
+
+    Args:
+        session: SQLAlchemy session
+
+    Returns:
+        Blob count, uncompressed and stored bytes, and the compression ratio
+    """
+    row = session.execute(text(
+        f"SELECT COUNT(*) AS blobs, COALESCE(SUM(raw_size), 0) AS raw_bytes, "
+        f"COALESCE(SUM(LENGTH(data)), 0) AS stored_bytes FROM {BLOB_TABLE}"
+    )).mappings().one()
+    stats = {column: int(value) for column, value in row.items()}
+    stats['compression_ratio'] = round(stats['raw_bytes'] / stats['stored_bytes'], 2) if stats['stored_bytes'] else 0
+    return stats
+
+
+def blob_store_statements() -> List[str]:
+    """
+    Postgres statements creating the blob store and the snapshot references.
+
+    Returns:
+        Idempotent DDL statements, without trailing semicolons
+    """
+    return [
+        f"CREATE TABLE IF NOT EXISTS {BLOB_TABLE} (\n"
+        "    sha256 CHAR(64) PRIMARY KEY,\n"
+        "    raw_size INTEGER NOT NULL,\n"
+        "    data BYTEA NOT NULL,\n"
+        "    created_at TIMESTAMP NOT NULL DEFAULT NOW()\n"
+        ")",
+        # Already zstd-compressed: store out of line without pglz
+        f"ALTER TABLE {BLOB_TABLE} ALTER COLUMN data SET STORAGE EXTERNAL",
+        "ALTER TABLE workflow_extraction_snapshots\n"
+        f"    ADD COLUMN IF NOT EXISTS payload_sha256 CHAR(64) REFERENCES {BLOB_TABLE} (sha256)",
+        "ALTER TABLE workflow_extraction_snapshots ALTER COLUMN payload DROP NOT NULL",
+        "CREATE INDEX IF NOT EXISTS idx_extraction_snapshots_payload_sha256\n"
+        "    ON workflow_extraction_snapshots (payload_sha256)",
+        # Offloaded payloads are NULL; the GIN index would only index what's left inline
+        "DROP INDEX IF EXISTS idx_extraction_snapshots_gin",
+    ]
+
+
+def blob_store_ddl() -> str:
+    """
+    Migration script for the blob store.
+
+    Returns:
+        SQL script (the contents of migrations/payload_blobs.sql)
+    """
+    header = (
+        "-- Payload Blob Store\n"
+        "-- Generated by `python scripts/install_blob_store.py --sql` from\n"
+        "-- src/storage/blob_store.py; edit the definitions there, not here.\n"
+        "-- Snapshot payloads move to payload_blobs (zstd, keyed by SHA-256 of the\n"
+        "-- canonical JSON). Existing payloads are compressed client-side, so move\n"
+        "-- them with `python scripts/install_blob_store.py` after applying this."
+    )
+    return "\n\n".join([header] + [f"{statement};" for statement in blob_store_statements()]) + "\n"
@@ -0,0 +1,107 @@
+"""
+Bulk upserts for workflow storage.
+
+WorkflowRepository.create_workflow checks every table for an existing row and
+then updates or inserts it, one round trip per table per workflow. The helpers
+here write many rows of one table with a single
+`INSERT ... ON CONFLICT (key) DO UPDATE` statement, executed as executemany
+(batched multi-row VALUES on psycopg2).
+
+Each row carries the columns to insert and the subset of columns an existing
+row should take over, so "only overwrite what this result contains" update
+rules survive the move to set-based writes. Rows with the same column sets
+share one statement.
+
+Usage:
+    rows = [UpsertRow({'workflow_id': '2462', 'title': 'Demo'}, ('title',))]
+    written = upsert_rows(session, WorkflowMetadata.__table__, rows, keys=('workflow_id',))
+"""
+
+from typing import Any, Dict, Iterable, List, NamedTuple, Sequence, Tuple
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+# Dialects with INSERT ... ON CONFLICT support
+UPSERT_DIALECTS = {
+    'postgresql': postgresql.insert,
+    'sqlite': sqlite.insert,
+}
+
+
+class UpsertRow(NamedTuple):
+    """Column values to insert, and the columns an existing row is updated with."""
+    values: Dict[str, Any]
+    update_columns: Tuple[str, ...]
+
+
+def merge_rows(rows: Iterable[UpsertRow], keys: Sequence[str]) -> List[UpsertRow]:
+    """
+    Collapse rows with the same key, later values winning.
+
+    One statement may not touch the same row twice, so duplicates in a batch
+    (the same workflow stored twice) are merged the way sequential writes
+    would leave them: the first row's values, overwritten by each later row's
+    update columns.
+
+    Args:
+        rows: Rows in write order
+        keys: Conflict key columns
+
+    Returns:
+        One row per key, in order of first appearance
+    """
+    merged: Dict[Tuple, UpsertRow] = {}
+    for row in rows:
+        key = tuple(row.values[column] for column in keys)
+        if key in merged:
+            earlier = merged[key]
+            update_columns = earlier.update_columns + tuple(
+                column for column in row.update_columns if column not in earlier.update_columns
+            )
+            # The later row only updates what the earlier one inserted
+            values = {**earlier.values, **{column: row.values[column] for column in row.update_columns}}
+            row = UpsertRow(values, update_columns)
+        merged[key] = row
+    return list(merged.values())
+
+
+def upsert_rows(session, table, rows: Sequence[UpsertRow], keys: Sequence[str]) -> int:
+    """
+    Insert or update rows with one ON CONFLICT statement per column layout.
+
+    Args:
+        session: SQLAlchemy session (committed by the caller)
+        table: Target Table (e.g. `Model.__table__`)
+        rows: Rows to write; keys must be covered by a unique index
+        keys: Conflict key columns
+
+    Returns:
+        Number of rows written
+    """
+    if not rows:
+        return 0
+    dialect = session.get_bind().dialect.name
+    if dialect not in UPSERT_DIALECTS:
+        raise ValueError(f"Bulk upsert needs one of {sorted(UPSERT_DIALECTS)}, got '{dialect}'")
+    insert = UPSERT_DIALECTS[dialect]
+
+    # Like ORM attribute assignment, values for columns the table lacks are ignored
+    columns = set(table.columns.keys())
+    rows = merge_rows(rows, keys)
+    layouts: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], List[Dict[str, Any]]] = {}
+    for row in rows:
+        values = {column: value for column, value in row.values.items() if column in columns}
+        update_columns = tuple(sorted(set(row.update_columns) & columns - set(keys)))
+        layouts.setdefault((tuple(sorted(values)), update_columns), []).append(values)
+
+    for (_, update_columns), values in layouts.items():
+        statement = insert(table)
+        if update_columns:
+            statement = statement.on_conflict_do_update(
+                index_elements=list(keys),
+                set_={column: statement.excluded[column] for column in update_columns}
+            )
+        else:
+            statement = statement.on_conflict_do_nothing(index_elements=list(keys))
+        session.execute(statement, values)
+    return len(rows)
@@ -17,7 +17,9 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, OperationalError
 from loguru import logger
 
+from .blob_store import prune_blobs, save_snapshot
 from .database import get_session, engine
+from .snapshot_lifecycle import add_partitions, compact_snapshots, lifecycle_installed
 from n8n_shared.models import Workflow, WorkflowNodeContext, WorkflowStandaloneDoc, WorkflowExtractionSnapshot
 
 
@@ -369,11 +371,10 @@ class EnhancedDatabaseManager:
             return 0, len(standalone_docs)
     
     async def save_extraction_snapshot(self, snapshot: Dict[str, Any]) -> bool:
-        """Save extraction snapshot."""
+        """Save extraction snapshot (workflow_id, layer, payload); the payload goes to the blob store."""
         try:
             async with self.get_optimized_session() as session:
-                snapshot_obj = WorkflowExtractionSnapshot(**snapshot)
-                session.add(snapshot_obj)
+                save_snapshot(session, snapshot['workflow_id'], snapshot['layer'], snapshot['payload'])
                 session.commit()
                 logger.debug(f"Saved extraction snapshot: {snapshot.get('workflow_id')}")
                 return True
@@ -486,16 +487,36 @@ class EnhancedDatabaseManager:
                 for table in tables:
                     session.execute(text(f"ANALYZE {table}"))
                 
-                # Clean up old data
-                session.execute(text("""
-                    DELETE FROM workflow_extraction_snapshots 
-                    WHERE created_at < NOW() - INTERVAL '6 months'
-                """))
+                session.commit()
+                
+                # Compact snapshots past retention into archives (history is kept, not deleted)
+                if lifecycle_installed(session):
+                    try:
+                        add_partitions(session)
+                        session.commit()
+                        after = None
+                        while True:
+                            after = compact_snapshots(session, after=after)['last_group']
+                            session.commit()
+                            if after is None:
+                                break
+                    except Exception as e:
+                        session.rollback()
+                        logger.error(f"Snapshot compaction failed: {e}")
+                else:
+                    logger.warning("Snapshot lifecycle not installed (migrations/snapshot_partitions.sql); skipping compaction")
                 
                 # Clean up orphaned data
                 await self.cleanup_orphaned_data()
                 
-                session.commit()
+                # Drop payloads no remaining snapshot references
+                try:
+                    prune_blobs(session)
+                    session.commit()
+                except Exception as e:
+                    session.rollback()
+                    logger.error(f"Blob pruning failed: {e}")
+                
                 logger.info("Database maintenance completed")
                 return True
                 
@@ -14,6 +14,7 @@ from loguru import logger
 
 from src.storage.database import get_session
 from n8n_shared.models import WorkflowStructure
+from src.scrapers.workflow_index import WorkflowIndex
 
 
 class Layer2EnhancedStorage:
@@ -222,12 +223,11 @@ class Layer2EnhancedStorage:
         if not api_data.get('success') or not api_data.get('data'):
             return []
         
-        workflow = api_data.get('data', {}).get('workflow', {})
-        nodes = workflow.get('nodes', [])
+        # Layer 2 already indexed the workflow JSON; older results are indexed here
+        if 'node_types' in api_data:
+            return list(api_data['node_types'])
         
-        # Extract unique node types
-        node_types = list(set(node.get('type') for node in nodes if node.get('type')))
-        return node_types
+        return WorkflowIndex.from_api_response(api_data.get('data')).node_types
     
     def get_workflow_structure(self, workflow_id: str) -> Optional[WorkflowStructure]:
         """
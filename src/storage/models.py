@@ -20,7 +20,7 @@ Date: October 11, 2025 + October 12, 2025
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, Float, Boolean, DateTime, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, Text, Float, Boolean, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import declarative_base, relationship
 
@@ -315,6 +315,11 @@ class VideoTranscript(Base):
     # Relationship
     workflow = relationship("Workflow", back_populates="transcripts")
     
+    # One transcript per video per workflow (bulk upsert conflict target)
+    __table_args__ = (
+        UniqueConstraint('workflow_id', 'video_url', name='uq_video_transcripts_workflow_video'),
+    )
+    
     def __repr__(self):
         return f"<VideoTranscript(workflow_id={self.workflow_id}, platform={self.platform})>"
 
@@ -330,7 +335,7 @@ class WorkflowBusinessIntelligence(Base):
     
     # Primary Key
     id = Column(Integer, primary_key=True)
-    workflow_id = Column(String(50), ForeignKey('workflows.workflow_id', ondelete='CASCADE'), nullable=False)
+    workflow_id = Column(String(50), ForeignKey('workflows.workflow_id', ondelete='CASCADE'), nullable=False, unique=True)
     
     # Revenue & Cost Metrics
     revenue_impact = Column(Float)
@@ -413,7 +418,7 @@ class WorkflowCommunityData(Base):
     
     # Primary Key
     id = Column(Integer, primary_key=True)
-    workflow_id = Column(String(50), ForeignKey('workflows.workflow_id', ondelete='CASCADE'), nullable=False)
+    workflow_id = Column(String(50), ForeignKey('workflows.workflow_id', ondelete='CASCADE'), nullable=False, unique=True)
     
     # Engagement Metrics
     comments_count = Column(Integer, default=0)
@@ -470,7 +475,7 @@ class WorkflowTechnicalDetails(Base):
     
     # Primary Key
     id = Column(Integer, primary_key=True)
-    workflow_id = Column(String(50), ForeignKey('workflows.workflow_id', ondelete='CASCADE'), nullable=False)
+    workflow_id = Column(String(50), ForeignKey('workflows.workflow_id', ondelete='CASCADE'), nullable=False, unique=True)
     
     # API Information
     api_endpoints = Column(JSONB)
@@ -556,7 +561,7 @@ class WorkflowPerformanceAnalytics(Base):
     
     # Primary Key
     id = Column(Integer, primary_key=True)
-    workflow_id = Column(String(50), ForeignKey('workflows.workflow_id', ondelete='CASCADE'), nullable=False)
+    workflow_id = Column(String(50), ForeignKey('workflows.workflow_id', ondelete='CASCADE'), nullable=False, unique=True)
     
     # Execution Metrics
     execution_success_rate = Column(Float)
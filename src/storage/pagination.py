@@ -0,0 +1,271 @@
+"""
+Keyset pagination for workflow listings.
+
+The viewers and list_workflows() paged with `LIMIT n OFFSET m` plus a
+`COUNT(*)` per request: page k scans and discards every row of pages 1..k-1,
+and the count scans the whole (filtered) catalog on every page view.
+Listings now page by keyset instead:
+- Rows are ordered by (sort key, workflow_id); workflow_id breaks ties so the
+  order is total and no row is skipped or repeated between pages
+- A page starts after (or, going back, before) the boundary row's key, a
+  `(key, workflow_id) < (boundary key, boundary id)` range an index on
+  (key, workflow_id) serves directly, whatever the page depth
+- The boundary travels as an opaque cursor (base64 JSON carrying the sort,
+  order, key and workflow_id), so clients can't forge offsets into other sorts
+- Totals come from the workflow_stats summary (unfiltered) or the planner's
+  row estimate (filtered), not a count
+
+Sort keys never evaluate to NULL (row comparison with NULL matches nothing):
+nullable columns are COALESCEd to a value below any real one, so missing
+values sort last in descending order. KEYSET_INDEX_SQL creates the matching
+expression indexes; migrations/workflow_keyset_indexes.sql is generated from
+SORT_KEYS by `python scripts/install_keyset_indexes.py --sql`.
+
+Usage:
+    page = fetch_page(conn, "workflow_id, url", sort='quality_score', order='DESC', limit=50)
+    later = fetch_page(conn, "workflow_id, url", sort='quality_score', order='DESC',
+                       limit=50, cursor=page.next_cursor)
+    total, exact = estimate_count(conn)
+"""
+
+import base64
+import binascii
+import json
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import tuple_
+
+from src.storage.workflow_stats import STATS_TABLE
+
+# Sort name -> SQL key over workflows (never NULL), valid on Postgres and SQLite.
+# Numeric IDs sort by length, then by workflow_id (the tie-breaker), which is
+# numeric order without a CAST that a non-numeric workflow_id would break
+SORT_KEYS = {
+    'workflow_id': "LENGTH(workflow_id)",
+    'url': "url",
+    'quality_score': "COALESCE(quality_score, -1)",
+    'processing_time': "COALESCE(processing_time, -1)",
+    'created_at': "COALESCE(created_at, '0001-01-01')",
+    'extracted_at': "COALESCE(extracted_at, '0001-01-01')",
+    'last_scraped_at': "COALESCE(last_scraped_at, '0001-01-01')",
+    'scraping_status': (
+        "CASE WHEN layer1_success AND layer2_success AND layer3_success THEN 4 "
+        "WHEN layer1_success OR layer2_success OR layer3_success THEN 3 "
+        "WHEN last_scraped_at IS NOT NULL THEN 2 ELSE 1 END"
+    ),
+}
+
+# One (key, workflow_id) index per sort; btree indexes scan both ways, so one serves ASC and DESC
+KEYSET_INDEX_SQL = {
+    sort: f"CREATE INDEX IF NOT EXISTS idx_workflows_keyset_{sort} ON workflows (({key}), workflow_id)"
+    for sort, key in SORT_KEYS.items()
+}
+
+
+class Page(NamedTuple):
+    """One page of a keyset listing."""
+    rows: List[Dict[str, Any]]
+    next_cursor: Optional[str]
+    prev_cursor: Optional[str]
+
+
+def _normalize_order(order: str) -> str:
+    return 'ASC' if order.upper() == 'ASC' else 'DESC'
+
+
+def encode_cursor(sort: str, order: str, key: Any, workflow_id: str) -> str:
+    """
+    Opaque cursor for the position of one row in a listing.
+
+    Args:
+        sort: Sort name the listing uses
+        order: 'ASC' or 'DESC'
+        key: The row's sort key value
+        workflow_id: The row's workflow_id (tie-breaker)
+
+    Returns:
+        URL-safe cursor string
+    """
+    kind = 'datetime' if isinstance(key, datetime) else 'value'
+    value = key.isoformat() if kind == 'datetime' else key
+    payload = json.dumps([sort, _normalize_order(order), kind, value, workflow_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, sort: str, order: str) -> Tuple[Any, str]:
+    """
+    Position a cursor points at.
+
+    Args:
+        cursor: Cursor from encode_cursor()
+        sort: Sort name of the listing being paged
+        order: Order of the listing being paged
+
+    Returns:
+        (sort key value, workflow_id)
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another sort or order
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        cursor_sort, cursor_order, kind, value, workflow_id = json.loads(base64.urlsafe_b64decode(padded))
+        if kind == 'datetime':
+            value = datetime.fromisoformat(value)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
+    if (cursor_sort, cursor_order) != (sort, _normalize_order(order)):
+        raise ValueError(f"Cursor is for sort {cursor_sort} {cursor_order}, not {sort} {_normalize_order(order)}")
+    return value, workflow_id
+
+
+def keyset_filter(key, id_column, position: Tuple[Any, str], descending: bool):
+    """
+    SQLAlchemy condition selecting the rows after a position.
+
+    Args:
+        key: Sort key column or expression
+        id_column: Tie-breaker column (workflow_id)
+        position: (key value, workflow_id) from decode_cursor()
+        descending: Listing order
+
+    Returns:
+        `(key, id) < position` for descending listings, `>` otherwise
+    """
+    row, boundary = tuple_(key, id_column), tuple_(*position)
+    return row < boundary if descending else row > boundary
+
+
+def fetch_page(
+    connection,
+    columns: str,
+    sort: str = 'extracted_at',
+    order: str = 'DESC',
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    backwards: bool = False,
+    where: str = '',
+    params: Sequence[Any] = ()
+) -> Page:
+    """
+    Fetch one page of workflows by keyset (DB-API).
+
+    Args:
+        connection: Open DB-API connection (psycopg2, or sqlite3 for local runs)
+        columns: SELECT list over workflows (must not be named sort_key)
+        sort: Key of SORT_KEYS (unknown names fall back to extracted_at)
+        order: 'ASC' or 'DESC'
+        limit: Rows per page
+        cursor: Page boundary from a previous Page (None: first page)
+        backwards: Return the page before the cursor instead of after it
+        where: Optional filter condition (without WHERE), with the driver's
+            placeholders (%s for psycopg2, ? for sqlite3)
+        params: Parameters for `where`
+
+    Returns:
+        Page of row dicts with cursors to its neighbours (None at either end)
+
+    Raises:
+        ValueError: If the cursor is invalid for this sort and order
+    """
+    sort = sort if sort in SORT_KEYS else 'extracted_at'
+    order = _normalize_order(order)
+    key = SORT_KEYS[sort]
+    position = decode_cursor(cursor, sort, order) if cursor else None
+    mark = '?' if isinstance(connection, sqlite3.Connection) else '%s'
+
+    conditions = [f"({where})"] if where else []
+    query_params = list(params)
+    # Going back walks the listing in reverse from the cursor, then flips the rows
+    scan_descending = (order == 'DESC') != backwards
+    if position is not None:
+        conditions.append(f"({key}, workflow_id) {'<' if scan_descending else '>'} ({mark}, {mark})")
+        query_params.extend(position)
+    direction = 'DESC' if scan_descending else 'ASC'
+    query = (
+        f"SELECT {columns}, {key} AS sort_key FROM workflows "
+        f"{'WHERE ' + ' AND '.join(conditions) if conditions else ''} "
+        f"ORDER BY {key} {direction}, workflow_id {direction} LIMIT {mark}"
+    )
+    query_params.append(limit + 1)
+
+    db_cursor = connection.cursor()
+    try:
+        db_cursor.execute(query, query_params)
+        names = [column[0] for column in db_cursor.description]
+        rows = [dict(zip(names, row, strict=True)) for row in db_cursor.fetchall()]
+    finally:
+        db_cursor.close()
+
+    # One extra row tells whether anything lies beyond this page
+    more = len(rows) > limit
+    rows = rows[:limit]
+    if backwards:
+        rows.reverse()
+    has_next, has_prev = (position is not None, more) if backwards else (more, position is not None)
+
+    keys = [row.pop('sort_key') for row in rows]
+    if not rows:
+        return Page(rows, None, None)
+    return Page(
+        rows,
+        encode_cursor(sort, order, keys[-1], rows[-1]['workflow_id']) if has_next else None,
+        encode_cursor(sort, order, keys[0], rows[0]['workflow_id']) if has_prev else None,
+    )
+
+
+def estimate_count(connection, where: str = '', params: Sequence[Any] = ()) -> Tuple[int, bool]:
+    """
+    Workflow count for pagination, without counting rows.
+
+    Unfiltered totals come from the workflow_stats summary (exact) or, when it
+    isn't installed, the table's row estimate. Filtered totals are the
+    planner's estimate for the condition.
+
+    Args:
+        connection: Open DB-API connection (psycopg2)
+        where: Optional filter condition (without WHERE), %s placeholders
+        params: Parameters for `where`
+
+    Returns:
+        (count, whether the count is exact)
+    """
+    db_cursor = connection.cursor()
+    try:
+        if where:
+            db_cursor.execute(f"EXPLAIN (FORMAT JSON) SELECT 1 FROM workflows WHERE {where}", list(params))
+            plan = db_cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]['Plan']['Plan Rows']), False
+
+        db_cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (STATS_TABLE,))
+        if db_cursor.fetchone()[0]:
+            db_cursor.execute(f"SELECT COUNT(*), COALESCE(SUM(total_workflows), 0) FROM {STATS_TABLE}")
+            slots, total = db_cursor.fetchone()
+            if slots:
+                return int(total), True
+
+        # reltuples is -1 before the first VACUUM/ANALYZE
+        db_cursor.execute("SELECT reltuples FROM pg_class WHERE oid = 'workflows'::regclass")
+        return max(int(db_cursor.fetchone()[0]), 0), False
+    finally:
+        db_cursor.close()
+
+
+def keyset_index_ddl() -> str:
+    """
+    Migration script: one (sort key, workflow_id) index per sort.
+
+    Returns:
+        SQL script (the contents of migrations/workflow_keyset_indexes.sql)
+    """
+    header = (
+        "-- Workflow Listing Keyset Indexes\n"
+        "-- Generated by `python scripts/install_keyset_indexes.py --sql` from\n"
+        "-- src/storage/pagination.py; edit SORT_KEYS there, not here.\n"
+        "-- Each index matches one viewer sort so a page is a single index range scan."
+    )
+    return "\n\n".join([header] + [f"{statement};" for statement in KEYSET_INDEX_SQL.values()]) + "\n"
@@ -9,15 +9,20 @@ Task: SCRAPE-008
 Date: October 11, 2025
 """
 
-from typing import List, Optional, Dict, Any
+import time
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 from datetime import datetime
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
+from sqlalchemy import literal_column
 
 from loguru import logger
 
+from src.storage.bulk_upsert import UpsertRow, upsert_rows
 from src.storage.database import get_session
+from src.storage.pagination import SORT_KEYS, decode_cursor, encode_cursor, keyset_filter
+from src.storage.search import index_workflows, search_workflows as search_index
+from src.storage.workflow_stats import read_statistics
 from n8n_shared.models import (
     Workflow,
     WorkflowMetadata,
@@ -32,6 +37,25 @@ from n8n_shared.models import (
     WorkflowEnhancedContent
 )
 
+# Tables written by bulk_upsert_workflows, parents first, with their conflict keys
+BULK_UPSERT_TABLES = (
+    (Workflow, ('workflow_id',)),
+    (WorkflowMetadata, ('workflow_id',)),
+    (WorkflowStructure, ('workflow_id',)),
+    (WorkflowContent, ('workflow_id',)),
+    (VideoTranscript, ('workflow_id', 'video_url')),
+    (WorkflowBusinessIntelligence, ('workflow_id',)),
+    (WorkflowCommunityData, ('workflow_id',)),
+    (WorkflowTechnicalDetails, ('workflow_id',)),
+    (WorkflowPerformanceAnalytics, ('workflow_id',)),
+)
+
+# Layer 2 fields create_workflow only overwrites when the result contains them
+STRUCTURE_OPTIONAL_FIELDS = (
+    'iframe_data', 'visual_layout', 'enhanced_content',
+    'media_content', 'extraction_sources', 'completeness_metrics'
+)
+
 
 class WorkflowRepository:
     """
@@ -328,6 +352,9 @@ class WorkflowRepository:
                     performance = self._create_performance_analytics(workflow_id, layer7_data)
                     session.add(performance)
             
+            # Keep the local search index current (Postgres triggers do this themselves)
+            index_workflows(session, [workflow_id])
+            
             # Commit if we own the session
             if self._owns_session:
                 session.commit()
@@ -345,6 +372,204 @@ class WorkflowRepository:
             if self._owns_session:
                 session.close()
     
+    def bulk_upsert_workflows(
+        self,
+        results: Sequence[Tuple[str, str, Dict[str, Any]]],
+        batch_size: int = 500
+    ) -> Dict[str, Any]:
+        """
+        Store many extraction results with set-based upserts.
+        
+        Writes the same rows as calling create_workflow for each result, but
+        with one INSERT ... ON CONFLICT DO UPDATE per table per batch instead
+        of an existence check and insert/update per table per workflow.
+        
+        Args:
+            results: (workflow_id, url, extraction_result) per workflow
+            batch_size: Workflows per transaction
+        
+        Returns:
+            Dictionary with workflows written, batches, rows written per table
+            and seconds per batch
+        
+        Example:
+            stats = repo.bulk_upsert_workflows([('2462', url, result), ...])
+        """
+        stats = {
+            'workflows': 0,
+            'batches': 0,
+            'rows': {model.__tablename__: 0 for model, _ in BULK_UPSERT_TABLES},
+            'batch_seconds': []
+        }
+        
+        for batch_start in range(0, len(results), batch_size):
+            batch = results[batch_start:batch_start + batch_size]
+            session = self._get_session()
+            start_time = time.time()
+            
+            try:
+                now = datetime.utcnow()
+                rows: Dict[str, List[UpsertRow]] = {model.__tablename__: [] for model, _ in BULK_UPSERT_TABLES}
+                for workflow_id, url, extraction_result in batch:
+                    for table, table_rows in self._workflow_upsert_rows(workflow_id, url, extraction_result, now).items():
+                        rows[table].extend(table_rows)
+                
+                written = {}
+                for model, keys in BULK_UPSERT_TABLES:
+                    written[model.__tablename__] = upsert_rows(session, model.__table__, rows[model.__tablename__], keys)
+                index_workflows(session, [workflow_id for workflow_id, _, _ in batch])
+                
+                if self._owns_session:
+                    session.commit()
+                
+            except Exception as e:
+                if self._owns_session:
+                    session.rollback()
+                logger.error(f"Error bulk storing workflows {batch_start}-{batch_start + len(batch)}: {e}")
+                raise
+            finally:
+                if self._owns_session:
+                    session.close()
+            
+            elapsed = time.time() - start_time
+            stats['workflows'] += len(batch)
+            stats['batches'] += 1
+            stats['batch_seconds'].append(round(elapsed, 3))
+            for table, count in written.items():
+                stats['rows'][table] += count
+            logger.info(f"Bulk stored {len(batch)} workflows in {elapsed:.2f}s: {written}")
+        
+        return stats
+    
+    def _workflow_upsert_rows(
+        self,
+        workflow_id: str,
+        url: str,
+        extraction_result: Dict[str, Any],
+        now: datetime
+    ) -> Dict[str, List[UpsertRow]]:
+        """
+        Rows create_workflow would write for one result, keyed by table name.
+        
+        Update columns follow create_workflow's update branches: Layer 1-3 rows
+        are overwritten, optional Layer 2 fields and Layer 4-7 fields only when
+        the result contains them.
+        """
+        layers_data = extraction_result.get('layers', {})
+        quality_data = extraction_result.get('quality') or {}
+        rows: Dict[str, List[UpsertRow]] = {}
+        
+        workflow_values = {
+            'workflow_id': workflow_id,
+            'url': url,
+            'processing_time': extraction_result.get('extraction_time'),
+            'quality_score': quality_data.get('overall_score'),
+            **{f"layer{n}_success": (layers_data.get(f"layer{n}") or {}).get('success', False) for n in range(1, 8)},
+            'last_scraped_at': extraction_result.get('extracted_at'),
+            'updated_at': now
+        }
+        rows[Workflow.__tablename__] = [UpsertRow(workflow_values, tuple(workflow_values))]
+        
+        layer1_data = layers_data.get('layer1', {})
+        if layer1_data.get('success'):
+            raw_data = layer1_data.get('data', {})
+            metadata_values = {
+                'workflow_id': workflow_id,
+                'title': layer1_data.get('title'),
+                'description': layer1_data.get('description'),
+                'use_case': layer1_data.get('use_case'),
+                'author_name': layer1_data.get('author', {}).get('name'),
+                'author_url': layer1_data.get('author', {}).get('url'),
+                'views': layer1_data.get('views'),
+                'shares': layer1_data.get('shares'),
+                'categories': self._extract_categories(raw_data),
+                'tags': self._extract_tags(raw_data),
+                'workflow_created_at': layer1_data.get('created_at'),
+                'workflow_updated_at': layer1_data.get('updated_at'),
+                'raw_metadata': layer1_data
+            }
+            rows[WorkflowMetadata.__tablename__] = [UpsertRow(metadata_values, tuple(metadata_values))]
+        
+        layer2_data = layers_data.get('layer2', {})
+        if layer2_data.get('success'):
+            structure_values = {
+                'workflow_id': workflow_id,
+                'node_count': layer2_data.get('node_count'),
+                'connection_count': layer2_data.get('connection_count'),
+                'node_types': layer2_data.get('node_types', []),
+                'extraction_type': layer2_data.get('extraction_type', 'full'),
+                'fallback_used': layer2_data.get('fallback_used', False),
+                'workflow_json': layer2_data.get('data')
+            }
+            update_columns = tuple(structure_values)
+            update_columns += tuple(field for field in STRUCTURE_OPTIONAL_FIELDS if field in layer2_data)
+            structure_values.update({field: layer2_data.get(field) for field in STRUCTURE_OPTIONAL_FIELDS})
+            rows[WorkflowStructure.__tablename__] = [UpsertRow(structure_values, update_columns)]
+        
+        layer3_data = layers_data.get('layer3', {})
+        if layer3_data.get('success'):
+            content_values = {
+                'workflow_id': workflow_id,
+                'explainer_text': layer3_data.get('explainer_text'),
+                'explainer_html': layer3_data.get('explainer_html'),
+                'setup_instructions': layer3_data.get('setup_instructions'),
+                'use_instructions': layer3_data.get('use_instructions'),
+                'has_videos': layer3_data.get('has_videos', False),
+                'video_count': len(layer3_data.get('videos', [])),
+                'has_iframes': layer3_data.get('has_iframes', False),
+                'iframe_count': layer3_data.get('iframe_count', 0),
+                'raw_content': layer3_data
+            }
+            rows[WorkflowContent.__tablename__] = [UpsertRow(content_values, tuple(content_values))]
+            
+            transcripts = []
+            for video in layer3_data.get('videos', []):
+                if video.get('transcript'):
+                    transcript_values = {
+                        'workflow_id': workflow_id,
+                        'video_url': video.get('url'),
+                        'video_id': video.get('video_id'),
+                        'platform': video.get('platform', 'youtube'),
+                        'transcript_text': video.get('transcript', {}).get('text'),
+                        'transcript_json': video.get('transcript'),
+                        'duration': video.get('transcript', {}).get('duration'),
+                        'language': video.get('transcript', {}).get('language', 'en')
+                    }
+                    transcripts.append(UpsertRow(transcript_values, tuple(transcript_values)))
+            rows[VideoTranscript.__tablename__] = transcripts
+        
+        analytics = (
+            ('layer4', WorkflowBusinessIntelligence, self._create_business_intelligence),
+            ('layer5', WorkflowCommunityData, self._create_community_data),
+            ('layer6', WorkflowTechnicalDetails, self._create_technical_details),
+            ('layer7', WorkflowPerformanceAnalytics, self._create_performance_analytics),
+        )
+        for layer, model, create in analytics:
+            layer_data = layers_data.get(layer) or {}
+            if not layer_data.get('success'):
+                continue
+            rows[model.__tablename__] = [self._analytics_upsert_row(model, create(workflow_id, layer_data), layer_data, now)]
+        
+        return rows
+    
+    @staticmethod
+    def _analytics_upsert_row(model, created, layer_data: Dict[str, Any], now: datetime) -> UpsertRow:
+        """
+        Upsert row for a Layer 4-7 table.
+        
+        Inserts the columns the `_create_*` builder sets; an existing row takes
+        only the fields present in the layer data, as in the `_update_*` methods.
+        """
+        columns = model.__table__.columns.keys()
+        values = {column: getattr(created, column) for column in columns if column in created.__dict__}
+        data = layer_data.get('data', {})
+        update_columns = tuple(column for column in data if column in columns and column not in ('id', 'workflow_id'))
+        values.update({column: data[column] for column in update_columns})
+        if update_columns and 'updated_at' in columns:
+            values['updated_at'] = now
+            update_columns += ('updated_at',)
+        return UpsertRow(values, update_columns)
+    
     def get_workflow(
         self,
         workflow_id: str,
@@ -398,6 +623,9 @@ class WorkflowRepository:
         """
         List workflows with pagination and filtering.
         
+        Offset pagination rescans every skipped row; use list_workflows_page()
+        to walk deep into the catalog.
+        
         Args:
             offset: Number of records to skip
             limit: Maximum number of records to return
@@ -411,20 +639,7 @@ class WorkflowRepository:
         session = self._get_session()
         
         try:
-            query = session.query(Workflow)
-            
-            # Apply filters
-            if filters:
-                if 'layer1_success' in filters:
-                    query = query.filter(Workflow.layer1_success == filters['layer1_success'])
-                if 'layer2_success' in filters:
-                    query = query.filter(Workflow.layer2_success == filters['layer2_success'])
-                if 'layer3_success' in filters:
-                    query = query.filter(Workflow.layer3_success == filters['layer3_success'])
-                if 'min_quality' in filters:
-                    query = query.filter(Workflow.quality_score >= filters['min_quality'])
-                if 'max_quality' in filters:
-                    query = query.filter(Workflow.quality_score <= filters['max_quality'])
+            query = self._filter_workflows(session.query(Workflow), filters)
             
             # Apply ordering
             order_field = getattr(Workflow, order_by, Workflow.extracted_at)
@@ -442,6 +657,79 @@ class WorkflowRepository:
             if self._owns_session:
                 session.close()
     
+    def list_workflows_page(
+        self,
+        limit: int = 100,
+        order_by: str = 'extracted_at',
+        order_desc: bool = True,
+        filters: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Workflow], Optional[str]]:
+        """
+        List workflows by keyset pagination.
+        
+        Unlike list_workflows(offset=...), every page costs the same however
+        deep it is: it starts at the cursor's (sort key, workflow_id) instead of
+        skipping rows. See src.storage.pagination.
+        
+        Args:
+            limit: Maximum number of records to return
+            order_by: Sort name from SORT_KEYS ('extracted_at', 'quality_score', 'workflow_id', ...)
+            order_desc: If True, order descending
+            filters: Optional filters, as for list_workflows()
+            cursor: next_cursor of the previous page (None: first page)
+        
+        Returns:
+            (workflows, cursor for the next page or None on the last page)
+        
+        Raises:
+            ValueError: If the cursor is invalid for this sort and order
+        """
+        order_by = order_by if order_by in SORT_KEYS else 'extracted_at'
+        order = 'DESC' if order_desc else 'ASC'
+        position = decode_cursor(cursor, order_by, order) if cursor else None
+        session = self._get_session()
+        
+        try:
+            key = literal_column(SORT_KEYS[order_by])
+            query = self._filter_workflows(session.query(Workflow, key), filters)
+            if position is not None:
+                query = query.filter(keyset_filter(key, Workflow.workflow_id, position, order_desc))
+            if order_desc:
+                query = query.order_by(key.desc(), Workflow.workflow_id.desc())
+            else:
+                query = query.order_by(key.asc(), Workflow.workflow_id.asc())
+            
+            # One extra row tells whether there is a next page
+            rows = query.limit(limit + 1).all()
+            next_cursor = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                last_workflow, last_key = rows[-1]
+                next_cursor = encode_cursor(order_by, order, last_key, last_workflow.workflow_id)
+            
+            return [workflow for workflow, _ in rows], next_cursor
+            
+        finally:
+            if self._owns_session:
+                session.close()
+    
+    @staticmethod
+    def _filter_workflows(query, filters: Optional[Dict[str, Any]]):
+        """Apply list_workflows() filters to a workflow query."""
+        if filters:
+            if 'layer1_success' in filters:
+                query = query.filter(Workflow.layer1_success == filters['layer1_success'])
+            if 'layer2_success' in filters:
+                query = query.filter(Workflow.layer2_success == filters['layer2_success'])
+            if 'layer3_success' in filters:
+                query = query.filter(Workflow.layer3_success == filters['layer3_success'])
+            if 'min_quality' in filters:
+                query = query.filter(Workflow.quality_score >= filters['min_quality'])
+            if 'max_quality' in filters:
+                query = query.filter(Workflow.quality_score <= filters['max_quality'])
+        return query
+    
     def update_workflow(
         self,
         workflow_id: str,
@@ -511,6 +799,7 @@ class WorkflowRepository:
                 return False
             
             session.delete(workflow)
+            index_workflows(session, [workflow_id])
             
             if self._owns_session:
                 session.commit()
@@ -531,64 +820,16 @@ class WorkflowRepository:
         """
         Get database statistics.
         
+        Reads the trigger-maintained workflow_stats summary (one query, O(1)
+        rows); falls back to a single aggregate scan where it isn't installed.
+        
         Returns:
             Dictionary with counts, success rates, and other metrics
         """
         session = self._get_session()
         
         try:
-            total = session.query(func.count(Workflow.id)).scalar()
-            
-            layer1_success = session.query(func.count(Workflow.id)).filter(
-                Workflow.layer1_success == True
-            ).scalar()
-            
-            layer2_success = session.query(func.count(Workflow.id)).filter(
-                Workflow.layer2_success == True
-            ).scalar()
-            
-            layer3_success = session.query(func.count(Workflow.id)).filter(
-                Workflow.layer3_success == True
-            ).scalar()
-            
-            layer4_success = session.query(func.count(Workflow.id)).filter(
-                Workflow.layer4_success == True
-            ).scalar()
-            
-            layer5_success = session.query(func.count(Workflow.id)).filter(
-                Workflow.layer5_success == True
-            ).scalar()
-            
-            layer6_success = session.query(func.count(Workflow.id)).filter(
-                Workflow.layer6_success == True
-            ).scalar()
-            
-            layer7_success = session.query(func.count(Workflow.id)).filter(
-                Workflow.layer7_success == True
-            ).scalar()
-            
-            avg_quality = session.query(func.avg(Workflow.quality_score)).scalar() or 0
-            avg_processing_time = session.query(func.avg(Workflow.processing_time)).scalar() or 0
-            
-            return {
-                'total_workflows': total,
-                'layer1_success_count': layer1_success,
-                'layer1_success_rate': (layer1_success / total * 100) if total > 0 else 0,
-                'layer2_success_count': layer2_success,
-                'layer2_success_rate': (layer2_success / total * 100) if total > 0 else 0,
-                'layer3_success_count': layer3_success,
-                'layer3_success_rate': (layer3_success / total * 100) if total > 0 else 0,
-                'layer4_success_count': layer4_success,
-                'layer4_success_rate': (layer4_success / total * 100) if total > 0 else 0,
-                'layer5_success_count': layer5_success,
-                'layer5_success_rate': (layer5_success / total * 100) if total > 0 else 0,
-                'layer6_success_count': layer6_success,
-                'layer6_success_rate': (layer6_success / total * 100) if total > 0 else 0,
-                'layer7_success_count': layer7_success,
-                'layer7_success_rate': (layer7_success / total * 100) if total > 0 else 0,
-                'avg_quality_score': round(avg_quality, 2),
-                'avg_processing_time': round(avg_processing_time, 2)
-            }
+            return read_statistics(session)
             
         finally:
             if self._owns_session:
@@ -891,41 +1132,36 @@ class WorkflowRepository:
     def search_workflows(
         self,
         search_term: str,
-        search_fields: List[str] = ['title', 'description'],
+        search_fields: Optional[List[str]] = None,
         limit: int = 50
     ) -> List[Workflow]:
         """
-        Search workflows by text.
+        Full-text search workflows, best match first.
+        
+        Every word must match as a prefix; see src.storage.search for the
+        index and ranking.
         
         Args:
             search_term: Text to search for
-            search_fields: Fields to search in ('title', 'description', 'use_case')
+            search_fields: Fields to search in ('title', 'description', 'use_case',
+                'explainer', 'transcripts'; default: all). 'explainer' and
+                'transcripts' share a weight and must be requested together
             limit: Maximum results
         
         Returns:
-            List of matching workflows
+            List of matching workflows, ranked
         """
         session = self._get_session()
         
         try:
-            query = session.query(Workflow).join(WorkflowMetadata)
-            
-            # Build search conditions
-            conditions = []
-            search_term_lower = search_term.lower()
-            
-            if 'title' in search_fields:
-                conditions.append(func.lower(WorkflowMetadata.title).contains(search_term_lower))
-            if 'description' in search_fields:
-                conditions.append(func.lower(WorkflowMetadata.description).contains(search_term_lower))
-            if 'use_case' in search_fields:
-                conditions.append(func.lower(WorkflowMetadata.use_case).contains(search_term_lower))
+            hits = search_index(session, search_term, search_fields=search_fields, limit=limit)
+            if not hits:
+                return []
             
-            if conditions:
-                query = query.filter(or_(*conditions))
-            
-            workflows = query.limit(limit).all()
-            return workflows
+            ranked_ids = [hit.workflow_id for hit in hits]
+            workflows = session.query(Workflow).filter(Workflow.workflow_id.in_(ranked_ids)).all()
+            position = {workflow_id: index for index, workflow_id in enumerate(ranked_ids)}
+            return sorted(workflows, key=lambda workflow: position[workflow.workflow_id])
             
         finally:
             if self._owns_session:
@@ -0,0 +1,530 @@
+"""
+Full-text search over workflows.
+
+Replaces `LIKE '%term%'` scans with an inverted index over each workflow's
+title, description, use case, explainer text and video transcripts:
+- Postgres: `workflow_search.search_vector` (weighted tsvector, GIN index),
+  kept current by statement-level triggers on the source tables, which
+  re-index each workflow a statement touched once (migrations/workflow_search.sql)
+  (without it, searches fall back to an unranked ILIKE match of the term)
+- SQLite (local runs and tests): an FTS5 table, built on first use and kept
+  current by the repository write path through index_workflows()
+
+Results are ranked (title > description/use case > explainer/transcripts),
+every search word matches as a prefix ("slack notif" finds "Slack
+notifications"), and each hit carries an HTML-escaped snippet with the
+matches wrapped in <mark>.
+
+Usage:
+    hits = search_workflows(session, 'slack notif', limit=20)
+    for hit in hits:
+        print(hit.workflow_id, hit.rank, hit.snippet)
+
+    # Plain psycopg2 connection (Postgres)
+    hits = search_workflows_dbapi(connection, 'slack notif', limit=20)
+"""
+
+import html
+import re
+from typing import List, NamedTuple, Optional, Sequence
+
+from sqlalchemy import bindparam, text
+
+SEARCH_TABLE = 'workflow_search'
+
+# Searchable fields and their Postgres weight labels (A ranks highest). A
+# tsvector has only four labels, so explainer and transcripts share D and can
+# only be searched together (see _fields)
+SEARCH_FIELDS = {
+    'title': 'A',
+    'description': 'B',
+    'use_case': 'C',
+    'explainer': 'D',
+    'transcripts': 'D',
+}
+
+# ts_rank weights for {D, C, B, A}; FTS5 bm25 weights per column, same order as FTS_COLUMNS
+RANK_WEIGHTS = '{0.1, 0.4, 0.4, 1.0}'
+FTS_COLUMNS = ('title', 'description', 'use_case', 'explainer', 'transcripts')
+FTS_WEIGHTS = (10.0, 4.0, 4.0, 1.0, 1.0)
+
+# Long transcripts are cut so one document stays within the tsvector size limit
+TRANSCRIPT_CHARS = 100000
+
+# Highlight markers; swapped for <mark> after the snippet is HTML-escaped
+MARK_START, MARK_END = '⟦', '⟧'
+SNIPPET_WORDS = 24
+
+
+class SearchHit(NamedTuple):
+    """One ranked search result."""
+    workflow_id: str
+    title: Optional[str]
+    rank: float
+    snippet: str
+
+
+def search_terms(term: str) -> List[str]:
+    """
+    Split user input into search words.
+
+    Args:
+        term: Raw search box input
+
+    Returns:
+        Lower-cased word tokens (punctuation and operators dropped)
+    """
+    return re.findall(r'\w+', term.lower())
+
+
+def _highlight(snippet: Optional[str]) -> str:
+    return html.escape(snippet or '').replace(MARK_START, '<mark>').replace(MARK_END, '</mark>')
+
+
+def _fields(search_fields: Optional[Sequence[str]]) -> List[str]:
+    fields = list(search_fields or SEARCH_FIELDS)
+    unknown = set(fields) - set(SEARCH_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown search fields {sorted(unknown)}; expected {list(SEARCH_FIELDS)}")
+    # Postgres restricts by weight label; a field can't be told apart from one sharing its label
+    shared = {other for field in fields for other, weight in SEARCH_FIELDS.items() if weight == SEARCH_FIELDS[field]}
+    if shared - set(fields):
+        raise ValueError(f"Search fields {sorted(shared)} share a weight and must be searched together")
+    return fields
+
+
+def _tsquery(words: List[str], fields: List[str]) -> str:
+    """to_tsquery input: every word as a prefix, restricted to the fields' weights."""
+    weights = ''.join(sorted({SEARCH_FIELDS[field] for field in fields}))
+    return ' & '.join(f"{word}:*{weights}" for word in words)
+
+
+def _fts_query(words: List[str], fields: List[str]) -> str:
+    """FTS5 MATCH input: every word as a prefix, restricted to the fields' columns."""
+    phrases = ' AND '.join(f'"{word}"*' for word in words)
+    return f"{{{' '.join(fields)}}} : ({phrases})"
+
+
+# =====================================================
+# Postgres
+# =====================================================
+
+PG_SEARCH_SQL = f"""
+    SELECT hits.workflow_id, m.title, hits.rank,
+           ts_headline('english',
+                       concat_ws(' ', m.title, m.description, m.use_case, c.explainer_text),
+                       hits.query,
+                       'StartSel={MARK_START}, StopSel={MARK_END}, MaxWords={SNIPPET_WORDS}, MinWords=8, MaxFragments=2') AS snippet
+    FROM (
+        SELECT s.workflow_id, q.query, ts_rank('{RANK_WEIGHTS}', s.search_vector, q.query) AS rank
+        FROM {SEARCH_TABLE} s, to_tsquery('english', :query) AS q(query)
+        WHERE s.search_vector @@ q.query
+        ORDER BY rank DESC, s.workflow_id
+        LIMIT :limit OFFSET :offset
+    ) hits
+    LEFT JOIN workflow_metadata m ON m.workflow_id = hits.workflow_id
+    LEFT JOIN workflow_content c ON c.workflow_id = hits.workflow_id
+    ORDER BY hits.rank DESC, hits.workflow_id
+"""
+
+PG_COUNT_SQL = f"""
+    SELECT COUNT(*) AS count FROM {SEARCH_TABLE}
+    WHERE search_vector @@ to_tsquery('english', :query)
+"""
+
+# Without the search table (migration not applied) Postgres falls back to
+# matching the whole term with ILIKE, unranked, in workflow_id order
+PG_FALLBACK_COLUMNS = {
+    'title': 'm.title',
+    'description': 'm.description',
+    'use_case': 'm.use_case',
+    'explainer': 'c.explainer_text',
+    'transcripts': (
+        "(SELECT string_agg(transcript_text, ' ') FROM video_transcripts v WHERE v.workflow_id = w.workflow_id)"
+    ),
+}
+FALLBACK_SNIPPET_CHARS = 200
+
+PG_FALLBACK_FROM = """
+    FROM workflows w
+    LEFT JOIN workflow_metadata m ON m.workflow_id = w.workflow_id
+    LEFT JOIN workflow_content c ON c.workflow_id = w.workflow_id"""
+
+# Search document per workflow (the caller adds a WHERE clause to select workflows)
+PG_DOCUMENT_SELECT = f"""
+    SELECT w.workflow_id,
+           setweight(to_tsvector('english', coalesce(m.title, '')), 'A') ||
+           setweight(to_tsvector('english', coalesce(m.description, '')), 'B') ||
+           setweight(to_tsvector('english', coalesce(m.use_case, '')), 'C') ||
+           setweight(to_tsvector('english', coalesce(c.explainer_text, '')), 'D') ||
+           setweight(to_tsvector('english', coalesce(left(t.transcripts, {TRANSCRIPT_CHARS}), '')), 'D')
+    FROM workflows w
+    LEFT JOIN workflow_metadata m ON m.workflow_id = w.workflow_id
+    LEFT JOIN workflow_content c ON c.workflow_id = w.workflow_id
+    LEFT JOIN LATERAL (
+        SELECT string_agg(transcript_text, ' ') AS transcripts
+        FROM video_transcripts v
+        WHERE v.workflow_id = w.workflow_id
+    ) t ON true"""
+
+# Source table -> columns whose changes re-index the workflow
+PG_TRIGGER_SOURCES = {
+    'workflow_metadata': ('title', 'description', 'use_case'),
+    'workflow_content': ('explainer_text',),
+    'video_transcripts': ('transcript_text',),
+}
+
+
+def _changed_workflows(columns: Sequence[str]) -> str:
+    """SQL selecting workflows whose rows an UPDATE changed in the given columns."""
+    tracked = ', '.join(('workflow_id',) + tuple(columns))
+    return (
+        f"SELECT DISTINCT workflow_id FROM (\n"
+        f"            (SELECT {tracked} FROM new_rows EXCEPT SELECT {tracked} FROM old_rows)\n"
+        f"            UNION ALL\n"
+        f"            (SELECT {tracked} FROM old_rows EXCEPT SELECT {tracked} FROM new_rows)\n"
+        f"        ) changed"
+    )
+
+
+def _trigger_function(name: str, workflows: str) -> str:
+    """DDL for a statement trigger function re-indexing the selected workflows once each."""
+    return (
+        f"CREATE OR REPLACE FUNCTION {name}() RETURNS trigger AS $$\n"
+        f"BEGIN\n"
+        f"    PERFORM {SEARCH_TABLE}_refresh(ARRAY(\n"
+        f"        {workflows}\n"
+        f"    ));\n"
+        f"    RETURN NULL;\n"
+        f"END;\n"
+        f"$$ LANGUAGE plpgsql"
+    )
+
+
+def search_statements() -> List[str]:
+    """
+    Postgres statements creating the search table, its index and triggers.
+
+    Triggers run once per statement on its transition tables, so a bulk write
+    re-indexes each workflow it touched once instead of once per row. The
+    refresh upserts, so concurrent writes re-indexing the same workflow don't
+    collide on the primary key; only rows of deleted workflows are removed.
+
+    Returns:
+        Idempotent DDL statements, without trailing semicolons
+    """
+    statements = [
+        f"CREATE TABLE IF NOT EXISTS {SEARCH_TABLE} (\n"
+        f"    workflow_id VARCHAR(50) PRIMARY KEY,\n"
+        f"    search_vector TSVECTOR NOT NULL\n)",
+        f"CREATE INDEX IF NOT EXISTS idx_{SEARCH_TABLE}_vector\n"
+        f"    ON {SEARCH_TABLE} USING GIN (search_vector)",
+    ]
+    # Row-level triggers and the single-workflow refresh they called
+    statements += [f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_{table} ON {table}" for table in PG_TRIGGER_SOURCES]
+    statements += [
+        f"DROP FUNCTION IF EXISTS {SEARCH_TABLE}_on_change()",
+        f"DROP FUNCTION IF EXISTS {SEARCH_TABLE}_refresh(VARCHAR)",
+        f"CREATE OR REPLACE FUNCTION {SEARCH_TABLE}_refresh(p_workflow_ids VARCHAR[]) RETURNS void AS $$\n"
+        f"BEGIN\n"
+        f"    DELETE FROM {SEARCH_TABLE} s WHERE s.workflow_id = ANY(p_workflow_ids)\n"
+        f"        AND NOT EXISTS (SELECT 1 FROM workflows w WHERE w.workflow_id = s.workflow_id);\n"
+        f"    INSERT INTO {SEARCH_TABLE} (workflow_id, search_vector){PG_DOCUMENT_SELECT}\n"
+        f"    WHERE w.workflow_id = ANY(p_workflow_ids)\n"
+        f"    ON CONFLICT (workflow_id) DO UPDATE SET search_vector = EXCLUDED.search_vector;\n"
+        f"END;\n"
+        f"$$ LANGUAGE plpgsql",
+        _trigger_function(f"{SEARCH_TABLE}_after_insert", "SELECT DISTINCT workflow_id FROM new_rows"),
+        _trigger_function(f"{SEARCH_TABLE}_after_delete", "SELECT DISTINCT workflow_id FROM old_rows"),
+    ]
+    for table, columns in PG_TRIGGER_SOURCES.items():
+        # Transition tables rule out UPDATE OF column lists; the function compares the columns instead
+        statements.append(_trigger_function(f"{SEARCH_TABLE}_after_{table}_update", _changed_workflows(columns)))
+        events = {
+            'insert': ("INSERT", "NEW TABLE AS new_rows", f"{SEARCH_TABLE}_after_insert"),
+            'update': ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows", f"{SEARCH_TABLE}_after_{table}_update"),
+            'delete': ("DELETE", "OLD TABLE AS old_rows", f"{SEARCH_TABLE}_after_delete"),
+        }
+        for event, (operation, referencing, function) in events.items():
+            statements += [
+                f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_{table}_{event} ON {table}",
+                f"CREATE TRIGGER {SEARCH_TABLE}_{table}_{event}\n"
+                f"    AFTER {operation} ON {table}\n"
+                f"    REFERENCING {referencing}\n"
+                f"    FOR EACH STATEMENT EXECUTE FUNCTION {function}()",
+            ]
+    return statements
+
+
+def search_ddl() -> str:
+    """
+    Migration script: search table, GIN index, triggers and the initial backfill.
+
+    Returns:
+        SQL script (the contents of migrations/workflow_search.sql)
+    """
+    header = (
+        "-- Workflow Full-Text Search\n"
+        "-- Generated by `python scripts/install_workflow_search.py --sql` from\n"
+        "-- src/storage/search.py; edit the search document there, not here.\n"
+        "-- Weighted tsvector per workflow (title A, description B, use case C,\n"
+        "-- explainer/transcripts D) behind a GIN index, re-indexed by statement\n"
+        "-- triggers once per workflow a write touched."
+    )
+    backfill = (
+        "-- Backfill\n"
+        f"TRUNCATE {SEARCH_TABLE};\n"
+        f"INSERT INTO {SEARCH_TABLE} (workflow_id, search_vector){PG_DOCUMENT_SELECT};"
+    )
+    return "\n\n".join([header] + [f"{statement};" for statement in search_statements()] + [backfill]) + "\n"
+
+
+# =====================================================
+# SQLite FTS5
+# =====================================================
+
+FTS_CREATE_SQL = (
+    f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5("
+    f"workflow_id UNINDEXED, {', '.join(FTS_COLUMNS)}, tokenize='porter unicode61')"
+)
+
+FTS_INSERT_SQL = f"""
+    INSERT INTO {SEARCH_TABLE} (workflow_id, {', '.join(FTS_COLUMNS)})
+    SELECT w.workflow_id, m.title, m.description, m.use_case, c.explainer_text,
+           (SELECT substr(group_concat(transcript_text, ' '), 1, {TRANSCRIPT_CHARS})
+            FROM video_transcripts v WHERE v.workflow_id = w.workflow_id)
+    FROM workflows w
+    LEFT JOIN workflow_metadata m ON m.workflow_id = w.workflow_id
+    LEFT JOIN workflow_content c ON c.workflow_id = w.workflow_id
+"""
+
+FTS_SEARCH_SQL = f"""
+    SELECT workflow_id, title,
+           -bm25({SEARCH_TABLE}, 0, {', '.join(str(weight) for weight in FTS_WEIGHTS)}) AS rank,
+           snippet({SEARCH_TABLE}, -1, '{MARK_START}', '{MARK_END}', '…', {SNIPPET_WORDS}) AS snippet
+    FROM {SEARCH_TABLE}
+    WHERE {SEARCH_TABLE} MATCH :query
+    ORDER BY rank DESC, workflow_id
+    LIMIT :limit OFFSET :offset
+"""
+
+FTS_COUNT_SQL = f"SELECT COUNT(*) FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH :query"
+
+
+def _fts_exists(session) -> bool:
+    return session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE name = :name"), {'name': SEARCH_TABLE}
+    ).first() is not None
+
+
+def _ensure_fts(session):
+    """Create and fill the FTS5 table on first use."""
+    if not _fts_exists(session):
+        session.execute(text(FTS_CREATE_SQL))
+        session.execute(text(FTS_INSERT_SQL))
+
+
+# =====================================================
+# Public API
+# =====================================================
+
+def _like_pattern(term: str) -> str:
+    """ILIKE pattern matching the term anywhere, with its wildcards escaped."""
+    return '%' + re.sub(r'([\\%_])', r'\\\1', term.strip()) + '%'
+
+
+def _pg_fallback_sql(select: str, fields: List[str]) -> str:
+    conditions = ' OR '.join(f"{PG_FALLBACK_COLUMNS[field]} ILIKE :pattern" for field in fields)
+    return f"{select}{PG_FALLBACK_FROM}\n    WHERE {conditions}"
+
+
+def _session_runner(session):
+    """Run named-parameter SQL on a session, returning rows as dicts."""
+    def run(sql: str, params: dict) -> List[dict]:
+        return [dict(row) for row in session.execute(text(sql), params).mappings()]
+    return run
+
+
+def _dbapi_runner(connection):
+    """Run named-parameter SQL on a psycopg2 connection, returning rows as dicts."""
+    def run(sql: str, params: dict) -> List[dict]:
+        db_cursor = connection.cursor()
+        try:
+            db_cursor.execute(re.sub(r'(?<!:):(\w+)', r'%(\1)s', sql), params)
+            names = [column[0] for column in db_cursor.description]
+            return [
+                row if isinstance(row, dict) else dict(zip(names, row, strict=True))
+                for row in db_cursor.fetchall()
+            ]
+        finally:
+            db_cursor.close()
+    return run
+
+
+def _pg_installed(run) -> bool:
+    rows = run("SELECT to_regclass(:name) IS NOT NULL AS installed", {'name': SEARCH_TABLE})
+    return bool(rows[0]['installed'])
+
+
+def _pg_search(run, term: str, words: List[str], fields: List[str], limit: Optional[int], offset: int) -> List[dict]:
+    # LIMIT NULL is LIMIT ALL
+    if _pg_installed(run):
+        return run(PG_SEARCH_SQL, {'query': _tsquery(words, fields), 'limit': limit, 'offset': offset})
+    select = (
+        f"SELECT w.workflow_id, m.title, 0.0 AS rank,\n"
+        f"           left(coalesce(m.description, m.use_case, ''), {FALLBACK_SNIPPET_CHARS}) AS snippet"
+    )
+    sql = _pg_fallback_sql(select, fields) + "\n    ORDER BY w.workflow_id\n    LIMIT :limit OFFSET :offset"
+    return run(sql, {'pattern': _like_pattern(term), 'limit': limit, 'offset': offset})
+
+
+def _pg_count(run, term: str, words: List[str], fields: List[str]) -> int:
+    if _pg_installed(run):
+        rows = run(PG_COUNT_SQL, {'query': _tsquery(words, fields)})
+    else:
+        rows = run(_pg_fallback_sql("SELECT COUNT(*) AS count", fields), {'pattern': _like_pattern(term)})
+    return rows[0]['count']
+
+
+def _hits(rows: List[dict]) -> List[SearchHit]:
+    return [
+        SearchHit(row['workflow_id'], row['title'], float(row['rank']), _highlight(row['snippet']))
+        for row in rows
+    ]
+
+
+def _dialect(session) -> str:
+    dialect = session.get_bind().dialect.name
+    if dialect not in ('postgresql', 'sqlite'):
+        raise ValueError(f"Full-text search needs postgresql or sqlite, got '{dialect}'")
+    return dialect
+
+
+def search_workflows(
+    session,
+    term: str,
+    search_fields: Optional[Sequence[str]] = None,
+    limit: Optional[int] = 50,
+    offset: int = 0
+) -> List[SearchHit]:
+    """
+    Ranked full-text search.
+
+    Args:
+        session: SQLAlchemy session
+        term: Search box input; every word must match (as a prefix)
+        search_fields: Restrict matching to these SEARCH_FIELDS (default: all)
+        limit: Maximum results (None: all)
+        offset: Results to skip (pagination)
+
+    Returns:
+        Hits, best first; empty if the term has no words
+    """
+    words = search_terms(term)
+    if not words:
+        return []
+    fields = _fields(search_fields)
+
+    run = _session_runner(session)
+    if _dialect(session) == 'postgresql':
+        return _hits(_pg_search(run, term, words, fields, limit, offset))
+    _ensure_fts(session)
+    params = {'query': _fts_query(words, fields), 'limit': -1 if limit is None else limit, 'offset': offset}
+    return _hits(run(FTS_SEARCH_SQL, params))
+
+
+def count_matches(session, term: str, search_fields: Optional[Sequence[str]] = None) -> int:
+    """
+    Number of workflows matching a search (for pagination).
+
+    Args:
+        session: SQLAlchemy session
+        term: Search box input
+        search_fields: Restrict matching to these SEARCH_FIELDS (default: all)
+
+    Returns:
+        Matching workflow count
+    """
+    words = search_terms(term)
+    if not words:
+        return 0
+    fields = _fields(search_fields)
+
+    if _dialect(session) == 'postgresql':
+        return _pg_count(_session_runner(session), term, words, fields)
+    _ensure_fts(session)
+    return session.execute(text(FTS_COUNT_SQL), {'query': _fts_query(words, fields)}).scalar()
+
+
+def search_workflows_dbapi(
+    connection,
+    term: str,
+    search_fields: Optional[Sequence[str]] = None,
+    limit: Optional[int] = 50,
+    offset: int = 0
+) -> List[SearchHit]:
+    """
+    search_workflows over a psycopg2 connection (Postgres only).
+
+    Args:
+        connection: psycopg2 connection
+        term: Search box input; every word must match (as a prefix)
+        search_fields: Restrict matching to these SEARCH_FIELDS (default: all)
+        limit: Maximum results (None: all)
+        offset: Results to skip (pagination)
+
+    Returns:
+        Hits, best first; empty if the term has no words
+    """
+    words = search_terms(term)
+    if not words:
+        return []
+    return _hits(_pg_search(_dbapi_runner(connection), term, words, _fields(search_fields), limit, offset))
+
+
+def count_matches_dbapi(connection, term: str, search_fields: Optional[Sequence[str]] = None) -> int:
+    """
+    count_matches over a psycopg2 connection (Postgres only).
+
+    Args:
+        connection: psycopg2 connection
+        term: Search box input
+        search_fields: Restrict matching to these SEARCH_FIELDS (default: all)
+
+    Returns:
+        Matching workflow count
+    """
+    words = search_terms(term)
+    if not words:
+        return 0
+    return _pg_count(_dbapi_runner(connection), term, words, _fields(search_fields))
+
+
+def index_workflows(session, workflow_ids: Optional[Sequence[str]] = None):
+    """
+    Re-index workflows after their searchable text changed.
+
+    A no-op on Postgres, where triggers re-index on every write. On SQLite the
+    FTS5 table is updated if it exists (otherwise it is built on first search).
+    The caller commits.
+
+    Args:
+        session: SQLAlchemy session (pending ORM changes are flushed first)
+        workflow_ids: Workflows to re-index (default: all)
+    """
+    if _dialect(session) == 'postgresql' or not _fts_exists(session):
+        return
+    session.flush()
+    if workflow_ids is None:
+        session.execute(text(f"DELETE FROM {SEARCH_TABLE}"))
+        session.execute(text(FTS_INSERT_SQL))
+        return
+    ids = {'ids': list(workflow_ids)}
+    session.execute(
+        text(f"DELETE FROM {SEARCH_TABLE} WHERE workflow_id IN :ids").bindparams(bindparam('ids', expanding=True)),
+        ids
+    )
+    session.execute(
+        text(FTS_INSERT_SQL + " WHERE w.workflow_id IN :ids").bindparams(bindparam('ids', expanding=True)),
+        ids
+    )
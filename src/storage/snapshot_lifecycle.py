@@ -0,0 +1,437 @@
+"""
+Extraction snapshot lifecycle: partitioning, retention and compaction.
+
+Every extraction appends a row to workflow_extraction_snapshots and nothing
+ever removed them (except perform_maintenance deleting everything older than
+six months, history and all), so per-workflow queries and maintenance slowed
+as history grew. Snapshots are now managed as:
+- Monthly range partitions on created_at, so recent-history queries and
+  maintenance touch only the partitions they need; partitions are created
+  ahead of time by add_partitions() and empty old ones dropped
+- Retention per (workflow_id, layer): the KEEP_LATEST newest snapshots stay
+  live, plus one checkpoint (the newest snapshot) per CHECKPOINT_PERIOD for
+  the last KEEP_CHECKPOINTS periods
+- Compaction: everything else is moved into one archive per run and
+  workflow/layer in workflow_snapshot_archives. An archive is a single zstd
+  blob of all its payloads in order, so successive versions of a payload
+  compress against each other (delta compression without a diff format)
+- missing_snapshots(): which workflows lack a snapshot, as one anti-join
+  instead of a query per workflow
+
+The DDL in migrations/snapshot_partitions.sql is generated by
+`python scripts/maintain_snapshots.py --sql`; it converts the existing table in
+place and needs the blob store (migrations/payload_blobs.sql) first.
+
+Usage:
+    with get_session() as session:
+        missing = missing_snapshots(session, workflow_ids, 'L2V2')
+        after = None
+        while True:
+            after = compact_snapshots(session, after=after)['last_group']
+            session.commit()
+            if after is None:
+                break
+"""
+
+import json
+import os
+from itertools import groupby
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import bindparam, inspect, text
+
+from src.storage.blob_store import canonical_json, load_json, put_blob
+
+SNAPSHOT_TABLE = 'workflow_extraction_snapshots'
+ARCHIVE_TABLE = 'workflow_snapshot_archives'
+
+# Retention defaults (overridable per call)
+KEEP_LATEST = int(os.getenv('SNAPSHOT_KEEP_LATEST', '3'))
+CHECKPOINT_PERIOD = os.getenv('SNAPSHOT_CHECKPOINT_PERIOD', 'month')
+KEEP_CHECKPOINTS = int(os.getenv('SNAPSHOT_KEEP_CHECKPOINTS', '12'))
+PARTITION_MONTHS_AHEAD = 2
+
+# Checkpoint period -> bucket expression over created_at, per dialect
+PERIOD_SQL = {
+    'postgresql': {
+        'day': "date_trunc('day', created_at)",
+        'week': "date_trunc('week', created_at)",
+        'month': "date_trunc('month', created_at)",
+    },
+    'sqlite': {
+        'day': "date(created_at)",
+        'week': "strftime('%Y-%W', created_at)",
+        'month': "strftime('%Y-%m', created_at)",
+    },
+}
+
+# Next batch of workflow/layer pairs that may have snapshots past retention, in
+# (workflow_id, layer) order; {after} resumes after the previous batch
+GROUPS_SQL = f"""
+    SELECT workflow_id, layer FROM {SNAPSHOT_TABLE}
+    WHERE workflow_id IS NOT NULL{{after}}
+    GROUP BY workflow_id, layer
+    HAVING COUNT(*) > :keep_latest
+    ORDER BY workflow_id, layer
+    LIMIT :max_groups
+"""
+
+# Snapshots past retention in the (workflow_id, layer) range of one batch: older
+# than the newest keep_latest and not a kept checkpoint
+EXPIRED_SQL = f"""
+    SELECT id, workflow_id, layer FROM (
+        SELECT id, workflow_id, layer,
+            ROW_NUMBER() OVER (PARTITION BY workflow_id, layer ORDER BY created_at DESC, id DESC) AS recency,
+            ROW_NUMBER() OVER (PARTITION BY workflow_id, layer, {{period}} ORDER BY created_at DESC, id DESC) AS period_rank,
+            DENSE_RANK() OVER (PARTITION BY workflow_id, layer ORDER BY {{period}} DESC) AS period_age
+        FROM {SNAPSHOT_TABLE}
+        WHERE (workflow_id, layer) >= (:first_workflow_id, :first_layer)
+          AND (workflow_id, layer) <= (:last_workflow_id, :last_layer)
+    ) ranked
+    WHERE recency > :keep_latest AND NOT (period_rank = 1 AND period_age <= :keep_checkpoints)
+    ORDER BY workflow_id, layer, id
+"""
+
+# Requested workflows without a snapshot for the layer (one anti-join)
+MISSING_SQL = f"""
+    SELECT w.workflow_id FROM workflows w
+    WHERE w.workflow_id IN :workflow_ids
+      AND NOT EXISTS (
+          SELECT 1 FROM {SNAPSHOT_TABLE} s WHERE s.workflow_id = w.workflow_id AND s.layer = :layer
+      )
+"""
+
+
+def _dialect(session) -> str:
+    dialect = session.get_bind().dialect.name
+    if dialect not in PERIOD_SQL:
+        raise ValueError(f"Snapshot lifecycle needs postgresql or sqlite, got '{dialect}'")
+    return dialect
+
+
+def missing_snapshots(session, workflow_ids: Sequence[str], layer: str) -> List[str]:
+    """
+    Workflows with no snapshot for a layer.
+
+    Args:
+        session: SQLAlchemy session
+        workflow_ids: Workflows to check (unknown IDs are ignored)
+        layer: Snapshot layer tag (e.g. 'L2V2')
+
+    Returns:
+        IDs of the existing workflows lacking a snapshot
+    """
+    if not workflow_ids:
+        return []
+    rows = session.execute(
+        text(MISSING_SQL).bindparams(bindparam('workflow_ids', expanding=True)),
+        {'workflow_ids': list(workflow_ids), 'layer': layer}
+    )
+    return [row.workflow_id for row in rows]
+
+
+def _payload(session, row) -> Any:
+    """A snapshot row's payload, from the blob store or still inline."""
+    if row.payload_sha256:
+        return load_json(session, row.payload_sha256)
+    return json.loads(row.payload) if isinstance(row.payload, str) else row.payload
+
+
+def compact_snapshots(
+    session,
+    keep_latest: int = KEEP_LATEST,
+    checkpoint_period: str = CHECKPOINT_PERIOD,
+    keep_checkpoints: int = KEEP_CHECKPOINTS,
+    max_groups: int = 200,
+    after: Optional[Tuple[str, str]] = None
+) -> Dict[str, Any]:
+    """
+    Move snapshots past retention into archives.
+
+    Handles the next max_groups (workflow_id, layer) pairs holding more than
+    keep_latest snapshots, reading only their rows; the caller commits and
+    repeats with `after=stats['last_group']` until that is None. Follow with
+    prune_blobs() to drop payload blobs only the archived rows referenced.
+    Snapshots without a workflow_id are left alone.
+
+    Args:
+        session: SQLAlchemy session
+        keep_latest: Newest snapshots kept live per workflow/layer (at least 1)
+        checkpoint_period: 'day', 'week' or 'month'
+        keep_checkpoints: Recent periods whose newest snapshot is kept live
+        max_groups: Workflow/layer pairs compacted per call
+        after: last_group of the previous call (None: start from the first pair)
+
+    Returns:
+        Counts of archives written and snapshots archived, and last_group: the
+        (workflow_id, layer) to resume after, or None once every pair is done
+    """
+    periods = PERIOD_SQL[_dialect(session)]
+    if checkpoint_period not in periods:
+        raise ValueError(f"checkpoint_period must be one of {sorted(periods)}, got '{checkpoint_period}'")
+
+    keep_latest = max(keep_latest, 1)
+    params = {'keep_latest': keep_latest, 'max_groups': max_groups}
+    after_sql = ''
+    if after is not None:
+        after_sql = " AND (workflow_id, layer) > (:after_workflow_id, :after_layer)"
+        params.update(after_workflow_id=after[0], after_layer=after[1])
+    candidates = session.execute(text(GROUPS_SQL.format(after=after_sql)), params).all()
+
+    stats = {'archives': 0, 'snapshots': 0, 'last_group': None}
+    if not candidates:
+        return stats
+    if len(candidates) == max_groups:
+        stats['last_group'] = tuple(candidates[-1])
+
+    expired = session.execute(
+        text(EXPIRED_SQL.format(period=periods[checkpoint_period])),
+        {
+            'keep_latest': keep_latest,
+            'keep_checkpoints': keep_checkpoints,
+            'first_workflow_id': candidates[0].workflow_id,
+            'first_layer': candidates[0].layer,
+            'last_workflow_id': candidates[-1].workflow_id,
+            'last_layer': candidates[-1].layer,
+        }
+    )
+    groups = [
+        (key, [row.id for row in rows])
+        for key, rows in groupby(expired, key=lambda row: (row.workflow_id, row.layer))
+    ]
+
+    for (workflow_id, layer), ids in groups:
+        rows = session.execute(
+            text(
+                f"SELECT id, created_at, payload, payload_sha256 FROM {SNAPSHOT_TABLE} "
+                "WHERE id IN :ids ORDER BY created_at, id"
+            ).bindparams(bindparam('ids', expanding=True)),
+            {'ids': ids}
+        ).all()
+        archive = {
+            'workflow_id': workflow_id,
+            'layer': layer,
+            'snapshots': [
+                {'id': row.id, 'created_at': row.created_at, 'payload': _payload(session, row)}
+                for row in rows
+            ],
+        }
+        session.execute(
+            text(
+                f"INSERT INTO {ARCHIVE_TABLE} "
+                "(workflow_id, layer, first_created_at, last_created_at, snapshot_count, archive_sha256) "
+                "VALUES (:workflow_id, :layer, :first, :last, :count, :sha256)"
+            ),
+            {
+                'workflow_id': workflow_id,
+                'layer': layer,
+                'first': rows[0].created_at,
+                'last': rows[-1].created_at,
+                'count': len(rows),
+                'sha256': put_blob(session, canonical_json(archive)),
+            }
+        )
+        session.execute(
+            text(f"DELETE FROM {SNAPSHOT_TABLE} WHERE id IN :ids").bindparams(bindparam('ids', expanding=True)),
+            {'ids': ids}
+        )
+        stats['archives'] += 1
+        stats['snapshots'] += len(rows)
+    return stats
+
+
+def archived_snapshots(session, workflow_id: str, layer: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Snapshots of a workflow that were compacted into archives.
+
+    Args:
+        session: SQLAlchemy session
+        workflow_id: Workflow ID
+        layer: Only this layer (default: all)
+
+    Returns:
+        Snapshots (id, layer, created_at, payload), oldest first
+    """
+    query = f"SELECT layer, archive_sha256 FROM {ARCHIVE_TABLE} WHERE workflow_id = :workflow_id"
+    if layer is not None:
+        query += " AND layer = :layer"
+    rows = session.execute(
+        text(query + " ORDER BY first_created_at, id"), {'workflow_id': workflow_id, 'layer': layer}
+    ).all()
+    snapshots = []
+    for row in rows:
+        for snapshot in load_json(session, row.archive_sha256)['snapshots']:
+            snapshots.append({**snapshot, 'layer': row.layer})
+    return sorted(snapshots, key=lambda snapshot: (snapshot['created_at'], snapshot['id']))
+
+
+def lifecycle_installed(session) -> bool:
+    """
+    Whether migrations/snapshot_partitions.sql has been applied.
+
+    Args:
+        session: SQLAlchemy session
+
+    Returns:
+        True if the archive table (and on Postgres the partition function) exists
+    """
+    if not inspect(session.connection()).has_table(ARCHIVE_TABLE):
+        return False
+    if _dialect(session) != 'postgresql':
+        return True
+    return session.execute(
+        text("SELECT to_regproc(:name) IS NOT NULL"), {'name': f"{SNAPSHOT_TABLE}_add_partitions"}
+    ).scalar()
+
+
+def add_partitions(session, months_ahead: int = PARTITION_MONTHS_AHEAD) -> int:
+    """
+    Create the monthly partitions up to months_ahead from now (Postgres).
+
+    Run from maintenance at least monthly: rows landing in the default
+    partition block creating their month's partition until moved out. The
+    caller commits.
+
+    Args:
+        session: SQLAlchemy session
+        months_ahead: Future months to create
+
+    Returns:
+        Number of partitions created
+    """
+    return session.execute(
+        text(f"SELECT {SNAPSHOT_TABLE}_add_partitions(CURRENT_DATE, :months_ahead)"),
+        {'months_ahead': months_ahead}
+    ).scalar()
+
+
+def drop_empty_partitions(session) -> List[str]:
+    """
+    Drop monthly partitions before the current month that compaction emptied (Postgres).
+
+    The caller commits.
+
+    Args:
+        session: SQLAlchemy session
+
+    Returns:
+        Names of the dropped partitions
+    """
+    partitions = session.execute(text(
+        "SELECT child.relname FROM pg_inherits "
+        "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        f"WHERE parent.relname = '{SNAPSHOT_TABLE}' AND child.relname ~ '_[0-9]{{4}}_[0-9]{{2}}$' "
+        f"AND child.relname < '{SNAPSHOT_TABLE}_' || to_char(CURRENT_DATE, 'YYYY_MM') "
+        "ORDER BY child.relname"
+    )).scalars().all()
+    dropped = []
+    for name in partitions:
+        if session.execute(text(f'SELECT 1 FROM "{name}" LIMIT 1')).first() is None:
+            session.execute(text(f'DROP TABLE "{name}"'))
+            dropped.append(name)
+    return dropped
+
+
+def lifecycle_statements() -> List[str]:
+    """
+    Postgres statements partitioning the snapshot table and creating the archives.
+
+    Idempotent: an already partitioned table is left alone.
+
+    Returns:
+        DDL statements, without trailing semicolons
+    """
+    return [
+        f"CREATE TABLE IF NOT EXISTS {ARCHIVE_TABLE} (\n"
+        "    id SERIAL PRIMARY KEY,\n"
+        "    workflow_id VARCHAR(50) NOT NULL,\n"
+        "    layer VARCHAR(20) NOT NULL,\n"
+        "    first_created_at TIMESTAMP NOT NULL,\n"
+        "    last_created_at TIMESTAMP NOT NULL,\n"
+        "    snapshot_count INTEGER NOT NULL,\n"
+        "    archive_sha256 CHAR(64) NOT NULL REFERENCES payload_blobs (sha256),\n"
+        "    created_at TIMESTAMP NOT NULL DEFAULT NOW()\n"
+        ")",
+        f"CREATE INDEX IF NOT EXISTS idx_snapshot_archives_workflow\n"
+        f"    ON {ARCHIVE_TABLE} (workflow_id, layer, first_created_at)",
+        f"""CREATE OR REPLACE FUNCTION {SNAPSHOT_TABLE}_add_partitions(p_from DATE, p_months_ahead INTEGER)
+RETURNS INTEGER AS $$
+DECLARE
+    v_month DATE;
+    v_name TEXT;
+    v_created INTEGER := 0;
+BEGIN
+    FOR v_month IN
+        SELECT generate_series(
+            date_trunc('month', p_from),
+            date_trunc('month', NOW()) + make_interval(months => p_months_ahead),
+            INTERVAL '1 month'
+        )::date
+    LOOP
+        v_name := '{SNAPSHOT_TABLE}_' || to_char(v_month, 'YYYY_MM');
+        IF to_regclass(v_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF {SNAPSHOT_TABLE} FOR VALUES FROM (%L) TO (%L)',
+                v_name, v_month, (v_month + INTERVAL '1 month')::date
+            );
+            v_created := v_created + 1;
+        END IF;
+    END LOOP;
+    RETURN v_created;
+END;
+$$ LANGUAGE plpgsql""",
+        # Convert the plain table: rename it aside, create the partitioned one
+        # (keeping the id sequence), copy, drop the old table
+        f"""DO $$
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = '{SNAPSHOT_TABLE}'::regclass) = 'p' THEN
+        RETURN;
+    END IF;
+    LOCK TABLE {SNAPSHOT_TABLE} IN EXCLUSIVE MODE;
+    ALTER TABLE {SNAPSHOT_TABLE} RENAME TO {SNAPSHOT_TABLE}_unpartitioned;
+    ALTER SEQUENCE {SNAPSHOT_TABLE}_id_seq OWNED BY NONE;
+    CREATE TABLE {SNAPSHOT_TABLE} (
+        id BIGINT NOT NULL DEFAULT nextval('{SNAPSHOT_TABLE}_id_seq'),
+        workflow_id VARCHAR(50) REFERENCES workflows (workflow_id),
+        layer VARCHAR(20) NOT NULL,
+        payload JSONB,
+        payload_sha256 CHAR(64) REFERENCES payload_blobs (sha256),
+        created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+        PRIMARY KEY (id, created_at)
+    ) PARTITION BY RANGE (created_at);
+    ALTER SEQUENCE {SNAPSHOT_TABLE}_id_seq OWNED BY {SNAPSHOT_TABLE}.id;
+    CREATE TABLE {SNAPSHOT_TABLE}_default PARTITION OF {SNAPSHOT_TABLE} DEFAULT;
+    PERFORM {SNAPSHOT_TABLE}_add_partitions(
+        COALESCE((SELECT MIN(created_at) FROM {SNAPSHOT_TABLE}_unpartitioned), NOW())::date,
+        {PARTITION_MONTHS_AHEAD}
+    );
+    INSERT INTO {SNAPSHOT_TABLE} (id, workflow_id, layer, payload, payload_sha256, created_at)
+    SELECT id, workflow_id, layer, payload, payload_sha256, COALESCE(created_at, NOW())
+    FROM {SNAPSHOT_TABLE}_unpartitioned;
+    DROP TABLE {SNAPSHOT_TABLE}_unpartitioned;
+END;
+$$""",
+        # Serves latest-N retention, per-workflow reads and missing_snapshots()
+        f"CREATE INDEX IF NOT EXISTS idx_extraction_snapshots_workflow_layer\n"
+        f"    ON {SNAPSHOT_TABLE} (workflow_id, layer, created_at DESC)",
+        f"CREATE INDEX IF NOT EXISTS idx_extraction_snapshots_payload_sha256\n"
+        f"    ON {SNAPSHOT_TABLE} (payload_sha256)",
+    ]
+
+
+def lifecycle_ddl() -> str:
+    """
+    Migration script for snapshot partitioning and archives.
+
+    Returns:
+        SQL script (the contents of migrations/snapshot_partitions.sql)
+    """
+    header = (
+        "-- Extraction Snapshot Partitioning and Archives\n"
+        "-- Generated by `python scripts/maintain_snapshots.py --sql` from\n"
+        "-- src/storage/snapshot_lifecycle.py; edit the definitions there, not here.\n"
+        "-- Requires migrations/payload_blobs.sql. Converts workflow_extraction_snapshots\n"
+        "-- to monthly partitions (rewriting it once) and adds workflow_snapshot_archives."
+    )
+    return "\n\n".join([header] + [f"{statement};" for statement in lifecycle_statements()]) + "\n"
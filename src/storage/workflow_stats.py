@@ -0,0 +1,279 @@
+"""
+Workflow statistics.
+
+get_statistics() and the dashboards used to count the workflows table on every
+call (nine queries in the repository, a full `COUNT(*) FILTER` scan per
+dashboard poll). Statistics now come from the `workflow_stats` summary table:
+- Statement-level triggers on `workflows` add each statement's delta (new rows
+  minus old rows, from the transition tables), so bulk upserts cost one
+  summary update per statement, not per row
+- Deltas go to one of STATS_SLOTS rows picked by backend pid, so concurrent
+  writers don't queue on a single counter row; readers sum the slots
+- Reading is one query over at most STATS_SLOTS rows, independent of catalog size
+
+Where the table isn't installed (or is empty), statistics fall back to
+AGGREGATE_SQL: one scan computing every counter at once.
+
+Counters are defined once in STAT_AGGREGATES; the trigger DDL in
+migrations/workflow_stats.sql is generated from them by
+`python scripts/install_workflow_stats.py --sql`.
+
+Usage:
+    with get_session() as session:
+        stats = read_statistics(session)
+
+    stats = read_statistics_dbapi(psycopg2.connect(**DB_CONFIG))
+"""
+
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import inspect, text
+
+STATS_TABLE = 'workflow_stats'
+STATS_SLOTS = 16
+
+# Workflow conditions shared by the repository and the dashboards
+COMPLETE = "layer1_success AND layer2_success AND layer3_success"
+NON_RETRYABLE_ERROR = (
+    "error_message LIKE '%404%' OR error_message LIKE '%no iframe%' "
+    "OR error_message LIKE '%no content%'"
+)
+
+# Summary column -> aggregate over workflow rows (must be 0, not NULL, for no rows)
+STAT_AGGREGATES = {
+    'total_workflows': "COUNT(*)",
+    **{
+        f'layer{layer}_success_count': f"COUNT(*) FILTER (WHERE layer{layer}_success)"
+        for layer in range(1, 8)
+    },
+    'fully_successful': f"COUNT(*) FILTER (WHERE {COMPLETE})",
+    'partial_success': (
+        f"COUNT(*) FILTER (WHERE NOT ({COMPLETE}) "
+        "AND (layer1_success OR layer2_success OR layer3_success))"
+    ),
+    'with_errors': "COUNT(*) FILTER (WHERE error_message IS NOT NULL)",
+    'failed': f"COUNT(*) FILTER (WHERE error_message IS NOT NULL AND NOT ({NON_RETRYABLE_ERROR}))",
+    'invalid': (
+        f"COUNT(*) FILTER (WHERE error_message IS NOT NULL AND ({NON_RETRYABLE_ERROR} "
+        "OR error_message LIKE '%empty%' OR quality_score = 0))"
+    ),
+    'pending': (
+        "COUNT(*) FILTER (WHERE extracted_at IS NULL OR (layer1_success = false "
+        "AND layer2_success = false AND layer3_success = false AND error_message IS NULL))"
+    ),
+    'quality_score_sum': "COALESCE(SUM(quality_score), 0)",
+    'quality_score_count': "COUNT(quality_score)",
+    'processing_time_sum': "COALESCE(SUM(processing_time), 0)",
+    'processing_time_count': "COUNT(processing_time)",
+}
+
+SUM_COLUMNS = ('quality_score_sum', 'processing_time_sum')
+
+# One scan of workflows computing every counter (on-demand fallback)
+AGGREGATE_SQL = "SELECT {} FROM workflows".format(
+    ", ".join(f"{expression} AS {column}" for column, expression in STAT_AGGREGATES.items())
+)
+
+# Sum of the summary slots; `slots` is 0 until triggers or a refresh wrote a row
+SUMMARY_SQL = "SELECT COUNT(*) AS slots, {} FROM {}".format(
+    ", ".join(f"COALESCE(SUM({column}), 0) AS {column}" for column in STAT_AGGREGATES),
+    STATS_TABLE
+)
+
+# Replace the slots with one row of fresh totals
+REFRESH_SQL = "INSERT INTO {0} (slot, {1}) SELECT 0, {1} FROM ({2}) AS totals".format(
+    STATS_TABLE, ", ".join(STAT_AGGREGATES), AGGREGATE_SQL
+)
+
+
+def derive_statistics(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Turn summary counters into the statistics dashboards show.
+
+    Args:
+        raw: Row from SUMMARY_SQL or AGGREGATE_SQL (column -> value)
+
+    Returns:
+        Counters plus success rates and averages
+    """
+    stats = {
+        column: float(raw[column]) if column in SUM_COLUMNS else int(raw[column])
+        for column in STAT_AGGREGATES
+    }
+    total = stats['total_workflows']
+    for layer in range(1, 8):
+        count = stats[f'layer{layer}_success_count']
+        stats[f'layer{layer}_success_rate'] = (count / total * 100) if total > 0 else 0
+    stats['success_rate'] = round(stats['fully_successful'] / total * 100, 1) if total > 0 else 0
+    stats['avg_quality_score'] = round(
+        stats['quality_score_sum'] / stats['quality_score_count'], 2
+    ) if stats['quality_score_count'] else 0
+    stats['avg_processing_time'] = round(
+        stats['processing_time_sum'] / stats['processing_time_count'], 2
+    ) if stats['processing_time_count'] else 0
+    return stats
+
+
+def read_statistics(session) -> Dict[str, Any]:
+    """
+    Read workflow statistics from the summary table.
+
+    Falls back to one aggregate scan when the summary table is missing or empty.
+
+    Args:
+        session: SQLAlchemy session
+
+    Returns:
+        Statistics as returned by derive_statistics()
+    """
+    raw: Optional[Dict[str, Any]] = None
+    if inspect(session.connection()).has_table(STATS_TABLE):
+        raw = dict(session.execute(text(SUMMARY_SQL)).mappings().one())
+        if not raw['slots']:
+            raw = None
+    if raw is None:
+        raw = dict(session.execute(text(AGGREGATE_SQL)).mappings().one())
+    return derive_statistics(raw)
+
+
+def read_statistics_dbapi(connection) -> Dict[str, Any]:
+    """
+    read_statistics() for a plain DB-API connection (the psycopg2 dashboards).
+
+    Args:
+        connection: Open DB-API connection to Postgres
+
+    Returns:
+        Statistics as returned by derive_statistics()
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (STATS_TABLE,))
+        raw = None
+        if cursor.fetchone()[0]:
+            cursor.execute(SUMMARY_SQL)
+            raw = dict(zip([column[0] for column in cursor.description], cursor.fetchone(), strict=True))
+            if not raw['slots']:
+                raw = None
+        if raw is None:
+            cursor.execute(AGGREGATE_SQL)
+            raw = dict(zip([column[0] for column in cursor.description], cursor.fetchone(), strict=True))
+        return derive_statistics(raw)
+    finally:
+        cursor.close()
+
+
+def refresh_statistics(session):
+    """
+    Recompute the summary table from workflows (backfill or repair).
+
+    Blocks writes to workflows while counting so no trigger delta is lost.
+    Postgres only; the caller commits.
+
+    Args:
+        session: SQLAlchemy session
+    """
+    session.execute(text("LOCK TABLE workflows IN SHARE MODE"))
+    session.execute(text(f"DELETE FROM {STATS_TABLE}"))
+    session.execute(text(REFRESH_SQL))
+
+
+def _delta(column: str, sources: Dict[str, int]) -> str:
+    """SQL for a column's delta, e.g. `new_rows_totals.c - old_rows_totals.c`."""
+    terms = [f"{'-' if sign < 0 else '+'} {alias}_totals.{column}" for alias, sign in sources.items()]
+    return " ".join(terms).lstrip('+ ')
+
+
+def _trigger_function(event: str, sources: Dict[str, int]) -> str:
+    """DDL for the trigger function adding a statement's delta to the summary."""
+    deltas = ",\n        ".join(_delta(column, sources) for column in STAT_AGGREGATES)
+    zeros = ", ".join("0" for _ in STAT_AGGREGATES)
+    aggregates = ",\n            ".join(
+        f"{expression} AS {column}" for column, expression in STAT_AGGREGATES.items()
+    )
+    from_clause = ",\n        ".join(
+        f"(SELECT\n            {aggregates}\n        FROM {alias}) AS {alias}_totals" for alias in sources
+    )
+    updates = ",\n        ".join(
+        f"{column} = {STATS_TABLE}.{column} + EXCLUDED.{column}" for column in STAT_AGGREGATES
+    )
+    # Statements that change no counter (no rows, or only untracked columns) skip the write
+    return f"""CREATE OR REPLACE FUNCTION {STATS_TABLE}_after_{event}() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO {STATS_TABLE} (slot, {", ".join(STAT_AGGREGATES)})
+    SELECT pg_backend_pid() % {STATS_SLOTS},
+        {deltas}
+    FROM {from_clause}
+    WHERE (
+        {deltas}
+    ) IS DISTINCT FROM ({zeros})
+    ON CONFLICT (slot) DO UPDATE SET
+        {updates};
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql"""
+
+
+def statistics_statements() -> List[str]:
+    """
+    Postgres statements creating the summary table and its triggers.
+
+    Returns:
+        Idempotent DDL statements, without trailing semicolons
+    """
+    columns = ",\n    ".join(
+        f"{column} {'DOUBLE PRECISION' if column in SUM_COLUMNS else 'BIGINT'} NOT NULL DEFAULT 0"
+        for column in STAT_AGGREGATES
+    )
+    events = {
+        'insert': ("INSERT", "NEW TABLE AS new_rows", {'new_rows': 1}),
+        'update': ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows", {'new_rows': 1, 'old_rows': -1}),
+        'delete': ("DELETE", "OLD TABLE AS old_rows", {'old_rows': -1}),
+    }
+    statements = [
+        f"CREATE TABLE IF NOT EXISTS {STATS_TABLE} (\n"
+        f"    slot SMALLINT PRIMARY KEY,\n    {columns}\n)"
+    ]
+    for event, (operation, referencing, sources) in events.items():
+        statements += [
+            _trigger_function(event, sources),
+            f"DROP TRIGGER IF EXISTS {STATS_TABLE}_{event} ON workflows",
+            f"CREATE TRIGGER {STATS_TABLE}_{event}\n"
+            f"    AFTER {operation} ON workflows\n"
+            f"    REFERENCING {referencing}\n"
+            f"    FOR EACH STATEMENT EXECUTE FUNCTION {STATS_TABLE}_after_{event}()",
+        ]
+    statements += [
+        f"CREATE OR REPLACE FUNCTION {STATS_TABLE}_after_truncate() RETURNS trigger AS $$\n"
+        f"BEGIN\n    DELETE FROM {STATS_TABLE};\n    RETURN NULL;\nEND;\n$$ LANGUAGE plpgsql",
+        f"DROP TRIGGER IF EXISTS {STATS_TABLE}_truncate ON workflows",
+        f"CREATE TRIGGER {STATS_TABLE}_truncate\n"
+        f"    AFTER TRUNCATE ON workflows\n"
+        f"    FOR EACH STATEMENT EXECUTE FUNCTION {STATS_TABLE}_after_truncate()",
+    ]
+    return statements
+
+
+def statistics_ddl() -> str:
+    """
+    Migration script: summary table, triggers and the initial backfill.
+
+    Returns:
+        SQL script (the contents of migrations/workflow_stats.sql)
+    """
+    header = (
+        "-- Workflow Statistics Summary\n"
+        "-- Generated by `python scripts/install_workflow_stats.py --sql` from\n"
+        "-- src/storage/workflow_stats.py; edit the counters there, not here.\n"
+        "-- Statement-level triggers keep workflow_stats in step with workflows so\n"
+        "-- statistics are read from at most 16 rows instead of counting the catalog."
+    )
+    backfill = (
+        "-- Backfill (blocks workflow writes while counting)\n"
+        "BEGIN;\n"
+        "LOCK TABLE workflows IN SHARE MODE;\n"
+        f"DELETE FROM {STATS_TABLE};\n"
+        f"{REFRESH_SQL};\n"
+        "COMMIT;"
+    )
+    return "\n\n".join([header] + [f"{statement};" for statement in statistics_statements()] + [backfill]) + "\n"
@@ -0,0 +1,302 @@
+"""
+Write-behind buffer with group commit.
+
+The production scrapers commit once per workflow, so every result pays a
+full transaction round trip to the remote Postgres. WriteBehindBuffer
+accumulates results and hands them to a batch write function that stores
+them in one transaction:
+- Flush when `max_records` results are pending or `max_delay_ms` after the
+  first one arrived, whichever comes first
+- If the batch transaction fails, each record is retried on its own, and
+  records that still fail are re-queued for the next flush
+- Records failing `max_attempts` times go to a dead-letter file
+  (`<spool>.failed`) instead of blocking the buffer; callers report them
+  as failed saves (`dead_lettered`), since add() already returned
+- Every record is appended to a local JSONL spool before add() returns, and
+  the spool is rewritten with what is still pending after each flush, so a
+  process that dies between flushes replays the rest on the next start
+
+Writes run on the StorageWriter thread, off the event loop. Spool appends,
+rewrites and dead-letter writes run in submission order on the buffer's own
+spool thread, so an fsync never stalls the loop or queues behind a database
+write.
+
+Usage:
+    buffer = WriteBehindBuffer('layer1_5', scraper.save_many_to_database)
+    await buffer.add({'workflow_id': '2462', 'markdown': md, 'metadata': meta})
+    ...
+    await buffer.close()
+"""
+
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+
+from .async_writer import StorageWriter, get_storage_writer
+
+DEFAULT_SPOOL_DIR = os.getenv('WRITE_SPOOL_DIR', 'data/spool')
+DEFAULT_MAX_RECORDS = 50
+DEFAULT_MAX_DELAY_MS = 2000
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+class WriteBehindBuffer:
+    """
+    Buffers JSON-serializable records and writes them in group commits.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        write: Callable[[List[Dict[str, Any]]], Any],
+        max_records: int = DEFAULT_MAX_RECORDS,
+        max_delay_ms: int = DEFAULT_MAX_DELAY_MS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        spool_dir: str = DEFAULT_SPOOL_DIR,
+        writer: Optional[StorageWriter] = None,
+        fsync: bool = True
+    ):
+        """
+        Initialize write-behind buffer and replay its spool.
+
+        Args:
+            name: Buffer name; the spool is `<spool_dir>/<name>.jsonl`
+            write: Blocking function storing a list of records in one
+                transaction; it must raise (and roll back) on failure
+            max_records: Pending records that trigger a flush
+            max_delay_ms: Longest a record waits before a flush
+            max_attempts: Individual write attempts before a record is dead-lettered
+            spool_dir: Directory for the spool and dead-letter files
+            writer: Writer thread to run writes on (default: get_storage_writer())
+            fsync: fsync the spool after every append (durable across power loss)
+        """
+        self.name = name
+        self.write = write
+        self.max_records = max_records
+        self.max_delay = max_delay_ms / 1000
+        self.max_attempts = max_attempts
+        self.writer = writer or get_storage_writer()
+        self.fsync = fsync
+
+        self.spool_path = Path(spool_dir) / f"{name}.jsonl"
+        self.dead_letter_path = self.spool_path.with_suffix('.failed')
+        self.spool_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._pending: List[Dict[str, Any]] = []
+        self._next_id = 0
+        self._timer: Optional[asyncio.Task] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._spool_executor: Optional[ThreadPoolExecutor] = None
+
+        self.stats = {
+            'added': 0,
+            'recovered': 0,
+            'flushes': 0,
+            'written': 0,
+            'batch_failures': 0,
+            'requeued': 0,
+            'dead_lettered': 0,
+            'flush_seconds': 0.0
+        }
+
+        self._recover()
+
+    @property
+    def pending(self) -> int:
+        """Records added (or recovered) but not yet written."""
+        return len(self._pending)
+
+    @property
+    def dead_lettered(self) -> int:
+        """Records given up on (moved to the dead-letter file) by this buffer."""
+        return self.stats['dead_lettered']
+
+    def _recover(self):
+        """Load records left in the spool by a previous run."""
+        if not self.spool_path.exists():
+            return
+        with open(self.spool_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    envelope = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn final line from a crash mid-append; its add() never returned
+                    logger.warning(f"Skipping unreadable line in spool {self.spool_path}")
+                    continue
+                self._pending.append(envelope)
+                self._next_id = max(self._next_id, envelope['id'] + 1)
+        self.stats['recovered'] = len(self._pending)
+        if self._pending:
+            logger.info(f"Write buffer '{self.name}' recovered {len(self._pending)} records from {self.spool_path}")
+
+    def _append_spool(self, envelope: Dict[str, Any]):
+        with open(self.spool_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(envelope, default=str) + '\n')
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _rewrite_spool(self, pending: List[Dict[str, Any]]):
+        """Atomically replace the spool with the records still pending."""
+        tmp_path = self.spool_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for envelope in pending:
+                f.write(json.dumps(envelope, default=str) + '\n')
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.spool_path)
+
+    def _append_dead_letter(self, envelope: Dict[str, Any]):
+        with open(self.dead_letter_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(envelope, default=str) + '\n')
+
+    async def _dead_letter(self, envelope: Dict[str, Any], error: Exception):
+        logger.error(f"Write buffer '{self.name}' gave up on record {envelope['id']} "
+                     f"after {envelope['attempts']} attempts: {error}")
+        envelope['error'] = str(error)
+        await self._spool_io(self._append_dead_letter, envelope)
+        self.stats['dead_lettered'] += 1
+
+    def _spool_io(self, func: Callable[..., Any], *args) -> asyncio.Future:
+        # Queued as soon as this is called (not when awaited): spool operations
+        # run in the order the loop issued them, one at a time
+        if self._spool_executor is None:
+            self._spool_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'spool-{self.name}')
+        return asyncio.get_running_loop().run_in_executor(self._spool_executor, func, *args)
+
+    def _ensure_loop(self):
+        # The flush lock belongs to one event loop (scripts may call asyncio.run repeatedly)
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._timer = None
+            self._loop = loop
+
+    def _schedule_flush(self):
+        if self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_delay())
+
+    async def _flush_after_delay(self):
+        await asyncio.sleep(self.max_delay)
+        self._timer = None
+        # Nobody awaits the timer task: log failures here or asyncio drops them unseen
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Write buffer '{self.name}' delayed flush failed: {e}")
+
+    def _cancel_timer(self):
+        timer, self._timer = self._timer, None
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+
+    async def add(self, record: Dict[str, Any]):
+        """
+        Spool a record and queue it for the next group commit.
+
+        Returns once the record is in the spool; the database write happens
+        on the next flush. Waits for that flush when the buffer is full.
+
+        Args:
+            record: JSON-serializable record passed to `write`
+        """
+        self._ensure_loop()
+        envelope = {'id': self._next_id, 'attempts': 0, 'record': record}
+        self._next_id += 1
+        # Pending before the append is queued: a flush in between rewrites the
+        # spool after this append and keeps the record in it
+        self._pending.append(envelope)
+        try:
+            await self._spool_io(self._append_spool, envelope)
+        except Exception:
+            if envelope in self._pending:
+                self._pending.remove(envelope)
+            raise
+        self.stats['added'] += 1
+
+        if len(self._pending) >= self.max_records:
+            await self.flush()
+        else:
+            self._schedule_flush()
+
+    async def flush(self) -> int:
+        """
+        Write all pending records in one transaction.
+
+        Falls back to one transaction per record when the batch fails;
+        failed records are re-queued (or dead-lettered after max_attempts).
+
+        Returns:
+            Number of records written
+        """
+        self._ensure_loop()
+        async with self._lock:
+            self._cancel_timer()
+            batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+
+            start_time = time.time()
+            written = 0
+            requeue = []
+            try:
+                await self.writer.submit(self.write, [envelope['record'] for envelope in batch])
+                written = len(batch)
+            except Exception as e:
+                self.stats['batch_failures'] += 1
+                logger.warning(f"Write buffer '{self.name}' batch of {len(batch)} failed ({e}); "
+                               f"writing records one by one")
+                for envelope in batch:
+                    try:
+                        await self.writer.submit(self.write, [envelope['record']])
+                        written += 1
+                    except Exception as record_error:
+                        envelope['attempts'] += 1
+                        if envelope['attempts'] >= self.max_attempts:
+                            await self._dead_letter(envelope, record_error)
+                        else:
+                            requeue.append(envelope)
+
+            # Records added while the batch was being written stay behind the re-queued ones
+            self._pending = requeue + self._pending
+            await self._spool_io(self._rewrite_spool, list(self._pending))
+
+            self.stats['flushes'] += 1
+            self.stats['written'] += written
+            self.stats['requeued'] += len(requeue)
+            self.stats['flush_seconds'] += time.time() - start_time
+            logger.debug(f"Write buffer '{self.name}' flushed {written}/{len(batch)} records")
+
+            if self._pending:
+                self._schedule_flush()
+            return written
+
+    async def close(self):
+        """Flush pending records and stop the flush timer."""
+        self._ensure_loop()
+        await self.flush()
+        self._cancel_timer()
+        if self._spool_executor is not None:
+            executor, self._spool_executor = self._spool_executor, None
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+        if self._pending:
+            logger.warning(f"Write buffer '{self.name}' closing with {len(self._pending)} "
+                           f"unwritten records kept in {self.spool_path}")
+        logger.info(f"Write buffer '{self.name}' closed: {self.stats}")
+
+    async def __aenter__(self):
+        self._ensure_loop()
+        if self._pending:
+            self._schedule_flush()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -39,8 +39,8 @@ try:
     
     # Test workflows
     try:
-        workflows, total = get_workflows(limit=5)
-        print(f"✅ Workflows retrieved: {len(workflows)} of {total}")
+        page, total, exact = get_workflows(limit=5)
+        print(f"✅ Workflows retrieved: {len(page.rows)} of {'' if exact else '~'}{total}")
     except Exception as e:
         print(f"❌ Workflows failed: {e}")
         
@@ -14,14 +14,14 @@ spec.loader.exec_module(view_database)
 try:
     # Get statistics and workflows
     stats = view_database.get_statistics()
-    workflows, total = view_database.get_workflows(limit=5)
+    page, total, exact = view_database.get_workflows(limit=5)
     
     print("✅ Data retrieved successfully")
     print(f"Stats: {stats}")
-    print(f"Workflows: {len(workflows)}")
+    print(f"Workflows: {len(page.rows)}")
     
     # Test HTML generation
-    html = view_database.generate_html(workflows, stats, total, page=1, limit=5, search=None, sort_by='extracted_at', sort_order='desc')
+    html = view_database.generate_html(page, stats, total, exact, search=None, sort_by='extracted_at', sort_order='desc')
     print("✅ HTML generated successfully")
     print("HTML length:", len(html))
     
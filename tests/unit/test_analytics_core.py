@@ -0,0 +1,83 @@
+"""
+Unit tests for the synchronous cores of analytics Layers 4-7.
+
+Tests cover:
+- extract_sync() returns the same result as the async extract()
+- analyze() returns the populated dataclass and raises on malformed input
+- Cores can run in a thread pool without an event loop
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.scrapers.layer4_business_intelligence import BusinessIntelligenceData, BusinessIntelligenceExtractor
+from src.scrapers.layer5_community_data import CommunityDataExtractor
+from src.scrapers.layer6_technical_details import TechnicalDetailsExtractor
+from src.scrapers.layer7_performance_analytics import PerformanceAnalyticsExtractor
+
+
+EXTRACTORS = [
+    BusinessIntelligenceExtractor,
+    CommunityDataExtractor,
+    TechnicalDetailsExtractor,
+    PerformanceAnalyticsExtractor,
+]
+
+
+def _workflow_data(index: int = 0):
+    return {
+        'workflow_id': f'wf{index}',
+        'layers': {
+            'layer1': {'data': {
+                'title': 'Sales Report', 'description': 'Daily KPI dashboard with Slack alerts',
+                'use_case': 'We must reduce cost', 'views': 120 + index
+            }},
+            'layer2': {'data': {'node_count': 4 + index, 'connection_count': 3 + index, 'node_types': ['httpRequest', 'slack']}},
+            'layer3': {'data': {
+                'explainer_text': 'Great workflow. It saves 5 hours per week! ROI: 200%',
+                'setup_instructions': 'Add your API key and OAuth credentials.',
+                'use_instructions': 'Run it daily, monitor errors and retry'
+            }}
+        }
+    }
+
+
+class TestSyncCore:
+    """Test the synchronous core against the async adapter."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('extractor_class', EXTRACTORS)
+    async def test_extract_sync_matches_extract(self, extractor_class):
+        extractor = extractor_class()
+        data = _workflow_data()
+
+        sync_result = extractor.extract_sync(data)
+
+        assert sync_result['success']
+        assert sync_result == await extractor.extract(data)
+        assert extractor.analyze(data).__dict__ == sync_result['data']
+
+    def test_analyze_returns_dataclass(self):
+        bi_data = BusinessIntelligenceExtractor().analyze(_workflow_data())
+
+        assert isinstance(bi_data, BusinessIntelligenceData)
+        assert bi_data.business_function == 'Sales'
+
+    def test_analyze_raises_where_extract_sync_reports(self):
+        extractor = TechnicalDetailsExtractor()
+        data = _workflow_data()
+        data['layers']['layer3']['data'] = None
+
+        with pytest.raises(AttributeError):
+            extractor.analyze(data)
+        assert extractor.extract_sync(data)['success'] is False
+
+    def test_runs_in_thread_pool(self):
+        extractor = PerformanceAnalyticsExtractor()
+        workflows = [_workflow_data(i) for i in range(8)]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(extractor.extract_sync, workflows))
+
+        assert results == [extractor.extract_sync(data) for data in workflows]
@@ -0,0 +1,101 @@
+"""
+Unit tests for the async storage writer.
+
+Tests cover:
+- Blocking writes don't stall the event loop
+- Writes run in order on one writer thread
+- Backpressure when max_pending calls are outstanding
+- Errors propagate to the caller
+- AsyncWorkflowRepository delegates to the repository
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock
+
+from src.storage.async_writer import AsyncWorkflowRepository, StorageWriter
+
+
+class TestStorageWriter:
+    """Test the writer thread and its queue."""
+
+    @pytest.mark.asyncio
+    async def test_loop_keeps_running_during_write(self):
+        ticks = []
+
+        async def ticker():
+            while len(ticks) < 5:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        async with StorageWriter() as writer:
+            ticker_task = asyncio.create_task(ticker())
+            assert await writer.submit(lambda: time.sleep(0.2) or 'saved') == 'saved'
+            await ticker_task
+
+        assert len(ticks) == 5
+
+    @pytest.mark.asyncio
+    async def test_writes_run_in_order_on_one_thread(self):
+        calls = []
+
+        def write(value):
+            calls.append((value, threading.current_thread().name))
+            return value
+
+        async with StorageWriter(name='writer-test') as writer:
+            results = await asyncio.gather(*(writer.submit(write, i) for i in range(20)))
+
+        assert results == list(range(20))
+        assert [value for value, _ in calls] == list(range(20))
+        assert {name for _, name in calls} == {'writer-test_0'}
+        assert threading.current_thread().name not in {name for _, name in calls}
+
+    @pytest.mark.asyncio
+    async def test_backpressure(self):
+        release = threading.Event()
+        writer = StorageWriter(max_pending=2)
+
+        tasks = [asyncio.create_task(writer.submit(release.wait, 5)) for _ in range(5)]
+        await asyncio.sleep(0.05)
+
+        assert writer.pending == 2
+        assert writer.stats['waited'] == 3
+
+        release.set()
+        assert await asyncio.gather(*tasks) == [True] * 5
+        assert writer.stats['max_pending'] == 2
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate(self):
+        def fail():
+            raise ValueError('constraint violated')
+
+        async with StorageWriter() as writer:
+            with pytest.raises(ValueError):
+                await writer.submit(fail)
+            assert await writer.submit(int, '3') == 3
+
+        assert writer.stats['failed'] == 1
+        assert writer.stats['completed'] == 1
+
+
+class TestAsyncWorkflowRepository:
+    """Test repository delegation."""
+
+    @pytest.mark.asyncio
+    async def test_delegates_to_repository(self):
+        repository = MagicMock()
+        repository.create_workflow.return_value = 'workflow'
+        repository.bulk_upsert_workflows.return_value = {'workflows': 1}
+
+        async with StorageWriter() as writer:
+            repo = AsyncWorkflowRepository(repository, writer=writer)
+            assert await repo.create_workflow('2462', 'https://n8n.io/workflows/2462', {}) == 'workflow'
+            assert await repo.bulk_upsert_workflows([('1', 'u', {})], batch_size=10) == {'workflows': 1}
+
+        repository.create_workflow.assert_called_once_with('2462', 'https://n8n.io/workflows/2462', {})
+        repository.bulk_upsert_workflows.assert_called_once_with([('1', 'u', {})], batch_size=10)
@@ -0,0 +1,76 @@
+"""
+Unit tests for the batch analytics engine.
+
+Tests cover:
+- Column-wise complexity rules match the Layer 7 tier tables
+- Chunk frames built from stored layer outputs
+- Batch scoring matches per-workflow extraction
+"""
+
+import pytest
+
+from src.scrapers.batch_analytics import BatchAnalyticsEngine, complexity_estimates, workflow_frame
+from src.scrapers.layer7_performance_analytics import PerformanceAnalyticsExtractor
+
+
+def _rows():
+    rows = []
+    for i, (nodes, connections) in enumerate([(0, 0), (3, 2), (10, 8), (16, 20), (40, 35)]):
+        rows.append((
+            i + 1,
+            f"wf{i}",
+            {'success': True, 'data': {'title': 'Sales sync', 'description': 'CRM', 'use_case': 'reduce cost', 'views': 50 * i}},
+            {'node_count': nodes, 'connection_count': connections},
+            {'success': True, 'data': {
+                'explainer_text': 'Great tool to optimize and monitor sales. Success rate 97%',
+                'setup_instructions': 'Add your API key',
+                'use_instructions': ''
+            }}
+        ))
+    return rows
+
+
+class TestComplexityEstimates:
+    """Test vectorized Layer 7 complexity rules."""
+
+    def test_tiers(self):
+        estimates = complexity_estimates([0, 5, 6, 16, 20], [0, 0, 10, 0, 20])
+
+        assert estimates['execution_success_rate'].isna().iat[0]
+        assert list(estimates['execution_success_rate'][1:]) == [95.0, 90.0, 85.0, 85.0]
+        assert list(estimates['support_level']) == ['low', 'low', 'medium', 'medium', 'high']
+        assert list(estimates['training_cost']) == [200.0, 200.0, 300.0, 300.0, 400.0]
+
+
+class TestWorkflowFrame:
+    """Test chunk frames built from stored rows."""
+
+    def test_missing_layers_become_empty(self):
+        frame = workflow_frame([(1, 'wf1', None, None, None), (2, 'wf2', {}, {'node_count': 'x'}, {})])
+
+        assert frame.loc[0, 'layer1'] == {}
+        assert frame.loc[0, 'node_count'] == 0
+        assert frame['node_count'].isna().iat[1]
+
+
+class TestBatchScoring:
+    """Test batch scoring against per-workflow extraction."""
+
+    @pytest.mark.asyncio
+    async def test_matches_single_workflow_extraction(self):
+        engine = BatchAnalyticsEngine(chunk_size=10)
+        rows = _rows()
+        scored = engine.score_chunk(workflow_frame(rows))
+
+        extractor = PerformanceAnalyticsExtractor()
+        for row, result in zip(rows, scored):
+            workflow_data = {
+                'workflow_id': row[1],
+                'layers': {'layer1': row[2], 'layer2': {'success': True, 'data': row[3]}, 'layer3': row[4]}
+            }
+            assert result['workflow_id'] == row[1]
+            assert result['layers']['layer7'] == await extractor.extract(workflow_data)
+            assert all(result['layers'][layer]['success'] for layer in ('layer4', 'layer5', 'layer6'))
+
+        assert engine.stats['workflows'] == 5
+        assert engine.stats['layer_failures'] == 0
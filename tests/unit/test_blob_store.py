@@ -0,0 +1,123 @@
+"""
+Unit tests for the payload blob store.
+
+Tests cover:
+- Equal payloads (in any key order) are stored once, compressed
+- Blobs stream back decompressed; unknown digests raise KeyError
+- Snapshots reference their payload; inline payloads are offloaded
+- Unreferenced blobs are pruned
+- The committed migration matches the store definitions
+"""
+
+import hashlib
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from src.storage.blob_store import (
+    blob_stats,
+    blob_store_ddl,
+    canonical_json,
+    load_json,
+    load_snapshot,
+    offload_snapshots,
+    open_blob,
+    prune_blobs,
+    put_json,
+    save_snapshot,
+)
+
+PAYLOAD = {'node_contexts': [{'node_name': f'Node {i}', 'sticky_content': 'Explains the step ' * 20} for i in range(50)]}
+
+
+@pytest.fixture
+def session():
+    engine = create_engine('sqlite://')
+    with Session(engine) as session:
+        session.execute(text(
+            "CREATE TABLE payload_blobs (sha256 CHAR(64) PRIMARY KEY, raw_size INTEGER NOT NULL, "
+            "data BLOB NOT NULL, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+        ))
+        session.execute(text(
+            "CREATE TABLE workflow_extraction_snapshots (id INTEGER PRIMARY KEY, workflow_id TEXT, "
+            "layer TEXT NOT NULL, payload TEXT, payload_sha256 CHAR(64), created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+        ))
+        yield session
+
+
+def snapshot_rows(session):
+    return session.execute(text(
+        "SELECT id, payload, payload_sha256 FROM workflow_extraction_snapshots ORDER BY id"
+    )).all()
+
+
+class TestBlobStore:
+    """Test storing and reading blobs."""
+
+    def test_identical_payloads_stored_once(self, session):
+        reordered = {'node_contexts': [dict(reversed(list(context.items()))) for context in PAYLOAD['node_contexts']]}
+
+        digest = put_json(session, PAYLOAD)
+
+        assert put_json(session, reordered) == digest
+        assert digest == hashlib.sha256(canonical_json(PAYLOAD)).hexdigest()
+        stats = blob_stats(session)
+        assert stats['blobs'] == 1
+        assert stats['raw_bytes'] == len(canonical_json(PAYLOAD))
+        assert stats['compression_ratio'] > 10
+
+    def test_streams_back(self, session):
+        digest = put_json(session, PAYLOAD)
+
+        with open_blob(session, digest) as stream:
+            chunks = iter(lambda: stream.read(1024), b'')
+            assert b''.join(chunks) == canonical_json(PAYLOAD)
+        assert load_json(session, digest) == PAYLOAD
+        with pytest.raises(KeyError):
+            load_json(session, '0' * 64)
+
+
+class TestSnapshots:
+    """Test snapshot references, offloading and pruning."""
+
+    def test_snapshots_share_payload(self, session):
+        first = save_snapshot(session, '2462', 'L2V2', PAYLOAD)
+        second = save_snapshot(session, '2462', 'L2V2', PAYLOAD)
+
+        rows = snapshot_rows(session)
+        assert first == second
+        assert [(row.payload, row.payload_sha256) for row in rows] == [(None, first), (None, first)]
+        assert blob_stats(session)['blobs'] == 1
+        assert load_snapshot(session, rows[1].id) == PAYLOAD
+        assert load_snapshot(session, 999) is None
+
+    def test_offload_inline_payloads(self, session):
+        session.execute(text(
+            "INSERT INTO workflow_extraction_snapshots (workflow_id, layer, payload) "
+            "VALUES ('1', 'L3V3', :a), ('2', 'L3V3', :a), ('3', 'L3V3', :b)"
+        ), {'a': '{"standalone_docs": []}', 'b': '{"standalone_docs": [{"doc_title": "Setup"}]}'})
+        assert load_snapshot(session, 1) == {'standalone_docs': []}
+
+        assert offload_snapshots(session, batch_size=2) == 2
+        assert offload_snapshots(session, batch_size=2) == 1
+        assert offload_snapshots(session, batch_size=2) == 0
+
+        rows = snapshot_rows(session)
+        assert all(row.payload is None for row in rows)
+        assert rows[0].payload_sha256 == rows[1].payload_sha256 != rows[2].payload_sha256
+        assert load_snapshot(session, 3) == {'standalone_docs': [{'doc_title': 'Setup'}]}
+
+    def test_prune_unreferenced(self, session):
+        kept = save_snapshot(session, '1', 'L2V2', PAYLOAD)
+        save_snapshot(session, '2', 'L2V2', {'node_contexts': []})
+        session.execute(text("DELETE FROM workflow_extraction_snapshots WHERE workflow_id = '2'"))
+
+        assert prune_blobs(session) == 1
+        assert blob_stats(session)['blobs'] == 1
+        assert load_json(session, kept) == PAYLOAD
+
+    def test_migration_is_generated(self):
+        migration = Path(__file__).parents[2] / 'migrations' / 'payload_blobs.sql'
+        assert migration.read_text() == blob_store_ddl()
@@ -0,0 +1,77 @@
+"""
+Unit tests for bulk upserts.
+
+Tests cover:
+- Insert, update of the row's update columns only, and do-nothing rows
+- Duplicate keys in one batch merge like sequential writes
+- One statement per column layout
+- Unknown columns are ignored
+"""
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, event, select
+from sqlalchemy.orm import Session
+
+from src.storage.bulk_upsert import UpsertRow, merge_rows, upsert_rows
+
+metadata = MetaData()
+items = Table(
+    'items', metadata,
+    Column('id', Integer, primary_key=True),
+    Column('workflow_id', String(50), unique=True, nullable=False),
+    Column('title', String(100)),
+    Column('views', Integer, default=0),
+)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine('sqlite://')
+    metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def _rows(session):
+    return [tuple(row) for row in session.execute(select(items.c.workflow_id, items.c.title, items.c.views).order_by(items.c.workflow_id))]
+
+
+class TestUpsertRows:
+    """Test set-based insert-or-update."""
+
+    def test_insert_then_partial_update(self, session):
+        upsert_rows(session, items, [
+            UpsertRow({'workflow_id': 'a', 'title': 'A', 'views': 1}, ('title', 'views')),
+            UpsertRow({'workflow_id': 'b', 'title': 'B', 'views': 2}, ('title', 'views')),
+        ], keys=('workflow_id',))
+        written = upsert_rows(session, items, [
+            UpsertRow({'workflow_id': 'a', 'title': 'A2', 'views': 0}, ('title',)),
+            UpsertRow({'workflow_id': 'b', 'title': 'B2', 'views': 0}, ()),
+            UpsertRow({'workflow_id': 'c', 'title': 'C', 'views': 0, 'unknown': 1}, ('title', 'unknown')),
+        ], keys=('workflow_id',))
+
+        assert written == 3
+        assert _rows(session) == [('a', 'A2', 1), ('b', 'B', 2), ('c', 'C', 0)]
+
+    def test_duplicates_merge_like_sequential_writes(self, session):
+        upsert_rows(session, items, [
+            UpsertRow({'workflow_id': 'a', 'title': 'A', 'views': 5}, ('title', 'views')),
+            UpsertRow({'workflow_id': 'a', 'title': None, 'views': 0}, ()),
+            UpsertRow({'workflow_id': 'a', 'title': 'A3', 'views': 0}, ('title',)),
+        ], keys=('workflow_id',))
+
+        assert _rows(session) == [('a', 'A3', 5)]
+        assert merge_rows([UpsertRow({'workflow_id': 'x'}, ())] * 3, ('workflow_id',)) == [UpsertRow({'workflow_id': 'x'}, ())]
+
+    def test_one_statement_per_layout(self, session):
+        statements = []
+        event.listen(session.get_bind(), 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+        upsert_rows(session, items, [
+            UpsertRow({'workflow_id': str(i), 'title': str(i)}, ('title',) if i % 2 else ())
+            for i in range(100)
+        ], keys=('workflow_id',))
+
+        assert len(statements) == 2
+        assert len(_rows(session)) == 100
+        assert upsert_rows(session, items, [], keys=('workflow_id',)) == 0
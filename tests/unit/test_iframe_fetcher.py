@@ -0,0 +1,88 @@
+"""
+Unit tests for IframeFetcher.
+
+Tests cover:
+- Run cache by URL
+- Coalescing of concurrent fetches for the same URL
+- Failures are not cached
+- Shared context creation and disposal
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.scrapers.iframe_fetcher import DEFAULT_HEADERS, IframeFetcher
+
+
+def _response(text='<html>demo</html>', ok=True, status=200):
+    response = MagicMock(ok=ok, status=status)
+    response.text = AsyncMock(return_value=text)
+    return response
+
+
+def _context(*responses):
+    context = MagicMock()
+    context.get = AsyncMock(side_effect=list(responses))
+    context.dispose = AsyncMock()
+    return context
+
+
+class TestIframeFetcher:
+    """Test cached, coalesced iframe fetches."""
+
+    @pytest.mark.asyncio
+    async def test_second_fetch_is_cache_hit(self):
+        context = _context(_response())
+        fetcher = IframeFetcher(context, timeout=5000)
+
+        assert await fetcher.fetch('https://n8n.io/demo') == '<html>demo</html>'
+        assert await fetcher.fetch('https://n8n.io/demo') == '<html>demo</html>'
+        context.get.assert_awaited_once_with('https://n8n.io/demo', timeout=5000)
+        assert fetcher.stats['hits'] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fetches_coalesce(self):
+        release = asyncio.Event()
+
+        async def slow_get(url, timeout):
+            await release.wait()
+            return _response(text=url)
+
+        context = _context()
+        context.get = AsyncMock(side_effect=slow_get)
+        fetcher = IframeFetcher(context)
+
+        tasks = [asyncio.create_task(fetcher.fetch('https://n8n.io/demo')) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == ['https://n8n.io/demo'] * 5
+        assert context.get.await_count == 1
+        assert fetcher.stats['coalesced'] == 4
+
+    @pytest.mark.asyncio
+    async def test_failures_not_cached(self):
+        context = _context(_response(ok=False, status=503), RuntimeError('reset'), _response())
+        fetcher = IframeFetcher(context)
+
+        assert await fetcher.fetch('https://n8n.io/demo') is None
+        assert await fetcher.fetch('https://n8n.io/demo') is None
+        assert await fetcher.fetch('https://n8n.io/demo') == '<html>demo</html>'
+        assert await fetcher.fetch('') is None
+        assert fetcher.stats['failed'] == 2
+
+    @pytest.mark.asyncio
+    async def test_create_and_close(self):
+        context = _context()
+        playwright = MagicMock()
+        playwright.request.new_context = AsyncMock(return_value=context)
+
+        fetcher = await IframeFetcher.create(playwright, timeout=7000)
+        await fetcher.close()
+        await fetcher.close()
+
+        kwargs = playwright.request.new_context.await_args.kwargs
+        assert kwargs['timeout'] == 7000
+        assert kwargs['extra_http_headers'] == DEFAULT_HEADERS
+        context.dispose.assert_awaited_once()
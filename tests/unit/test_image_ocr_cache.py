@@ -0,0 +1,171 @@
+"""
+Unit tests for ImageOCRCache.
+
+Tests cover:
+- Exact and near-duplicate lookups (same aspect ratio only)
+- "No text" verdicts
+- LRU eviction and persistence
+- OCRService integration (OCR runs saved)
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+from unittest.mock import patch
+
+from src.scrapers.image_ocr_cache import ImageOCRCache, fingerprint_image
+from src.scrapers.ocr_service import OCRService, NO_TEXT_FOUND
+
+
+def _diagram(seed: int = 0, size=(400, 300), fmt="PNG", quality=None) -> bytes:
+    """Synthetic 'diagram' image; same seed -> same picture."""
+    rng = np.random.default_rng(seed)
+    image = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(image)
+    for _ in range(12):
+        x0, y0 = rng.integers(0, size[0] - 60), rng.integers(0, size[1] - 40)
+        draw.rectangle([x0, y0, x0 + 60, y0 + 40], fill=tuple(int(c) for c in rng.integers(0, 200, 3)))
+    buffer = BytesIO()
+    kwargs = {"quality": quality} if quality else {}
+    image.save(buffer, format=fmt, **kwargs)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = ImageOCRCache(db_path=str(tmp_path / "images.db"))
+    yield c
+    c.close()
+
+
+class TestFingerprint:
+    """Test hashing."""
+
+    def test_reencoded_image_has_close_hashes(self):
+        original = fingerprint_image(_diagram(1))
+        jpeg = fingerprint_image(_diagram(1, fmt="JPEG", quality=70))
+
+        assert original.content_hash != jpeg.content_hash
+        assert bin((original.dhash ^ jpeg.dhash) & (2**64 - 1)).count("1") <= 4
+
+    def test_dimensions_recorded(self):
+        fp = fingerprint_image(_diagram(1, size=(320, 200)))
+        assert (fp.width, fp.height) == (320, 200)
+
+
+class TestImageOCRCacheLookup:
+    """Test lookup semantics."""
+
+    def test_exact_hit(self, cache):
+        fp = fingerprint_image(_diagram(1))
+        cache.put(fp, "Step 1: Connect", has_text=True)
+
+        hit = cache.lookup(fp)
+
+        assert hit['match'] == 'exact'
+        assert hit['ocr_text'] == "Step 1: Connect"
+        assert (hit['width'], hit['height']) == (400, 300)
+
+    def test_near_duplicate_hit(self, cache):
+        cache.put(fingerprint_image(_diagram(1)), "Step 1: Connect", has_text=True)
+
+        resized = BytesIO()
+        Image.open(BytesIO(_diagram(1))).resize((200, 150)).save(resized, format="PNG")
+        hit = cache.lookup(fingerprint_image(resized.getvalue()))
+
+        assert hit is not None
+        assert hit['match'] == 'near'
+        assert cache.ocr_runs_saved == 1
+
+    def test_near_duplicate_needs_same_aspect_ratio(self, cache):
+        cache.put(fingerprint_image(_diagram(1)), "Step 1: Connect", has_text=True)
+
+        stretched = BytesIO()
+        Image.open(BytesIO(_diagram(1))).resize((400, 200)).save(stretched, format="PNG")
+        fp = fingerprint_image(stretched.getvalue())
+
+        assert cache.lookup(fp) is None
+        assert cache.stats['near_hits'] == 0
+
+    def test_different_image_misses(self, cache):
+        cache.put(fingerprint_image(_diagram(1)), "Step 1", has_text=True)
+        assert cache.lookup(fingerprint_image(_diagram(2))) is None
+
+    def test_no_text_verdict(self, cache):
+        fp = fingerprint_image(_diagram(3))
+        cache.put(fp, "", has_text=False)
+        assert cache.lookup(fp)['has_text'] is False
+
+
+class TestImageOCRCacheLifecycle:
+    """Test LRU and persistence."""
+
+    def test_lru_eviction(self, tmp_path):
+        cache = ImageOCRCache(db_path=str(tmp_path / "lru.db"), max_entries=2)
+        fps = [fingerprint_image(_diagram(i)) for i in range(3)]
+        cache.put(fps[0], "a", True)
+        cache.put(fps[1], "b", True)
+        cache.lookup(fps[0])  # refresh a
+        cache.put(fps[2], "c", True)  # evicts b
+
+        assert len(cache) == 2
+        assert cache.lookup(fps[0]) is not None
+        assert cache._fetch(fps[1].content_hash) is None
+        cache.close()
+
+    def test_eviction_updates_index_in_place(self, tmp_path):
+        cache = ImageOCRCache(db_path=str(tmp_path / "lru.db"), max_entries=3)
+        fps = [fingerprint_image(_diagram(i)) for i in range(6)]
+
+        with patch.object(cache, '_load_hash_index', side_effect=AssertionError("index reloaded")):
+            for i, fp in enumerate(fps):
+                cache.put(fp, f"text {i}", True)
+
+        assert len(cache) == 3
+        assert sorted(cache._keys) == sorted(fp.content_hash for fp in fps[3:])
+        assert {cache._keys[position]: position for position in range(3)} == cache._positions
+        for i, fp in enumerate(fps):
+            hit = cache.lookup(fp)
+            assert (hit['ocr_text'] if hit else None) == (f"text {i}" if i >= 3 else None)
+        cache.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "p.db")
+        fp = fingerprint_image(_diagram(1))
+        first = ImageOCRCache(db_path=path)
+        first.put(fp, "persisted", True)
+        first.close()
+
+        second = ImageOCRCache(db_path=path)
+        assert second.lookup(fp)['ocr_text'] == "persisted"
+        second.close()
+
+
+class TestOCRServiceWithCache:
+    """Test OCR service skips cached images."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_images_ocr_once(self, cache):
+        executor = ThreadPoolExecutor(max_workers=1)
+        with patch('src.scrapers.ocr_service.pytesseract.image_to_string', return_value="Diagram text") as ocr:
+            async with OCRService(max_workers=1, executor=executor, cache=cache) as service:
+                first = await (await service.submit_bytes(_diagram(1), "a.png"))
+                second = await (await service.submit_bytes(_diagram(1, fmt="JPEG", quality=80), "b.jpg"))
+        executor.shutdown()
+
+        assert ocr.call_count == 1
+        assert second.cached is True
+        assert second.text == first.text == "Diagram text"
+
+    @pytest.mark.asyncio
+    async def test_cached_no_text(self, cache):
+        cache.put(fingerprint_image(_diagram(5)), "", has_text=False)
+        executor = ThreadPoolExecutor(max_workers=1)
+        async with OCRService(max_workers=1, executor=executor, cache=cache) as service:
+            result = await (await service.submit_bytes(_diagram(5), "logo.png"))
+        executor.shutdown()
+
+        assert result.as_tuple() == (True, NO_TEXT_FOUND, None)
@@ -0,0 +1,94 @@
+"""
+Unit tests for OCR image preprocessing.
+
+Tests cover:
+- DPI-aware downscaling
+- Adaptive thresholding and crop-to-text
+- Skip heuristic for icons, photos and blank images
+"""
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from src.scrapers.image_preprocessing import (
+    adaptive_threshold,
+    downscale,
+    ink_bounding_box,
+    preprocess_for_ocr,
+)
+
+
+def _text_screenshot(size=(800, 400), background="white", ink="black") -> Image.Image:
+    image = Image.new("RGB", size, background)
+    draw = ImageDraw.Draw(image)
+    for row in range(5):
+        draw.text((300, 150 + row * 14), "Connect your Gmail account to n8n", fill=ink)
+    return image
+
+
+class TestDownscale:
+    """Test DPI-aware downscaling."""
+
+    def test_retina_screenshot_downscaled(self):
+        image = Image.new("RGB", (2000, 1000), "white")
+        image.info["dpi"] = (192, 192)
+        assert downscale(image).size == (1000, 500)
+
+    def test_normal_dpi_untouched(self):
+        image = Image.new("RGB", (800, 600), "white")
+        assert downscale(image) is image
+
+    def test_huge_image_capped(self):
+        image = Image.new("RGB", (6000, 4000), "white")
+        width, height = downscale(image, max_pixels=1_000_000).size
+        assert width * height <= 1_000_000
+
+
+class TestThresholdAndCrop:
+    """Test binarization and cropping."""
+
+    def test_threshold_marks_text_as_ink(self):
+        gray = np.asarray(_text_screenshot().convert("L"))
+        ink = adaptive_threshold(gray)
+        assert ink.any()
+        assert ink.mean() < 0.2
+
+    def test_flat_image_has_no_ink(self):
+        gray = np.full((100, 100), 200, dtype=np.uint8)
+        assert not adaptive_threshold(gray).any()
+        assert ink_bounding_box(adaptive_threshold(gray)) is None
+
+    def test_crop_to_text_region(self):
+        processed, reason = preprocess_for_ocr(_text_screenshot())
+        assert reason is None
+        assert processed.mode == "L"
+        assert processed.size[0] < 800 and processed.size[1] < 400
+        assert set(np.unique(np.asarray(processed))) <= {0, 255}
+
+    def test_dark_mode_is_inverted(self):
+        processed, reason = preprocess_for_ocr(_text_screenshot(background="black", ink="white"))
+        assert reason is None
+        assert np.asarray(processed).mean() > 127  # dark text on light background
+
+
+class TestSkipHeuristic:
+    """Test text-free image detection."""
+
+    def test_icon_skipped(self):
+        assert preprocess_for_ocr(Image.new("RGB", (16, 16), "red")) == (None, "icon")
+
+    def test_blank_image_skipped(self):
+        assert preprocess_for_ocr(Image.new("RGB", (400, 300), "white")) == (None, "blank")
+
+    def test_photo_skipped(self):
+        rng = np.random.default_rng(0)
+        pixels = rng.integers(0, 256, (300, 400, 3), dtype=np.uint8)
+        image, reason = preprocess_for_ocr(Image.fromarray(pixels))
+        assert image is None
+        assert reason == "photo"
+
+    def test_transparent_logo_flattened(self):
+        logo = Image.new("RGBA", (200, 200), (0, 0, 0, 0))
+        image, reason = preprocess_for_ocr(logo)
+        assert image is None
+        assert reason == "blank"
@@ -0,0 +1,75 @@
+"""
+Unit tests for the shared keyword matcher.
+
+Tests cover:
+- Same results as `keyword in text` (overlapping and nested keywords)
+- Counts, offsets and category helpers
+- Registry used by the analytics layers
+"""
+
+import importlib
+import random
+
+from src.scrapers.keyword_matcher import KeywordMatcher, get_keyword_matcher, scan_text
+
+
+CATEGORIES = {
+    'cost': ['cost', 'reduce cost', 'cost effective', 'budget'],
+    'time': ['time', 'reduce time', 'faster'],
+    'it': ['it', 'api', 'data'],
+}
+
+
+class TestKeywordMatcher:
+    """Test scanning semantics."""
+
+    def test_nested_and_overlapping_keywords(self):
+        scan = KeywordMatcher(CATEGORIES).scan("reduce cost and reduce time, cost effective")
+
+        assert scan.present('cost') == ['cost', 'reduce cost', 'cost effective']
+        assert scan.count('cost') == 2
+        assert scan.offsets['reduce cost'] == [0]
+        assert scan.present('time') == ['time', 'reduce time']
+
+    def test_substring_semantics_match_in_operator(self):
+        matcher = KeywordMatcher(CATEGORIES)
+        rng = random.Random(7)
+        vocabulary = ['reduce', 'cost', 'time', 'it', 'with', 'api', 'data', 'fast', 'er', 'budget', 'effective']
+        for _ in range(200):
+            text = " ".join(rng.choice(vocabulary) for _ in range(20))
+            scan = matcher.scan(text)
+            for name, keywords in CATEGORIES.items():
+                assert scan.present(name) == [k for k in keywords if k in text]
+                for keyword in keywords:
+                    assert scan.count(keyword) == sum(
+                        1 for i in range(len(text)) if text.startswith(keyword, i)
+                    )
+
+    def test_first_and_hits(self):
+        scan = KeywordMatcher(CATEGORIES).scan("the budget api")
+
+        assert scan.first('cost') == 'budget'
+        assert scan.hits('it') == 1
+        assert scan.first('time') is None
+        assert scan.category_counts() == {'cost': 1, 'it': 1}
+
+    def test_empty_text(self):
+        scan = KeywordMatcher(CATEGORIES).scan("")
+        assert scan.offsets == {}
+
+
+class TestRegistry:
+    """Test the shared matcher used by layers 4-7."""
+
+    def test_layer_vocabularies_registered(self):
+        # The layers register their vocabularies on import
+        importlib.import_module('src.scrapers.layer4_business_intelligence')
+        importlib.import_module('src.scrapers.layer5_community_data')
+
+        categories = get_keyword_matcher().categories
+        assert 'layer4.business_functions.sales' in categories
+        assert 'layer5.sentiment.positive' in categories
+
+        scan = scan_text("a great tool for sales")
+        assert scan.hits('layer5.sentiment.positive') == 1
+        assert scan.first('layer4.business_functions.sales') == 'sales'
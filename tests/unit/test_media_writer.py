@@ -0,0 +1,158 @@
+"""
+Unit tests for the append-only media tables and MediaWriter.
+
+Tests cover:
+- Rows buffered until the workflow batch ends
+- Legacy-shaped aggregates from the summary views
+- WAL mode and single transaction per flush
+- Legacy columns appended once per batch, including for single-item stores
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from src.database.media_writer import MediaWriter
+from src.database.multimodal_schema import create_multimodal_tables, get_workflow_media
+from src.scrapers.multimodal_processor import MultimodalProcessor
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "media.db"
+
+
+def create_legacy_table(db_path, rows=()):
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE workflows (workflow_id TEXT UNIQUE, image_urls TEXT, ocr_text TEXT, "
+        "video_urls TEXT, video_transcripts TEXT, scrape_date TIMESTAMP, layer3_success BOOLEAN)"
+    )
+    conn.executemany("INSERT INTO workflows (workflow_id, image_urls, ocr_text) VALUES (?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+
+def legacy_media(db_path, workflow_id):
+    conn = sqlite3.connect(db_path)
+    row = conn.execute(
+        "SELECT image_urls, ocr_text, video_urls, video_transcripts FROM workflows WHERE workflow_id = ?",
+        (workflow_id,)
+    ).fetchone()
+    conn.close()
+    return json.loads(row[0] or '[]'), row[1], json.loads(row[2] or '[]'), json.loads(row[3] or '[]')
+
+
+class TestMediaWriter:
+    """Test buffered writes."""
+
+    def test_rows_buffered_until_flush_every(self, db_path):
+        with MediaWriter(db_path, flush_every=2) as writer:
+            writer.add_image("wf1", "a.png", True, "hello")
+            writer.end_workflow("wf1")
+            assert writer.stats['transactions'] == 0
+
+            writer.add_video("wf2", "https://youtu.be/abc", "abc", True, "transcript")
+            writer.end_workflow("wf2")
+            assert writer.stats == {'images_written': 1, 'videos_written': 1, 'transactions': 1}
+
+    def test_close_flushes_pending_rows(self, db_path):
+        writer = MediaWriter(db_path, flush_every=100)
+        for i in range(50):
+            writer.add_image("wf1", f"{i}.png", True, f"text {i}")
+        writer.close()
+
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT COUNT(*) FROM workflow_images").fetchone()[0] == 50
+        conn.close()
+
+    def test_wal_mode_enabled(self, db_path):
+        create_multimodal_tables(db_path)
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn.close()
+
+
+class TestWorkflowMediaAggregates:
+    """Test read-time aggregation views."""
+
+    def test_aggregates_match_legacy_shape(self, db_path):
+        with MediaWriter(db_path) as writer:
+            writer.add_image("wf1", "a.png", True, "first")
+            writer.add_image("wf1", "b.png", True, "")
+            writer.add_image("wf1", "c.png", True, "second")
+            writer.add_video("wf1", "https://youtu.be/abc", "abc", False, None, "No transcript")
+            writer.end_workflow("wf1")
+
+        media = get_workflow_media(db_path, "wf1")
+
+        assert media['image_urls'] == ["a.png", "b.png", "c.png"]
+        assert media['ocr_text'] == "first\n\nsecond"
+        assert media['video_urls'] == ["https://youtu.be/abc"]
+        entry = media['video_transcripts'][0]
+        assert entry['video_id'] == "abc"
+        assert entry['success'] is False
+        assert entry['error'] == "No transcript"
+
+    def test_unknown_workflow_is_empty(self, db_path):
+        create_multimodal_tables(db_path)
+        media = get_workflow_media(db_path, "missing")
+        assert media['image_urls'] == [] and media['video_transcripts'] == []
+
+    def test_legacy_workflows_columns_refreshed(self, db_path):
+        create_legacy_table(db_path)
+
+        with MediaWriter(db_path) as writer:
+            writer.add_image("wf1", "a.png", True, "first")
+            writer.end_workflow("wf1")
+            writer.add_image("wf1", "b.png", True, "second")
+            writer.add_video("wf1", "https://youtu.be/abc", "abc", False, None, "No transcript")
+            writer.end_workflow("wf1")
+
+        image_urls, ocr_text, video_urls, video_transcripts = legacy_media(db_path, "wf1")
+        assert image_urls == ["a.png", "b.png"]
+        assert ocr_text == "first\n\nsecond"
+        assert video_urls == ["https://youtu.be/abc"]
+        assert video_transcripts == get_workflow_media(db_path, "wf1")['video_transcripts']
+
+    def test_legacy_columns_appended_not_rebuilt(self, db_path):
+        # Media stored before the append-only tables existed lives only in the legacy columns
+        create_legacy_table(db_path, [("wf1", '["old.png"]', "old"), ("wf2", "not json", None)])
+
+        with MediaWriter(db_path) as writer:
+            writer.add_image("wf1", "a.png", True, "first")
+            writer.add_image("wf2", "b.png", True, "")
+            writer.end_workflow("wf1")
+
+        assert legacy_media(db_path, "wf1")[:2] == (["old.png", "a.png"], "old\n\nfirst")
+        assert legacy_media(db_path, "wf2")[:2] == (["b.png"], "")
+
+
+class TestProcessorMediaBatches:
+    """Test MultimodalProcessor routes every store through a batch."""
+
+    def test_single_item_store_is_a_batch(self, db_path):
+        create_legacy_table(db_path)
+        processor = MultimodalProcessor(db_path=str(db_path))
+
+        processor.store_image_data("wf1", "a.png", True, "first")
+        processor.store_video_data("wf1", "https://youtu.be/abc", "abc", True, "transcript")
+
+        assert processor.media_writer.stats['transactions'] == 2
+        image_urls, ocr_text, video_urls, _ = legacy_media(db_path, "wf1")
+        assert (image_urls, ocr_text, video_urls) == (["a.png"], "first", ["https://youtu.be/abc"])
+        processor.media_writer.close()
+
+    def test_stores_inside_batch_commit_once(self, db_path):
+        create_legacy_table(db_path)
+        processor = MultimodalProcessor(db_path=str(db_path))
+
+        with processor.media_batch("wf1"):
+            for i in range(5):
+                processor.store_image_data("wf1", f"{i}.png", True, f"text {i}")
+            assert processor.media_writer.stats['transactions'] == 0
+
+        assert processor.media_writer.stats['transactions'] == 1
+        assert legacy_media(db_path, "wf1")[0] == [f"{i}.png" for i in range(5)]
+        processor.media_writer.close()
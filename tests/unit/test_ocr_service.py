@@ -0,0 +1,126 @@
+"""
+Unit tests for OCRService.
+
+Tests cover:
+- Results and timing breakdown
+- "No Text Found" handling and error reporting
+- Bounded queue backpressure
+- Event loop stays responsive during OCR
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import pytest
+from PIL import Image
+from unittest.mock import AsyncMock, patch
+
+from src.scrapers.ocr_service import OCRService, NO_TEXT_FOUND
+
+
+def _png_bytes() -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (20, 10), "white").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def executor():
+    pool = ThreadPoolExecutor(max_workers=2)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+class TestOCRServiceResults:
+    """Test OCR results."""
+
+    @pytest.mark.asyncio
+    async def test_ocr_returns_text_and_timings(self, executor):
+        with patch('src.scrapers.ocr_service.pytesseract.image_to_string', return_value="  Hello n8n  "):
+            async with OCRService(max_workers=2, executor=executor, preprocess=False) as service:
+                service._download = AsyncMock(return_value=_png_bytes())
+                result = await service.ocr("https://example.com/a.png")
+
+        assert result.success is True
+        assert result.text == "Hello n8n"
+        assert result.ocr_time >= 0 and result.queue_wait >= 0
+        assert service.stats['jobs'] == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_text_reports_no_text_found(self, executor):
+        with patch('src.scrapers.ocr_service.pytesseract.image_to_string', return_value=""):
+            async with OCRService(max_workers=1, executor=executor, preprocess=False) as service:
+                service._download = AsyncMock(return_value=_png_bytes())
+                result = await service.ocr("https://example.com/a.png")
+
+        assert result.as_tuple() == (True, NO_TEXT_FOUND, None)
+
+    @pytest.mark.asyncio
+    async def test_download_failure(self, executor):
+        async with OCRService(max_workers=1, executor=executor, preprocess=False) as service:
+            service._download = AsyncMock(side_effect=RuntimeError("404"))
+            result = await service.ocr("https://example.com/missing.png")
+
+        assert result.success is False
+        assert "OCR error" in result.error
+
+    @pytest.mark.asyncio
+    async def test_invalid_image_bytes(self, executor):
+        async with OCRService(max_workers=1, executor=executor, preprocess=False) as service:
+            result = await (await service.submit_bytes(b"not an image", "broken"))
+
+        assert result.success is False
+        assert result.error.startswith("OCR error")
+
+
+class TestOCRServiceBackpressure:
+    """Test queueing behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_submit_blocks_when_queue_full(self, executor):
+        release = threading.Event()
+
+        def slow_ocr(image):
+            release.wait(timeout=5)
+            return "text"
+
+        with patch('src.scrapers.ocr_service.pytesseract.image_to_string', side_effect=slow_ocr):
+            async with OCRService(max_workers=1, queue_size=1, executor=executor, preprocess=False) as service:
+                first = await service.submit_bytes(_png_bytes(), "1")
+                await asyncio.sleep(0.05)  # dispatcher picks up job 1
+                second = await service.submit_bytes(_png_bytes(), "2")  # fills queue
+
+                third = asyncio.create_task(service.submit_bytes(_png_bytes(), "3"))
+                await asyncio.sleep(0.05)
+                assert not third.done()
+
+                release.set()
+                results = await asyncio.gather(first, second, await third)
+
+        assert [r.text for r in results] == ["text"] * 3
+        assert results[2].queue_wait > 0
+
+    @pytest.mark.asyncio
+    async def test_event_loop_not_blocked(self, executor):
+        def slow_ocr(image):
+            time.sleep(0.2)
+            return "text"
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        with patch('src.scrapers.ocr_service.pytesseract.image_to_string', side_effect=slow_ocr):
+            async with OCRService(max_workers=1, executor=executor, preprocess=False) as service:
+                task = asyncio.create_task(ticker())
+                await (await service.submit_bytes(_png_bytes(), "1"))
+                task.cancel()
+
+        assert ticks >= 5
@@ -0,0 +1,151 @@
+"""
+Unit tests for keyset pagination.
+
+Tests cover:
+- Cursors round-trip sort key values, including timestamps
+- Cursors are rejected for another sort or order, or when malformed
+- fetch_page walks every sort both ways, visiting every row once (ties and
+  NULLs included), and pages back from any cursor
+- The committed migration matches the sort keys
+"""
+
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.storage.pagination import SORT_KEYS, decode_cursor, encode_cursor, fetch_page, keyset_index_ddl
+
+# workflow_id, quality_score, processing_time, extracted_at, layer successes
+WORKFLOWS = [
+    ('1', 90.0, 12.5, '2025-10-01 09:00:00', (1, 1, 1)),
+    ('2', 50.0, None, '2025-10-02 09:00:00', (1, 0, 0)),
+    ('10', 50.0, 12.5, None, (0, 0, 0)),
+    ('100', None, 3.0, '2025-10-02 09:00:00', (1, 1, 1)),
+    ('25', 50.0, None, '2025-10-03 09:00:00', (0, 0, 0)),
+    ('7', 70.0, 8.0, None, (0, 1, 0)),
+    ('abc', None, 3.0, '2025-10-01 09:00:00', (1, 1, 0)),
+]
+
+# Expected listing order per sort: None sorts below any value, workflow_id breaks ties
+EXPECTED_KEYS = {
+    'workflow_id': lambda row: len(row['workflow_id']),
+    'url': lambda row: row['url'],
+    'quality_score': lambda row: -1 if row['quality_score'] is None else row['quality_score'],
+    'processing_time': lambda row: -1 if row['processing_time'] is None else row['processing_time'],
+    'created_at': lambda row: row['created_at'],
+    'extracted_at': lambda row: row['extracted_at'] or '0001-01-01',
+    'last_scraped_at': lambda row: row['last_scraped_at'] or '0001-01-01',
+    'scraping_status': lambda row: (
+        4 if all(row['layers']) else 3 if any(row['layers']) else 2 if row['last_scraped_at'] else 1
+    ),
+}
+
+
+def rows():
+    return [
+        {
+            'workflow_id': workflow_id,
+            'url': f'https://n8n.io/workflows/{workflow_id}',
+            'quality_score': quality,
+            'processing_time': processing_time,
+            'created_at': '2025-09-01 00:00:00',
+            'extracted_at': extracted_at,
+            'last_scraped_at': extracted_at,
+            'layers': layers,
+        }
+        for workflow_id, quality, processing_time, extracted_at, layers in WORKFLOWS
+    ]
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(':memory:')
+    connection.execute(
+        "CREATE TABLE workflows (workflow_id TEXT PRIMARY KEY, url TEXT, quality_score REAL, "
+        "processing_time REAL, created_at TIMESTAMP, extracted_at TIMESTAMP, last_scraped_at TIMESTAMP, "
+        "layer1_success BOOLEAN, layer2_success BOOLEAN, layer3_success BOOLEAN)"
+    )
+    connection.executemany(
+        "INSERT INTO workflows VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (row['workflow_id'], row['url'], row['quality_score'], row['processing_time'], row['created_at'],
+             row['extracted_at'], row['last_scraped_at'], *row['layers'])
+            for row in rows()
+        ]
+    )
+    yield connection
+    connection.close()
+
+
+def walk(connection, sort, order, limit, **filters):
+    """Page forward through a listing, returning the page contents and the pages' cursors."""
+    pages, cursors, cursor = [], [], None
+    while True:
+        page = fetch_page(connection, "workflow_id", sort=sort, order=order, limit=limit, cursor=cursor, **filters)
+        pages.append([row['workflow_id'] for row in page.rows])
+        cursors.append(page.prev_cursor)
+        if page.next_cursor is None:
+            return pages, cursors
+        cursor = page.next_cursor
+
+
+class TestCursors:
+    """Test cursor encoding."""
+
+    def test_round_trip(self):
+        extracted_at = datetime(2025, 10, 11, 9, 30, 15, 250000)
+        cursor = encode_cursor('extracted_at', 'desc', extracted_at, '2462')
+
+        assert decode_cursor(cursor, 'extracted_at', 'DESC') == (extracted_at, '2462')
+        assert decode_cursor(encode_cursor('quality_score', 'ASC', 87.5, '7'), 'quality_score', 'asc') == (87.5, '7')
+
+    def test_rejects_foreign_or_malformed(self, connection):
+        cursor = encode_cursor('quality_score', 'DESC', 87.5, '7')
+
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, 'quality_score', 'ASC')
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, 'url', 'DESC')
+        for garbage in ('not-a-cursor', '', 'W10', cursor[:-3]):
+            with pytest.raises(ValueError):
+                decode_cursor(garbage, 'quality_score', 'DESC')
+        with pytest.raises(ValueError):
+            fetch_page(connection, "workflow_id", sort='url', order='DESC', cursor=cursor)
+
+
+class TestFetchPage:
+    """Test walking listings with fetch_page."""
+
+    @pytest.mark.parametrize('sort', list(SORT_KEYS))
+    @pytest.mark.parametrize('order', ['ASC', 'DESC'])
+    def test_walks_every_sort(self, connection, sort, order):
+        key = EXPECTED_KEYS[sort]
+        expected = [
+            row['workflow_id']
+            for row in sorted(rows(), key=lambda row: (key(row), row['workflow_id']), reverse=order == 'DESC')
+        ]
+
+        pages, prev_cursors = walk(connection, sort, order, limit=3)
+
+        assert pages == [expected[:3], expected[3:6], expected[6:]]
+        assert prev_cursors[0] is None
+        # Going back from a page returns the page before it
+        for before, cursor in zip(pages, prev_cursors[1:]):
+            page = fetch_page(connection, "workflow_id", sort=sort, order=order, limit=3, cursor=cursor, backwards=True)
+            assert [row['workflow_id'] for row in page.rows] == before
+
+    def test_workflow_id_sorts_numerically(self, connection):
+        pages, _ = walk(connection, 'workflow_id', 'ASC', limit=4)
+
+        assert pages == [['1', '2', '7', '10'], ['25', '100', 'abc']]
+
+    def test_filter_and_fallback_sort(self, connection):
+        pages, _ = walk(connection, 'no_such_sort', 'ASC', limit=2, where="quality_score >= ?", params=(60,))
+
+        assert pages == [['7', '1']]
+
+    def test_migration_is_generated(self):
+        migration = Path(__file__).parents[2] / 'migrations' / 'workflow_keyset_indexes.sql'
+        assert migration.read_text() == keyset_index_ddl()
@@ -0,0 +1,91 @@
+"""
+Unit tests for the precompiled regex registry.
+
+Tests cover:
+- Named registration and lookup
+- YouTube ID helpers match the per-pattern loops they replaced
+- Text corpus accepts compiled patterns
+"""
+
+import importlib
+import random
+import re
+
+from src.scrapers.regex_registry import (
+    NON_VIDEO_URL,
+    YOUTUBE_URL_ID_LOOSE,
+    YOUTUBE_URL_OR_MARKDOWN_ID,
+    get_pattern,
+    register_pattern_groups,
+    registered_patterns,
+    youtube_id,
+    youtube_ids,
+)
+from src.scrapers.text_corpus import WorkflowTextCorpus
+
+
+TEXT_LINK_PATTERNS = [
+    r'https?://(?:www\.)?youtube\.com/watch\?v=([\w-]{11})',
+    r'https?://(?:www\.)?youtu\.be/([\w-]{11})',
+    r'@\[youtube\]\(([\w-]{11})\)',
+    r'youtube\.com/watch\?v=([\w-]{11})',
+    r'youtu\.be/([\w-]{11})'
+]
+
+
+class TestRegistry:
+    """Test named registration."""
+
+    def test_groups_are_registered_in_order(self):
+        groups = register_pattern_groups('test.counts', {'likes': [r'(\d+)\s*like', r'like[s]?\s*(\d+)']}, re.IGNORECASE)
+
+        assert [p.pattern for p in groups['likes']] == [r'(\d+)\s*like', r'like[s]?\s*(\d+)']
+        assert get_pattern('test.counts.likes.1') is groups['likes'][1]
+        assert set(registered_patterns('test.counts.')) == {'test.counts.likes.0', 'test.counts.likes.1'}
+        assert groups['likes'][0].findall("12 LIKES") == ['12']
+
+    def test_extractor_patterns_registered_on_import(self):
+        # Layer 4 registers its patterns on import
+        importlib.import_module('src.scrapers.layer4_business_intelligence')
+
+        assert get_pattern('layer4.roi.payback').findall("payback 3 months") == ['3']
+
+
+class TestYouTubeIds:
+    """Test YouTube URL helpers."""
+
+    def test_url_forms(self):
+        assert youtube_id("https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=10") == 'dQw4w9WgXcQ'
+        assert youtube_id("https://youtu.be/dQw4w9WgXcQ?si=abc") == 'dQw4w9WgXcQ'
+        assert youtube_id("https://www.youtube.com/embed/dQw4w9WgXcQ") == 'dQw4w9WgXcQ'
+        assert youtube_id("https://youtu.be/short") is None
+        assert youtube_id("https://youtu.be/short", YOUTUBE_URL_ID_LOOSE) == 'short'
+        assert youtube_id("@[youtube](dQw4w9WgXcQ)", YOUTUBE_URL_OR_MARKDOWN_ID) == 'dQw4w9WgXcQ'
+
+    def test_text_links_match_sequential_patterns(self):
+        rng = random.Random(3)
+        pieces = [
+            "see ", "https://www.youtube.com/watch?v=", "youtu.be/", "@[youtube](", ")",
+            "dQw4w9WgXcQ", "9bZkp7q19f0", "abc", " and ", "http://youtu.be/"
+        ]
+        for _ in range(300):
+            text = "".join(rng.choice(pieces) for _ in range(12))
+            expected = {match for pattern in TEXT_LINK_PATTERNS for match in re.findall(pattern, text)}
+            assert set(youtube_ids(text)) == expected
+
+    def test_non_video_urls(self):
+        assert NON_VIDEO_URL.search("https://www.youtube.com/@n8n-io")
+        assert NON_VIDEO_URL.search("https://www.youtube.com/playlist?list=PL1")
+        assert NON_VIDEO_URL.search("/watch?v=dQw4w9WgXcQ")
+        assert not NON_VIDEO_URL.search("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+
+
+class TestCorpusPatterns:
+    """Test the text corpus with compiled patterns."""
+
+    def test_compiled_and_string_patterns_agree(self):
+        corpus = WorkflowTextCorpus({'layers': {'layer1': {'success': True, 'data': {'description': 'Saves 5 hours'}}}})
+        text = corpus.text('description')
+        compiled = re.compile(r'saves?\s+(\d+)', re.IGNORECASE)
+
+        assert corpus.findall(compiled, text) == corpus.findall(r'saves?\s+(\d+)', text, re.IGNORECASE) == ['5']
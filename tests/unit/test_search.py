@@ -0,0 +1,95 @@
+"""
+Unit tests for workflow full-text search.
+
+Tests cover:
+- Every word matches as a prefix; title hits outrank explainer hits
+- search_fields restricts the columns matched; fields sharing a weight go together
+- Snippets are HTML-escaped with matches marked
+- index_workflows picks up changed and deleted workflows
+- The Postgres ILIKE fallback escapes wildcards in the term
+- The committed migration matches the search definitions
+"""
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from src.storage.search import _like_pattern, count_matches, index_workflows, search_ddl, search_workflows
+
+WORKFLOWS = [
+    # workflow_id, title, description, explainer, transcript
+    ('1', 'Slack alerts for GitHub issues', 'Post new issues to a channel', None, None),
+    ('2', 'Daily report', 'Summarise sales', 'Sends a Slack message every morning', None),
+    ('3', 'Invoice parser', 'Extract totals from <b>PDF</b> invoices', None, 'we parse the invoices here'),
+]
+
+
+@pytest.fixture
+def session():
+    engine = create_engine('sqlite://')
+    with Session(engine) as session:
+        for statement in (
+            "CREATE TABLE workflows (workflow_id TEXT PRIMARY KEY)",
+            "CREATE TABLE workflow_metadata (workflow_id TEXT, title TEXT, description TEXT, use_case TEXT)",
+            "CREATE TABLE workflow_content (workflow_id TEXT, explainer_text TEXT)",
+            "CREATE TABLE video_transcripts (workflow_id TEXT, transcript_text TEXT)",
+        ):
+            session.execute(text(statement))
+        for workflow_id, title, description, explainer, transcript in WORKFLOWS:
+            params = {'id': workflow_id, 'title': title, 'description': description,
+                      'explainer': explainer, 'transcript': transcript}
+            session.execute(text("INSERT INTO workflows VALUES (:id)"), params)
+            session.execute(text("INSERT INTO workflow_metadata VALUES (:id, :title, :description, NULL)"), params)
+            session.execute(text("INSERT INTO workflow_content VALUES (:id, :explainer)"), params)
+            if transcript:
+                session.execute(text("INSERT INTO video_transcripts VALUES (:id, :transcript)"), params)
+        yield session
+
+
+class TestWorkflowSearch:
+    """Test ranked search on the SQLite FTS5 index."""
+
+    def test_prefix_match_and_ranking(self, session):
+        hits = search_workflows(session, 'slac')
+
+        assert [hit.workflow_id for hit in hits] == ['1', '2']
+        assert hits[0].rank > hits[1].rank
+        assert count_matches(session, 'slac') == 2
+        assert [hit.workflow_id for hit in search_workflows(session, 'slack github')] == ['1']
+        assert search_workflows(session, '  "" ') == []
+
+    def test_search_fields(self, session):
+        assert [hit.workflow_id for hit in search_workflows(session, 'slack', search_fields=['title'])] == ['1']
+        assert [hit.workflow_id for hit in search_workflows(session, 'extract', search_fields=['description'])] == ['3']
+        assert count_matches(session, 'extract', search_fields=['use_case']) == 0
+        assert [hit.workflow_id for hit in search_workflows(session, 'invoices', search_fields=['explainer', 'transcripts'])] == ['3']
+        assert count_matches(session, 'extract', search_fields=['title']) == 0
+        with pytest.raises(ValueError):
+            search_workflows(session, 'invoices', search_fields=['transcripts'])
+
+    def test_snippet_escaped_and_marked(self, session):
+        hit = search_workflows(session, 'pdf')[0]
+
+        assert hit.title == 'Invoice parser'
+        assert '<mark>PDF</mark>' in hit.snippet
+        assert '&lt;b&gt;' in hit.snippet
+        assert '<b>' not in hit.snippet
+
+    def test_index_workflows(self, session):
+        assert search_workflows(session, 'payroll') == []
+
+        session.execute(text("UPDATE workflow_metadata SET title = 'Payroll sync' WHERE workflow_id = '2'"))
+        session.execute(text("DELETE FROM workflows WHERE workflow_id = '1'"))
+        index_workflows(session, ['1', '2'])
+
+        assert [hit.workflow_id for hit in search_workflows(session, 'payroll')] == ['2']
+        assert search_workflows(session, 'github') == []
+
+    def test_fallback_pattern_escapes_wildcards(self):
+        assert _like_pattern(' 100%_off\\n ') == '%100\\%\\_off\\\\n%'
+
+    def test_migration_is_generated(self):
+        migration = Path(__file__).parents[2] / 'migrations' / 'workflow_search.sql'
+        assert migration.read_text() == search_ddl()
@@ -0,0 +1,137 @@
+"""
+Unit tests for the extraction snapshot lifecycle.
+
+Tests cover:
+- Missing snapshots are found with one anti-join
+- Retention keeps the newest snapshots plus periodic checkpoints
+- Compacted snapshots are readable from their archive; their blobs can be pruned
+- Compaction walks workflow/layer pairs in batches, resuming after the last one
+- The lifecycle is reported missing until the archive table exists
+- The committed migration matches the lifecycle definitions
+"""
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from src.storage.blob_store import blob_stats, prune_blobs, save_snapshot
+from src.storage.snapshot_lifecycle import (
+    archived_snapshots,
+    compact_snapshots,
+    lifecycle_ddl,
+    lifecycle_installed,
+    missing_snapshots,
+)
+
+# (created_at, payload version) for workflow 1, layer L2V2, oldest first
+HISTORY = [
+    ('2025-06-03 10:00:00', 1),
+    ('2025-07-01 10:00:00', 2),
+    ('2025-07-20 10:00:00', 3),
+    ('2025-08-05 10:00:00', 4),
+    ('2025-08-06 10:00:00', 5),
+    ('2025-08-07 10:00:00', 5),
+    ('2025-09-01 10:00:00', 6),
+    ('2025-09-02 10:00:00', 7),
+]
+
+
+def payload(version):
+    return {'node_contexts': [{'node_name': 'Webhook', 'version': version}]}
+
+
+@pytest.fixture
+def session():
+    engine = create_engine('sqlite://')
+    with Session(engine) as session:
+        for statement in (
+            "CREATE TABLE workflows (workflow_id TEXT PRIMARY KEY)",
+            "CREATE TABLE payload_blobs (sha256 CHAR(64) PRIMARY KEY, raw_size INTEGER NOT NULL, "
+            "data BLOB NOT NULL, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)",
+            "CREATE TABLE workflow_extraction_snapshots (id INTEGER PRIMARY KEY, workflow_id TEXT, "
+            "layer TEXT NOT NULL, payload TEXT, payload_sha256 CHAR(64), created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)",
+            "CREATE TABLE workflow_snapshot_archives (id INTEGER PRIMARY KEY, workflow_id TEXT NOT NULL, "
+            "layer TEXT NOT NULL, first_created_at TIMESTAMP NOT NULL, last_created_at TIMESTAMP NOT NULL, "
+            "snapshot_count INTEGER NOT NULL, archive_sha256 CHAR(64) NOT NULL, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)",
+        ):
+            session.execute(text(statement))
+        session.execute(text("INSERT INTO workflows VALUES ('1'), ('2'), ('3')"))
+        for created_at, version in HISTORY:
+            save_snapshot(session, '1', 'L2V2', payload(version))
+            session.execute(
+                text("UPDATE workflow_extraction_snapshots SET created_at = :created_at WHERE id = (SELECT MAX(id) FROM workflow_extraction_snapshots)"),
+                {'created_at': created_at}
+            )
+        save_snapshot(session, '2', 'L3V3', {'standalone_docs': []})
+        yield session
+
+
+def live_ids(session):
+    return session.execute(text(
+        "SELECT id FROM workflow_extraction_snapshots WHERE workflow_id = '1' ORDER BY id"
+    )).scalars().all()
+
+
+class TestSnapshotLifecycle:
+    """Test existence checks, retention and compaction."""
+
+    def test_missing_snapshots(self, session):
+        assert missing_snapshots(session, ['1', '2', '3', 'unknown'], 'L2V2') == ['2', '3']
+        assert missing_snapshots(session, ['1', '2', '3'], 'L3V3') == ['1', '3']
+        assert missing_snapshots(session, [], 'L2V2') == []
+
+    def test_retention_and_archive(self, session):
+        stats = compact_snapshots(session, keep_latest=2, checkpoint_period='month', keep_checkpoints=3)
+
+        # Newest two (8, 7) plus the newest of the last three months (6 in Aug, 3 in Jul)
+        assert live_ids(session) == [3, 6, 7, 8]
+        assert stats == {'archives': 1, 'snapshots': 4, 'last_group': None}
+        archived = archived_snapshots(session, '1', 'L2V2')
+        assert [snapshot['id'] for snapshot in archived] == [1, 2, 4, 5]
+        assert [snapshot['payload'] for snapshot in archived] == [payload(v) for v in (1, 2, 4, 5)]
+        assert archived_snapshots(session, '2') == []
+
+        # Compaction is idempotent; versions 1, 2 and 4 now live only in the archive
+        assert compact_snapshots(session, keep_latest=2, checkpoint_period='month', keep_checkpoints=3)['snapshots'] == 0
+        blobs = blob_stats(session)['blobs']
+        assert prune_blobs(session) == 3
+        assert blob_stats(session)['blobs'] == blobs - 3
+        assert [snapshot['payload'] for snapshot in archived_snapshots(session, '1')] == [payload(v) for v in (1, 2, 4, 5)]
+
+    def test_keeps_latest_without_checkpoints(self, session):
+        compact_snapshots(session, keep_latest=1, checkpoint_period='week', keep_checkpoints=0)
+
+        assert live_ids(session) == [8]
+        assert len(archived_snapshots(session, '1')) == 7
+        with pytest.raises(ValueError):
+            compact_snapshots(session, checkpoint_period='year')
+
+    def test_batches_resume_after_last_group(self, session):
+        for workflow_id in ('2', '3'):
+            for version in range(3):
+                save_snapshot(session, workflow_id, 'L2V2', payload(version))
+
+        batches, after = [], None
+        while True:
+            stats = compact_snapshots(session, keep_latest=1, checkpoint_period='day', keep_checkpoints=0,
+                                      max_groups=1, after=after)
+            batches.append((stats['archives'], stats['snapshots']))
+            after = stats['last_group']
+            if after is None:
+                break
+
+        # ('2', 'L3V3') has a single snapshot, so it is never a candidate
+        assert batches == [(1, 7), (1, 2), (1, 2), (0, 0)]
+        assert [len(archived_snapshots(session, workflow_id)) for workflow_id in ('1', '2', '3')] == [7, 2, 2]
+        assert len(archived_snapshots(session, '2', 'L3V3')) == 0
+
+    def test_lifecycle_installed(self, session):
+        assert lifecycle_installed(session)
+        session.execute(text("DROP TABLE workflow_snapshot_archives"))
+        assert not lifecycle_installed(session)
+
+    def test_migration_is_generated(self):
+        migration = Path(__file__).parents[2] / 'migrations' / 'snapshot_partitions.sql'
+        assert migration.read_text() == lifecycle_ddl()
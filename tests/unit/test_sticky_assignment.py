@@ -0,0 +1,158 @@
+"""
+Unit tests for global node-to-sticky assignment.
+
+Tests cover:
+- Confidence matrix equals the unified extractor's pairwise scoring
+- Sorted assignment equals greedy over the explicitly sorted pairs
+- Assignment does not depend on node order
+- Section-header stickies, capacities and thresholds
+- Optimal assignment maximizes total confidence (needs scipy)
+"""
+
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from src.scrapers.sticky_assignment import assign_stickies, confidence_matrix, section_header_capacities
+from src.scrapers.unified_workflow_extractor import UnifiedWorkflowExtractor
+from tests.unit.test_sticky_index import _random_canvas
+
+
+def _sorted_pairs_reference(matrix, threshold, capacities):
+    remaining = [float('inf') if capacity is None else capacity for capacity in capacities]
+    assigned = {}
+    pairs = sorted(
+        (-matrix[node, sticky], node, sticky)
+        for node in range(matrix.shape[0]) for sticky in range(matrix.shape[1])
+        if matrix[node, sticky] > threshold
+    )
+    for _, node, sticky in pairs:
+        if node not in assigned and remaining[sticky] > 0:
+            assigned[node] = sticky
+            remaining[sticky] -= 1
+    return sorted(assigned.items())
+
+
+def _random_matrix(rng, nodes, stickies):
+    values = [0.0, 0.1, 0.3, 0.5, 0.9]
+    return np.array([[rng.choice(values + [rng.random()]) for _ in range(stickies)] for _ in range(nodes)]).reshape(nodes, stickies)
+
+
+class TestConfidenceMatrix:
+    """Test vectorized scoring."""
+
+    def test_equals_pairwise_scoring(self):
+        extractor = UnifiedWorkflowExtractor()
+        rng = random.Random(4)
+        for _ in range(30):
+            nodes, stickies = _random_canvas(rng, rng.randint(0, 20), rng.randint(0, 12))
+            expected = np.array([
+                [
+                    max(extractor._calculate_proximity_confidence(node, sticky), extractor._calculate_name_confidence(node, sticky))
+                    for sticky in stickies
+                ]
+                for node in nodes
+            ]).reshape(len(nodes), len(stickies))
+
+            assert np.array_equal(confidence_matrix(nodes, stickies), expected)
+
+
+class TestSortedAssignment:
+    """Test greedy on the sorted matrix."""
+
+    def test_matches_reference(self):
+        rng = random.Random(8)
+        for _ in range(200):
+            matrix = _random_matrix(rng, rng.randint(0, 25), rng.randint(1, 8))
+            capacities = [rng.choice([0, 1, 1, 2, None]) for _ in range(matrix.shape[1])]
+
+            pairs = assign_stickies(matrix, threshold=0.1, capacities=capacities)
+
+            assert [(node, sticky) for node, sticky, _ in pairs] == _sorted_pairs_reference(matrix, 0.1, capacities)
+            assert all(confidence == matrix[node, sticky] > 0.1 for node, sticky, confidence in pairs)
+
+    def test_node_order_independent(self):
+        rng = random.Random(12)
+        # Distinct confidences: ties are broken by node order
+        matrix = np.array([[rng.random() for _ in range(15)] for _ in range(40)])
+        permutation = list(range(40))
+        rng.shuffle(permutation)
+
+        pairs = {(node, sticky) for node, sticky, _ in assign_stickies(matrix)}
+        shuffled = assign_stickies(matrix[permutation])
+
+        assert {(permutation[node], sticky) for node, sticky, _ in shuffled} == pairs
+
+    def test_invalid_input(self):
+        with pytest.raises(ValueError):
+            assign_stickies(np.ones((2, 2)), method='random')
+        with pytest.raises(ValueError):
+            assign_stickies(np.ones((2, 2)), capacities=[1])
+        assert assign_stickies(np.zeros((0, 3))) == []
+
+
+class TestSectionHeaders:
+    """Test many-to-one section-header stickies."""
+
+    def test_header_covers_nodes(self):
+        nodes = [
+            {'id': str(i), 'name': f"Step {i}", 'type': 'n8n-nodes-base.set', 'position': {'x': 100 + i * 200, 'y': 100}}
+            for i in range(3)
+        ]
+        stickies = [
+            {'name': 'Section', 'content': 'Enrich leads', 'position': {'x': 0, 'y': 0, 'width': 800, 'height': 300}},
+            {'name': 'Tip', 'content': 'Use a test sheet', 'position': {'x': 2000, 'y': 2000, 'width': 200, 'height': 100}},
+        ]
+
+        capacities = section_header_capacities(nodes, stickies)
+        pairs = assign_stickies(confidence_matrix(nodes, stickies), capacities=capacities)
+
+        assert capacities == [None, 1]
+        assert [sticky for _, sticky, _ in pairs] == [0, 0, 0]
+
+    def test_extractor_global_mode(self):
+        nodes = [
+            {'id': '1', 'name': 'Fetch', 'type': 'n8n-nodes-base.httpRequest', 'position': {'x': 0, 'y': 0}},
+            {'id': '2', 'name': 'Notify', 'type': 'n8n-nodes-base.slack', 'position': {'x': 250, 'y': 0}},
+        ]
+        # Greedy gives Fetch the sticky right next to Notify, leaving Notify nothing
+        stickies = [
+            {'name': 'Alert', 'content': 'Posts to #ops', 'position': {'x': 260, 'y': 0, 'width': 0, 'height': 0}},
+            {'name': 'Notes', 'content': 'fetch the API', 'position': {'x': 5000, 'y': 0, 'width': 0, 'height': 0}},
+        ]
+
+        greedy, _ = UnifiedWorkflowExtractor()._match_nodes_with_stickies(nodes, stickies)
+        extractor = UnifiedWorkflowExtractor(sticky_assignment='sorted')
+        assigned, standalone = extractor._match_nodes_with_stickies(nodes, stickies)
+
+        assert [(c['node_name'], c['sticky_title']) for c in greedy] == [('Fetch', 'Alert')]
+        assert [(c['node_name'], c['sticky_title']) for c in assigned] == [('Fetch', 'Notes'), ('Notify', 'Alert')]
+        assert standalone == []
+        with pytest.raises(ValueError):
+            UnifiedWorkflowExtractor(sticky_assignment='random')
+
+
+class TestOptimalAssignment:
+    """Test Hungarian assignment against exhaustive search."""
+
+    def test_maximizes_total_confidence(self):
+        pytest.importorskip('scipy')
+        rng = random.Random(6)
+        for _ in range(100):
+            matrix = _random_matrix(rng, rng.randint(1, 5), rng.randint(1, 4))
+            capacities = [rng.choice([1, 2, None]) for _ in range(matrix.shape[1])]
+
+            best = 0.0
+            for choice in itertools.product(range(-1, matrix.shape[1]), repeat=matrix.shape[0]):
+                used = [choice.count(sticky) for sticky in range(matrix.shape[1])]
+                if any(capacity is not None and count > capacity for count, capacity in zip(used, capacities)):
+                    continue
+                if any(sticky >= 0 and matrix[node, sticky] <= 0.1 for node, sticky in enumerate(choice)):
+                    continue
+                best = max(best, sum(matrix[node, sticky] for node, sticky in enumerate(choice) if sticky >= 0))
+
+            pairs = assign_stickies(matrix, capacities=capacities, method='optimal')
+
+            assert sum(confidence for _, _, confidence in pairs) == pytest.approx(best)
@@ -0,0 +1,127 @@
+"""
+Unit tests for the sticky note index and indexed node-to-sticky matching.
+
+Tests cover:
+- Grid, containment and shared-word candidate lookups
+- Unified extractor matching equals the pairwise loop
+- Layer 2 Enhanced V2 matching equals the pairwise loop
+"""
+
+import asyncio
+import random
+
+from src.scrapers.layer2_enhanced_v2 import NodeContextExtractor
+from src.scrapers.sticky_index import StickyIndex
+from src.scrapers.unified_workflow_extractor import UnifiedWorkflowExtractor
+
+WORDS = ['http', 'request', 'slack', 'notify', 'sheet', 'merge', 'set', 'code', 'email', 'send']
+
+
+def _random_canvas(rng, nodes, stickies):
+    node_list = [
+        {
+            'id': str(i),
+            'name': rng.choice(['', ' '.join(rng.sample(WORDS, rng.randint(1, 2))), f"{rng.choice(WORDS)} {i}"]),
+            'type': 'n8n-nodes-base.set',
+            'position': {'x': rng.choice([0, 100, 1200, rng.uniform(-3000, 3000)]), 'y': rng.uniform(-3000, 3000)}
+        }
+        for i in range(nodes)
+    ]
+    sticky_list = [
+        {
+            'name': rng.choice(['', rng.choice(WORDS), f"Note {i}"]),
+            'content': ' '.join(rng.choice(WORDS) for _ in range(rng.randint(0, 6))),
+            'position': {'x': rng.choice([0, 1200, rng.uniform(-3000, 3000)]), 'y': rng.uniform(-3000, 3000)}
+        }
+        for i in range(stickies)
+    ]
+    return node_list, sticky_list
+
+
+class TestStickyIndex:
+    """Test candidate lookups."""
+
+    def test_lookups(self):
+        stickies = [
+            {'name': 'Setup', 'content': 'Connect Slack', 'position': {'x': 0, 'y': 0}},
+            {'name': 'HTTP', 'content': 'Calls the API', 'position': {'x': 5000, 'y': 0}},
+            {'name': 'Far', 'content': 'nothing here', 'position': {'x': float('nan'), 'y': 0}},
+        ]
+        index = StickyIndex(stickies, cell_size=1200)
+
+        assert index.near(100, 100, 1200) == {0}
+        assert index.near(float('inf'), 0, 1200) == set()
+        assert index.containing('slack') == {0}
+        assert index.containing('the') == {1}
+        assert index.containing('') == {0, 1, 2}
+        assert index.titles_within('http request', 'send') == {1}
+        assert index.sharing_words({'api', 'here'}) == {1, 2}
+        assert index.candidates(0, 0, 1200, needles=['api'], exclude=[True, False, False]) == [1]
+
+
+class TestIndexedMatching:
+    """Test indexed matching against the pairwise loops it replaces."""
+
+    def test_unified_matches_pairwise(self):
+        extractor = UnifiedWorkflowExtractor()
+        rng = random.Random(3)
+        for _ in range(30):
+            nodes, stickies = _random_canvas(rng, rng.randint(0, 25), rng.randint(0, 15))
+
+            expected = []
+            unmatched = stickies.copy()
+            for node in nodes:
+                best, best_confidence, best_index = None, 0.0, -1
+                for i, sticky in enumerate(unmatched):
+                    confidence = max(
+                        extractor._calculate_proximity_confidence(node, sticky),
+                        extractor._calculate_name_confidence(node, sticky)
+                    )
+                    if confidence > best_confidence:
+                        best, best_confidence, best_index = sticky, confidence, i
+                if best and best_confidence > 0.1:
+                    expected.append((node['id'], best['name'], best['content'], best_confidence))
+                    unmatched.pop(best_index)
+
+            contexts, standalone = extractor._match_nodes_with_stickies(nodes, stickies)
+
+            assert [
+                (c['node_id'], c['sticky_title'], c['sticky_content'], c['match_confidence'])
+                for c in contexts
+            ] == expected
+            assert [id(sticky) for sticky in standalone] == [id(sticky) for sticky in unmatched]
+
+    def test_layer2_v2_matches_pairwise(self):
+        extractor = NodeContextExtractor()
+        rng = random.Random(9)
+        for _ in range(30):
+            canvas_nodes, canvas_stickies = _random_canvas(rng, rng.randint(0, 25), rng.randint(0, 15))
+            nodes = [{'node_name': n['name'], 'node_type': n['type'], 'position': n['position']} for n in canvas_nodes]
+            stickies = [{'title': s['name'], 'content': s['content'], 'position': s['position']} for s in canvas_stickies]
+            if rng.random() < 0.5:
+                for item in nodes + stickies:
+                    item['position'] = dict(item['position'], center_x=item['position']['x'] + 40, center_y=item['position']['y'])
+
+            expected = []
+            for node in nodes:
+                best, best_confidence, best_method = None, 0.0, 'none'
+                for below, score, method in [
+                    (None, extractor._calculate_name_match_confidence, 'name_exact'),
+                    (0.7, extractor._calculate_proximity_confidence, 'proximity'),
+                    (0.5, extractor._calculate_fuzzy_match_confidence, 'fuzzy')
+                ]:
+                    if below is not None and best_confidence >= below:
+                        continue
+                    for sticky in stickies:
+                        confidence = score(node, sticky)
+                        if confidence > best_confidence:
+                            best, best_confidence, best_method = sticky, confidence, method
+                if best and best_confidence > 0.3:
+                    expected.append((node['node_name'], best['title'], best['content'], best_confidence, best_method))
+
+            contexts = asyncio.run(extractor._match_nodes_with_stickies(nodes, stickies))
+
+            assert [
+                (c['node_name'], c['sticky_title'], c['sticky_content'], c['match_confidence'], c['extraction_method'])
+                for c in contexts
+            ] == expected
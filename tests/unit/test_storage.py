@@ -9,12 +9,16 @@ Task: SCRAPE-008
 Date: October 11, 2025
 """
 
+import copy
+
 import pytest
 from datetime import datetime
+from sqlalchemy import DateTime, select
 
 from src.storage.database import get_session, init_database, drop_all_tables
 from src.storage.models import Workflow, WorkflowMetadata, WorkflowStructure
-from src.storage.repository import WorkflowRepository
+from src.storage.pagination import SORT_KEYS
+from src.storage.repository import BULK_UPSERT_TABLES, WorkflowRepository
 
 
 @pytest.fixture(scope="function")
@@ -231,7 +235,38 @@ class TestWorkflowRepository:
         high_quality = repo.list_workflows(filters={'min_quality': 70.0})
         
         assert len(high_quality) == 3  # 70, 80, 90
-    
+
+    def test_list_workflows_page(self, clean_database, sample_extraction_result):
+        """Test keyset pages for every sort visit each workflow once, in order."""
+        repo = WorkflowRepository()
+
+        for workflow_id, quality in (('7', 70.0), ('10', 50.0), ('100', 50.0), ('25', 90.0)):
+            result = copy.deepcopy(sample_extraction_result)
+            result['workflow_id'] = workflow_id
+            result['quality'] = {'overall_score': quality}
+            repo.create_workflow(workflow_id, f'https://n8n.io/workflows/{workflow_id}', result)
+
+        for order_by in SORT_KEYS:
+            for order_desc in (True, False):
+                whole, _ = repo.list_workflows_page(limit=10, order_by=order_by, order_desc=order_desc)
+                walked, cursor = [], None
+                while True:
+                    page, cursor = repo.list_workflows_page(
+                        limit=3, order_by=order_by, order_desc=order_desc, cursor=cursor
+                    )
+                    walked += [workflow.workflow_id for workflow in page]
+                    if cursor is None:
+                        break
+                assert walked == [workflow.workflow_id for workflow in whole]
+                assert sorted(walked) == ['10', '100', '25', '7']
+
+        by_id, _ = repo.list_workflows_page(order_by='workflow_id', order_desc=False)
+        assert [workflow.workflow_id for workflow in by_id] == ['7', '10', '25', '100']
+        by_quality, _ = repo.list_workflows_page(order_by='quality_score')
+        assert [workflow.workflow_id for workflow in by_quality] == ['25', '7', '100', '10']
+        with pytest.raises(ValueError):
+            repo.list_workflows_page(order_by='url', cursor='not-a-cursor')
+
     def test_search_workflows(self, clean_database, sample_extraction_result):
         """Test workflow search."""
         repo = WorkflowRepository()
@@ -251,5 +286,70 @@ class TestWorkflowRepository:
         assert len(results) == 2  # Email Automation, Email Notifications
 
 
+
+def _stored_rows():
+    """Rows of every bulk-upserted table, without generated ids and timestamps."""
+    stored = {}
+    with get_session() as session:
+        for model, keys in BULK_UPSERT_TABLES:
+            table = model.__table__
+            columns = [
+                column for column in table.columns
+                if not (column.primary_key and column.name not in keys)
+                and not (isinstance(column.type, DateTime) and (
+                    column.default is not None or column.onupdate is not None or column.server_default is not None
+                ))
+            ]
+            query = select(*columns).order_by(*[table.c[key] for key in keys])
+            stored[table.name] = [dict(row._mapping) for row in session.execute(query)]
+    return stored
+
+
+class TestBulkUpsert:
+    """Tests for WorkflowRepository.bulk_upsert_workflows."""
+    
+    def _passes(self, sample_extraction_result):
+        """Two passes over three workflows; the second changes one of them."""
+        first = []
+        for i in range(3):
+            result = copy.deepcopy(sample_extraction_result)
+            result['workflow_id'] = f'BULK-{i:03d}'
+            result['url'] = f'https://n8n.io/workflows/BULK-{i:03d}'
+            result['layers']['layer1']['title'] = f'Bulk Workflow {i}'
+            result['quality'] = {'overall_score': 80.0 + i}
+            first.append((result['workflow_id'], result['url'], result))
+        
+        second = copy.deepcopy(first)
+        changed = second[1][2]
+        changed['layers']['layer1']['title'] = 'Renamed Workflow'
+        changed['layers']['layer2']['node_count'] = 9
+        changed['quality'] = {'overall_score': 42.0}
+        return first, second
+    
+    def test_bulk_upsert_matches_create_workflow(self, clean_database, sample_extraction_result):
+        """Test bulk upserts store the same rows as create_workflow, inserts and updates alike."""
+        repo = WorkflowRepository()
+        passes = self._passes(sample_extraction_result)
+        
+        for results in passes:
+            for workflow_id, url, result in results:
+                repo.create_workflow(workflow_id, url, result)
+        expected = _stored_rows()
+        
+        drop_all_tables()
+        init_database()
+        for results in passes:
+            stats = repo.bulk_upsert_workflows(results, batch_size=2)
+            assert stats['workflows'] == 3
+            assert stats['batches'] == 2
+        
+        stored = _stored_rows()
+        assert stored == expected
+        assert [row['title'] for row in stored['workflow_metadata']] == [
+            'Bulk Workflow 0', 'Renamed Workflow', 'Bulk Workflow 2'
+        ]
+        assert len(stored['video_transcripts']) == 3
+
+
 if __name__ == "__main__":
     pytest.main([__file__, '-v'])
@@ -0,0 +1,98 @@
+"""
+Unit tests for WorkflowTextCorpus.
+
+Tests cover:
+- Combined text views built once
+- Cached keyword scans and regex results
+- Tokens and sentence boundaries
+- Sharing one corpus across analytics layers
+"""
+
+import pytest
+
+from src.scrapers.text_corpus import WorkflowTextCorpus
+
+
+def _workflow_data():
+    return {
+        'workflow_id': 'wf1',
+        'layers': {
+            'layer1': {'data': {'title': 'Sales Report', 'description': 'Daily KPI dashboard', 'use_case': 'We must reduce cost'}},
+            'layer2': {'data': {'node_count': 4, 'connection_count': 3}},
+            'layer3': {'data': {
+                'explainer_text': 'Great workflow. It saves 5 hours per week!',
+                'setup_instructions': 'Add your API key.',
+                'use_instructions': 'Run it daily'
+            }}
+        }
+    }
+
+
+class TestTextViews:
+    """Test normalized text views."""
+
+    def test_content_and_metadata(self):
+        corpus = WorkflowTextCorpus(_workflow_data())
+
+        assert corpus.content == "great workflow. it saves 5 hours per week! add your api key. run it daily"
+        assert corpus.metadata == "sales report daily kpi dashboard we must reduce cost"
+        assert corpus.raw('use_case') == "We must reduce cost"
+
+    def test_text_built_once(self):
+        corpus = WorkflowTextCorpus(_workflow_data())
+        assert corpus.content is corpus.content
+        assert corpus.text('title', 'use_case', sep="\n") == "sales report\nwe must reduce cost"
+
+    def test_missing_layer_raises_lazily(self):
+        data = _workflow_data()
+        data['layers']['layer3']['data'] = None
+        corpus = WorkflowTextCorpus(data)
+
+        assert corpus.metadata
+        with pytest.raises(AttributeError):
+            corpus.content
+
+
+class TestCachedScans:
+    """Test cached scans and regex results."""
+
+    def test_findall_cached(self):
+        corpus = WorkflowTextCorpus(_workflow_data())
+        first = corpus.findall(r'(\d+)\s+hours', corpus.content)
+        assert first == ['5']
+        assert corpus.findall(r'(\d+)\s+hours', corpus.content) is first
+
+    def test_scan_cached(self):
+        corpus = WorkflowTextCorpus(_workflow_data())
+        assert corpus.scan(corpus.content) is corpus.scan(corpus.content)
+
+    def test_tokens_and_sentences(self):
+        corpus = WorkflowTextCorpus(_workflow_data())
+        text = corpus.content
+
+        assert corpus.tokens(text)[:3] == ['great', 'workflow', 'it']
+        sentences = [text[start:end] for start, end in corpus.sentences(text)]
+        assert sentences == [
+            "great workflow", "it saves 5 hours per week", "add your api key", "run it daily"
+        ]
+
+
+class TestSharedAcrossLayers:
+    """Test one corpus handed to several layers."""
+
+    @pytest.mark.asyncio
+    async def test_layers_accept_shared_corpus(self):
+        from src.scrapers.layer4_business_intelligence import BusinessIntelligenceExtractor
+        from src.scrapers.layer5_community_data import CommunityDataExtractor
+
+        data = _workflow_data()
+        corpus = WorkflowTextCorpus(data)
+
+        layer4 = await BusinessIntelligenceExtractor().extract(data, corpus=corpus)
+        layer5 = await CommunityDataExtractor().extract(data, corpus=corpus)
+
+        assert layer4['success'] and layer5['success']
+        assert layer4['data']['business_function'] == 'Sales'
+        assert layer4['data']['business_requirement'] == "Workflow addresses must in business operations"
+        assert layer5['data']['community_sentiment_score'] == 100.0
+        assert corpus.content in corpus._scans
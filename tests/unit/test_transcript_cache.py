@@ -0,0 +1,157 @@
+"""
+Unit tests for TranscriptCache.
+
+Tests cover:
+- Positive and negative caching with TTLs
+- Transient failures are not cached
+- Single-flight coalescing of concurrent fetches
+- TranscriptExtractor integration
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.scrapers.transcript_cache import TranscriptCache
+from src.scrapers.transcript_extractor import TranscriptExtractor
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Fresh on-disk cache per test."""
+    c = TranscriptCache(db_path=str(tmp_path / "transcripts.db"))
+    yield c
+    c.close()
+
+
+class TestTranscriptCacheStorage:
+    """Test get/put semantics."""
+
+    def test_miss_returns_none(self, cache):
+        assert cache.get("dQw4w9WgXcQ") is None
+
+    def test_available_transcript_roundtrip(self, cache):
+        assert cache.put("dQw4w9WgXcQ", (True, "- hello world", None))
+        assert cache.get("dQw4w9WgXcQ") == (True, "- hello world", None)
+
+    def test_language_is_part_of_key(self, cache):
+        cache.put("dQw4w9WgXcQ", (True, "- hello", None), language="English")
+        assert cache.get("dQw4w9WgXcQ", language="German") is None
+
+    def test_no_transcript_is_cached(self, cache):
+        assert cache.put("abcdefghijk", (False, None, "No transcript text found in panel"))
+        success, transcript, error = cache.get("abcdefghijk")
+        assert success is False
+        assert transcript is None
+        assert "no transcript" in error.lower()
+
+    def test_transient_failure_not_cached(self, cache):
+        assert not cache.put("abcdefghijk", (False, None, "Timeout while extracting transcript"))
+        assert not cache.put("abcdefghijk", (False, None, "Could not open transcript panel"))
+        assert not cache.put("abcdefghijk", (False, None, "Transcript extraction failed for abcdefghijk: crashed"))
+        assert cache.get("abcdefghijk") is None
+
+    def test_negative_entry_expires_sooner(self, tmp_path):
+        cache = TranscriptCache(db_path=str(tmp_path / "t.db"), available_ttl=3600, unavailable_ttl=0)
+        cache.put("aaaaaaaaaaa", (True, "- text", None))
+        cache.put("bbbbbbbbbbb", (False, None, "No transcript available"))
+        time.sleep(0.01)
+        assert cache.get("aaaaaaaaaaa") is not None
+        assert cache.get("bbbbbbbbbbb") is None
+        cache.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "t.db")
+        first = TranscriptCache(db_path=path)
+        first.put("dQw4w9WgXcQ", (True, "- persisted", None))
+        first.close()
+
+        second = TranscriptCache(db_path=path)
+        assert second.get("dQw4w9WgXcQ") == (True, "- persisted", None)
+        second.close()
+
+    def test_invalidate(self, cache):
+        cache.put("dQw4w9WgXcQ", (True, "- text", None))
+        cache.invalidate("dQw4w9WgXcQ")
+        assert cache.get("dQw4w9WgXcQ") is None
+
+
+class TestTranscriptCacheSingleFlight:
+    """Test get_or_fetch coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_fetch_once(self, cache):
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return True, "- shared transcript", None
+
+        results = await asyncio.gather(*[cache.get_or_fetch("dQw4w9WgXcQ", fetch) for _ in range(5)])
+
+        assert calls == 1
+        assert all(r == (True, "- shared transcript", None) for r in results)
+        assert cache.stats['coalesced'] == 4
+
+    @pytest.mark.asyncio
+    async def test_second_call_is_cache_hit(self, cache):
+        fetch = AsyncMock(return_value=(True, "- text", None))
+
+        await cache.get_or_fetch("dQw4w9WgXcQ", fetch)
+        await cache.get_or_fetch("dQw4w9WgXcQ", fetch)
+
+        assert fetch.await_count == 1
+        assert cache.stats['hits'] == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_exception_propagates_to_waiters(self, cache):
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("browser crashed")
+
+        results = await asyncio.gather(
+            cache.get_or_fetch("dQw4w9WgXcQ", fetch),
+            cache.get_or_fetch("dQw4w9WgXcQ", fetch),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert cache.get("dQw4w9WgXcQ") is None
+
+
+class TestTranscriptExtractorCacheIntegration:
+    """Test that TranscriptExtractor consults the cache before YouTube."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_browser(self, cache):
+        cache.put("dQw4w9WgXcQ", (True, "- cached", None))
+        extractor = TranscriptExtractor(cache=cache)
+        extractor._extract_transcript_uncached = AsyncMock()
+
+        result = await extractor.extract_transcript("https://youtu.be/dQw4w9WgXcQ", "dQw4w9WgXcQ")
+
+        assert result == (True, "- cached", None)
+        extractor._extract_transcript_uncached.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_does_not_launch_browser(self, cache):
+        cache.put("dQw4w9WgXcQ", (True, "- cached", None))
+
+        with patch('src.scrapers.transcript_extractor.async_playwright') as mock_pw:
+            async with TranscriptExtractor(cache=cache) as extractor:
+                result = await extractor.extract_transcript("https://youtu.be/dQw4w9WgXcQ", "dQw4w9WgXcQ")
+
+        assert result == (True, "- cached", None)
+        mock_pw.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_without_cache_calls_youtube(self):
+        extractor = TranscriptExtractor()
+        extractor._extract_transcript_uncached = AsyncMock(return_value=(True, "- fresh", None))
+
+        result = await extractor.extract_transcript("https://youtu.be/dQw4w9WgXcQ", "dQw4w9WgXcQ")
+
+        assert result == (True, "- fresh", None)
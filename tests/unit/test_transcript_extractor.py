@@ -46,7 +46,10 @@ class TestTranscriptExtractorInitialization:
             mock_browser.close = AsyncMock()
             mock_pw_instance.stop = AsyncMock()
             
+            # The browser is launched on first use, not on enter
             async with TranscriptExtractor() as extractor:
+                assert extractor.browser is None
+                await extractor._ensure_browser()
                 assert extractor.playwright is not None
                 assert extractor.browser is not None
     
@@ -62,7 +65,7 @@ class TestTranscriptExtractorInitialization:
             mock_browser.close = AsyncMock()
             
             async with TranscriptExtractor() as extractor:
-                pass
+                await extractor._ensure_browser()
             
             # Verify cleanup was called
             mock_browser.close.assert_called_once()
@@ -0,0 +1,174 @@
+"""
+Unit tests for TranscriptWorker.
+
+Tests cover:
+- Lazy single browser launch
+- Fresh context per retry attempt
+- Concurrency bounded by max_pages
+- Per-video attempt timings
+- UnifiedWorkflowExtractor shares one worker across workflows
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.scrapers.transcript_cache import TranscriptCache
+from src.scrapers.transcript_worker import TranscriptWorker
+from src.scrapers.unified_workflow_extractor import UnifiedWorkflowExtractor
+
+
+def _mock_browser():
+    """Browser mock whose new_context() returns closable contexts."""
+    browser = MagicMock()
+    browser.close = AsyncMock()
+
+    async def new_context():
+        context = MagicMock()
+        context.close = AsyncMock()
+        return context
+
+    browser.new_context = AsyncMock(side_effect=new_context)
+    return browser
+
+
+@pytest.fixture
+def worker():
+    w = TranscriptWorker(max_pages=2, max_attempts=3)
+    w.browser = _mock_browser()
+    return w
+
+
+class TestTranscriptWorkerLaunch:
+    """Test browser lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_enter_does_not_launch_browser(self):
+        with patch('src.scrapers.transcript_extractor.async_playwright') as mock_pw:
+            async with TranscriptWorker() as worker:
+                assert worker.browser is None
+            mock_pw.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_browser_launched_once_for_many_videos(self):
+        with patch('src.scrapers.transcript_extractor.async_playwright') as mock_pw:
+            mock_pw_instance = AsyncMock()
+            mock_pw.return_value.start = AsyncMock(return_value=mock_pw_instance)
+            mock_pw_instance.chromium.launch = AsyncMock(return_value=_mock_browser())
+
+            async with TranscriptWorker(max_pages=3) as worker:
+                worker._extract_transcript_in = AsyncMock(return_value=(True, "- " + "x" * 60, None))
+                await worker.extract_many([(f"https://youtu.be/vid{i:08d}", f"vid{i:08d}") for i in range(6)])
+
+            mock_pw_instance.chromium.launch.assert_awaited_once()
+
+
+class TestTranscriptWorkerRetries:
+    """Test retry behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_retry_uses_fresh_context(self, worker):
+        worker._extract_transcript_in = AsyncMock(side_effect=[
+            (False, None, "Timeout while extracting transcript"),
+            (True, "- " + "x" * 60, None),
+        ])
+
+        with patch('src.scrapers.transcript_worker.asyncio.sleep', new=AsyncMock()):
+            success, transcript, error = await worker.extract_transcript("https://youtu.be/aaaaaaaaaaa", "aaaaaaaaaaa")
+
+        assert success is True
+        assert worker.browser.new_context.await_count == 2
+        timings = worker.attempt_timings["aaaaaaaaaaa"]
+        assert [t['attempt'] for t in timings] == [1, 2]
+        assert timings[0]['success'] is False and timings[1]['success'] is True
+
+    @pytest.mark.asyncio
+    async def test_timeout_grows_per_attempt(self, worker):
+        worker._extract_transcript_in = AsyncMock(return_value=(False, None, "Timeout"))
+
+        with patch('src.scrapers.transcript_worker.asyncio.sleep', new=AsyncMock()):
+            success, _, error = await worker.extract_transcript("https://youtu.be/aaaaaaaaaaa", "aaaaaaaaaaa")
+
+        assert success is False
+        timeouts = [c.kwargs['timeout'] for c in worker._extract_transcript_in.await_args_list]
+        assert timeouts == [30000, 40000, 50000]
+
+    @pytest.mark.asyncio
+    async def test_no_transcript_stops_retrying(self, worker):
+        worker._extract_transcript_in = AsyncMock(return_value=(False, None, "No transcript text found in panel"))
+
+        await worker.extract_transcript("https://youtu.be/aaaaaaaaaaa", "aaaaaaaaaaa")
+
+        assert worker._extract_transcript_in.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_panel_not_opening_is_retried(self, worker):
+        worker._extract_transcript_in = AsyncMock(return_value=(False, None, "Could not open transcript panel"))
+
+        with patch('src.scrapers.transcript_worker.asyncio.sleep', new=AsyncMock()):
+            await worker.extract_transcript("https://youtu.be/aaaaaaaaaaa", "aaaaaaaaaaa")
+
+        assert worker._extract_transcript_in.await_count == 3
+
+
+class TestTranscriptWorkerConcurrency:
+    """Test bounded concurrency and cache use."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_by_max_pages(self, worker):
+        active = 0
+        peak = 0
+
+        async def fake_extract(context, url, video_id, timeout=None):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return True, "- " + "x" * 60, None
+
+        worker._extract_transcript_in = fake_extract
+        results = await worker.extract_many([(f"https://youtu.be/vid{i:08d}", f"vid{i:08d}") for i in range(6)])
+
+        assert peak == 2
+        assert all(r[0] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cached_videos_skip_browser(self, tmp_path):
+        cache = TranscriptCache(db_path=str(tmp_path / "t.db"))
+        cache.put("aaaaaaaaaaa", (True, "- cached", None))
+        worker = TranscriptWorker(cache=cache)
+
+        results = await worker.extract_many([("https://youtu.be/aaaaaaaaaaa", "aaaaaaaaaaa")])
+
+        assert results == [(True, "- cached", None)]
+        assert worker.browser is None
+        cache.close()
+
+
+class TestExtractorSharesWorker:
+    """Test the unified extractor reuses one worker for the whole run."""
+
+    @pytest.mark.asyncio
+    async def test_one_worker_per_run(self, worker):
+        async def fake_extract(context, url, video_id, timeout=None):
+            return True, "- " + "x" * 60, None
+
+        worker._extract_transcript_in = fake_extract
+        extractor = UnifiedWorkflowExtractor()
+        extractor._open_transcript_worker = AsyncMock(return_value=worker)
+
+        for video_id in ("aaaaaaaaaaa", "bbbbbbbbbbb"):
+            timings = {}
+            videos = [{'url': f"https://youtu.be/{video_id}", 'youtube_id': video_id}]
+            transcripts = await extractor._extract_transcripts_robust(videos, timings)
+            assert list(transcripts) == [f"https://youtu.be/{video_id}"]
+            assert list(timings) == [video_id]
+
+        extractor._open_transcript_worker.assert_awaited_once()
+        assert worker.attempt_timings == {}
+        assert extractor.stats['transcript_attempts'] == 2
+
+        await extractor.cleanup()
+        worker.browser.close.assert_awaited_once()
+        assert extractor.transcript_worker is None
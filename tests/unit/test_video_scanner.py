@@ -0,0 +1,98 @@
+"""
+Unit tests for the single-pass video ID scanner.
+
+Tests cover:
+- Context classification (anchor, embed, markdown, json, url, param)
+- Deduplication keeps the most specific context
+- Byte and text scans agree
+- Inline ID validation
+- URL and link-form helpers
+"""
+
+from src.scrapers.video_scanner import LINK_FORMS, scan_videos, video_id_from_url, video_ids
+
+PAGE = '''
+<p>Intro: https://youtu.be/aaaaaaaaaaa and again later.</p>
+<a class="btn" href="https://www.youtube.com/watch?v=aaaaaaaaaaa&t=3">Watch</a>
+<a href="https://www.youtube.com/playlist?list=x&v=bbbbbbbbbbb">Playlist</a>
+<iframe width="560" src="https://www.youtube-nocookie.com/embed/ccccccccccc?rel=0"></iframe>
+<div>@[youtube](ddddddddddd)</div>
+<script>{"videoId": "eeeeeeeeeee"}</script>
+<div data-video-id="fffffffffff"></div>
+'''
+
+
+class TestScanVideos:
+    """Test one-pass scanning."""
+
+    def test_contexts(self):
+        hits = {hit.video_id: hit.context for hit in scan_videos(PAGE)}
+
+        assert hits == {
+            'aaaaaaaaaaa': 'anchor',
+            'bbbbbbbbbbb': 'param',
+            'ccccccccccc': 'embed',
+            'ddddddddddd': 'markdown',
+            'eeeeeeeeeee': 'json',
+            'fffffffffff': 'param',
+        }
+
+    def test_dedupe_keeps_first_appearance_and_best_context(self):
+        hits = scan_videos(PAGE)
+        every = scan_videos(PAGE, dedupe=False)
+
+        assert hits[0].video_id == 'aaaaaaaaaaa'
+        assert hits[0].form == 'watch'
+        assert [hit.context for hit in every if hit.video_id == 'aaaaaaaaaaa'] == ['url', 'anchor']
+        assert hits[0].url == 'https://youtu.be/aaaaaaaaaaa'
+
+    def test_attribute_values_with_angle_brackets(self):
+        html = (
+            '<a title="a > b" href="https://youtu.be/aaaaaaaaaaa">x</a>'
+            '<a title=\'1 < 2\' data-x="</p>" href=https://www.youtube.com/watch?v=bbbbbbbbbbb>y</a>'
+            '<p title="a > b">https://youtu.be/ccccccccccc</p>'
+        )
+
+        hits = {hit.video_id: hit.context for hit in scan_videos(html)}
+
+        assert hits == {'aaaaaaaaaaa': 'anchor', 'bbbbbbbbbbb': 'anchor', 'ccccccccccc': 'url'}
+        assert scan_videos(html.encode()) == scan_videos(html)
+
+    def test_watch_url_with_v_after_other_parameters(self):
+        html = (
+            '<a href="https://www.youtube.com/watch?list=PLxyz&amp;v=aaaaaaaaaaa">x</a>'
+            '<iframe src="https://www.youtube.com/watch?list=PLxyz&index=2&v=bbbbbbbbbbb"></iframe>'
+        )
+
+        hits = scan_videos(html)
+
+        assert [(hit.video_id, hit.form, hit.context) for hit in hits] == [
+            ('aaaaaaaaaaa', 'watch', 'anchor'),
+            ('bbbbbbbbbbb', 'watch', 'embed'),
+        ]
+        assert video_id_from_url('https://www.youtube.com/watch?list=PLxyz&v=ccccccccccc') == 'ccccccccccc'
+
+    def test_bytes_match_text(self):
+        assert scan_videos(PAGE.encode()) == scan_videos(PAGE)
+        assert scan_videos(None) == [] and scan_videos(b'') == []
+
+    def test_rejects_longer_tokens(self):
+        text = 'youtu.be/abcdefghijkl nav=abcdefghijk youtu.be/abc-efg_ijk'
+
+        assert video_ids(text) == ['abc-efg_ijk']
+
+
+class TestHelpers:
+    """Test ID helpers built on the scanner."""
+
+    def test_video_id_from_url(self):
+        assert video_id_from_url('https://youtu.be/dQw4w9WgXcQ?t=42') == 'dQw4w9WgXcQ'
+        assert video_id_from_url('https://www.youtube.com/v/dQw4w9WgXcQ') == 'dQw4w9WgXcQ'
+        assert video_id_from_url('https://example.com/?v=dQw4w9WgXcQ') is None
+        assert video_id_from_url('') is None
+
+    def test_link_forms(self):
+        text = 'See @[youtube](ddddddddddd) and youtu.be/aaaaaaaaaaa, not videoId=eeeeeeeeeee'
+
+        assert video_ids(text, forms=LINK_FORMS) == ['ddddddddddd', 'aaaaaaaaaaa']
+        assert video_ids(text) == ['ddddddddddd', 'aaaaaaaaaaa', 'eeeeeeeeeee']
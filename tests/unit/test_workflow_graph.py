@@ -0,0 +1,130 @@
+"""
+Unit tests for the workflow connection graph engine.
+
+Tests cover:
+- CSR packing and per-workflow metrics (depth, fan-in/out, paths, loops)
+- Strongly connected components against brute-force reachability
+- Batch results equal single-workflow results
+- Metrics reaching Layers 6 and 7
+"""
+
+import random
+
+from src.scrapers.workflow_graph import (
+    WorkflowGraph,
+    graph_metrics,
+    graph_metrics_batch,
+    layer2_graph_metrics,
+)
+from src.scrapers.workflow_index import STICKY_NOTE_TYPE, WorkflowIndex
+
+
+def _index(edges, extra=()):
+    names = sorted({name for edge in edges for name in edge} | set(extra))
+    connections = {}
+    for source, target in edges:
+        connections.setdefault(source, {'main': [[]]})['main'][0].append({'node': target, 'type': 'main', 'index': 0})
+    nodes = [{'name': name, 'type': 'n8n-nodes-base.set'} for name in names]
+    nodes.append({'name': 'Note', 'type': STICKY_NOTE_TYPE})
+    return WorkflowIndex({'nodes': nodes, 'connections': connections})
+
+
+def _random_edges(rng, size):
+    names = [f"n{i}" for i in range(size)]
+    return [(rng.choice(names), rng.choice(names)) for _ in range(rng.randint(0, size * 2))], names
+
+
+class TestGraphMetrics:
+    """Test metrics of small known graphs."""
+
+    def test_diamond(self):
+        metrics = graph_metrics(_index([('T', 'A'), ('T', 'B'), ('A', 'C'), ('B', 'C'), ('C', 'D')]))
+
+        assert metrics['graph_nodes'] == 5  # sticky note left out
+        assert metrics['graph_edges'] == 5
+        assert metrics['depth'] == 4
+        assert metrics['max_fan_out'] == 2 and metrics['max_fan_in'] == 2
+        assert metrics['parallel_branches'] == 2
+        assert metrics['trigger_to_sink_paths'] == 2
+        assert metrics['branch_nodes'] == ['T']
+        assert metrics['cycle_count'] == 0
+
+    def test_loop_and_isolated_node(self):
+        metrics = graph_metrics(_index([('A', 'B'), ('B', 'A'), ('B', 'C'), ('C', 'C')], extra=['Z']))
+
+        assert metrics['cycle_count'] == 2
+        assert metrics['loop_nodes'] == ['A', 'B', 'C']
+        assert metrics['depth'] == 2
+        assert metrics['isolated_nodes'] == 1
+        assert metrics['trigger_count'] == 1 and metrics['sink_count'] == 1
+
+    def test_empty(self):
+        assert graph_metrics(WorkflowIndex({}))['graph_nodes'] == 0
+        assert layer2_graph_metrics({'node_count': 3}) is None
+        assert layer2_graph_metrics({'data': '{not json'}) is None
+
+
+class TestComponents:
+    """Test Tarjan against brute-force reachability."""
+
+    def test_matches_mutual_reachability(self):
+        rng = random.Random(11)
+        for _ in range(50):
+            edges, names = _random_edges(rng, rng.randint(1, 9))
+            graph = WorkflowGraph([_index(edges, extra=names)])
+            component = graph.strongly_connected_components()
+
+            reach = {node: {node} for node in range(graph.node_count)}
+            changed = True
+            while changed:
+                changed = False
+                for node in range(graph.node_count):
+                    for target in graph.successors(node):
+                        if not reach[int(target)] <= reach[node]:
+                            reach[node] |= reach[int(target)]
+                            changed = True
+            for a in range(graph.node_count):
+                for b in range(graph.node_count):
+                    same = b in reach[a] and a in reach[b]
+                    assert (component[a] == component[b]) == same
+                for target in graph.successors(a):
+                    assert component[a] >= component[target]
+
+
+class TestBatch:
+    """Test packed batch runs."""
+
+    def test_batch_equals_single(self):
+        rng = random.Random(5)
+        indexes = [_index(*_random_edges(rng, rng.randint(1, 12))) for _ in range(40)] + [None]
+
+        batch = graph_metrics_batch(indexes)
+
+        assert batch[-1]['graph_nodes'] == 0
+        assert batch[:-1] == [graph_metrics(index) for index in indexes[:-1]]
+
+
+class TestLayerFeeds:
+    """Test graph metrics in Layer 6 / 7 output."""
+
+    def test_layers_use_graph(self):
+        from src.scrapers.layer6_technical_details import TechnicalDetailsExtractor
+        from src.scrapers.layer7_performance_analytics import PerformanceAnalyticsExtractor
+
+        index = _index([('T', 'A'), ('T', 'B'), ('A', 'C'), ('B', 'C')])
+        workflow_data = {
+            'workflow_id': 'wf1',
+            'layers': {
+                'layer1': {'data': {'title': 'Sync'}},
+                'layer2': {'data': {'workflow': {'nodes': index.items, 'connections': index.connections}}},
+                'layer3': {'data': {'explainer_text': 'Sync contacts'}}
+            }
+        }
+
+        layer6 = TechnicalDetailsExtractor().extract_sync(workflow_data)['data']
+        layer7 = PerformanceAnalyticsExtractor().extract_sync(workflow_data)['data']
+
+        assert layer6['workflow_parallelism'] == ['T']
+        assert layer6['workflow_graph']['depth'] == 3
+        assert layer7['performance_benchmarks']['critical_path_nodes'] == 3
+        assert layer7['performance_benchmarks']['execution_paths'] == 2
@@ -0,0 +1,89 @@
+"""
+Unit tests for the single-pass workflow JSON index.
+
+Tests cover:
+- Layer 2 node / connection metrics and node types
+- Nodes by type, sticky notes, auth usage and URL parameters
+- Connection adjacency
+- Layer 6 reads the index instead of re-walking the JSON
+"""
+
+import json
+
+from src.scrapers.layer6_technical_details import TechnicalDetailsData, TechnicalDetailsExtractor
+from src.scrapers.workflow_index import STICKY_NOTE_TYPE, WorkflowIndex
+
+
+def _workflow():
+    return {
+        'nodes': [
+            {'id': '1', 'name': 'Webhook', 'type': 'n8n-nodes-base.webhook', 'position': [0, 0], 'parameters': {}},
+            {
+                'id': '2', 'name': 'Fetch', 'type': 'n8n-nodes-base.httpRequest', 'position': [200, 0],
+                'parameters': {'url': 'https://api.example.com', 'authentication': 'oAuth2', 'ssl': True},
+                'credentials': {'oAuth2Api': {'id': '7'}}
+            },
+            {
+                'id': '3', 'name': 'Notify', 'type': 'n8n-nodes-base.slack', 'position': [400, 0],
+                'parameters': {'headers': {'API_KEY': 'x'}}
+            },
+            {'id': '4', 'name': 'Note', 'type': STICKY_NOTE_TYPE, 'position': [0, -200], 'parameters': {'content': 'Read me'}},
+        ],
+        'connections': {
+            'Webhook': {'main': [[{'node': 'Fetch', 'type': 'main', 'index': 0}]]},
+            'Fetch': {'main': [[{'node': 'Notify', 'type': 'main', 'index': 0}], [{'node': 'Webhook', 'type': 'main', 'index': 0}]]}
+        }
+    }
+
+
+class TestWorkflowIndex:
+    """Test what one traversal collects."""
+
+    def test_layer2_metrics(self):
+        index = WorkflowIndex.from_api_response({'workflow': _workflow()})
+
+        assert index.node_count == 4
+        assert index.connection_count == 2
+        assert index.node_types == [
+            'n8n-nodes-base.webhook', 'n8n-nodes-base.httpRequest', 'n8n-nodes-base.slack', STICKY_NOTE_TYPE
+        ]
+
+    def test_nodes_and_parameters(self):
+        index = WorkflowIndex(_workflow())
+
+        assert [node['name'] for node in index.nodes_at(index.sticky_notes)] == ['Note']
+        assert len(index.workflow_nodes) == 3
+        assert index.of_type('n8n-nodes-base.slack')[0]['id'] == '3'
+        assert index.url_parameters == [
+            {'url': 'https://api.example.com', 'method': 'GET', 'node_type': 'n8n-nodes-base.httpRequest'}
+        ]
+        assert index.authentication_types == ['oAuth2']
+        assert index.credential_types == {'oAuth2Api': [1]}
+        assert index.security_markers() == {'ssl_required', 'oauth_required', 'api_key_required'}
+
+    def test_adjacency(self):
+        index = WorkflowIndex.from_json(json.dumps(_workflow()))
+
+        assert index.adjacency == {'Webhook': ['Fetch'], 'Fetch': ['Notify', 'Webhook']}
+        assert index.edges == [('Webhook', 'Fetch'), ('Fetch', 'Notify'), ('Fetch', 'Webhook')]
+        assert index.by_name['Notify'] == 2
+
+    def test_empty_workflow(self):
+        index = WorkflowIndex.from_api_response(None)
+
+        assert index.node_count == 0
+        assert index.connection_count == 0
+        assert index.node_types == []
+        assert index.security_markers() == set()
+
+
+class TestLayer6UsesIndex:
+    """Test Layer 6 workflow JSON analysis."""
+
+    def test_analyze_workflow_json(self):
+        tech_data = TechnicalDetailsData()
+        TechnicalDetailsExtractor()._analyze_workflow_json(_workflow(), tech_data)
+
+        assert tech_data.api_endpoints[0]['url'] == 'https://api.example.com'
+        assert tech_data.credential_types == ['oAuth2']
+        assert sorted(tech_data.security_requirements) == ['api_key_required', 'oauth_required', 'ssl_required']
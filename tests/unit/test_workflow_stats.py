@@ -0,0 +1,83 @@
+"""
+Unit tests for workflow statistics.
+
+Tests cover:
+- The aggregate query computes every counter in one scan
+- Reads come from the summary slots, with the aggregate as fallback
+- The committed migration matches the counter definitions
+"""
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from src.storage.workflow_stats import STATS_TABLE, STAT_AGGREGATES, read_statistics, statistics_ddl
+
+WORKFLOWS = [
+    # layer1, layer2, layer3, error_message, quality_score, processing_time
+    (True, True, True, None, 0.8, 10.0),
+    (True, True, True, None, 0.7, 20.0),
+    (True, False, False, 'timeout', 0.5, None),
+    (True, False, False, 'HTTP 404', 0.0, None),
+    (False, False, False, None, None, None),
+]
+
+
+@pytest.fixture
+def session():
+    engine = create_engine('sqlite://')
+    with Session(engine) as session:
+        session.execute(text(
+            "CREATE TABLE workflows (id INTEGER PRIMARY KEY, extracted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, "
+            + ", ".join(f"layer{layer}_success BOOLEAN DEFAULT 0" for layer in range(1, 8))
+            + ", error_message TEXT, quality_score FLOAT, processing_time FLOAT)"
+        ))
+        for row in WORKFLOWS:
+            session.execute(text(
+                "INSERT INTO workflows (layer1_success, layer2_success, layer3_success, error_message, quality_score, processing_time) "
+                "VALUES (:l1, :l2, :l3, :error, :quality, :time)"
+            ), dict(zip(('l1', 'l2', 'l3', 'error', 'quality', 'time'), row)))
+        yield session
+
+
+class TestWorkflowStatistics:
+    """Test statistics reads."""
+
+    def test_aggregate_fallback(self, session):
+        stats = read_statistics(session)
+
+        assert stats['total_workflows'] == 5
+        assert stats['layer1_success_count'] == 4
+        assert stats['layer2_success_rate'] == 40.0
+        assert stats['fully_successful'] == 2
+        assert stats['partial_success'] == 2
+        assert stats['with_errors'] == 2
+        assert stats['failed'] == 1
+        assert stats['invalid'] == 1
+        assert stats['pending'] == 1
+        assert stats['avg_quality_score'] == 0.5
+        assert stats['avg_processing_time'] == 15.0
+        assert stats['success_rate'] == 40.0
+
+    def test_reads_summary_slots(self, session):
+        columns = ", ".join(f"{column} FLOAT DEFAULT 0" for column in STAT_AGGREGATES)
+        session.execute(text(f"CREATE TABLE {STATS_TABLE} (slot INTEGER PRIMARY KEY, {columns})"))
+
+        # Empty summary: not installed yet, so count the table
+        assert read_statistics(session)['total_workflows'] == 5
+
+        session.execute(text(
+            f"INSERT INTO {STATS_TABLE} (slot, total_workflows, layer1_success_count, quality_score_sum, quality_score_count) "
+            "VALUES (0, 1000, 900, 300, 400), (7, 24, -2, 2, 0)"
+        ))
+        stats = read_statistics(session)
+
+        assert stats['total_workflows'] == 1024
+        assert stats['layer1_success_count'] == 898
+        assert stats['avg_quality_score'] == 0.76
+
+    def test_migration_is_generated(self):
+        migration = Path(__file__).parents[2] / 'migrations' / 'workflow_stats.sql'
+        assert migration.read_text() == statistics_ddl()
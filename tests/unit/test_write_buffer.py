@@ -0,0 +1,152 @@
+"""
+Unit tests for the write-behind buffer.
+
+Tests cover:
+- Flush on max_records and after max_delay_ms, one write per flush
+- A failed batch falls back to per-record writes; failures are re-queued
+- Records failing max_attempts times are dead-lettered and counted
+- A failing delayed flush is logged instead of dying unseen in the timer task
+- Pending records survive a crash through the spool
+- Spool I/O runs off the event loop, in order
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+from loguru import logger
+
+from src.storage.async_writer import StorageWriter
+from src.storage.write_buffer import WriteBehindBuffer
+
+
+class FakeStore:
+    """Batch write function that can reject given records."""
+
+    def __init__(self, reject=()):
+        self.batches = []
+        self.reject = set(reject)
+
+    def __call__(self, records):
+        ids = [record['workflow_id'] for record in records]
+        if self.reject & set(ids):
+            raise RuntimeError('constraint violated')
+        self.batches.append(ids)
+
+
+@pytest.fixture
+async def writer():
+    writer = StorageWriter()
+    yield writer
+    await writer.close()
+
+
+class TestWriteBehindBuffer:
+    """Test group commits, fallback and the spool."""
+
+    @pytest.mark.asyncio
+    async def test_flush_on_size_and_delay(self, tmp_path, writer):
+        store = FakeStore()
+        buffer = WriteBehindBuffer('test', store, max_records=3, max_delay_ms=50,
+                                   spool_dir=str(tmp_path), writer=writer)
+
+        for i in range(4):
+            await buffer.add({'workflow_id': str(i)})
+        assert store.batches == [['0', '1', '2']]
+        assert buffer.pending == 1
+
+        await asyncio.sleep(0.15)
+        assert store.batches == [['0', '1', '2'], ['3']]
+        assert buffer.pending == 0
+        assert buffer.spool_path.read_text() == ''
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_requeues_failing_records(self, tmp_path, writer):
+        store = FakeStore(reject={'bad'})
+        buffer = WriteBehindBuffer('test', store, max_records=10, max_attempts=2,
+                                   spool_dir=str(tmp_path), writer=writer)
+
+        for workflow_id in ('a', 'bad', 'c'):
+            await buffer.add({'workflow_id': workflow_id})
+        assert await buffer.flush() == 2
+
+        assert store.batches == [['a'], ['c']]
+        assert buffer.pending == 1
+        assert buffer.stats['batch_failures'] == 1
+        assert buffer.stats['requeued'] == 1
+        assert [json.loads(line)['record'] for line in buffer.spool_path.read_text().splitlines()] == [{'workflow_id': 'bad'}]
+
+        # Second failure reaches max_attempts: dead-lettered, no longer pending
+        assert await buffer.flush() == 0
+        assert buffer.pending == 0
+        dead = [json.loads(line) for line in buffer.dead_letter_path.read_text().splitlines()]
+        assert dead[0]['record'] == {'workflow_id': 'bad'}
+        assert dead[0]['attempts'] == 2
+        assert buffer.dead_lettered == 1
+        await buffer.close()
+
+    @pytest.mark.asyncio
+    async def test_spool_replayed_after_crash(self, tmp_path, writer):
+        crashed = WriteBehindBuffer('test', FakeStore(), max_records=10, max_delay_ms=60000,
+                                    spool_dir=str(tmp_path), writer=writer)
+        await crashed.add({'workflow_id': '1'})
+        await crashed.add({'workflow_id': '2'})
+        crashed._cancel_timer()
+        # Process dies mid-append: a torn last line
+        with open(crashed.spool_path, 'a') as f:
+            f.write('{"id": 2, "attem')
+
+        store = FakeStore()
+        async with WriteBehindBuffer('test', store, spool_dir=str(tmp_path), writer=writer) as buffer:
+            assert buffer.stats['recovered'] == 2
+            await buffer.add({'workflow_id': '3'})
+
+        assert store.batches == [['1', '2', '3']]
+        assert buffer.spool_path.read_text() == ''
+
+    @pytest.mark.asyncio
+    async def test_spool_io_off_event_loop(self, tmp_path, writer, monkeypatch):
+        threads = set()
+        append = WriteBehindBuffer._append_spool
+
+        def recording_append(self, envelope):
+            threads.add(threading.current_thread())
+            append(self, envelope)
+
+        monkeypatch.setattr(WriteBehindBuffer, '_append_spool', recording_append)
+        store = FakeStore()
+        buffer = WriteBehindBuffer('test', store, max_records=5, max_delay_ms=60000,
+                                   spool_dir=str(tmp_path), writer=writer)
+
+        # Concurrent adds: all are pending by the time the fifth flushes, so the
+        # spool rewrite must land after every queued append
+        await asyncio.gather(*(buffer.add({'workflow_id': str(i)}) for i in range(7)))
+
+        assert threading.current_thread() not in threads
+        assert store.batches == [['0', '1', '2', '3', '4', '5', '6']]
+        assert buffer.spool_path.read_text() == ''
+        await buffer.add({'workflow_id': '7'})
+        assert [json.loads(line)['record'] for line in buffer.spool_path.read_text().splitlines()] == [{'workflow_id': '7'}]
+        await buffer.close()
+        assert buffer.spool_path.read_text() == ''
+
+    @pytest.mark.asyncio
+    async def test_delayed_flush_failure_is_logged(self, tmp_path, writer, monkeypatch):
+        buffer = WriteBehindBuffer('test', FakeStore(), max_records=10, max_delay_ms=10,
+                                   spool_dir=str(tmp_path), writer=writer)
+        await buffer.add({'workflow_id': '1'})
+
+        def broken_rewrite(pending):
+            raise OSError('disk full')
+
+        monkeypatch.setattr(buffer, '_rewrite_spool', broken_rewrite)
+        errors = []
+        handler = logger.add(errors.append, level='ERROR')
+        try:
+            await asyncio.sleep(0.1)
+        finally:
+            logger.remove(handler)
+
+        assert any('delayed flush failed: disk full' in message for message in errors)
+        assert buffer._timer is None